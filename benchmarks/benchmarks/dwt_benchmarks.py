@@ -36,6 +36,38 @@ class IdwtTimeSuite(DwtTimeSuiteBase):
         pywt.idwt(self.cA, self.cD, wavelet, mode)
 
 
+class DwtMethodTimeSuiteBase:
+    """
+    Set-up for (I)DWT timing of the convolution and lifting methods.
+    """
+    params = ([256, 65536],
+              ['haar', 'db2', 'db4', 'bior4.4'],
+              ['convolution', 'lifting'])
+    param_names = ('n', 'wavelet', 'method')
+
+    def setup(self, n, wavelet, method):
+        if not hasattr(pywt._dwt, '_lifting_for_method'):
+            raise NotImplementedError("method keyword not supported")
+        self.data = np.random.randn(n)
+        # factor the filter bank outside of the timed code
+        pywt.dwt(self.data[:16], wavelet, method=method)
+
+
+class DwtMethodTimeSuite(DwtMethodTimeSuiteBase):
+    def time_dwt(self, n, wavelet, method):
+        pywt.dwt(self.data, wavelet, method=method)
+
+
+class IdwtMethodTimeSuite(DwtMethodTimeSuiteBase):
+    def setup(self, n, wavelet, method):
+        super().setup(n, wavelet, method)
+        self.cA, self.cD = pywt.dwt(self.data, wavelet)
+        pywt.idwt(self.cA[:16], self.cD[:16], wavelet, method=method)
+
+    def time_idwt(self, n, wavelet, method):
+        pywt.idwt(self.cA, self.cD, wavelet, method=method)
+
+
 class Dwt2TimeSuiteBase:
     """
     Set-up for (I)DWT2 timing.
@@ -89,6 +121,34 @@ class IdwtnTimeSuite(DwtnTimeSuiteBase):
         pywt.idwtn(self.data, wavelet)
 
 
+class DwtAxisTimeSuiteBase:
+    """
+    Set-up for (I)DWT timing along the axes of a C-ordered 3D volume.
+    """
+    params = ([64, 128],
+              ['haar', 'db4'],
+              [0, 1, 2])
+    param_names = ('n', 'wavelet', 'axis')
+
+    def setup(self, n, wavelet, axis):
+        rstate = np.random.RandomState(1234)
+        self.data = rstate.standard_normal((n, ) * 3)
+
+
+class DwtAxisTimeSuite(DwtAxisTimeSuiteBase):
+    def time_dwt_axis(self, n, wavelet, axis):
+        pywt.dwt(self.data, wavelet, axis=axis)
+
+
+class IdwtAxisTimeSuite(DwtAxisTimeSuiteBase):
+    def setup(self, n, wavelet, axis):
+        super().setup(n, wavelet, axis)
+        self.cA, self.cD = pywt.dwt(self.data, wavelet, axis=axis)
+
+    def time_idwt_axis(self, n, wavelet, axis):
+        pywt.idwt(self.cA, self.cD, wavelet, axis=axis)
+
+
 """
 Multilevel DWT benchmarks
 """
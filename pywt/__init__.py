@@ -20,8 +20,9 @@ from ._dwt import *
 from ._swt import *
 from ._cwt import *
 from ._mra import *
+from ._streaming import *
 
-from . import data
+from . import data, outofcore, parallel
 
 __all__ = [s for s in dir() if not s.startswith('_')]
 try:
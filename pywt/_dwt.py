@@ -9,7 +9,12 @@ from ._extensions._dwt import dwt_coeff_len as _dwt_coeff_len
 from ._extensions._dwt import dwt_max_level as _dwt_max_level
 from ._extensions._dwt import upcoef as _upcoef
 from ._extensions._pywt import Modes, Wavelet, _check_dtype, wavelist
-from ._utils import AxisError, _as_wavelet
+from ._lifting import (
+    _integer_dwt_axis,
+    _integer_idwt_axis,
+    _lifting_for_method,
+)
+from ._utils import AxisError, _as_wavelet, _check_workers
 
 __all__ = ["dwt", "idwt", "downcoef", "upcoef", "dwt_max_level",
            "dwt_coeff_len", "pad"]
@@ -117,9 +122,34 @@ def dwt_coeff_len(data_len, filter_len, mode):
     return _dwt_coeff_len(data_len, filter_len, Modes.from_object(mode))
 
 
-def dwt(data, wavelet, mode='symmetric', axis=-1):
+def _as_transform_array(data):
+    """Convert ``data`` to an array of a dtype supported by the transforms.
+
+    float16 is kept: the axis transforms compute it in float32 and store the
+    result as float16.
+    """
+    data = np.asarray(data)
+    if data.dtype == np.float16:
+        return data
+    return np.asarray(data, dtype=_check_dtype(data), order='C')
+
+
+def _check_no_out(out, method):
+    if out is not None:
+        raise ValueError(f"out is not supported with method={method!r}.")
+
+
+def _check_no_workers(workers, method):
+    if _check_workers(workers) > 1:
+        raise ValueError(
+            f"workers > 1 is not supported with method={method!r}.")
+
+
+def dwt(data, wavelet, mode='symmetric', axis=-1, workers=None,
+        method='convolution', out=None):
     """
-    dwt(data, wavelet, mode='symmetric', axis=-1)
+    dwt(data, wavelet, mode='symmetric', axis=-1, workers=None,
+        method='convolution', out=None)
 
     Single level Discrete Wavelet Transform.
 
@@ -134,11 +164,43 @@ def dwt(data, wavelet, mode='symmetric', axis=-1):
     axis: int, optional
         Axis over which to compute the DWT. If not given, the
         last axis is used.
+    workers : int, optional
+        Maximum number of threads to use for the transform. The rows along
+        the transformed axis are split into ``workers`` groups that are
+        processed concurrently. If negative, the value wraps around from
+        ``os.cpu_count()``, so ``-1`` uses all CPUs. The default (None) uses
+        a single thread.
+    method : {'convolution', 'lifting', 'integer'}, optional
+        Algorithm used for the transform.  ``'lifting'`` applies the
+        factorization of the filter bank into lifting steps, which takes
+        fewer arithmetic operations than the convolution with the full
+        filters.  It is available for the ``db``, ``sym``, ``bior`` and
+        ``rbio`` families, and gives the same coefficients up to rounding
+        errors.  Other wavelets, as well as the longest ``db`` filters that
+        cannot be factored accurately, fall back to convolution, and Haar
+        filters always use their dedicated kernel.
+
+        ``'integer'`` computes a reversible integer to integer transform of
+        integer ``data``: the S-transform for ``'haar'`` and the CDF 5/3
+        transform of JPEG 2000 for ``'bior2.2'``.  It requires
+        ``mode='periodization'``.  The coefficients are int32 for inputs of
+        up to 16 bits and int32 inputs, and int64 for uint32 and int64
+        inputs; they grow by a few bits per level, so int32 and int64 inputs
+        that leave no room for it raise a ValueError rather than wrap
+        around.  ``cA`` and ``cD`` are close to the coefficients of the
+        convolution scaled by ``1/sqrt(2)`` and ``sqrt(2)`` respectively.
+        ``workers`` greater than 1 is not supported.
+    out : tuple of two ndarrays, optional
+        Preallocated arrays that receive ``cA`` and ``cD``.  They must have
+        the shape and dtype of the coefficients, be writeable, and not
+        overlap ``data`` or each other; any strides are accepted.  Not
+        supported with ``method='integer'``.
 
     Returns
     -------
     (cA, cD) : tuple
-        Approximation and detail coefficients.
+        Approximation and detail coefficients (the arrays of ``out`` if
+        given).
 
     Notes
     -----
@@ -151,6 +213,10 @@ def dwt(data, wavelet, mode='symmetric', axis=-1):
 
         ``len(cA) == len(cD) == ceil(len(data) / 2)``
 
+    float16 data gives float16 coefficients.  They are computed in float32,
+    converting a slab of the data at a time, so the memory use stays close
+    to that of the float16 arrays.
+
     Examples
     --------
     >>> import pywt
@@ -161,36 +227,53 @@ def dwt(data, wavelet, mode='symmetric', axis=-1):
     array([-0.70710678, -0.70710678, -0.70710678])
 
     """
+    if method == 'integer':
+        _check_no_out(out, method)
+        _check_no_workers(workers, method)
+        return _integer_dwt_axis(data, wavelet, mode, axis)
+
     if not _have_c99_complex and np.iscomplexobj(data):
         data = np.asarray(data)
-        cA_r, cD_r = dwt(data.real, wavelet, mode, axis)
-        cA_i, cD_i = dwt(data.imag, wavelet, mode, axis)
+        if out is not None:
+            # the real and imaginary parts are views of the complex arrays
+            dwt(data.real, wavelet, mode, axis, workers, method,
+                out=tuple(c.real for c in out))
+            dwt(data.imag, wavelet, mode, axis, workers, method,
+                out=tuple(c.imag for c in out))
+            return tuple(out)
+        cA_r, cD_r = dwt(data.real, wavelet, mode, axis, workers, method)
+        cA_i, cD_i = dwt(data.imag, wavelet, mode, axis, workers, method)
         return (cA_r + 1j*cA_i, cD_r + 1j*cD_i)
 
     # accept array_like input; make a copy to ensure a contiguous array
-    dt = _check_dtype(data)
-    data = np.asarray(data, dtype=dt, order='C')
+    data = _as_transform_array(data)
+    dt = data.dtype
     mode = Modes.from_object(mode)
     wavelet = _as_wavelet(wavelet)
+    workers = _check_workers(workers)
+    lifting = _lifting_for_method(method, wavelet, mode)
 
     if axis < 0:
         axis = axis + data.ndim
     if not 0 <= axis < data.ndim:
         raise AxisError("Axis greater than data dimensions")
 
-    if data.ndim == 1:
+    if (data.ndim == 1 and lifting is None and dt != np.float16
+            and out is None):
         cA, cD = dwt_single(data, wavelet, mode)
-        # TODO: Check whether this makes a copy
-        cA, cD = np.asarray(cA, dt), np.asarray(cD, dt)
     else:
-        cA, cD = dwt_axis(data, wavelet, mode, axis=axis)
+        cA, cD = dwt_axis(data, wavelet, mode, axis=axis, workers=workers,
+                          lifting=lifting,
+                          out=None if out is None else tuple(out))
 
     return (cA, cD)
 
 
-def idwt(cA, cD, wavelet, mode='symmetric', axis=-1):
+def idwt(cA, cD, wavelet, mode='symmetric', axis=-1, workers=None,
+         method='convolution', out=None):
     """
-    idwt(cA, cD, wavelet, mode='symmetric', axis=-1)
+    idwt(cA, cD, wavelet, mode='symmetric', axis=-1, workers=None,
+         method='convolution', out=None)
 
     Single level Inverse Discrete Wavelet Transform.
 
@@ -209,11 +292,21 @@ def idwt(cA, cD, wavelet, mode='symmetric', axis=-1):
     axis: int, optional
         Axis over which to compute the inverse DWT. If not given, the
         last axis is used.
+    workers : int, optional
+        Maximum number of threads to use for the transform, see `dwt`.
+    method : {'convolution', 'lifting', 'integer'}, optional
+        Algorithm used for the transform, see `dwt`.  With ``'integer'``,
+        the coefficients of an integer transform are inverted exactly, and
+        the result has the dtype of the coefficients.
+    out : ndarray, optional
+        Preallocated array that receives the reconstruction, with the same
+        requirements as in `dwt`.
 
     Returns
     -------
     rec: array_like
-        Single level reconstruction of signal from given coefficients.
+        Single level reconstruction of signal from given coefficients (``out``
+        if given).
 
     Examples
     --------
@@ -241,6 +334,11 @@ def idwt(cA, cD, wavelet, mode='symmetric', axis=-1):
         raise ValueError("At least one coefficient parameter must be "
                          "specified.")
 
+    if method == 'integer':
+        _check_no_out(out, method)
+        _check_no_workers(workers, method)
+        return _integer_idwt_axis(cA, cD, wavelet, mode, axis)
+
     # for complex inputs: compute real and imaginary separately then combine
     if not _have_c99_complex and (np.iscomplexobj(cA) or np.iscomplexobj(cD)):
         if cA is None:
@@ -249,15 +347,20 @@ def idwt(cA, cD, wavelet, mode='symmetric', axis=-1):
         elif cD is None:
             cA = np.asarray(cA)
             cD = np.zeros_like(cA)
-        return (idwt(cA.real, cD.real, wavelet, mode, axis) +
-                1j*idwt(cA.imag, cD.imag, wavelet, mode, axis))
+        if out is not None:
+            idwt(cA.real, cD.real, wavelet, mode, axis, workers, method,
+                 out=out.real)
+            idwt(cA.imag, cD.imag, wavelet, mode, axis, workers, method,
+                 out=out.imag)
+            return out
+        return (idwt(cA.real, cD.real, wavelet, mode, axis, workers, method) +
+                1j*idwt(cA.imag, cD.imag, wavelet, mode, axis, workers,
+                        method))
 
     if cA is not None:
-        dt = _check_dtype(cA)
-        cA = np.asarray(cA, dtype=dt, order='C')
+        cA = _as_transform_array(cA)
     if cD is not None:
-        dt = _check_dtype(cD)
-        cD = np.asarray(cD, dtype=dt, order='C')
+        cD = _as_transform_array(cD)
 
     if cA is not None and cD is not None:
         if cA.dtype != cD.dtype:
@@ -278,16 +381,22 @@ def idwt(cA, cD, wavelet, mode='symmetric', axis=-1):
 
     mode = Modes.from_object(mode)
     wavelet = _as_wavelet(wavelet)
+    workers = _check_workers(workers)
+    lifting = _lifting_for_method(method, wavelet, mode, inverse=True)
 
     if axis < 0:
         axis = axis + ndim
     if not 0 <= axis < ndim:
         raise AxisError("Axis greater than coefficient dimensions")
 
-    if ndim == 1:
+    if (ndim == 1 and lifting is None and cA.dtype != np.float16
+            and out is None):
         rec = idwt_single(cA, cD, wavelet, mode)
     else:
-        rec = idwt_axis(cA, cD, wavelet, mode, axis=axis)
+        if ndim == 1 and cA.size != cD.size:
+            raise ValueError("Coefficients arrays must have the same size.")
+        rec = idwt_axis(cA, cD, wavelet, mode, axis=axis, workers=workers,
+                        lifting=lifting, out=out)
 
     return rec
 
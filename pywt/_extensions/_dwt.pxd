@@ -1,5 +1,10 @@
+from . cimport c_wt
 from ._pywt cimport Wavelet, cdata_t
 
 
+cdef class LiftingScheme:
+    cdef c_wt.LiftingScheme scheme
+
+
 cpdef upcoef(bint do_rec_a, cdata_t[::1] coeffs, Wavelet wavelet, int level,
              size_t take)
@@ -3,6 +3,14 @@ from . cimport common
 from . cimport c_wt
 from .common cimport pywt_index_t, MODE
 from ._pywt cimport _check_dtype
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+
+import os
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import product
 
 cimport numpy as np
 import numpy as np
@@ -11,6 +19,120 @@ include "config.pxi"
 
 np.import_array()
 
+
+def _simd_levels():
+    """Names of the SIMD kernel levels usable on this CPU, lowest first."""
+    cdef size_t level = 0
+    levels = []
+    while common.simd_level_name(level) != NULL:
+        name = common.simd_level_name(level)
+        if common.simd_supported(name):
+            levels.append(name.decode('ascii'))
+        level += 1
+    return levels
+
+
+def _get_simd_level():
+    """Name of the SIMD kernel level currently used by the convolutions."""
+    return common.simd_selected().decode('ascii')
+
+
+def _set_simd_level(name=None):
+    """Select the SIMD kernel level used by the convolutions.
+
+    ``None`` selects the best level supported by the CPU.  All levels give
+    identical results, this is only meant for testing and benchmarking.
+    """
+    cdef bytes bname = (name or '').encode('ascii')
+    cdef int retval = common.simd_select(bname)
+    if retval == -1:
+        raise ValueError("Unknown SIMD level {!r}, expected one of {}."
+                         .format(name, _simd_levels()))
+    elif retval == -2:
+        raise ValueError("SIMD level {!r} is not supported by this CPU."
+                         .format(name))
+
+
+# The PYWT_SIMD environment variable overrides the automatic selection
+try:
+    _set_simd_level(os.environ.get('PYWT_SIMD'))
+except ValueError as e:
+    warnings.warn("Ignoring PYWT_SIMD: {}".format(e), RuntimeWarning)
+    _set_simd_level()
+
+cdef class LiftingScheme:
+    """Factorization of a filter bank into lifting steps.
+
+    Built by ``pywt._lifting``, which documents the meaning of the
+    parameters, and passed to `dwt_axis` and `idwt_axis`.
+
+    Parameters
+    ----------
+    targets : sequence of int
+        Phase (0 or 1) updated by each step.
+    offsets : sequence of int
+        Delay of the first coefficient of each step.
+    coeffs : sequence of array_like
+        Coefficients of each step.
+    scales : (float, float)
+        Scaling of the two output phases.
+    shifts : (int, int)
+        Delays of the two output phases.
+    parity : int
+        Input phase of an analysis scheme, -1 for a synthesis scheme.
+    """
+    def __cinit__(self, targets, offsets, coeffs, scales, shifts, int parity):
+        cdef size_t i, j, n = 0
+        cdef size_t num_steps = len(targets)
+        cdef const double[::1] c
+
+        coeffs = [np.ascontiguousarray(c, dtype=np.float64).ravel()
+                  for c in coeffs]
+        if len(offsets) != num_steps or len(coeffs) != num_steps:
+            raise ValueError("Expected the same number of targets, offsets "
+                             "and coefficients.")
+        if any(c.size == 0 for c in coeffs):
+            raise ValueError("Lifting steps must have coefficients.")
+        if any(t not in (0, 1) for t in targets) or parity not in (-1, 0, 1):
+            raise ValueError("Phases must be 0 or 1.")
+
+        n = sum(c.size for c in coeffs)
+        self.scheme.target = <int *> PyMem_Malloc((num_steps + 1) * sizeof(int))
+        self.scheme.offset = <pywt_index_t *> PyMem_Malloc(
+            (num_steps + 1) * sizeof(pywt_index_t))
+        self.scheme.length = <size_t *> PyMem_Malloc(
+            (num_steps + 1) * sizeof(size_t))
+        self.scheme.coeffs = <double *> PyMem_Malloc((n + 1) * sizeof(double))
+        if (self.scheme.target == NULL or self.scheme.offset == NULL or
+                self.scheme.length == NULL or self.scheme.coeffs == NULL):
+            raise MemoryError()
+
+        n = 0
+        for i in range(num_steps):
+            c = coeffs[i]
+            self.scheme.target[i] = targets[i]
+            self.scheme.offset[i] = offsets[i]
+            self.scheme.length[i] = c.size
+            for j in range(<size_t> c.size):
+                self.scheme.coeffs[n] = c[j]
+                n += 1
+        self.scheme.num_steps = num_steps
+        for i in range(2):
+            self.scheme.scale[i] = scales[i]
+            self.scheme.shift[i] = shifts[i]
+        self.scheme.parity = parity
+
+    def __dealloc__(self):
+        PyMem_Free(self.scheme.target)
+        PyMem_Free(self.scheme.offset)
+        PyMem_Free(self.scheme.length)
+        PyMem_Free(self.scheme.coeffs)
+
+    @property
+    def num_steps(self):
+        return self.scheme.num_steps
+
+
 cpdef dwt_max_level(size_t data_len, size_t filter_len):
     return common.dwt_max_level(data_len, filter_len)
 
@@ -23,10 +145,16 @@ cpdef dwt_coeff_len(size_t data_len, size_t filter_len, MODE mode):
 
     return common.dwt_buffer_length(data_len, filter_len, mode)
 
+
+cpdef idwt_coeff_len(size_t coeffs_len, size_t filter_len, MODE mode):
+    """Length of the single level reconstruction from ``coeffs_len``
+    coefficients."""
+    return common.idwt_buffer_length(coeffs_len, filter_len, mode)
+
 cpdef dwt_single(const cdata_t[::1] data, Wavelet wavelet, MODE mode):
     cdef size_t output_len = dwt_coeff_len(data.size, wavelet.dec_len, mode)
     cdef np.ndarray cA, cD
-    cdef int retval_a, retval_d
+    cdef int retval
     cdef size_t data_size = data.size
     if output_len < 1:
         raise RuntimeError("Invalid output length.")
@@ -34,151 +162,477 @@ cpdef dwt_single(const cdata_t[::1] data, Wavelet wavelet, MODE mode):
     if data_size == 1 and (mode == MODE.MODE_REFLECT or mode == MODE.MODE_ANTIREFLECT):
         raise ValueError("Input data length must be greater than 1 for [anti]reflect mode.")
 
+    # approximation and detail coefficients are computed in a single pass,
+    # writing every element of the outputs
     if cdata_t is np.float64_t:
-        # TODO: Don't think these have to be 0-initialized
-        # TODO: Check other methods of allocating (e.g. Cython/CPython arrays)
-        cA = np.zeros(output_len, np.float64)
-        cD = np.zeros(output_len, np.float64)
+        cA = np.empty(output_len, np.float64)
+        cD = np.empty(output_len, np.float64)
         with nogil:
-            retval_a = c_wt.double_dec_a(&data[0], data_size, wavelet.w,
-                                <double *>cA.data, output_len, mode)
-            retval_d = c_wt.double_dec_d(&data[0], data_size, wavelet.w,
-                            <double *>cD.data, output_len, mode)
-        if ( retval_a < 0 or retval_d < 0):
+            retval = c_wt.double_dec_ad(&data[0], data_size, wavelet.w,
+                                        <double *>cA.data, <double *>cD.data,
+                                        output_len, mode)
+        if retval < 0:
             raise RuntimeError("C dwt failed.")
     elif cdata_t is np.float32_t:
-        cA = np.zeros(output_len, np.float32)
-        cD = np.zeros(output_len, np.float32)
+        cA = np.empty(output_len, np.float32)
+        cD = np.empty(output_len, np.float32)
         with nogil:
-            retval_a = c_wt.float_dec_a(&data[0], data_size, wavelet.w,
-                               <float *>cA.data, output_len, mode)
-            retval_d = c_wt.float_dec_d(&data[0], data_size, wavelet.w,
-                           <float *>cD.data, output_len, mode)
-        if ( retval_a < 0 or retval_d < 0):
+            retval = c_wt.float_dec_ad(&data[0], data_size, wavelet.w,
+                                       <float *>cA.data, <float *>cD.data,
+                                       output_len, mode)
+        if retval < 0:
             raise RuntimeError("C dwt failed.")
 
     IF HAVE_C99_CPLX:
         if cdata_t is np.complex128_t:
-            cA = np.zeros(output_len, np.complex128)
-            cD = np.zeros(output_len, np.complex128)
+            cA = np.empty(output_len, np.complex128)
+            cD = np.empty(output_len, np.complex128)
             with nogil:
-                retval_a = c_wt.double_complex_dec_a(&data[0], data_size, wavelet.w,
-                                    <double complex *>cA.data, output_len, mode)
-                retval_d = c_wt.double_complex_dec_d(&data[0], data_size, wavelet.w,
-                                <double complex *>cD.data, output_len, mode)
-            if ( retval_a < 0 or retval_d < 0):
+                retval = c_wt.double_complex_dec_ad(&data[0], data_size, wavelet.w,
+                                                    <double complex *>cA.data,
+                                                    <double complex *>cD.data,
+                                                    output_len, mode)
+            if retval < 0:
                 raise RuntimeError("C dwt failed.")
         elif cdata_t is np.complex64_t:
-            cA = np.zeros(output_len, np.complex64)
-            cD = np.zeros(output_len, np.complex64)
+            cA = np.empty(output_len, np.complex64)
+            cD = np.empty(output_len, np.complex64)
             with nogil:
-                retval_a = c_wt.float_complex_dec_a(&data[0], data_size, wavelet.w,
-                                   <float complex *>cA.data, output_len, mode)
-                retval_d = c_wt.float_complex_dec_d(&data[0], data_size, wavelet.w,
-                               <float complex *>cD.data, output_len, mode)
-            if ( retval_a < 0 or retval_d < 0):
+                retval = c_wt.float_complex_dec_ad(&data[0], data_size, wavelet.w,
+                                                   <float complex *>cA.data,
+                                                   <float complex *>cD.data,
+                                                   output_len, mode)
+            if retval < 0:
                 raise RuntimeError("C dwt failed.")
 
     return (cA, cD)
 
 
-cpdef dwt_axis(np.ndarray data, Wavelet wavelet, MODE mode, unsigned int axis=0):
-    # memory-views do not support n-dimensional arrays, use np.ndarray instead
-    cdef common.ArrayInfo data_info, output_info
-    cdef np.ndarray cD, cA
-    # Explicit input_shape necessary to prevent memory leak
-    cdef size_t[::1] input_shape, output_shape
+def _half_slabs(shape, axis, size_t slab_size=1 << 18):
+    """Slices splitting an array of ``shape`` into tiles of at most
+    ``slab_size`` elements, or of a single line along ``axis`` if that is
+    longer.  The tiles span the whole of ``axis`` and are cut along the other
+    axes, the last ones being kept whole where possible.
+
+    float16 arrays are transformed in float32 one tile at a time, so that no
+    float32 copy of the whole array is made.  Lines longer than
+    ``slab_size`` are converted in blocks along ``axis`` instead.
+    """
+    outer = [i for i in range(len(shape)) if i != axis]
+    steps = list(shape)
+    budget = slab_size // max(shape[axis], 1) if outer else 0
+    for i in reversed(outer):
+        steps[i] = max(1, min(shape[i], budget))
+        budget //= max(shape[i], 1)
+    for starts in product(*(range(0, shape[i], steps[i]) for i in outer)):
+        s = [slice(None), ] * len(shape)
+        for i, start in zip(outer, starts):
+            s[i] = slice(start, start + steps[i])
+        yield tuple(s)
+
+
+def _half_blocks(size_t n, size_t block=1 << 16):
+    """Bounds of the blocks of ``n`` outputs converted at a time along the
+    lines that are too long for `_half_slabs` to bound.
+    """
+    return [(i, min(i + block, n)) for i in range(0, n, block)]
+
+
+def _take_line(data, Py_ssize_t start, Py_ssize_t stop, unsigned int axis,
+               Py_ssize_t n_ext=0):
+    """Samples ``start:stop`` of ``data`` along ``axis``, indices outside the
+    line wrapping around ``n_ext`` (its length by default) and being clipped
+    to its last sample.
+    """
+    cdef Py_ssize_t n = data.shape[axis]
+    if 0 <= start and stop <= n:
+        return data[(slice(None), ) * axis + (slice(start, stop), )]
+    idx = np.minimum(np.arange(start, stop) % (n_ext or n), n - 1)
+    return np.take(data, idx, axis)
+
+
+def _dwt_block(Py_ssize_t n, Wavelet wavelet, MODE mode, Py_ssize_t o0,
+               Py_ssize_t o1):
+    """Where coefficients ``o0:o1`` of a line of ``n`` samples come from.
+
+    Returns ``(start, stop, n_ext, mode, keep)``: the coefficients are
+    ``keep`` of the transform in ``mode`` of ``_take_line(data, start, stop,
+    axis, n_ext)``.
+    """
+    cdef Py_ssize_t m = (wavelet.dec_len - 1) // 2
+    cdef Py_ssize_t i0 = 1, n_ext = n
+    if mode == MODE.MODE_PERIODIZATION:
+        i0 = wavelet.dec_len // 2
+        n_ext = n + n % 2
+    q = i0 + 2 * o0 - 2 * m - 1
+    r = i0 + 2 * (o1 - 1) + 1
+    if (mode == MODE.MODE_PERIODIC or mode == MODE.MODE_PERIODIZATION or
+            (q >= 0 and r <= n)):
+        # the samples are taken through the extension of the signal
+        return q, r, n_ext, MODE.MODE_ZEROPAD, slice(m, m + o1 - o0)
+    if q < 0:
+        # enough samples for the extension before the start of the signal
+        stop = min(n, max(r, 2 * wavelet.dec_len))
+        return 0, stop, n_ext, mode, slice(o0, o1)
+    # enough samples for the extension past the end of the signal
+    s0 = max(0, min(q, n - 2 * wavelet.dec_len))
+    s0 -= s0 % 2
+    return s0, n, n_ext, mode, slice(o0 - s0 // 2, o1 - s0 // 2)
+
+
+def _idwt_block(Py_ssize_t n, Wavelet wavelet, MODE mode, Py_ssize_t p0,
+                Py_ssize_t p1):
+    """Where samples ``p0:p1`` reconstructed from lines of ``n`` coefficients
+    come from, for filters of even length.
+
+    Returns ``(start, stop, mode, keep)``: the samples are ``keep`` of the
+    inverse transform in ``mode`` of coefficients ``start:stop``, taken with
+    `_take_line`.
+    """
+    cdef Py_ssize_t F = wavelet.rec_len
+    cdef Py_ssize_t sh = 0
+    if mode == MODE.MODE_PERIODIZATION:
+        sh = F // 2 - 1
+    k0 = (p0 - sh) // 2
+    if mode == MODE.MODE_PERIODIZATION:
+        K = (p1 - 2 * k0 - sh + F - 1) // 2 + 1
+        mode = MODE.MODE_ZEROPAD
+    else:
+        K = min(n - k0, -(-(p1 - 2 * k0 + F - 2) // 2))
+    u0 = p0 - 2 * k0 - sh
+    return k0, k0 + K, mode, slice(u0, u0 + p1 - p0)
+
+
+def _dwt_half_line(data, cA, cD, Wavelet wavelet, MODE mode,
+                   unsigned int axis):
+    """Transform a float16 line in blocks of coefficients, each computed in
+    float32 from the samples it depends on.
+    """
+    lead = (slice(None), ) * axis
+    for o0, o1 in _half_blocks(cA.shape[axis]):
+        start, stop, n_ext, block_mode, keep = _dwt_block(
+            data.shape[axis], wavelet, mode, o0, o1)
+        block = _take_line(data, start, stop, axis, n_ext)
+        a, d = dwt_axis(block.astype(np.float32), wavelet, block_mode, axis)
+        cA[lead + (slice(o0, o1), )] = a[lead + (keep, )]
+        cD[lead + (slice(o0, o1), )] = d[lead + (keep, )]
+
+
+def _idwt_half_line(coefs_a, coefs_d, output, Wavelet wavelet, MODE mode,
+                    unsigned int axis):
+    """Reconstruct a float16 line in blocks of samples, each computed in
+    float32 from the coefficients it depends on.  Returns False, leaving
+    ``output`` untouched, for filters of odd length.
+    """
+    if wavelet.rec_len % 2:
+        return False
+    coefs = coefs_a if coefs_a is not None else coefs_d
+    lead = (slice(None), ) * axis
+    for p0, p1 in _half_blocks(output.shape[axis]):
+        start, stop, block_mode, keep = _idwt_block(
+            coefs.shape[axis], wavelet, mode, p0, p1)
+        a, d = [None if c is None else
+                _take_line(c, start, stop, axis).astype(np.float32)
+                for c in (coefs_a, coefs_d)]
+        y = idwt_axis(a, d, wavelet, block_mode, axis)
+        output[lead + (slice(p0, p1), )] = y[lead + (keep, )]
+    return True
+
+
+def _overlaps(a, b):
+    """Whether arrays ``a`` and ``b`` share any element."""
+    if not np.may_share_memory(a, b):
+        return False
+    try:
+        return np.shares_memory(a, b, max_work=1 << 16)
+    except np.exceptions.TooHardError:
+        return True
+
+
+def _check_out(out, shape, dtype, inputs=()):
+    """Check that ``out`` can hold a transform output of ``shape`` and
+    ``dtype`` without overlapping any of the arrays in ``inputs``.
+
+    Any strides are accepted, as the transforms gather and scatter
+    non-contiguous rows.
+    """
+    if not isinstance(out, np.ndarray):
+        raise TypeError("out must be a numpy array, not {}"
+                        .format(type(out).__name__))
+    if out.shape != tuple(shape):
+        raise ValueError("out has shape {}, expected {}."
+                         .format(out.shape, tuple(shape)))
+    if out.dtype != dtype:
+        raise ValueError("out has dtype {}, expected {}."
+                         .format(out.dtype, np.dtype(dtype)))
+    if not out.flags.writeable:
+        raise ValueError("out must be writeable.")
+    if not out.flags.aligned:
+        raise ValueError("out must be aligned.")
+    if any(s == 0 and n > 1 for s, n in zip(out.strides, out.shape)):
+        raise ValueError("out must not have zero strides.")
+    for x in inputs:
+        if x is not None and _overlaps(out, x):
+            raise ValueError("out must not overlap the input or other "
+                             "outputs.")
+    return out
+
+
+# thread pool shared by all transforms, grown to the largest number of
+# workers requested so far
+_executor = None
+_executor_size = 0
+_executor_lock = threading.Lock()
+
+
+def _get_executor(int size):
+    """The shared thread pool, with at least ``size`` threads."""
+    global _executor, _executor_size
+    with _executor_lock:
+        if _executor_size < size:
+            # a smaller pool is not shut down, as other calls may still be
+            # submitting to it; its threads exit once it is collected
+            _executor = ThreadPoolExecutor(max_workers=size,
+                                           thread_name_prefix='pywt')
+            _executor_size = size
+        return _executor
+
+
+def _reset_executor():
+    # a forked child does not inherit the threads of the pool
+    global _executor, _executor_size, _executor_lock
+    _executor = None
+    _executor_size = 0
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_executor)
+
+
+def _run_rows(func, size_t num_rows, int workers):
+    """Call ``func(row_start, row_stop)`` over ``num_rows`` rows.
+
+    The rows are split into ``workers`` contiguous ranges that are processed
+    concurrently by the calling thread and the shared thread pool.  ``func``
+    must release the GIL for this to give any speedup.
+    """
+    cdef size_t n
+    if workers > 1 and <size_t>workers > num_rows:
+        workers = num_rows
+    if workers <= 1:
+        func(0, num_rows)
+        return
+    bounds = [(num_rows * n) // workers for n in range(workers + 1)]
+    executor = _get_executor(workers - 1)
+    jobs = [executor.submit(func, row_start, row_stop)
+            for row_start, row_stop in zip(bounds[1:-1], bounds[2:])]
+    func(bounds[0], bounds[1])
+    for job in jobs:
+        job.result()
+
+
+def _dwt_axis_rows(np.ndarray data, np.ndarray cA, np.ndarray cD,
+                   Wavelet wavelet, MODE mode, unsigned int axis,
+                   LiftingScheme lifting, size_t row_start, size_t row_stop):
+    cdef common.ArrayInfo data_info, a_info, d_info
+    cdef c_wt.LiftingScheme *lifting_p = NULL
     cdef int retval = -5
 
-
-    if data.shape[axis] == 1 and (mode == MODE.MODE_REFLECT or mode == MODE.MODE_ANTIREFLECT):
-        raise ValueError("Input data length must be greater than 1 for [anti]reflect mode along the transformed axis.")
-
-    data = data.astype(_check_dtype(data), copy=False)
-
-    input_shape = <size_t [:data.ndim]> <size_t *> data.shape
-    output_shape = input_shape.copy()
-    output_shape[axis] = dwt_coeff_len(data.shape[axis], wavelet.dec_len, mode)
-
-    cA = np.empty(output_shape, data.dtype)
-    cD = np.empty(output_shape, data.dtype)
+    if lifting is not None:
+        lifting_p = &lifting.scheme
 
     data_info.ndim = data.ndim
     data_info.strides = <pywt_index_t *> data.strides
     data_info.shape = <size_t *> data.shape
 
-    output_info.ndim = cA.ndim
-    output_info.strides = <pywt_index_t *> cA.strides
-    output_info.shape = <size_t *> cA.shape
+    a_info.ndim = cA.ndim
+    a_info.strides = <pywt_index_t *> cA.strides
+    a_info.shape = <size_t *> cA.shape
 
+    d_info.ndim = cD.ndim
+    d_info.strides = <pywt_index_t *> cD.strides
+    d_info.shape = <size_t *> cD.shape
+
+    # cA and cD are computed together, reading each input row only once
     if data.dtype == np.float64:
         with nogil:
-            retval = c_wt.double_downcoef_axis(<double *> data.data, data_info,
-                                         <double *> cA.data, output_info,
-                                         wavelet.w, axis, common.COEF_APPROX, mode,
-                                         0, common.DWT_TRANSFORM)
-        if retval:
-            raise RuntimeError("C wavelet transform failed")
-        with nogil:
-            retval = c_wt.double_downcoef_axis(<double *> data.data, data_info,
-                                     <double *> cD.data, output_info,
-                                     wavelet.w, axis, common.COEF_DETAIL, mode,
-                                     0, common.DWT_TRANSFORM)
+            retval = c_wt.double_dwt_axis_rows(<double *> data.data, data_info,
+                                               <double *> cA.data, a_info,
+                                               <double *> cD.data, d_info,
+                                               wavelet.w, axis, mode,
+                                               row_start, row_stop, lifting_p)
         if retval:
             raise RuntimeError("C wavelet transform failed")
     elif data.dtype == np.float32:
         with nogil:
-            retval = c_wt.float_downcoef_axis(<float *> data.data, data_info,
-                                    <float *> cA.data, output_info,
-                                    wavelet.w, axis, common.COEF_APPROX, mode,
-                                    0, common.DWT_TRANSFORM)
-        if retval:
-            raise RuntimeError("C wavelet transform failed")
-        with nogil:
-            retval = c_wt.float_downcoef_axis(<float *> data.data, data_info,
-                                    <float *> cD.data, output_info,
-                                    wavelet.w, axis, common.COEF_DETAIL, mode,
-                                    0, common.DWT_TRANSFORM)
+            retval = c_wt.float_dwt_axis_rows(<float *> data.data, data_info,
+                                              <float *> cA.data, a_info,
+                                              <float *> cD.data, d_info,
+                                              wavelet.w, axis, mode,
+                                              row_start, row_stop, lifting_p)
         if retval:
             raise RuntimeError("C wavelet transform failed")
     IF HAVE_C99_CPLX:
         if data.dtype == np.complex64:
             with nogil:
-                retval = c_wt.float_complex_downcoef_axis(<float complex *> data.data, data_info,
-                                        <float complex *> cA.data, output_info,
-                                        wavelet.w, axis, common.COEF_APPROX, mode,
-                                        0, common.DWT_TRANSFORM)
-            if retval:
-                raise RuntimeError("C wavelet transform failed")
-            with nogil:
-                retval = c_wt.float_complex_downcoef_axis(<float complex *> data.data, data_info,
-                                        <float complex *> cD.data, output_info,
-                                        wavelet.w, axis, common.COEF_DETAIL, mode,
-                                        0, common.DWT_TRANSFORM)
+                retval = c_wt.float_complex_dwt_axis_rows(<float complex *> data.data, data_info,
+                                                          <float complex *> cA.data, a_info,
+                                                          <float complex *> cD.data, d_info,
+                                                          wavelet.w, axis, mode,
+                                                          row_start, row_stop, lifting_p)
             if retval:
                 raise RuntimeError("C wavelet transform failed")
         elif data.dtype == np.complex128:
             with nogil:
-                retval = c_wt.double_complex_downcoef_axis(<double complex *> data.data, data_info,
-                                             <double complex *> cA.data, output_info,
-                                             wavelet.w, axis, common.COEF_APPROX, mode,
-                                             0, common.DWT_TRANSFORM)
-            if retval:
-                raise RuntimeError("C wavelet transform failed")
-            with nogil:
-                retval = c_wt.double_complex_downcoef_axis(<double complex *> data.data, data_info,
-                                         <double complex *> cD.data, output_info,
-                                         wavelet.w, axis, common.COEF_DETAIL, mode,
-                                         0, common.DWT_TRANSFORM)
+                retval = c_wt.double_complex_dwt_axis_rows(<double complex *> data.data, data_info,
+                                                           <double complex *> cA.data, a_info,
+                                                           <double complex *> cD.data, d_info,
+                                                           wavelet.w, axis, mode,
+                                                           row_start, row_stop, lifting_p)
             if retval:
                 raise RuntimeError("C wavelet transform failed")
 
     if retval == -5:
         raise TypeError("Array must be floating point, not {}"
                         .format(data.dtype))
+
+
+def _dwt_outputs(out, shape, dtype, data):
+    """``cA`` and ``cD`` arrays of ``shape``: new ones, or the validated
+    pair of arrays ``out``."""
+    if out is None:
+        return np.empty(shape, dtype), np.empty(shape, dtype)
+    if len(out) != 2:
+        raise ValueError("out must be a pair of arrays (cA, cD).")
+    cA = _check_out(out[0], shape, dtype, (data, ))
+    cD = _check_out(out[1], shape, dtype, (data, cA))
+    return cA, cD
+
+
+cpdef dwt_axis(np.ndarray data, Wavelet wavelet, MODE mode, unsigned int axis=0,
+               int workers=1, LiftingScheme lifting=None, tuple out=None):
+    # memory-views do not support n-dimensional arrays, use np.ndarray instead
+    cdef np.ndarray cD, cA
+    # Explicit input_shape necessary to prevent memory leak
+    cdef size_t[::1] input_shape, output_shape
+    cdef size_t num_rows
+
+    if data.shape[axis] == 1 and (mode == MODE.MODE_REFLECT or mode == MODE.MODE_ANTIREFLECT):
+        raise ValueError("Input data length must be greater than 1 for [anti]reflect mode along the transformed axis.")
+
+    if data.dtype == np.float16:
+        # stored as float16, transformed in float32 one tile at a time
+        shape = list(np.shape(data))
+        shape[axis] = dwt_coeff_len(data.shape[axis], wavelet.dec_len, mode)
+        cA, cD = _dwt_outputs(out, shape, np.dtype(np.float16), data)
+        for s in _half_slabs(np.shape(data), axis):
+            if data.shape[axis] > 1 << 18:
+                _dwt_half_line(data[s], cA[s], cD[s], wavelet, mode, axis)
+                continue
+            cA[s], cD[s] = dwt_axis(data[s].astype(np.float32), wavelet, mode,
+                                    axis, workers, lifting)
+        return (cA, cD)
+
+    data = data.astype(_check_dtype(data), copy=False)
+
+    input_shape = <size_t [:data.ndim]> <size_t *> data.shape
+    output_shape = input_shape.copy()
+    output_shape[axis] = dwt_coeff_len(data.shape[axis], wavelet.dec_len, mode)
+
+    cA, cD = _dwt_outputs(out, output_shape, data.dtype, data)
+
+    num_rows = cA.size // output_shape[axis]
+    _run_rows(partial(_dwt_axis_rows, data, cA, cD, wavelet, mode, axis,
+                      lifting),
+              num_rows, workers)
     return (cA, cD)
 
 
+def _wavedec_batch_rows(const cdata_t[::1] data, const np.int64_t[::1] offsets,
+                        cdata_t[::1] coeffs,
+                        const np.int64_t[:, ::1] coeff_offsets,
+                        Wavelet wavelet, MODE mode, size_t level,
+                        size_t row_start, size_t row_stop):
+    """Multilevel decomposition of the signals ``row_start:row_stop`` of a
+    packed batch, see `wavedec_batch`."""
+    cdef size_t i, m, n, n_out, scratch_len = 0
+    cdef int retval = 0
+    cdef const cdata_t *x
+    cdef cdata_t *cA
+    cdef cdata_t *scratch
+
+    for i in range(row_start, row_stop):
+        if level > 1:
+            # the approximation of level 1 has the length of cD1
+            scratch_len = max(scratch_len, <size_t>(
+                coeff_offsets[i, level + 1] - coeff_offsets[i, level]))
+    # the approximations of the intermediate levels alternate between the
+    # two halves of the scratch buffer
+    scratch = <cdata_t *>PyMem_Malloc(2 * scratch_len * sizeof(cdata_t) + 1)
+    if scratch == NULL:
+        raise MemoryError("Failed to allocate memory for the batch.")
+
+    try:
+        with nogil:
+            for i in range(row_start, row_stop):
+                x = &data[offsets[i]]
+                n = offsets[i + 1] - offsets[i]
+                if level == 0:
+                    for m in range(n):
+                        coeffs[coeff_offsets[i, 0] + m] = x[m]
+                    continue
+                for m in range(1, level + 1):
+                    # cD of level m is entry level - m + 1 of the result
+                    n_out = (coeff_offsets[i, level - m + 2] -
+                             coeff_offsets[i, level - m + 1])
+                    if m == level:
+                        cA = &coeffs[coeff_offsets[i, 0]]
+                    else:
+                        cA = scratch + (m % 2) * scratch_len
+                    if cdata_t is np.float64_t:
+                        retval = c_wt.double_dec_ad(
+                            x, n, wavelet.w, cA,
+                            &coeffs[coeff_offsets[i, level - m + 1]],
+                            n_out, mode)
+                    elif cdata_t is np.float32_t:
+                        retval = c_wt.float_dec_ad(
+                            x, n, wavelet.w, cA,
+                            &coeffs[coeff_offsets[i, level - m + 1]],
+                            n_out, mode)
+                    IF HAVE_C99_CPLX:
+                        if cdata_t is np.complex128_t:
+                            retval = c_wt.double_complex_dec_ad(
+                                x, n, wavelet.w, cA,
+                                &coeffs[coeff_offsets[i, level - m + 1]],
+                                n_out, mode)
+                        elif cdata_t is np.complex64_t:
+                            retval = c_wt.float_complex_dec_ad(
+                                x, n, wavelet.w, cA,
+                                &coeffs[coeff_offsets[i, level - m + 1]],
+                                n_out, mode)
+                    if retval < 0:
+                        break
+                    x = cA
+                    n = n_out
+                if retval < 0:
+                    break
+    finally:
+        PyMem_Free(scratch)
+    if retval < 0:
+        raise RuntimeError("C dwt failed.")
+
+
+def wavedec_batch_packed(np.ndarray data, np.ndarray offsets,
+                         np.ndarray coeffs, np.ndarray coeff_offsets,
+                         Wavelet wavelet, MODE mode, size_t level,
+                         int workers=1):
+    """Fill ``coeffs`` with the decompositions of a packed batch, the
+    signals being split among ``workers`` threads."""
+    _run_rows(partial(_wavedec_batch_rows, data, offsets, coeffs,
+                      coeff_offsets, wavelet, mode, level),
+              offsets.shape[0] - 1, workers)
+
 cpdef idwt_single(np.ndarray cA, np.ndarray cD, Wavelet wavelet, MODE mode):
     cdef size_t input_len, rec_len
     cdef int retval
@@ -243,89 +697,72 @@ cpdef idwt_single(np.ndarray cA, np.ndarray cD, Wavelet wavelet, MODE mode):
     return rec
 
 
-cpdef idwt_axis(np.ndarray coefs_a, np.ndarray coefs_d,
-                Wavelet wavelet, MODE mode, unsigned int axis=0):
+def _idwt_axis_rows(np.ndarray coefs_a, np.ndarray coefs_d, np.ndarray output,
+                    Wavelet wavelet, MODE mode, unsigned int axis,
+                    LiftingScheme lifting, size_t row_start, size_t row_stop):
     cdef common.ArrayInfo a_info, d_info, output_info
     cdef common.ArrayInfo *a_info_p = NULL
     cdef common.ArrayInfo *d_info_p = NULL
-    cdef np.ndarray output
-    cdef np.dtype output_dtype
+    cdef c_wt.LiftingScheme *lifting_p = NULL
     cdef void *data_a = NULL
     cdef void *data_d = NULL
-    # Explicit input_shape necessary to prevent memory leak
-    cdef size_t[::1] input_shape, output_shape
     cdef int retval = -5
 
     if coefs_a is not None:
-        if coefs_d is not None and coefs_d.dtype.itemsize > coefs_a.dtype.itemsize:
-            coefs_a = coefs_a.astype(_check_dtype(coefs_d), copy=False)
-        else:
-            coefs_a = coefs_a.astype(_check_dtype(coefs_a), copy=False)
         a_info.ndim = coefs_a.ndim
         a_info.strides = <pywt_index_t *> coefs_a.strides
         a_info.shape = <size_t *> coefs_a.shape
         a_info_p = &a_info
         data_a = <void *> coefs_a.data
     if coefs_d is not None:
-        if coefs_a is not None and coefs_a.dtype.itemsize > coefs_d.dtype.itemsize:
-            coefs_d = coefs_d.astype(_check_dtype(coefs_a), copy=False)
-        else:
-            coefs_d = coefs_d.astype(_check_dtype(coefs_d), copy=False)
         d_info.ndim = coefs_d.ndim
         d_info.strides = <pywt_index_t *> coefs_d.strides
         d_info.shape = <size_t *> coefs_d.shape
         d_info_p = &d_info
         data_d = <void *> coefs_d.data
 
-    if coefs_a is not None:
-        input_shape = <size_t [:coefs_a.ndim]> <size_t *> coefs_a.shape
-        output_dtype = coefs_a.dtype
-    elif coefs_d is not None:
-        input_shape = <size_t [:coefs_d.ndim]> <size_t *> coefs_d.shape
-        output_dtype = coefs_d.dtype
-    else:
-        return None
-
-    output_shape = input_shape.copy()
-    output_shape[axis] = common.idwt_buffer_length(input_shape[axis],
-                                                   wavelet.rec_len, mode)
-    output = np.empty(output_shape, output_dtype)
-
     output_info.ndim = output.ndim
     output_info.strides = <pywt_index_t *> output.strides
     output_info.shape = <size_t *> output.shape
 
+    if lifting is not None:
+        lifting_p = &lifting.scheme
+
     if output.dtype == np.float64:
         with nogil:
-            retval = c_wt.double_idwt_axis(<double *> data_a, a_info_p,
+            retval = c_wt.double_idwt_axis_rows(<double *> data_a, a_info_p,
                                  <double *> data_d, d_info_p,
                                  <double *> output.data, output_info,
-                                 wavelet.w, axis, mode)
+                                 wavelet.w, axis, mode,
+                                 row_start, row_stop, lifting_p)
         if retval:
             raise RuntimeError("C inverse wavelet transform failed")
     elif output.dtype == np.float32:
         with nogil:
-            retval = c_wt.float_idwt_axis(<float *> data_a, a_info_p,
+            retval = c_wt.float_idwt_axis_rows(<float *> data_a, a_info_p,
                                 <float *> data_d, d_info_p,
                                 <float *> output.data, output_info,
-                                wavelet.w, axis, mode)
+                                wavelet.w, axis, mode,
+                                row_start, row_stop, lifting_p)
         if retval:
             raise RuntimeError("C inverse wavelet transform failed")
     IF HAVE_C99_CPLX:
         if output.dtype == np.complex128:
             with nogil:
-                retval = c_wt.double_complex_idwt_axis(<double complex *> data_a, a_info_p,
+                retval = c_wt.double_complex_idwt_axis_rows(<double complex *> data_a, a_info_p,
                                      <double complex *> data_d, d_info_p,
                                      <double complex *> output.data, output_info,
-                                     wavelet.w, axis, mode)
+                                     wavelet.w, axis, mode,
+                                     row_start, row_stop, lifting_p)
             if retval:
                 raise RuntimeError("C inverse wavelet transform failed")
         elif output.dtype == np.complex64:
             with nogil:
-                retval = c_wt.float_complex_idwt_axis(<float complex *> data_a, a_info_p,
+                retval = c_wt.float_complex_idwt_axis_rows(<float complex *> data_a, a_info_p,
                                     <float complex *> data_d, d_info_p,
                                     <float complex *> output.data, output_info,
-                                    wavelet.w, axis, mode)
+                                    wavelet.w, axis, mode,
+                                    row_start, row_stop, lifting_p)
             if retval:
                 raise RuntimeError("C inverse wavelet transform failed")
 
@@ -333,9 +770,85 @@ cpdef idwt_axis(np.ndarray coefs_a, np.ndarray coefs_d,
         raise TypeError("Array must be floating point, not {}"
                         .format(output.dtype))
 
+
+cpdef idwt_axis(np.ndarray coefs_a, np.ndarray coefs_d,
+                Wavelet wavelet, MODE mode, unsigned int axis=0,
+                int workers=1, LiftingScheme lifting=None, np.ndarray out=None):
+    cdef np.ndarray output
+    cdef np.dtype output_dtype
+    # Explicit input_shape necessary to prevent memory leak
+    cdef size_t[::1] input_shape, output_shape
+    cdef size_t num_rows
+
+    coefs = coefs_a if coefs_a is not None else coefs_d
+    if (coefs is not None and coefs.dtype == np.float16 and
+            (coefs_d is None or coefs_d.dtype == np.float16)):
+        # stored as float16, transformed in float32 one tile at a time
+        shape = list(np.shape(coefs))
+        shape[axis] = common.idwt_buffer_length(shape[axis], wavelet.rec_len,
+                                                mode)
+        if out is None:
+            output = np.empty(shape, np.float16)
+        else:
+            output = _check_out(out, shape, np.float16, (coefs_a, coefs_d))
+        for s in _half_slabs(np.shape(coefs), axis):
+            if coefs.shape[axis] > 1 << 18 and _idwt_half_line(
+                    None if coefs_a is None else coefs_a[s],
+                    None if coefs_d is None else coefs_d[s],
+                    output[s], wavelet, mode, axis):
+                continue
+            output[s] = idwt_axis(
+                None if coefs_a is None else coefs_a[s].astype(np.float32),
+                None if coefs_d is None else coefs_d[s].astype(np.float32),
+                wavelet, mode, axis, workers, lifting)
+        return output
+
+    if coefs_a is not None:
+        if coefs_d is not None and coefs_d.dtype.itemsize > coefs_a.dtype.itemsize:
+            coefs_a = coefs_a.astype(_check_dtype(coefs_d), copy=False)
+        else:
+            coefs_a = coefs_a.astype(_check_dtype(coefs_a), copy=False)
+    if coefs_d is not None:
+        if coefs_a is not None and coefs_a.dtype.itemsize > coefs_d.dtype.itemsize:
+            coefs_d = coefs_d.astype(_check_dtype(coefs_a), copy=False)
+        else:
+            coefs_d = coefs_d.astype(_check_dtype(coefs_d), copy=False)
+
+    if coefs_a is not None:
+        input_shape = <size_t [:coefs_a.ndim]> <size_t *> coefs_a.shape
+        output_dtype = coefs_a.dtype
+    elif coefs_d is not None:
+        input_shape = <size_t [:coefs_d.ndim]> <size_t *> coefs_d.shape
+        output_dtype = coefs_d.dtype
+    else:
+        return None
+
+    output_shape = input_shape.copy()
+    output_shape[axis] = common.idwt_buffer_length(input_shape[axis],
+                                                   wavelet.rec_len, mode)
+    if out is None:
+        output = np.empty(output_shape, output_dtype)
+    else:
+        output = _check_out(out, output_shape, output_dtype,
+                            (coefs_a, coefs_d))
+
+    num_rows = output.size // output_shape[axis] if output_shape[axis] else 0
+    _run_rows(partial(_idwt_axis_rows, coefs_a, coefs_d, output, wavelet,
+                      mode, axis, lifting),
+              num_rows, workers)
     return output
 
 
+def _scratch_views(shapes, dtype):
+    """Views of ``shapes`` into one scratch allocation, consecutive views
+    alternating between its two halves."""
+    sizes = [int(np.prod(shape)) for shape in shapes]
+    even = max(sizes[0::2], default=0)
+    scratch = np.empty(even + max(sizes[1::2], default=0), dtype)
+    return [scratch[(j % 2) * even:(j % 2) * even + size].reshape(shape)
+            for j, (shape, size) in enumerate(zip(shapes, sizes))]
+
+
 cpdef upcoef(bint do_rec_a, cdata_t[::1] coeffs, Wavelet wavelet, int level,
              size_t take):
     cdef cdata_t[::1] rec
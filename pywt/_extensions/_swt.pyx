@@ -9,12 +9,19 @@ cimport numpy as np
 
 from .common cimport pywt_index_t
 from ._pywt cimport c_wavelet_from_object, cdata_t, Wavelet, _check_dtype
+from ._dwt import _check_out, _half_blocks, _half_slabs, _take_line
 
 include "config.pxi"
 
 np.import_array()
 
 
+def _is_haar(Wavelet wavelet):
+    """Whether the filters of ``wavelet`` are those of the Haar wavelet, up to
+    the scaling of the lowpass and highpass channels."""
+    return bool(c_wt.is_haar(wavelet.w))
+
+
 def swt_max_level(size_t input_len):
     """
     swt_max_level(input_len)
@@ -34,280 +41,332 @@ def swt_max_level(size_t input_len):
 
     Notes
     -----
-    For the current implementation of the stationary wavelet transform, this
-    corresponds to the number of times ``input_len`` is evenly divisible by
-    two. In other words, for an n-level transform, the signal length must be a
-    multiple of ``2**n``. ``numpy.pad`` can be used to pad a signal up to an
-    appropriate length as needed.
+    This corresponds to the number of times ``input_len`` is evenly divisible
+    by two, i.e. the highest level ``n`` for which the signal length is a
+    multiple of ``2**n``. It is the default number of levels of `swt`,
+    `swt2` and `swtn`. Higher levels, up to ``floor(log2(input_len))``, can be
+    requested explicitly for signals of any length.
     """
     if input_len < 1:
         raise ValueError("Cannot apply swt to a size 0 signal.")
     max_level = common.swt_max_level(input_len)
     if max_level == 0:
         warnings.warn(
-            "No levels of stationary wavelet decomposition are possible. The "
-            "signal to be transformed must have a size that is a multiple "
-            "of 2**n for an n-level decomposition.")
+            "The signal length is not a multiple of 2, so swt_max_level is 0. "
+            "Levels up to floor(log2(input_len)) can still be requested "
+            "explicitly.")
     return max_level
 
 
-def swt(cdata_t[::1] data, Wavelet wavelet, size_t level, size_t start_level,
-        bool trim_approx=False):
-    cdef cdata_t[::1] cA, cD
-    cdef Wavelet w
-    cdef int retval
-    cdef size_t end_level = start_level + level
-    cdef size_t data_size, output_len, i
+cdef size_t _swt_level_limit(size_t input_len):
+    """The highest level of the SWT of a signal of length ``input_len``, the
+    largest ``n`` with ``2**n <= input_len``.  The transform is circular, so
+    the length need not be a multiple of ``2**n``."""
+    cdef size_t n = 0
+    while input_len >> (n + 1):
+        n += 1
+    return n
+
+
+_too_short = ("The signal is too short for a stationary wavelet transform: "
+              "at least 2 samples are needed along each transformed axis.")
 
-    if data.size % 2:
-        raise ValueError("Length of data must be even.")
-    if data.size < 1:
-        raise ValueError("Data must have non-zero size")
 
+def _default_level(size_t input_len):
+    """The default level of `swt`: `swt_max_level`, or the highest level
+    possible when the length is not a multiple of 2."""
+    cdef size_t level
+    if input_len < 1:
+        raise ValueError("Cannot apply swt to a size 0 signal.")
+    level = common.swt_max_level(input_len)
+    if level == 0:
+        level = _swt_level_limit(input_len)
+    if level == 0:
+        raise ValueError(_too_short)
+    return level
+
+
+def _check_levels(size_t input_len, size_t level, size_t start_level):
     if level < 1:
         raise ValueError("Level value must be greater than zero.")
-    if start_level >= common.swt_max_level(data.size):
+    if _swt_level_limit(input_len) == 0:
+        raise ValueError(_too_short)
+    if start_level >= _swt_level_limit(input_len):
         raise ValueError("start_level must be less than %d." %
-                         common.swt_max_level(data.size))
-
-    if end_level > common.swt_max_level(data.size):
+                         _swt_level_limit(input_len))
+    if start_level + level > _swt_level_limit(input_len):
         msg = ("Level value too high (max level for current data size and "
                "start_level is %d)." % (
-                common.swt_max_level(data.size) - start_level))
+                _swt_level_limit(input_len) - start_level))
         raise ValueError(msg)
 
 
-    output_len = common.swt_buffer_length(data.size)
-    if output_len < 1:
-        raise RuntimeError("Invalid output length.")
+def swt(cdata_t[::1] data, Wavelet wavelet, size_t level, size_t start_level,
+        bool trim_approx=False):
+    if data.size < 1:
+        raise ValueError("Data must have non-zero size")
+    _check_levels(data.size, level, start_level)
+
+    return _swt_levels(np.asarray(data), wavelet, level, start_level, 0,
+                       trim_approx)
+
 
-    ret = []
-    for i in range(start_level+1, end_level+1):
-        data_size = data.size
-        # alloc memory, decompose D
-        if cdata_t is np.float64_t:
-            cD = np.zeros(output_len, dtype=np.float64)
+cdef _swt_levels_axis(np.ndarray data, np.ndarray coefs_a,
+                      np.ndarray coefs_d, Wavelet wavelet, unsigned int axis,
+                      size_t first_level, size_t level):
+    """Levels ``first_level, ..., first_level + level - 1`` of the SWT along
+    ``axis``, with the details of each level in ``coefs_d`` (finest first)
+    and the approximations in ``coefs_a``, which holds either all levels or
+    the last one only."""
+    cdef common.ArrayInfo data_info, a_info, d_info
+    cdef int retval = -5
+
+    data_info.ndim = data.ndim
+    data_info.strides = <pywt_index_t *> data.strides
+    data_info.shape = <size_t *> data.shape
+    a_info.ndim = coefs_a.ndim
+    a_info.strides = <pywt_index_t *> coefs_a.strides
+    a_info.shape = <size_t *> coefs_a.shape
+    d_info.ndim = coefs_d.ndim
+    d_info.strides = <pywt_index_t *> coefs_d.strides
+    d_info.shape = <size_t *> coefs_d.shape
+
+    if data.dtype == np.float64:
+        with nogil:
+            retval = c_wt.double_swt_levels_axis(
+                <double *> data.data, data_info,
+                <double *> coefs_a.data, a_info,
+                <double *> coefs_d.data, d_info,
+                wavelet.w, axis, first_level, level)
+    elif data.dtype == np.float32:
+        with nogil:
+            retval = c_wt.float_swt_levels_axis(
+                <float *> data.data, data_info,
+                <float *> coefs_a.data, a_info,
+                <float *> coefs_d.data, d_info,
+                wavelet.w, axis, first_level, level)
+    IF HAVE_C99_CPLX:
+        if data.dtype == np.complex128:
             with nogil:
-                retval = c_wt.double_swt_d(&data[0], data_size, wavelet.w,
-                                 &cD[0], output_len, i)
-            if retval < 0:
-                raise RuntimeError("C swt failed.")
-        elif cdata_t is np.float32_t:
-            cD = np.zeros(output_len, dtype=np.float32)
+                retval = c_wt.double_complex_swt_levels_axis(
+                    <double complex *> data.data, data_info,
+                    <double complex *> coefs_a.data, a_info,
+                    <double complex *> coefs_d.data, d_info,
+                    wavelet.w, axis, first_level, level)
+        elif data.dtype == np.complex64:
             with nogil:
-                retval = c_wt.float_swt_d(&data[0], data_size, wavelet.w,
-                                &cD[0], output_len, i)
-            if retval < 0:
-                raise RuntimeError("C swt failed.")
-        IF HAVE_C99_CPLX:
-            if cdata_t is np.complex128_t:
-                cD = np.zeros(output_len, dtype=np.complex128)
-                with nogil:
-                    retval = c_wt.double_complex_swt_d(&data[0], data_size, wavelet.w,
-                                     &cD[0], output_len, i)
-                if retval < 0:
-                    raise RuntimeError("C swt failed.")
-            elif cdata_t is np.complex64_t:
-                cD = np.zeros(output_len, dtype=np.complex64)
-                with nogil:
-                    retval = c_wt.float_complex_swt_d(&data[0], data_size, wavelet.w,
-                                    &cD[0], output_len, i)
-                if retval < 0:
-                    raise RuntimeError("C swt failed.")
-
-        # alloc memory, decompose A
-        if cdata_t is np.float64_t:
-            cA = np.zeros(output_len, dtype=np.float64)
+                retval = c_wt.float_complex_swt_levels_axis(
+                    <float complex *> data.data, data_info,
+                    <float complex *> coefs_a.data, a_info,
+                    <float complex *> coefs_d.data, d_info,
+                    wavelet.w, axis, first_level, level)
+    if retval == -5:
+        raise TypeError("Array must be floating point, not {}"
+                        .format(data.dtype))
+    if retval:
+        raise RuntimeError(
+            "C wavelet transform failed with error code %d" % retval)
+
+
+def _swt_window(np.ndarray buffer, Wavelet wavelet, unsigned int level,
+                size_t start, size_t count):
+    """The approximation and detail coefficients of level ``level`` at the
+    ``count`` positions from ``start`` on, of the rows of the C-contiguous
+    2D ``buffer``, each of which is taken as circular.  The coefficients are
+    returned in one array of shape ``(2, buffer.shape[0], count)``."""
+    cdef np.ndarray coefs
+    cdef void *coefs_a
+    cdef void *coefs_d
+    cdef size_t num_rows, n
+    cdef int retval = -5
+
+    if buffer.ndim != 2 or not buffer.flags.c_contiguous:
+        raise ValueError("buffer must be a C-contiguous 2D array.")
+    num_rows = buffer.shape[0]
+    n = buffer.shape[1]
+    coefs = np.empty((2, num_rows, count), dtype=buffer.dtype)
+    if num_rows == 0 or count == 0:
+        return coefs
+    coefs_a = <void *> coefs.data
+    coefs_d = <void *> (coefs.data + coefs.strides[0])
+
+    if buffer.dtype == np.float64:
+        with nogil:
+            retval = c_wt.double_swt_window(
+                <double *> buffer.data, num_rows, n, wavelet.w, level, start,
+                count, <double *> coefs_a, <double *> coefs_d)
+    elif buffer.dtype == np.float32:
+        with nogil:
+            retval = c_wt.float_swt_window(
+                <float *> buffer.data, num_rows, n, wavelet.w, level, start,
+                count, <float *> coefs_a, <float *> coefs_d)
+    IF HAVE_C99_CPLX:
+        if buffer.dtype == np.complex128:
             with nogil:
-                retval = c_wt.double_swt_a(&data[0], data_size, wavelet.w,
-                                 &cA[0], output_len, i)
-            if retval < 0:
-                raise RuntimeError("C swt failed.")
-        elif cdata_t is np.float32_t:
-            cA = np.zeros(output_len, dtype=np.float32)
+                retval = c_wt.double_complex_swt_window(
+                    <double complex *> buffer.data, num_rows, n, wavelet.w,
+                    level, start, count, <double complex *> coefs_a,
+                    <double complex *> coefs_d)
+        elif buffer.dtype == np.complex64:
             with nogil:
-                retval = c_wt.float_swt_a(&data[0], data_size, wavelet.w,
-                                &cA[0], output_len, i)
-            if retval < 0:
-                raise RuntimeError("C swt failed.")
-        IF HAVE_C99_CPLX:
-            if cdata_t is np.complex128_t:
-                cA = np.zeros(output_len, dtype=np.complex128)
-                with nogil:
-                    retval = c_wt.double_complex_swt_a(&data[0], data_size, wavelet.w,
-                                     &cA[0], output_len, i)
-                if retval < 0:
-                    raise RuntimeError("C swt failed.")
-            elif cdata_t is np.complex64_t:
-                cA = np.zeros(output_len, dtype=np.complex64)
-                with nogil:
-                    retval = c_wt.float_complex_swt_a(&data[0], data_size, wavelet.w,
-                                    &cA[0], output_len, i)
-                if retval < 0:
-                    raise RuntimeError("C swt failed.")
-
-        data = cA
-        if not trim_approx:
-            ret.append((np.asarray(cA), np.asarray(cD)))
-        else:
-            ret.append(np.asarray(cD))
+                retval = c_wt.float_complex_swt_window(
+                    <float complex *> buffer.data, num_rows, n, wavelet.w,
+                    level, start, count, <float complex *> coefs_a,
+                    <float complex *> coefs_d)
+    if retval == -5:
+        raise TypeError("Array must be floating point, not {}"
+                        .format(buffer.dtype))
+    if retval:
+        raise RuntimeError(
+            "C wavelet transform failed with error code %d" % retval)
+    return coefs
+
+
+def _swt_levels(np.ndarray data, Wavelet wavelet, size_t level,
+                size_t start_level, unsigned int axis, bool trim_approx):
+    """The result of `swt_axis`, with all levels computed in a single sweep
+    along each row and written into one block: of shape
+    ``(level, 2) + data.shape`` holding the (cA, cD) pairs, or of shape
+    ``(level + 1, ) + data.shape`` with ``trim_approx``."""
+    cdef np.ndarray coefs_a, coefs_d
+
+    shape = np.shape(data)
+    if trim_approx:
+        block = np.empty((level + 1, ) + shape, dtype=data.dtype)
+        coefs_a = block[:1]
+        coefs_d = block[:0:-1]
+    elif level == 1:
+        # independent arrays, so that either can be released on its own
+        coefs_a = np.empty((1, ) + shape, dtype=data.dtype)
+        coefs_d = np.empty((1, ) + shape, dtype=data.dtype)
+    else:
+        block = np.empty((level, 2) + shape, dtype=data.dtype)
+        # the kernel takes the finest level first
+        coefs_a = block[::-1, 0]
+        coefs_d = block[::-1, 1]
+
+    _swt_levels_axis(data, coefs_a, coefs_d, wavelet, axis, start_level + 1,
+                     level)
 
     if trim_approx:
-        ret.append(np.asarray(cA))
-    ret.reverse()
-    return ret
+        return list(block)
+    if level == 1:
+        return [(coefs_a[0], coefs_d[0])]
+    return [(pair[0], pair[1]) for pair in block]
+
+
+def _swt_outputs(out, size_t level, bool trim_approx):
+    """The arrays of ``out``, structured as the result of `swt_axis`, as a
+    list with the (cA, cD) pair of each level, finest level first.  Arrays
+    that are not part of the result (the approximations of all but the last
+    level with ``trim_approx``) are None."""
+    out = list(out)
+    if len(out) != (level + 1 if trim_approx else level):
+        raise ValueError("out must have the structure of the swt result for "
+                         "{} levels.".format(level))
+    # negative indices are not available with wraparound=False
+    if trim_approx:
+        pairs = [[None, cD] for cD in reversed(out[1:])]
+        pairs[level - 1][0] = out[0]
+    else:
+        pairs = [list(pair) for pair in reversed(out)]
+        if any(len(pair) != 2 for pair in pairs):
+            raise ValueError("out must hold (cA, cD) pairs.")
+    return pairs
+
+
+def _swt_half_line(data, outputs, Wavelet wavelet, size_t level,
+                   size_t start_level, unsigned int axis, bool trim_approx):
+    """Transform a float16 line in blocks of coefficients, each computed in
+    float32 from the periodically extended samples it depends on.  Returns
+    False, leaving ``outputs`` untouched, if the line is too short for that.
+    """
+    cdef Py_ssize_t n = data.shape[axis]
+    cdef Py_ssize_t halo = (wavelet.dec_len - 1) * 2**(start_level + level)
+    blocks = _half_blocks(n)
+    if 2 * halo + blocks[0][1] >= n:
+        return False
+    lead = (slice(None), ) * axis
+    for p0, p1 in blocks:
+        block = _take_line(data, p0 - halo, p1 + halo, axis)
+        coeffs = swt_axis(block.astype(np.float32), wavelet, level,
+                          start_level, axis, trim_approx)
+        if not trim_approx:
+            coeffs = [c for pair in coeffs for c in pair]
+        keep = lead + (slice(halo, halo + p1 - p0), )
+        for output, c in zip(outputs, coeffs):
+            output[lead + (slice(p0, p1), )] = c[keep]
+    return True
 
 
 cpdef swt_axis(np.ndarray data, Wavelet wavelet, size_t level,
                size_t start_level, unsigned int axis=0,
-               bool trim_approx=False):
+               bool trim_approx=False, out=None):
     # memory-views do not support n-dimensional arrays, use np.ndarray instead
-    cdef common.ArrayInfo data_info, output_info
     cdef np.ndarray cD, cA
-    cdef size_t[::1] output_shape
-    cdef np.npy_intp[::1] strides_view
     cdef size_t end_level = start_level + level
-    cdef int retval = -5
     cdef size_t i
 
-    if data.shape[axis] % 2:
-        raise ValueError("Length of data must be even along the transform axis.")
     if data.shape[axis] < 1:
         raise ValueError("Data must have non-zero size along the transform axis.")
-
-    if level < 1:
-        raise ValueError("Level value must be greater than zero.")
-    if start_level >= common.swt_max_level(data.shape[axis]):
-        raise ValueError("start_level must be less than %d." %
-                         common.swt_max_level(data.shape[axis]))
-
-    if end_level > common.swt_max_level(data.shape[axis]):
-        msg = ("Level value too high (max level for current data size and "
-               "start_level is %d)." % (
-                common.swt_max_level(data.shape[axis]) - start_level))
-        raise ValueError(msg)
+    _check_levels(data.shape[axis], level, start_level)
+
+    out_pairs = None
+    if out is not None:
+        out_pairs = _swt_outputs(out, level, trim_approx)
+
+    if data.dtype == np.float16:
+        # stored as float16, transformed in float32 one tile at a time, so
+        # that the levels are chained in float32
+        if out_pairs is None:
+            outputs = [np.empty(np.shape(data), np.float16)
+                       for _ in range(level + 1 if trim_approx else 2 * level)]
+        else:
+            outputs = [_check_out(c, np.shape(data), np.float16, (data, ))
+                       for c in (list(out) if trim_approx else
+                                 [c for pair in out for c in pair])]
+        for s in _half_slabs(np.shape(data), axis):
+            if data.shape[axis] > 1 << 18 and _swt_half_line(
+                    data[s], [output[s] for output in outputs], wavelet,
+                    level, start_level, axis, trim_approx):
+                continue
+            coeffs = swt_axis(data[s].astype(np.float32), wavelet, level,
+                              start_level, axis, trim_approx)
+            if not trim_approx:
+                coeffs = [c for pair in coeffs for c in pair]
+            for output, c in zip(outputs, coeffs):
+                output[s] = c
+        if trim_approx:
+            return outputs
+        return list(zip(outputs[0::2], outputs[1::2]))
 
     data = data.astype(_check_dtype(data), copy=False)
-    # For SWT, the output matches the shape of the input
-    output_shape = <size_t [:data.ndim]> <size_t *> data.shape
-
-    data_info.ndim = data.ndim
-    data_info.strides = <pywt_index_t *> data.strides
-    data_info.shape = <size_t *> data.shape
+    if out_pairs is None:
+        return _swt_levels(data, wavelet, level, start_level, axis,
+                           trim_approx)
 
-    output_info.ndim = data.ndim
+    # levels are computed one at a time into the given arrays
+    inputs = [data]
 
     ret = []
     for i in range(start_level+1, end_level+1):
-        cA = np.empty(output_shape, dtype=data.dtype)
-        cD = np.empty(output_shape, dtype=data.dtype)
-
-        # strides won't match data_info.strides if data is not C-contiguous
-        # We need an explicit copy of `cA.strides` here because cA is
-        # zero-initialized for complex dtypes further down in this same for-loop;
-        # the pointer to `cA.strides` would then be dangling (see gh-753).
-        strides_view = <np.npy_intp [:data.ndim]> <np.npy_intp *> cA.strides
-        strides_view = strides_view.copy()
-        output_info.strides = <pywt_index_t *> &strides_view[0]
-        output_info.shape = <size_t *> &output_shape[0]
-
-        if data.dtype == np.float64:
-            with nogil:
-                retval = c_wt.double_downcoef_axis(
-                    <double *> data.data, data_info,
-                    <double *> cA.data, output_info,
-                    wavelet.w, axis,
-                    common.COEF_APPROX, common.MODE_PERIODIZATION,
-                    i, common.SWT_TRANSFORM)
-            if retval:
-                raise RuntimeError(
-                    "C wavelet transform failed with error code %d" % retval)
-            with nogil:
-                retval = c_wt.double_downcoef_axis(
-                    <double *> data.data, data_info,
-                    <double *> cD.data, output_info,
-                    wavelet.w, axis,
-                    common.COEF_DETAIL, common.MODE_PERIODIZATION,
-                    i, common.SWT_TRANSFORM)
-            if retval:
-                raise RuntimeError(
-                    "C wavelet transform failed with error code %d" % retval)
-        elif data.dtype == np.float32:
-            with nogil:
-                retval = c_wt.float_downcoef_axis(
-                    <float *> data.data, data_info,
-                    <float *> cA.data, output_info,
-                    wavelet.w, axis,
-                    common.COEF_APPROX, common.MODE_PERIODIZATION,
-                    i, common.SWT_TRANSFORM)
-            if retval:
-                raise RuntimeError(
-                    "C wavelet transform failed with error code %d" % retval)
-            with nogil:
-                retval = c_wt.float_downcoef_axis(
-                    <float *> data.data, data_info,
-                    <float *> cD.data, output_info,
-                    wavelet.w, axis,
-                    common.COEF_DETAIL, common.MODE_PERIODIZATION,
-                    i, common.SWT_TRANSFORM)
-            if retval:
-                raise RuntimeError(
-                    "C wavelet transform failed with error code %d" % retval)
-
-        IF HAVE_C99_CPLX:
-            if data.dtype == np.complex128:
-                cA = np.zeros(output_shape, dtype=np.complex128)
-                with nogil:
-                    retval = c_wt.double_complex_downcoef_axis(
-                        <double complex *> data.data, data_info,
-                        <double complex *> cA.data, output_info,
-                        wavelet.w, axis,
-                        common.COEF_APPROX, common.MODE_PERIODIZATION,
-                        i, common.SWT_TRANSFORM)
-                if retval:
-                    raise RuntimeError(
-                        "C wavelet transform failed with error code %d" %
-                        retval)
-                cD = np.zeros(output_shape, dtype=np.complex128)
-                with nogil:
-                    retval = c_wt.double_complex_downcoef_axis(
-                        <double complex *> data.data, data_info,
-                        <double complex *> cD.data, output_info,
-                        wavelet.w, axis,
-                        common.COEF_DETAIL, common.MODE_PERIODIZATION,
-                        i, common.SWT_TRANSFORM)
-                if retval:
-                    raise RuntimeError(
-                        "C wavelet transform failed with error code %d" %
-                        retval)
-            elif data.dtype == np.complex64:
-                cA = np.zeros(output_shape, dtype=np.complex64)
-                with nogil:
-                    retval = c_wt.float_complex_downcoef_axis(
-                        <float complex *> data.data, data_info,
-                        <float complex *> cA.data, output_info,
-                        wavelet.w, axis,
-                        common.COEF_APPROX, common.MODE_PERIODIZATION,
-                        i, common.SWT_TRANSFORM)
-                if retval:
-                    raise RuntimeError(
-                        "C wavelet transform failed with error code %d" %
-                        retval)
-                cD = np.zeros(output_shape, dtype=np.complex64)
-                with nogil:
-                    retval = c_wt.float_complex_downcoef_axis(
-                        <float complex *> data.data, data_info,
-                        <float complex *> cD.data, output_info,
-                        wavelet.w, axis,
-                        common.COEF_DETAIL, common.MODE_PERIODIZATION,
-                        i, common.SWT_TRANSFORM)
-                if retval:
-                    raise RuntimeError(
-                        "C wavelet transform failed with error code %d" %
-                        retval)
-        if retval == -5:
-            raise TypeError("Array must be floating point, not {}"
-                            .format(data.dtype))
+        # the output matches the shape of the input
+        cA = cD = None
+        if out_pairs is not None:
+            cA, cD = out_pairs[i - start_level - 1]
+        if cA is None:
+            cA = np.empty(np.shape(data), dtype=data.dtype)
+        else:
+            cA = _check_out(cA, np.shape(data), data.dtype, inputs)
+            inputs.append(cA)
+        if cD is None:
+            cD = np.empty(np.shape(data), dtype=data.dtype)
+        else:
+            cD = _check_out(cD, np.shape(data), data.dtype, inputs)
+            inputs.append(cD)
+
+        _swt_levels_axis(data, cA[np.newaxis], cD[np.newaxis], wavelet,
+                         axis, i, 1)
         if not trim_approx:
             ret.append((cA, cD))
         else:
@@ -315,12 +374,93 @@ cpdef swt_axis(np.ndarray data, Wavelet wavelet, size_t level,
 
         # previous approx coeffs are the data for the next level
         data = cA
-        # update data_info to match the new data array
-        data_info.strides = <pywt_index_t *> data.strides
-        data_info.shape = <size_t *> data.shape
 
     if trim_approx:
         ret.append(cA)
 
     ret.reverse()
     return ret
+
+
+cpdef iswt_axis(np.ndarray cA, np.ndarray cD, Wavelet wavelet, size_t level,
+                unsigned int axis=0):
+    """The approximation of level ``level - 1`` reconstructed from the
+    coefficients of level ``level`` of the SWT along ``axis``.  Either ``cA``
+    or ``cD`` can be None for coefficients that are all zero, which are then
+    not read at all."""
+    cdef np.ndarray output, coefs
+    cdef common.ArrayInfo a_info, d_info, output_info
+    cdef void *data_a = NULL
+    cdef void *data_d = NULL
+    cdef int retval = -5
+
+    coefs = cA if cA is not None else cD
+    if coefs is None:
+        raise ValueError("At least one coefficient array must be given.")
+    if cA is not None and cD is not None:
+        if cA.dtype != cD.dtype:
+            raise ValueError("Coefficients must have the same dtype.")
+        if np.shape(cA) != np.shape(cD):
+            raise RuntimeError(
+                "Mismatch in shape of intermediate coefficient arrays")
+    if axis >= coefs.ndim:
+        raise ValueError("Axis greater than coefficient dimensions.")
+    if level < 1:
+        raise ValueError("Level value must be greater than zero.")
+    if coefs.shape[axis] < 1:
+        raise ValueError("Coefficients must have non-zero size along the "
+                         "transform axis.")
+
+    output = np.empty(np.shape(coefs), dtype=coefs.dtype)
+
+    # a missing array is passed as NULL, with the layout of the other one
+    if cA is None:
+        cA = cD
+    else:
+        data_a = <void *> cA.data
+    if cD is None:
+        cD = cA
+    else:
+        data_d = <void *> cD.data
+    a_info.ndim = cA.ndim
+    a_info.strides = <pywt_index_t *> cA.strides
+    a_info.shape = <size_t *> cA.shape
+    d_info.ndim = cD.ndim
+    d_info.strides = <pywt_index_t *> cD.strides
+    d_info.shape = <size_t *> cD.shape
+    output_info.ndim = output.ndim
+    output_info.strides = <pywt_index_t *> output.strides
+    output_info.shape = <size_t *> output.shape
+
+    if output.dtype == np.float64:
+        with nogil:
+            retval = c_wt.double_iswt_axis(
+                <double *> data_a, a_info, <double *> data_d, d_info,
+                <double *> output.data, output_info, wavelet.w, axis, level)
+    elif output.dtype == np.float32:
+        with nogil:
+            retval = c_wt.float_iswt_axis(
+                <float *> data_a, a_info, <float *> data_d, d_info,
+                <float *> output.data, output_info, wavelet.w, axis, level)
+    IF HAVE_C99_CPLX:
+        if output.dtype == np.complex128:
+            with nogil:
+                retval = c_wt.double_complex_iswt_axis(
+                    <double complex *> data_a, a_info,
+                    <double complex *> data_d, d_info,
+                    <double complex *> output.data, output_info,
+                    wavelet.w, axis, level)
+        elif output.dtype == np.complex64:
+            with nogil:
+                retval = c_wt.float_complex_iswt_axis(
+                    <float complex *> data_a, a_info,
+                    <float complex *> data_d, d_info,
+                    <float complex *> output.data, output_info,
+                    wavelet.w, axis, level)
+    if retval == -5:
+        raise TypeError("Array must be floating point, not {}"
+                        .format(output.dtype))
+    if retval:
+        raise RuntimeError(
+            "C inverse wavelet transform failed with error code %d" % retval)
+    return output
@@ -95,3 +95,15 @@ unsigned char swt_max_level(size_t input_len){
     }
     return j;
 }
+
+size_t axis_tile_rows(size_t row_len, size_t item_size){
+    /* Aim for tiles of about 128 KiB, but always gather whole cache lines
+     * from the neighbouring rows. */
+    const size_t tile_bytes = 128 * 1024;
+    size_t rows = tile_bytes / (row_len * item_size + 1);
+    if (rows < 8)
+        rows = 8;
+    if (rows > 64)
+        rows = 64;
+    return rows;
+}
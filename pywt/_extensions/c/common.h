@@ -125,3 +125,9 @@ unsigned char dwt_max_level(size_t input_len, size_t filter_len);
 
 /* Maximum useful level of SWT decomposition. */
 unsigned char swt_max_level(size_t input_len);
+
+/*
+ * Number of neighbouring rows that are gathered into a contiguous tile when
+ * transforming rows of row_len items of item_size bytes along a strided axis.
+ */
+size_t axis_tile_rows(size_t row_len, size_t item_size);
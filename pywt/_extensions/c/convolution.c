@@ -1,5 +1,15 @@
 #include "convolution.h"
 
+size_t downsampling_convolution_qmf_buffer_length(const size_t N,
+                                                  const size_t F)
+{
+    /* short signals are extended as a whole, longer ones only at the edges,
+     * with room for the even and odd samples and the sums of one block */
+    if (N < F)
+        return 2 * (N + 2 * F);
+    return 5 * F + 4 * SIMD_BLOCK + QMF_ACC_PAD;
+}
+
 #ifdef TYPE
 #error TYPE should not be defined here.
 #else
@@ -1,6 +1,17 @@
 #pragma once
 
 #include "common.h"
+#include "simd.h"
+
+/* Offset in elements between the lowpass and highpass sums of a block in
+ * the workspace of *_downsampling_convolution_qmf, keeping them from being a
+ * multiple of the page size apart. */
+#define QMF_ACC_PAD 16
+
+/* Length of the work buffer of *_downsampling_convolution_qmf for inputs of
+ * length N and filters of length F, in elements of TYPE. */
+size_t downsampling_convolution_qmf_buffer_length(const size_t N,
+                                                  const size_t F);
 
 #ifdef TYPE
 #error TYPE should not be defined here.
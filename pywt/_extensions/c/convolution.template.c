@@ -579,12 +579,29 @@ static int CAT(TYPE, _upsampling_convolution_valid_sf_periodization)(const TYPE
         }
     }
 
-    for (; i < N; ++i, o += 2){
-        size_t j;
-        for(j = 0; j < F/2; ++j){
-            output[o] += filter[2*j] * input[i-j];
-            output[o+1] += filter[2*j+1] * input[i-j];
+    // all filter taps overlap the input: vectorized kernel
+    while (i < N){
+        const size_t w = sizeof(TYPE) / sizeof(REAL_TYPE);
+        const size_t n = (N - i < SIMD_BLOCK) ? N - i : SIMD_BLOCK;
+        REAL_TYPE acc_even[2 * SIMD_BLOCK], acc_odd[2 * SIMD_BLOCK];
+        size_t t, r;
+        for (t = 0; t < n; ++t){
+            for (r = 0; r < w; ++r){
+                acc_even[t*w + r] = ((const REAL_TYPE *)(output + o + 2*t))[r];
+                acc_odd[t*w + r] = ((const REAL_TYPE *)(output + o + 2*t + 1))[r];
+            }
+        }
+        CAT(REAL_TYPE, _dual_fir)((const REAL_TYPE *)(input + i - (F/2 - 1)), NULL,
+                                  F/2 - 1, 0, filter, filter + 1, 2, F/2, w,
+                                  acc_even, acc_odd, n * w);
+        for (t = 0; t < n; ++t){
+            for (r = 0; r < w; ++r){
+                ((REAL_TYPE *)(output + o + 2*t))[r] = acc_even[t*w + r];
+                ((REAL_TYPE *)(output + o + 2*t + 1))[r] = acc_odd[t*w + r];
+            }
         }
+        i += n;
+        o += 2 * n;
     }
 
     for (; i < F/2 && i < end; ++i, o += 2){
@@ -651,22 +668,294 @@ int CAT(TYPE, _upsampling_convolution_valid_sf)(const TYPE * const restrict inpu
 
     // Perform only stage 2 - all elements in the filter overlap an input element.
     {
+        const size_t w = sizeof(TYPE) / sizeof(REAL_TYPE);
         size_t o, i;
-        for(o = 0, i = F/2 - 1; i < N; ++i, o += 2){
-            TYPE sum_even = 0;
-            TYPE sum_odd = 0;
-            size_t j;
-            for(j = 0; j < F/2; ++j){
-                sum_even += filter[j*2] * input[i-j];
-                sum_odd += filter[j*2+1] * input[i-j];
+        for(o = 0, i = F/2 - 1; i < N; ){
+            const size_t n = (N - i < SIMD_BLOCK) ? N - i : SIMD_BLOCK;
+            REAL_TYPE sum_even[2 * SIMD_BLOCK] = {0};
+            REAL_TYPE sum_odd[2 * SIMD_BLOCK] = {0};
+            size_t t, r;
+            CAT(REAL_TYPE, _dual_fir)((const REAL_TYPE *)(input + i - (F/2 - 1)), NULL,
+                                      F/2 - 1, 0, filter, filter + 1, 2, F/2, w,
+                                      sum_even, sum_odd, n * w);
+            for (t = 0; t < n; ++t){
+                for (r = 0; r < w; ++r){
+                    ((REAL_TYPE *)(output + o + 2*t))[r] += sum_even[t*w + r];
+                    ((REAL_TYPE *)(output + o + 2*t + 1))[r] += sum_odd[t*w + r];
+                }
             }
-            output[o] += sum_even;
-            output[o+1] += sum_odd;
+            i += n;
+            o += 2 * n;
         }
     }
     return 0;
 }
 
+void CAT(TYPE, _extension_values)(const TYPE * const restrict input, const size_t N,
+                                  TYPE * const restrict extension, const size_t count,
+                                  MODE mode, const int right)
+{
+    size_t m = 0, k;
+
+    if (mode == MODE_SMOOTH && N < 2)
+        mode = MODE_CONSTANT_EDGE;
+    if ((mode == MODE_REFLECT || mode == MODE_ANTIREFLECT) && N < 2)
+        mode = MODE_CONSTANT_EDGE;
+
+    switch(mode) {
+    case MODE_SYMMETRIC:
+        while (m < count){
+            for(k = 0; k < N && m < count; ++k, ++m)
+                extension[m] = right ? input[N-1-k] : input[k];
+            for(k = 0; k < N && m < count; ++k, ++m)
+                extension[m] = right ? input[k] : input[N-1-k];
+        }
+        break;
+    case MODE_ANTISYMMETRIC:
+        while (m < count){
+            for(k = 0; k < N && m < count; ++k, ++m)
+                extension[m] = right ? -input[N-1-k] : -input[k];
+            for(k = 0; k < N && m < count; ++k, ++m)
+                extension[m] = right ? input[k] : input[N-1-k];
+        }
+        break;
+    case MODE_REFLECT:
+        while (m < count){
+            for(k = 1; k < N && m < count; ++k, ++m)
+                extension[m] = right ? input[N-1-k] : input[k];
+            for(k = 1; k < N && m < count; ++k, ++m)
+                extension[m] = right ? input[k] : input[N-1-k];
+        }
+        break;
+    case MODE_ANTIREFLECT:{
+        // whole-sample anti-symmetric
+        TYPE edge = right ? input[N-1] : input[0];
+        TYPE tmp = 0;
+        while (m < count){
+            for(k = 1; k < N && m < count; ++k, ++m){
+                if (right)
+                    tmp = edge - (input[N-1-k] - input[N-1]);
+                else
+                    tmp = edge - (input[k] - input[0]);
+                extension[m] = tmp;
+            }
+            edge = tmp;
+            for(k = 1; k < N && m < count; ++k, ++m){
+                if (right)
+                    tmp = edge + (input[k] - input[0]);
+                else
+                    tmp = edge + (input[N-1-k] - input[N-1]);
+                extension[m] = tmp;
+            }
+            edge = tmp;
+        }
+        break;
+    }
+    case MODE_CONSTANT_EDGE:
+        for(; m < count; ++m)
+            extension[m] = right ? input[N-1] : input[0];
+        break;
+    case MODE_SMOOTH:
+        for(k = 1; m < count; ++k, ++m){
+            if (right)
+                extension[m] = input[N-1] + k * (input[N-1] - input[N-2]);
+            else
+                extension[m] = input[0] + k * (input[0] - input[1]);
+        }
+        break;
+    case MODE_PERIODIC:
+    case MODE_PERIODIZATION:
+        while (m < count){
+            for(k = 0; k < N && m < count; ++k, ++m)
+                extension[m] = right ? input[k] : input[N-1-k];
+        }
+        break;
+    case MODE_ZEROPAD:
+    default:
+        for(; m < count; ++m)
+            extension[m] = 0;
+        break;
+    }
+}
+
+
+int CAT(TYPE, _downsampling_convolution_qmf)(const TYPE * const restrict input, const size_t N,
+                                             const REAL_TYPE * const restrict filter_lo,
+                                             const REAL_TYPE * const restrict filter_hi,
+                                             const size_t F,
+                                             TYPE * const restrict output_lo,
+                                             TYPE * const restrict output_hi,
+                                             const size_t O, MODE mode,
+                                             TYPE * const restrict buffer)
+{
+    /*
+     * Outputs near the boundaries are computed from copies of the signal
+     * edges laid out in buffer as
+     *     head = [left extension | signal[0:F]]
+     *     tail = [signal[N-F:N_ext] | right extension]
+     * so that both filters can run over them without any boundary handling.
+     * For MODE_PERIODIZATION an odd-length signal is padded by repeating its
+     * last sample.  Signals shorter than the filter are copied whole into
+     * head, with both extensions.
+     */
+    const size_t w = sizeof(TYPE) / sizeof(REAL_TYPE);
+    size_t i, i0, o, o_start, o_stop, left, right, N_ext = N;
+    size_t tail_start, head_len, tail_len;
+    TYPE * restrict head, * restrict tail, * restrict rest;
+
+    if (N < 1 || F < 1)
+        return -1;
+
+    if (mode == MODE_PERIODIZATION){
+        N_ext = N + (N % 2);
+        left = F - 1 - F/2;
+        right = F/2 > 0 ? F/2 - 1 : 0;
+        if (O != N_ext / 2)
+            return -1;
+    } else {
+        left = F - 1;
+        right = F - 1;
+        if (O != (N + F - 1) / 2)
+            return -1;
+    }
+
+    // head and tail are the same buffer for short signals
+    tail_start = (N < F) ? 0 : N - F;
+    head_len = (N < F) ? left + N_ext + right : left + F;
+    tail_len = (N < F) ? 0 : N_ext - tail_start + right;
+    head = buffer;
+    tail = (N < F) ? head + left : head + head_len;
+    rest = head + head_len + tail_len;
+
+    memcpy(head + left, input, ((N < F) ? N : F) * sizeof(TYPE));
+    memcpy(tail, input + tail_start, (N - tail_start) * sizeof(TYPE));
+    if (N_ext > N)
+        tail[N - tail_start] = input[N-1];
+
+    // extension values are generated outwards from the signal edges
+    if (mode == MODE_PERIODIZATION && N_ext > N && N >= F){
+        // the padded sample is not part of input
+        for(i = 0; i < left; ++i)
+            head[left - 1 - i] = (i == 0) ? input[N-1] : input[N - i];
+        for(i = 0; i < right; ++i)
+            tail[N_ext - tail_start + i] = input[i];
+    } else {
+        const TYPE * const signal = (N < F) ? head + left : input;
+        if (left > 0){
+            CAT(TYPE, _extension_values)(signal, N_ext, rest, left, mode, 0);
+            for(i = 0; i < left; ++i)
+                head[left - 1 - i] = rest[i];
+        }
+        CAT(TYPE, _extension_values)(signal, N_ext, tail + (N_ext - tail_start),
+                                     right, mode, 1);
+    }
+
+    /*
+     * Output o is the full convolution evaluated at i = i0 + 2*o.  Outputs
+     * with F - 1 <= i < N do not depend on the extension and are computed
+     * directly from input with the vectorized kernel, from the even and odd
+     * samples.  Near the boundaries the terms are accumulated in the same
+     * order as in _downsampling_convolution so that both give identical
+     * results.
+     */
+    i0 = (mode == MODE_PERIODIZATION) ? F/2 : 1;
+    o_start = (F - 1 > i0) ? (F - i0) / 2 : 0;
+    o_stop = (N > i0) ? (N - i0 + 1) / 2 : 0;
+    if (o_stop > O)
+        o_stop = O;
+    if (o_stop > o_start){
+        /* The even and odd samples are split one block of outputs at a
+         * time, so that they stay in the cache.  A block of n outputs
+         * starting at o reads the samples from i0 + 2*o - (F - 1) to
+         * i0 + 2*(o + n - 1), and both phases hold at most n + F/2 of them.
+         * The sums are accumulated in the workspace and copied out once per
+         * block: the two outputs are often a multiple of the page size
+         * apart, and accumulating in place then stalls on false
+         * store-to-load dependencies between them. */
+        const size_t block = (o_stop - o_start < SIMD_BLOCK)
+            ? o_stop - o_start : SIMD_BLOCK;
+        REAL_TYPE * const restrict even = (REAL_TYPE *) rest;
+        REAL_TYPE * const restrict odd = even + (block + F/2) * w;
+        REAL_TYPE * const restrict acc_lo = odd + (block + F/2) * w;
+        REAL_TYPE * const restrict acc_hi = acc_lo + (block + QMF_ACC_PAD) * w;
+        for(o = o_start; o < o_stop; o += SIMD_BLOCK){
+            const size_t n = (o_stop - o < SIMD_BLOCK) ? o_stop - o : SIMD_BLOCK;
+            // first sample read, rounded down to an even position
+            const size_t first = (i0 + 2*o - (F - 1)) & ~(size_t) 1;
+            const size_t c = i0 + 2*o - first;
+            const size_t len_even = (c + 2*n) / 2, len_odd = (c + 2*n - 1) / 2;
+            const REAL_TYPE * const restrict src = (const REAL_TYPE *)(input + first);
+            size_t k, r;
+            for(k = 0; k < len_odd; ++k){
+                for(r = 0; r < w; ++r){
+                    even[k * w + r] = src[2 * k * w + r];
+                    odd[k * w + r] = src[(2 * k + 1) * w + r];
+                }
+            }
+            for(; k < len_even; ++k)
+                for(r = 0; r < w; ++r)
+                    even[k * w + r] = src[2 * k * w + r];
+            memset(acc_lo, 0, n * sizeof(TYPE));
+            memset(acc_hi, 0, n * sizeof(TYPE));
+            CAT(REAL_TYPE, _dual_fir)(even, odd, c, 1,
+                                      filter_lo, filter_hi, 1, F, w,
+                                      acc_lo, acc_hi, n * w);
+            memcpy(output_lo + o, acc_lo, n * sizeof(TYPE));
+            memcpy(output_hi + o, acc_hi, n * sizeof(TYPE));
+        }
+    }
+
+    for(o = 0, i = i0; o < O; ++o, i += 2){
+        // window[-j] is the extended signal at position i - j
+        const TYPE * const restrict window = (i < F)
+            ? head + left + i : tail + (i - tail_start);
+        TYPE sum_lo = 0, sum_hi = 0;
+        size_t j = 0, j_stop = F;
+
+        if (o == o_start && o_stop > o_start){
+            i += 2 * (o_stop - o_start - 1);
+            o = o_stop - 1;
+            continue;
+        }
+
+        // right extension (filter indices up to i - N)
+        if (i >= N){
+            switch(mode) {
+            case MODE_ZEROPAD:
+                break;
+            case MODE_CONSTANT_EDGE:
+            case MODE_SMOOTH:
+                for(; j <= i - N; ++j){
+                    sum_lo += filter_lo[j]*window[-(pywt_index_t)j];
+                    sum_hi += filter_hi[j]*window[-(pywt_index_t)j];
+                }
+                break;
+            default:{
+                size_t k;
+                for(k = i - N + 1; k > 0; --k){
+                    sum_lo += filter_lo[k-1]*window[-(pywt_index_t)(k-1)];
+                    sum_hi += filter_hi[k-1]*window[-(pywt_index_t)(k-1)];
+                }
+                break;
+            }
+            }
+            j = i - N + 1;
+        }
+
+        // signal and left extension (filter indices above i)
+        if (mode == MODE_ZEROPAD && i + 1 < F)
+            j_stop = i + 1;
+        for(; j < j_stop; ++j){
+            sum_lo += filter_lo[j]*window[-(pywt_index_t)j];
+            sum_hi += filter_hi[j]*window[-(pywt_index_t)j];
+        }
+        output_lo[o] = sum_lo;
+        output_hi[o] = sum_hi;
+    }
+    return 0;
+}
+
+
 /* -> swt - todo */
 int CAT(TYPE, _upsampled_filter_convolution)(const TYPE * const restrict input, const size_t N,
                                              const REAL_TYPE * const restrict filter, const size_t F,
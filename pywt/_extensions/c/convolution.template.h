@@ -60,6 +60,38 @@ int CAT(TYPE, _downsampling_convolution_periodization)(
     TYPE * const restrict output, const size_t step,
     const size_t fstep);
 
+/* Fills extension[m] with the value of the signal extended at position -1-m
+ * (left side, right == 0) or N+m (right side) for m < count.  The values are
+ * the same as the ones computed on the fly by _downsampling_convolution.
+ */
+void CAT(TYPE, _extension_values)(const TYPE * const restrict input, const size_t N,
+                                  TYPE * const restrict extension, const size_t count,
+                                  MODE mode, const int right);
+
+/* Computes the downsampled (step = 2) convolution of input with both filters
+ * of a quadrature mirror filter pair in a single pass over the input.
+ *
+ * input        - input data
+ * N            - input data length
+ * filter_lo    - lowpass filter data
+ * filter_hi    - highpass filter data
+ * F            - filter data length (both filters)
+ * output_lo    - lowpass output data
+ * output_hi    - highpass output data
+ * O            - output length (as given by dwt_buffer_length)
+ * mode         - signal extension mode
+ * buffer       - workspace of downsampling_convolution_qmf_buffer_length(N, F)
+ *                elements
+ */
+int CAT(TYPE, _downsampling_convolution_qmf)(const TYPE * const restrict input, const size_t N,
+                                             const REAL_TYPE * const restrict filter_lo,
+                                             const REAL_TYPE * const restrict filter_hi,
+                                             const size_t F,
+                                             TYPE * const restrict output_lo,
+                                             TYPE * const restrict output_hi,
+                                             const size_t O, MODE mode,
+                                             TYPE * const restrict buffer);
+
 /*
  * Performs normal (full) convolution of "upsampled" input coeffs array with
  * filter Requires zero-filled output buffer (adds values instead of
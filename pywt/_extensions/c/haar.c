@@ -0,0 +1,67 @@
+/* Copyright (c) 2026 The PyWavelets Developers
+ *                    <https://github.com/PyWavelets/pywt>
+ * See COPYING for license details.
+ */
+
+#include "haar.h"
+
+int is_haar(const DiscreteWavelet * const wavelet)
+{
+    const double * const dec_lo = wavelet->dec_lo_double;
+    const double * const dec_hi = wavelet->dec_hi_double;
+    const double * const rec_lo = wavelet->rec_lo_double;
+    const double * const rec_hi = wavelet->rec_hi_double;
+    const float * const dec_lo_f = wavelet->dec_lo_float;
+    const float * const dec_hi_f = wavelet->dec_hi_float;
+    const float * const rec_lo_f = wavelet->rec_lo_float;
+    const float * const rec_hi_f = wavelet->rec_hi_float;
+
+    if (wavelet->dec_len != 2 || wavelet->rec_len != 2)
+        return 0;
+    return (dec_lo[0] == dec_lo[1] && rec_lo[0] == dec_lo[0]
+            && rec_lo[1] == dec_lo[0]
+            && dec_hi[0] == -dec_hi[1] && rec_hi[0] == dec_hi[1]
+            && rec_hi[1] == dec_hi[0]
+            && dec_lo_f[0] == dec_lo_f[1] && rec_lo_f[0] == dec_lo_f[0]
+            && rec_lo_f[1] == dec_lo_f[0]
+            && dec_hi_f[0] == -dec_hi_f[1] && rec_hi_f[0] == dec_hi_f[1]
+            && rec_hi_f[1] == dec_hi_f[0]);
+}
+
+
+#ifdef TYPE
+#error TYPE should not be defined here.
+#else
+
+#ifdef REAL_TYPE
+#error REAL_TYPE should not be defined here.
+#else
+
+#define TYPE float
+#define REAL_TYPE float
+#include "haar.template.c"
+#undef REAL_TYPE
+#undef TYPE
+
+#define TYPE double
+#define REAL_TYPE double
+#include "haar.template.c"
+#undef REAL_TYPE
+#undef TYPE
+
+#ifdef HAVE_C99_COMPLEX
+    #define TYPE float_complex
+    #define REAL_TYPE float
+    #include "haar.template.c"
+    #undef REAL_TYPE
+    #undef TYPE
+
+    #define TYPE double_complex
+    #define REAL_TYPE double
+    #include "haar.template.c"
+    #undef REAL_TYPE
+    #undef TYPE
+#endif
+
+#endif /* REAL_TYPE */
+#endif /* TYPE */
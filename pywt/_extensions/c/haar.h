@@ -0,0 +1,63 @@
+/* Copyright (c) 2026 The PyWavelets Developers
+ *                    <https://github.com/PyWavelets/pywt>
+ * See COPYING for license details.
+ */
+
+/* Single level DWT, IDWT and SWT with the Haar wavelet */
+
+#pragma once
+
+#include "common.h"
+#include "convolution.h"
+#include "wavelets.h"
+
+/*
+ * Nonzero if the filters of wavelet are those of the Haar wavelet, up to the
+ * scaling of the two channels:
+ *
+ *     dec_lo = {p, p}, dec_hi = {-q, q}, rec_lo = {p, p}, rec_hi = {q, -q}
+ *
+ * Each coefficient is then a scaled sum or difference of two samples,
+ *
+ *     a[k] = p * (x[2k] + x[2k+1]),  d[k] = q * (x[2k] - x[2k+1])
+ *
+ * and the transforms below compute these directly instead of convolving.
+ */
+int is_haar(const DiscreteWavelet * const wavelet);
+
+#ifdef TYPE
+#error TYPE should not be defined here.
+#else
+
+#ifdef REAL_TYPE
+#error REAL_TYPE should not be defined here.
+#else
+
+#define TYPE float
+#define REAL_TYPE float
+#include "haar.template.h"
+#undef REAL_TYPE
+#undef TYPE
+
+#define TYPE double
+#define REAL_TYPE double
+#include "haar.template.h"
+#undef REAL_TYPE
+#undef TYPE
+
+#ifdef HAVE_C99_COMPLEX
+    #define TYPE float_complex
+    #define REAL_TYPE float
+    #include "haar.template.h"
+    #undef REAL_TYPE
+    #undef TYPE
+
+    #define TYPE double_complex
+    #define REAL_TYPE double
+    #include "haar.template.h"
+    #undef REAL_TYPE
+    #undef TYPE
+#endif
+
+#endif /* REAL_TYPE */
+#endif /* TYPE */
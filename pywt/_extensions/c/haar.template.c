@@ -0,0 +1,130 @@
+/* Copyright (c) 2026 The PyWavelets Developers
+ *                    <https://github.com/PyWavelets/pywt>
+ * See COPYING for license details.
+ */
+
+#include "templating.h"
+
+#ifndef REAL_TYPE
+#error REAL_TYPE must be defined here.
+#else
+
+#ifndef TYPE
+#error TYPE must be defined here.
+#else
+
+#include "haar.h"
+
+#if defined _MSC_VER
+#define restrict __restrict
+#elif defined __GNUC__
+#define restrict __restrict__
+#endif
+
+int CAT(TYPE, _dwt_haar)(const TYPE * const restrict input, const size_t N,
+                         const DiscreteWavelet * const restrict wavelet,
+                         TYPE * const restrict output_a,
+                         TYPE * const restrict output_d,
+                         const size_t O, const MODE mode)
+{
+    const REAL_TYPE p = wavelet->CAT(dec_lo_, REAL_TYPE)[1];
+    const REAL_TYPE q = wavelet->CAT(dec_hi_, REAL_TYPE)[1];
+    const size_t pairs = N / 2;
+    size_t k;
+
+    if (N < 1 || O != dwt_buffer_length(N, 2, mode) || O != (N + 1) / 2)
+        return -1;
+
+    if (output_a != NULL)
+        for (k = 0; k < pairs; ++k)
+            output_a[k] = p * (input[2 * k] + input[2 * k + 1]);
+    if (output_d != NULL)
+        for (k = 0; k < pairs; ++k)
+            output_d[k] = q * (input[2 * k] - input[2 * k + 1]);
+
+    /* for odd N, the last pair holds the first sample of the right
+     * extension (MODE_PERIODIZATION pads with the last sample) */
+    if (N % 2){
+        const TYPE last = input[N - 1];
+        TYPE next;
+        if (mode == MODE_PERIODIZATION)
+            next = last;
+        else
+            CAT(TYPE, _extension_values)(input, N, &next, 1, mode, 1);
+        if (output_a != NULL)
+            output_a[pairs] = p * (last + next);
+        if (output_d != NULL)
+            output_d[pairs] = q * (last - next);
+    }
+    return 0;
+}
+
+
+int CAT(TYPE, _idwt_haar)(const TYPE * const restrict coeffs_a,
+                          const TYPE * const restrict coeffs_d,
+                          const size_t N,
+                          const DiscreteWavelet * const restrict wavelet,
+                          TYPE * const restrict output, const size_t O)
+{
+    const REAL_TYPE p = wavelet->CAT(rec_lo_, REAL_TYPE)[0];
+    const REAL_TYPE q = wavelet->CAT(rec_hi_, REAL_TYPE)[0];
+    size_t k;
+
+    if (O != 2 * N || (coeffs_a == NULL && coeffs_d == NULL))
+        return -1;
+
+    if (coeffs_a != NULL && coeffs_d != NULL){
+        for (k = 0; k < N; ++k){
+            const TYPE a = p * coeffs_a[k], d = q * coeffs_d[k];
+            output[2 * k] = a + d;
+            output[2 * k + 1] = a - d;
+        }
+    } else if (coeffs_a != NULL){
+        for (k = 0; k < N; ++k)
+            output[2 * k] = output[2 * k + 1] = p * coeffs_a[k];
+    } else {
+        for (k = 0; k < N; ++k){
+            const TYPE d = q * coeffs_d[k];
+            output[2 * k] = d;
+            output[2 * k + 1] = -d;
+        }
+    }
+    return 0;
+}
+
+
+int CAT(TYPE, _swt_haar)(const TYPE * const restrict input, const size_t N,
+                         const DiscreteWavelet * const restrict wavelet,
+                         TYPE * const restrict output_a,
+                         TYPE * const restrict output_d,
+                         const unsigned int level)
+{
+    const REAL_TYPE p = wavelet->CAT(dec_lo_, REAL_TYPE)[1];
+    const REAL_TYPE q = wavelet->CAT(dec_hi_, REAL_TYPE)[1];
+    size_t s, i;
+
+    if (level < 1)
+        return -1;
+    if (level > swt_max_level(N))
+        return -2;
+    s = (size_t) 1 << (level - 1);
+
+    // x[i + s] wraps around for the last s samples
+    if (output_a != NULL){
+        for (i = 0; i < N - s; ++i)
+            output_a[i] = p * (input[i] + input[i + s]);
+        for (; i < N; ++i)
+            output_a[i] = p * (input[i] + input[i + s - N]);
+    }
+    if (output_d != NULL){
+        for (i = 0; i < N - s; ++i)
+            output_d[i] = q * (input[i] - input[i + s]);
+        for (; i < N; ++i)
+            output_d[i] = q * (input[i] - input[i + s - N]);
+    }
+    return 0;
+}
+
+#undef restrict
+#endif /* TYPE */
+#endif /* REAL_TYPE */
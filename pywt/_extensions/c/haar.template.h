@@ -0,0 +1,71 @@
+/* Copyright (c) 2026 The PyWavelets Developers
+ *                    <https://github.com/PyWavelets/pywt>
+ * See COPYING for license details.
+ */
+
+#include "templating.h"
+
+#ifndef REAL_TYPE
+#error REAL_TYPE must be defined here.
+#else
+
+#ifndef TYPE
+#error TYPE must be defined here.
+#else
+
+#include "haar.h"
+
+#if defined _MSC_VER
+#define restrict __restrict
+#elif defined __GNUC__
+#define restrict __restrict__
+#endif
+
+/* Single level DWT of a contiguous input of length N with a wavelet for
+ * which is_haar holds.
+ *
+ * Computes the same coefficients (O of each) as
+ * _downsampling_convolution_qmf in any mode.  Either output may be NULL.
+ *
+ * Returns 0 on success and -1 if O does not match N and the mode.
+ */
+int CAT(TYPE, _dwt_haar)(const TYPE * const restrict input, const size_t N,
+                         const DiscreteWavelet * const restrict wavelet,
+                         TYPE * const restrict output_a,
+                         TYPE * const restrict output_d,
+                         const size_t O, const MODE mode);
+
+/* Single level IDWT of N approximation and detail coefficients with a
+ * wavelet for which is_haar holds.
+ *
+ * Writes the O == 2 * N samples of the reconstruction, which does not depend
+ * on the mode.  Either of the coefficients can be NULL and is then taken to
+ * be zero.
+ *
+ * Returns 0 on success and -1 if the sizes do not match.
+ */
+int CAT(TYPE, _idwt_haar)(const TYPE * const restrict coeffs_a,
+                          const TYPE * const restrict coeffs_d,
+                          const size_t N,
+                          const DiscreteWavelet * const restrict wavelet,
+                          TYPE * const restrict output, const size_t O);
+
+/* SWT of an input of length N at the given level with a wavelet for which
+ * is_haar holds:
+ *
+ *     a[i] = p * (x[i] + x[i + s]),  d[i] = q * (x[i] - x[i + s])
+ *
+ * with s = 2**(level - 1) and the indices taken modulo N.  Either output may
+ * be NULL, the outputs have N samples.
+ *
+ * Returns 0 on success and a negative value for invalid levels.
+ */
+int CAT(TYPE, _swt_haar)(const TYPE * const restrict input, const size_t N,
+                         const DiscreteWavelet * const restrict wavelet,
+                         TYPE * const restrict output_a,
+                         TYPE * const restrict output_d,
+                         const unsigned int level);
+
+#undef restrict
+#endif /* TYPE */
+#endif /* REAL_TYPE */
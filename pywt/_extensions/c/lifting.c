@@ -0,0 +1,176 @@
+/* Copyright (c) 2026 The PyWavelets Developers
+ *                    <https://github.com/PyWavelets/pywt>
+ * See COPYING for license details.
+ */
+
+#include "lifting.h"
+
+/* Number of outputs computed at a time, the phases of a block stay in the
+ * cache while the lifting steps run over them. */
+#define LIFTING_BLOCK 1024
+
+/*
+ * Index ranges shared by the row kernels and the buffer length functions.
+ * Outputs are taken from the phases at [t_start, t_stop) before the shifts,
+ * and they depend on the phases of the input at [k_start, k_stop).  The
+ * support of a block of outputs is wider by margin phase samples.  For the
+ * analysis, the extended signal is needed at positions [p_start, p_stop).
+ */
+typedef struct {
+    pywt_index_t t_start, t_stop;
+    pywt_index_t k_start, k_stop;
+    pywt_index_t margin;
+    pywt_index_t p_start, p_stop;
+} LiftingLayout;
+
+
+/* Range of phases that the steps read to compute the outputs */
+static void lifting_support(const LiftingScheme * const scheme,
+                            LiftingLayout * const layout)
+{
+    /* [lo, hi] ranges of the indices needed from both phases, propagated
+     * backwards through the steps */
+    pywt_index_t lo[2], hi[2];
+    size_t s, p;
+
+    for (p = 0; p < 2; ++p){
+        lo[p] = layout->t_start - scheme->shift[p];
+        hi[p] = layout->t_stop - 1 - scheme->shift[p];
+    }
+    for (s = scheme->num_steps; s > 0; --s){
+        const int t = scheme->target[s - 1];
+        const pywt_index_t first = scheme->offset[s - 1];
+        const pywt_index_t last = first + (pywt_index_t) scheme->length[s - 1] - 1;
+        if (lo[t] - last < lo[1 - t])
+            lo[1 - t] = lo[t] - last;
+        if (hi[t] - first > hi[1 - t])
+            hi[1 - t] = hi[t] - first;
+    }
+    layout->k_start = lo[0] < lo[1] ? lo[0] : lo[1];
+    layout->k_stop = (hi[0] > hi[1] ? hi[0] : hi[1]) + 1;
+    layout->margin = (layout->k_stop - layout->k_start)
+        - (layout->t_stop - layout->t_start);
+}
+
+
+/* Length of the phases of the largest block */
+static size_t lifting_block_length(const LiftingLayout * const layout)
+{
+    const pywt_index_t T = layout->t_stop - layout->t_start;
+    return (size_t) ((T < LIFTING_BLOCK ? T : LIFTING_BLOCK) + layout->margin);
+}
+
+
+static int lifting_dwt_layout(const LiftingScheme * const scheme,
+                              const size_t N, const size_t F,
+                              const MODE mode, LiftingLayout * const layout)
+{
+    const size_t O = dwt_buffer_length(N, F, mode);
+    const size_t i0 = (mode == MODE_PERIODIZATION) ? F/2 : 1;
+    const pywt_index_t N_ext = (pywt_index_t) (
+        (mode == MODE_PERIODIZATION) ? N + (N % 2) : N);
+
+    // output o is centered on the extended signal at position i0 + 2*o
+    if (scheme->parity != (int) (i0 % 2))
+        return -1;
+    layout->t_start = (pywt_index_t) (i0 / 2);
+    layout->t_stop = layout->t_start + (pywt_index_t) O;
+    lifting_support(scheme, layout);
+
+    layout->p_start = 2 * layout->k_start < 0 ? 2 * layout->k_start : 0;
+    layout->p_stop = 2 * layout->k_stop > N_ext ? 2 * layout->k_stop : N_ext;
+    return 0;
+}
+
+
+static int lifting_idwt_layout(const LiftingScheme * const scheme,
+                               const size_t N, const size_t F,
+                               const MODE mode, LiftingLayout * const layout)
+{
+    const size_t O = idwt_buffer_length(N, F, mode);
+    // output n is sample n + s of the full reconstruction
+    const size_t s = (mode == MODE_PERIODIZATION) ? F/2 - 1 : F - 2;
+
+    if (scheme->parity != -1 || F < 2)
+        return -1;
+    layout->t_start = (pywt_index_t) (s / 2);
+    layout->t_stop = (pywt_index_t) ((s + O + 1) / 2);
+    lifting_support(scheme, layout);
+    layout->p_start = layout->p_stop = 0;
+    return 0;
+}
+
+
+size_t lifting_dwt_buffer_length(const LiftingScheme * const scheme,
+                                 const size_t N, const size_t filter_len,
+                                 const MODE mode)
+{
+    LiftingLayout layout;
+    size_t N_ext = N;
+    if (lifting_dwt_layout(scheme, N, filter_len, mode, &layout))
+        return 0;
+    if (mode == MODE_PERIODIZATION)
+        N_ext = N + (N % 2);
+    /* both phases of a block, the extensions on both sides and a copy of
+     * the signal when it has to be padded */
+    return 2 * lifting_block_length(&layout)
+        + (size_t) (layout.p_stop - layout.p_start) - N_ext
+        + (N_ext > N ? N_ext : 0);
+}
+
+
+size_t lifting_idwt_buffer_length(const LiftingScheme * const scheme,
+                                  const size_t N, const size_t filter_len,
+                                  const MODE mode)
+{
+    LiftingLayout layout;
+    if (lifting_idwt_layout(scheme, N, filter_len, mode, &layout))
+        return 0;
+    return 2 * lifting_block_length(&layout);
+}
+
+
+#ifdef TYPE
+#error TYPE should not be defined here.
+#else
+
+#ifdef REAL_TYPE
+#error REAL_TYPE should not be defined here.
+#else
+
+#define TYPE float
+#define REAL_TYPE float
+#define WORK_TYPE double
+#include "lifting.template.c"
+#undef WORK_TYPE
+#undef REAL_TYPE
+#undef TYPE
+
+#define TYPE double
+#define REAL_TYPE double
+#define WORK_TYPE double
+#include "lifting.template.c"
+#undef WORK_TYPE
+#undef REAL_TYPE
+#undef TYPE
+
+#ifdef HAVE_C99_COMPLEX
+    #define TYPE float_complex
+    #define REAL_TYPE float
+    #define WORK_TYPE double_complex
+    #include "lifting.template.c"
+    #undef WORK_TYPE
+    #undef REAL_TYPE
+    #undef TYPE
+
+    #define TYPE double_complex
+    #define REAL_TYPE double
+    #define WORK_TYPE double_complex
+    #include "lifting.template.c"
+    #undef WORK_TYPE
+    #undef REAL_TYPE
+    #undef TYPE
+#endif
+
+#endif /* REAL_TYPE */
+#endif /* TYPE */
@@ -0,0 +1,104 @@
+/* Copyright (c) 2026 The PyWavelets Developers
+ *                    <https://github.com/PyWavelets/pywt>
+ * See COPYING for license details.
+ */
+
+/* Single level DWT and IDWT computed with lifting steps */
+
+#pragma once
+
+#include "common.h"
+#include "convolution.h"
+
+/*
+ * Factorization of the polyphase matrix of a two-channel filter bank into
+ * lifting steps (computed by pywt._lifting).
+ *
+ * The transform splits its input into the phases x0 and x1 and applies the
+ * steps in order.  Step s updates phase target[s] from the other phase:
+ *
+ *     x_t[k] += sum_m c_s[m] * x_{1-t}[k - offset[s] - m],  m < length[s]
+ *
+ * where the coefficients c_s of all steps are stored one after the other in
+ * coeffs.  The output phases are then
+ *
+ *     y_p[k] = scale[p] * x_p[k - shift[p]]
+ *
+ * For the analysis, x0 and x1 are the samples of the extended signal at
+ * positions 2*k + parity and 2*k + 1 - parity, and y0, y1 give the
+ * approximation and detail coefficients.  For the synthesis (parity == -1),
+ * x0 and x1 are the approximation and detail coefficients, and y0, y1 the
+ * even and odd samples of the (unshifted) reconstruction.
+ *
+ * The steps of badly conditioned factorizations amplify rounding errors, so
+ * they are run in double precision for all types (see TYPE_lifting_work).
+ */
+typedef struct {
+    size_t num_steps;
+    int * target;
+    pywt_index_t * offset;
+    size_t * length;
+    double * coeffs;
+    double scale[2];
+    pywt_index_t shift[2];
+    int parity;
+} LiftingScheme;
+
+/* Length of the work buffer of *_dwt_lifting for inputs of length N, in
+ * elements of TYPE_lifting_work, or 0 if the scheme cannot be used with the
+ * filter length and mode. */
+size_t lifting_dwt_buffer_length(const LiftingScheme * const scheme,
+                                 const size_t N, const size_t filter_len,
+                                 const MODE mode);
+
+/* Length of the work buffer of *_idwt_lifting for coefficients of length N,
+ * in elements of TYPE_lifting_work, or 0 if the scheme is not a synthesis
+ * scheme. */
+size_t lifting_idwt_buffer_length(const LiftingScheme * const scheme,
+                                  const size_t N, const size_t filter_len,
+                                  const MODE mode);
+
+#ifdef TYPE
+#error TYPE should not be defined here.
+#else
+
+#ifdef REAL_TYPE
+#error REAL_TYPE should not be defined here.
+#else
+
+#define TYPE float
+#define REAL_TYPE float
+#define WORK_TYPE double
+#include "lifting.template.h"
+#undef WORK_TYPE
+#undef REAL_TYPE
+#undef TYPE
+
+#define TYPE double
+#define REAL_TYPE double
+#define WORK_TYPE double
+#include "lifting.template.h"
+#undef WORK_TYPE
+#undef REAL_TYPE
+#undef TYPE
+
+#ifdef HAVE_C99_COMPLEX
+    #define TYPE float_complex
+    #define REAL_TYPE float
+    #define WORK_TYPE double_complex
+    #include "lifting.template.h"
+    #undef WORK_TYPE
+    #undef REAL_TYPE
+    #undef TYPE
+
+    #define TYPE double_complex
+    #define REAL_TYPE double
+    #define WORK_TYPE double_complex
+    #include "lifting.template.h"
+    #undef WORK_TYPE
+    #undef REAL_TYPE
+    #undef TYPE
+#endif
+
+#endif /* REAL_TYPE */
+#endif /* TYPE */
@@ -0,0 +1,308 @@
+/* Copyright (c) 2026 The PyWavelets Developers
+ *                    <https://github.com/PyWavelets/pywt>
+ * See COPYING for license details.
+ */
+
+#include "templating.h"
+
+#ifndef REAL_TYPE
+#error REAL_TYPE must be defined here.
+#else
+
+#ifndef TYPE
+#error TYPE must be defined here.
+#else
+
+#ifndef WORK_TYPE
+#error WORK_TYPE must be defined here.
+#else
+
+#include "lifting.h"
+
+#if defined _MSC_VER
+#define restrict __restrict
+#elif defined __GNUC__
+#define restrict __restrict__
+#endif
+
+/* Number of doubles in WORK_TYPE, for the kernels of simd.h */
+#define WORK_REALS (sizeof(WORK_TYPE) / sizeof(double))
+/* Whether TYPE and WORK_TYPE are both double, the kernels then also move the
+ * samples to and from the work buffer */
+#define PLAIN_DOUBLE (sizeof(TYPE) == sizeof(double) && WORK_REALS == 1)
+
+/* sum_m c[m] * src[j - m] over the taps with 0 <= j - m < L */
+static WORK_TYPE CAT(TYPE, _lifting_tap_sum)(const double * const restrict c,
+                                             const WORK_TYPE * const restrict src,
+                                             const pywt_index_t j,
+                                             const pywt_index_t length,
+                                             const pywt_index_t L)
+{
+    const pywt_index_t m_start = (j - L + 1 > 0) ? j - L + 1 : 0;
+    const pywt_index_t m_stop = (j + 1 < length) ? j + 1 : length;
+    pywt_index_t m;
+    WORK_TYPE sum = 0;
+    for (m = m_start; m < m_stop; ++m)
+        sum += c[m] * src[j - m];
+    return sum;
+}
+
+
+/*
+ * Applies the lifting steps in place to the phases x0 and x1 of length L.
+ * Samples outside of the phases are taken to be zero, the caller makes sure
+ * the outputs it uses do not depend on them.
+ */
+static void CAT(TYPE, _lifting_steps)(const LiftingScheme * const restrict scheme,
+                                      WORK_TYPE * const restrict x0,
+                                      WORK_TYPE * const restrict x1,
+                                      const pywt_index_t L)
+{
+    const double * restrict c = scheme->coeffs;
+    size_t s;
+
+    for (s = 0; s < scheme->num_steps; c += scheme->length[s], ++s){
+        WORK_TYPE * const restrict x = scheme->target[s] ? x1 : x0;
+        const WORK_TYPE * const restrict src = scheme->target[s] ? x0 : x1;
+        const pywt_index_t offset = scheme->offset[s];
+        const pywt_index_t length = (pywt_index_t) scheme->length[s];
+        // all taps are inside of the phases for k in [k_lo, k_hi)
+        pywt_index_t k_lo = offset + length - 1, k_hi = offset + L, k;
+
+        if (k_lo < 0)
+            k_lo = 0;
+        if (k_lo > L)
+            k_lo = L;
+        if (k_hi < k_lo)
+            k_hi = k_lo;
+        if (k_hi > L)
+            k_hi = L;
+
+        // x[k] += sum_m c[m] * src[k - offset - m] for 0 <= k - offset - m < L
+        for (k = 0; k < k_lo; ++k)
+            x[k] += CAT(TYPE, _lifting_tap_sum)(c, src, k - offset, length, L);
+        if (k_hi > k_lo)
+            double_lifting_step((double *) (x + k_lo),
+                                (const double *) (src - offset + k_lo), c,
+                                (size_t) length, WORK_REALS,
+                                (size_t) (k_hi - k_lo) * WORK_REALS);
+        for (k = k_hi; k < L; ++k)
+            x[k] += CAT(TYPE, _lifting_tap_sum)(c, src, k - offset, length, L);
+    }
+}
+
+
+/* Sample of the extended signal at position p */
+static inline TYPE CAT(TYPE, _lifting_sample)(const TYPE * const restrict signal,
+                                              const pywt_index_t N,
+                                              const TYPE * const restrict left,
+                                              const TYPE * const restrict right,
+                                              const pywt_index_t p)
+{
+    if (p < 0)
+        return left[-1 - p];
+    if (p >= N)
+        return right[p - N];
+    return signal[p];
+}
+
+
+int CAT(TYPE, _dwt_lifting)(const TYPE * const restrict input, const size_t N,
+                            const LiftingScheme * const restrict scheme,
+                            const size_t F,
+                            TYPE * const restrict output_a,
+                            TYPE * const restrict output_d,
+                            const size_t O, const MODE mode,
+                            CAT(TYPE, _lifting_work) * const restrict buffer)
+{
+    /*
+     * buffer holds the two phases of a block, followed by the left and
+     * right extensions of the signal and, for MODE_PERIODIZATION with odd N,
+     * the signal padded to even length.  The extensions are stored as TYPE,
+     * which is not larger than the work type.
+     */
+    LiftingLayout layout;
+    const TYPE * restrict signal = input;
+    WORK_TYPE * restrict x0, * restrict x1;
+    TYPE * restrict left, * restrict right;
+    pywt_index_t N_ext = (pywt_index_t) N, t0, t1, k;
+    size_t block;
+    const int parity = scheme->parity;
+    const double scale_a = scheme->scale[0];
+    const double scale_d = scheme->scale[1];
+
+    if (N < 1 || O != dwt_buffer_length(N, F, mode))
+        return -1;
+    if (lifting_dwt_layout(scheme, N, F, mode, &layout))
+        return -1;
+    if (mode == MODE_PERIODIZATION)
+        N_ext += (pywt_index_t) (N % 2);
+
+    block = lifting_block_length(&layout);
+    x0 = buffer;
+    x1 = x0 + block;
+    left = (TYPE *) (x1 + block);
+    right = left - layout.p_start;
+    if (N_ext > (pywt_index_t) N){
+        TYPE * const padded = right + (layout.p_stop - N_ext);
+        memcpy(padded, input, N * sizeof(TYPE));
+        padded[N] = padded[N-1];
+        signal = padded;
+    }
+    CAT(TYPE, _extension_values)(signal, (size_t) N_ext, left,
+                                 (size_t) -layout.p_start, mode, 0);
+    CAT(TYPE, _extension_values)(signal, (size_t) N_ext, right,
+                                 (size_t) (layout.p_stop - N_ext), mode, 1);
+
+    for (t0 = layout.t_start; t0 < layout.t_stop; t0 = t1){
+        const pywt_index_t k_start = layout.k_start + (t0 - layout.t_start);
+        pywt_index_t L;
+        t1 = t0 + LIFTING_BLOCK < layout.t_stop ? t0 + LIFTING_BLOCK
+                                                : layout.t_stop;
+        L = (t1 - t0) + layout.margin;
+
+        // x0 holds the samples at 2*k + parity and x1 the other ones
+        if (k_start >= 0 && 2 * (k_start + L) <= N_ext && PLAIN_DOUBLE){
+            const double * const p = (const double *) (signal + 2 * k_start);
+            double_deinterleave(p, (double *) (parity ? x1 : x0),
+                                (double *) (parity ? x0 : x1), (size_t) L);
+        } else if (k_start >= 0 && 2 * (k_start + L) <= N_ext){
+            const TYPE * const restrict p = signal + 2 * k_start;
+            for (k = 0; k < L; ++k){
+                x0[k] = p[2 * k + parity];
+                x1[k] = p[2 * k + 1 - parity];
+            }
+        } else {
+            for (k = 0; k < L; ++k){
+                const pywt_index_t p = 2 * (k_start + k);
+                x0[k] = CAT(TYPE, _lifting_sample)(signal, N_ext, left, right,
+                                                   p + parity);
+                x1[k] = CAT(TYPE, _lifting_sample)(signal, N_ext, left, right,
+                                                   p + 1 - parity);
+            }
+        }
+
+        CAT(TYPE, _lifting_steps)(scheme, x0, x1, L);
+
+        {
+            const WORK_TYPE * const restrict a = x0 + (t0 - scheme->shift[0] - k_start);
+            const WORK_TYPE * const restrict d = x1 + (t0 - scheme->shift[1] - k_start);
+            const pywt_index_t o0 = t0 - layout.t_start;
+            if (sizeof(TYPE) == sizeof(WORK_TYPE)){
+                double_scale((const double *) a, scale_a,
+                             (double *) (output_a + o0),
+                             (size_t) (t1 - t0) * WORK_REALS);
+                double_scale((const double *) d, scale_d,
+                             (double *) (output_d + o0),
+                             (size_t) (t1 - t0) * WORK_REALS);
+            } else for (k = 0; k < t1 - t0; ++k){
+                output_a[o0 + k] = scale_a * a[k];
+                output_d[o0 + k] = scale_d * d[k];
+            }
+        }
+    }
+    return 0;
+}
+
+
+int CAT(TYPE, _idwt_lifting)(const TYPE * const restrict coeffs_a,
+                             const TYPE * const restrict coeffs_d,
+                             const size_t N,
+                             const LiftingScheme * const restrict scheme,
+                             const size_t F,
+                             TYPE * const restrict output, const size_t O,
+                             const MODE mode,
+                             CAT(TYPE, _lifting_work) * const restrict buffer)
+{
+    LiftingLayout layout;
+    pywt_index_t t0, t1, k, s;
+    const pywt_index_t N_in = (pywt_index_t) N;
+    WORK_TYPE * restrict x0, * restrict x1;
+    const double scale_even = scheme->scale[0];
+    const double scale_odd = scheme->scale[1];
+
+    if (N < 1 || O != idwt_buffer_length(N, F, mode))
+        return -1;
+    if (lifting_idwt_layout(scheme, N, F, mode, &layout))
+        return -1;
+
+    x0 = buffer;
+    x1 = buffer + lifting_block_length(&layout);
+    // output n is sample n + s of the full reconstruction
+    s = (pywt_index_t) ((mode == MODE_PERIODIZATION) ? F/2 - 1 : F - 2);
+
+    for (t0 = layout.t_start; t0 < layout.t_stop; t0 = t1){
+        const pywt_index_t k_start = layout.k_start + (t0 - layout.t_start);
+        pywt_index_t L;
+        t1 = t0 + LIFTING_BLOCK < layout.t_stop ? t0 + LIFTING_BLOCK
+                                                : layout.t_stop;
+        L = (t1 - t0) + layout.margin;
+
+        /* The coefficients are zero outside of [0, N), except for
+         * MODE_PERIODIZATION where they are periodic. */
+        if (k_start >= 0 && k_start + L <= N_in
+                && coeffs_a != NULL && coeffs_d != NULL
+                && sizeof(TYPE) == sizeof(WORK_TYPE)){
+            memcpy(x0, coeffs_a + k_start, (size_t) L * sizeof(WORK_TYPE));
+            memcpy(x1, coeffs_d + k_start, (size_t) L * sizeof(WORK_TYPE));
+        } else if (k_start >= 0 && k_start + L <= N_in
+                && coeffs_a != NULL && coeffs_d != NULL){
+            for (k = 0; k < L; ++k){
+                x0[k] = coeffs_a[k_start + k];
+                x1[k] = coeffs_d[k_start + k];
+            }
+        } else for (k = 0; k < L; ++k){
+            pywt_index_t j = k_start + k;
+            if (mode == MODE_PERIODIZATION){
+                j %= N_in;
+                if (j < 0)
+                    j += N_in;
+            }
+            if (j >= 0 && j < N_in){
+                x0[k] = coeffs_a != NULL ? coeffs_a[j] : 0;
+                x1[k] = coeffs_d != NULL ? coeffs_d[j] : 0;
+            } else {
+                x0[k] = 0;
+                x1[k] = 0;
+            }
+        }
+
+        CAT(TYPE, _lifting_steps)(scheme, x0, x1, L);
+
+        {
+            const WORK_TYPE * const restrict even = x0 - scheme->shift[0] - k_start;
+            const WORK_TYPE * const restrict odd = x1 - scheme->shift[1] - k_start;
+            // both samples of pair k are inside of the output for k in
+            // [k_lo, k_hi)
+            pywt_index_t k_lo = (s + 1) / 2, k_hi = ((pywt_index_t) O + s) / 2;
+            if (k_lo < t0)
+                k_lo = t0;
+            if (k_hi > t1)
+                k_hi = t1;
+            for (k = t0; k < t1; ++k){
+                const pywt_index_t n = 2 * k - s;
+                if (k == k_lo && k_hi > k_lo && PLAIN_DOUBLE){
+                    double_interleave((const double *) (even + k),
+                                      (const double *) (odd + k),
+                                      scale_even, scale_odd,
+                                      (double *) (output + n),
+                                      (size_t) (k_hi - k_lo));
+                    k = k_hi - 1;
+                    continue;
+                }
+                if (n >= 0 && n < (pywt_index_t) O)
+                    output[n] = scale_even * even[k];
+                if (n + 1 >= 0 && n + 1 < (pywt_index_t) O)
+                    output[n + 1] = scale_odd * odd[k];
+            }
+        }
+    }
+    return 0;
+}
+
+#undef PLAIN_DOUBLE
+#undef WORK_REALS
+#undef restrict
+#endif /* WORK_TYPE */
+#endif /* TYPE */
+#endif /* REAL_TYPE */
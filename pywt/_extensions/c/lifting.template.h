@@ -0,0 +1,74 @@
+/* Copyright (c) 2026 The PyWavelets Developers
+ *                    <https://github.com/PyWavelets/pywt>
+ * See COPYING for license details.
+ */
+
+#include "templating.h"
+
+#ifndef REAL_TYPE
+#error REAL_TYPE must be defined here.
+#else
+
+#ifndef TYPE
+#error TYPE must be defined here.
+#else
+
+#ifndef WORK_TYPE
+#error WORK_TYPE must be defined here.
+#else
+
+#include "lifting.h"
+
+#if defined _MSC_VER
+#define restrict __restrict
+#elif defined __GNUC__
+#define restrict __restrict__
+#endif
+
+/* Type that the lifting steps are computed in */
+typedef WORK_TYPE CAT(TYPE, _lifting_work);
+
+/* Single level DWT of a contiguous input with a lifting scheme.
+ *
+ * Computes the same approximation and detail coefficients (O of each) as
+ * _downsampling_convolution_qmf with the decomposition filters of length F
+ * that were factored into scheme.
+ *
+ * buffer - work buffer of lifting_dwt_buffer_length(scheme, N, F, mode)
+ *          elements
+ *
+ * Returns 0 on success and -1 if the scheme or sizes do not match the mode.
+ */
+int CAT(TYPE, _dwt_lifting)(const TYPE * const restrict input, const size_t N,
+                            const LiftingScheme * const restrict scheme,
+                            const size_t F,
+                            TYPE * const restrict output_a,
+                            TYPE * const restrict output_d,
+                            const size_t O, const MODE mode,
+                            CAT(TYPE, _lifting_work) * const restrict buffer);
+
+/* Single level IDWT with a lifting scheme.
+ *
+ * Computes the same output (O samples) as summing
+ * _upsampling_convolution_valid_sf of coeffs_a and coeffs_d (N of each) with
+ * the reconstruction filters of length F that were factored into scheme.
+ * Either of the coefficients can be NULL and are then taken to be zero.
+ *
+ * buffer - work buffer of lifting_idwt_buffer_length(scheme, N, F, mode)
+ *          elements
+ *
+ * Returns 0 on success and -1 if the scheme or sizes do not match the mode.
+ */
+int CAT(TYPE, _idwt_lifting)(const TYPE * const restrict coeffs_a,
+                             const TYPE * const restrict coeffs_d,
+                             const size_t N,
+                             const LiftingScheme * const restrict scheme,
+                             const size_t F,
+                             TYPE * const restrict output, const size_t O,
+                             const MODE mode,
+                             CAT(TYPE, _lifting_work) * const restrict buffer);
+
+#undef restrict
+#endif /* WORK_TYPE */
+#endif /* TYPE */
+#endif /* REAL_TYPE */
@@ -0,0 +1,261 @@
+/* Copyright (c) 2026 The PyWavelets Developers
+ *                    <https://github.com/PyWavelets/pywt>
+ * See COPYING for license details.
+ */
+
+#include "simd.h"
+#include <string.h>
+
+/*
+ * The kernels are written with the GCC/Clang vector extensions and compiled
+ * once per instruction set using target attributes; the best one supported
+ * by the CPU is selected at runtime.  Other compilers only get the scalar
+ * kernels.
+ *
+ * Multiply-adds must not be fused, otherwise the results would depend on the
+ * selected level.  GCC does not contract in ISO C mode (c_std=c17).
+ */
+#if defined(__clang__)
+#pragma clang fp contract(off)
+#endif
+
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#define SIMD_X86
+#elif defined(__GNUC__) && defined(__aarch64__)
+#define SIMD_NEON
+#endif
+
+/* the lifting kernels shuffle the lanes of the vectors with this builtin
+ * (GCC 12, Clang), and fall back to scalar loops without it */
+#if defined(__has_builtin)
+#if __has_builtin(__builtin_shufflevector)
+#define SIMD_SHUFFLE
+#endif
+#endif
+
+typedef void (*float_dual_fir_t)(const float *, const float *, size_t, int,
+                                 const float *, const float *, size_t, size_t,
+                                 size_t, float *, float *, size_t);
+typedef void (*double_dual_fir_t)(const double *, const double *, size_t, int,
+                                  const double *, const double *, size_t,
+                                  size_t, size_t, double *, double *, size_t);
+typedef void (*double_lifting_step_t)(double *, const double *,
+                                      const double *, size_t, size_t, size_t);
+typedef void (*double_deinterleave_t)(const double *, double *, double *,
+                                      size_t);
+typedef void (*double_interleave_t)(const double *, const double *, double,
+                                    double, double *, size_t);
+typedef void (*double_scale_t)(const double *, double, double *, size_t);
+
+#define SIMD_NAME scalar
+#define SIMD_BYTES 0
+#define SIMD_ATTR
+#define REAL_TYPE float
+#include "simd.template.c"
+#undef REAL_TYPE
+#define REAL_TYPE double
+#define SIMD_LIFTING
+#include "simd.template.c"
+#undef SIMD_LIFTING
+#undef REAL_TYPE
+#undef SIMD_ATTR
+#undef SIMD_BYTES
+#undef SIMD_NAME
+
+#if defined(SIMD_X86)
+
+#define SIMD_NAME sse2
+#define SIMD_BYTES 16
+#define SIMD_ATTR __attribute__((target("sse2")))
+#define REAL_TYPE float
+#include "simd.template.c"
+#undef REAL_TYPE
+#define REAL_TYPE double
+#define SIMD_LIFTING
+#include "simd.template.c"
+#undef SIMD_LIFTING
+#undef REAL_TYPE
+#undef SIMD_ATTR
+#undef SIMD_BYTES
+#undef SIMD_NAME
+
+#define SIMD_NAME avx2
+#define SIMD_BYTES 32
+#define SIMD_ATTR __attribute__((target("avx2")))
+#define REAL_TYPE float
+#include "simd.template.c"
+#undef REAL_TYPE
+#define REAL_TYPE double
+#define SIMD_LIFTING
+#include "simd.template.c"
+#undef SIMD_LIFTING
+#undef REAL_TYPE
+#undef SIMD_ATTR
+#undef SIMD_BYTES
+#undef SIMD_NAME
+
+#define SIMD_NAME avx512f
+#define SIMD_BYTES 64
+#define SIMD_ATTR __attribute__((target("avx512f")))
+#define REAL_TYPE float
+#include "simd.template.c"
+#undef REAL_TYPE
+#define REAL_TYPE double
+#define SIMD_LIFTING
+#include "simd.template.c"
+#undef SIMD_LIFTING
+#undef REAL_TYPE
+#undef SIMD_ATTR
+#undef SIMD_BYTES
+#undef SIMD_NAME
+
+#elif defined(SIMD_NEON)
+
+/* Advanced SIMD is part of the aarch64 baseline */
+#define SIMD_NAME neon
+#define SIMD_BYTES 16
+#define SIMD_ATTR
+#define REAL_TYPE float
+#include "simd.template.c"
+#undef REAL_TYPE
+#define REAL_TYPE double
+#define SIMD_LIFTING
+#include "simd.template.c"
+#undef SIMD_LIFTING
+#undef REAL_TYPE
+#undef SIMD_ATTR
+#undef SIMD_BYTES
+#undef SIMD_NAME
+
+#endif
+
+typedef struct {
+    const char * name;
+    float_dual_fir_t float_dual_fir;
+    double_dual_fir_t double_dual_fir;
+    double_lifting_step_t double_lifting_step;
+    double_deinterleave_t double_deinterleave;
+    double_interleave_t double_interleave;
+    double_scale_t double_scale;
+} SimdLevel;
+
+#define SIMD_LEVEL(name) {#name, float_dual_fir_##name, double_dual_fir_##name, \
+        double_lifting_step_##name, double_deinterleave_##name,               \
+        double_interleave_##name, double_scale_##name}
+
+static const SimdLevel simd_levels[] = {
+    SIMD_LEVEL(scalar),
+#if defined(SIMD_X86)
+    SIMD_LEVEL(sse2),
+    SIMD_LEVEL(avx2),
+    SIMD_LEVEL(avx512f),
+#elif defined(SIMD_NEON)
+    SIMD_LEVEL(neon),
+#endif
+};
+
+#define NUM_SIMD_LEVELS (sizeof(simd_levels) / sizeof(simd_levels[0]))
+
+static const SimdLevel * simd_current = &simd_levels[0];
+
+
+static int simd_level_supported(const size_t level){
+#if defined(SIMD_X86)
+    __builtin_cpu_init();
+    switch (level){
+    case 1:
+        return __builtin_cpu_supports("sse2") != 0;
+    case 2:
+        return __builtin_cpu_supports("avx2") != 0;
+    case 3:
+        return __builtin_cpu_supports("avx512f") != 0;
+    }
+#endif
+    return level < NUM_SIMD_LEVELS;
+}
+
+
+int simd_select(const char * const name){
+    size_t level;
+    if (name == NULL || name[0] == '\0'){
+        for (level = NUM_SIMD_LEVELS - 1; level > 0; --level)
+            if (simd_level_supported(level))
+                break;
+        simd_current = &simd_levels[level];
+        return 0;
+    }
+    for (level = 0; level < NUM_SIMD_LEVELS; ++level){
+        if (strcmp(name, simd_levels[level].name) == 0){
+            if (!simd_level_supported(level))
+                return -2;
+            simd_current = &simd_levels[level];
+            return 0;
+        }
+    }
+    return -1;
+}
+
+
+const char * simd_selected(void){
+    return simd_current->name;
+}
+
+
+const char * simd_level_name(const size_t level){
+    return level < NUM_SIMD_LEVELS ? simd_levels[level].name : NULL;
+}
+
+
+int simd_supported(const char * const name){
+    size_t level;
+    for (level = 0; level < NUM_SIMD_LEVELS; ++level)
+        if (strcmp(name, simd_levels[level].name) == 0)
+            return simd_level_supported(level);
+    return 0;
+}
+
+
+void float_dual_fir(const float * const phase0, const float * const phase1,
+                    const size_t c, const int decimate,
+                    const float * const f1, const float * const f2,
+                    const size_t fstride, const size_t ntaps, const size_t w,
+                    float * const acc1, float * const acc2, const size_t n){
+    simd_current->float_dual_fir(phase0, phase1, c, decimate, f1, f2, fstride,
+                                 ntaps, w, acc1, acc2, n);
+}
+
+
+void double_dual_fir(const double * const phase0, const double * const phase1,
+                     const size_t c, const int decimate,
+                     const double * const f1, const double * const f2,
+                     const size_t fstride, const size_t ntaps, const size_t w,
+                     double * const acc1, double * const acc2, const size_t n){
+    simd_current->double_dual_fir(phase0, phase1, c, decimate, f1, f2, fstride,
+                                  ntaps, w, acc1, acc2, n);
+}
+
+
+void double_lifting_step(double * const x, const double * const src,
+                         const double * const c, const size_t length,
+                         const size_t w, const size_t n){
+    simd_current->double_lifting_step(x, src, c, length, w, n);
+}
+
+
+void double_deinterleave(const double * const p, double * const x0,
+                         double * const x1, const size_t n){
+    simd_current->double_deinterleave(p, x0, x1, n);
+}
+
+
+void double_interleave(const double * const x0, const double * const x1,
+                       const double s0, const double s1, double * const out,
+                       const size_t n){
+    simd_current->double_interleave(x0, x1, s0, s1, out, n);
+}
+
+
+void double_scale(const double * const x, const double s, double * const out,
+                  const size_t n){
+    simd_current->double_scale(x, s, out, n);
+}
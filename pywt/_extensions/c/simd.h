@@ -0,0 +1,89 @@
+/* Copyright (c) 2026 The PyWavelets Developers
+ *                    <https://github.com/PyWavelets/pywt>
+ * See COPYING for license details.
+ */
+
+/* Vectorized inner loops of the convolutions with runtime CPU dispatch */
+
+#pragma once
+
+#include "common.h"
+
+/* Number of outputs processed per call by the convolutions, chosen so that
+ * the accumulators stay in the L1 cache. */
+#define SIMD_BLOCK 256
+
+/* Selects the instruction set used by the kernels below.
+ *
+ * name - one of the names returned by simd_level_name, or NULL (or "") for
+ *        the best level supported by the CPU
+ *
+ * Returns 0 on success, -1 if the name is unknown and -2 if the level is not
+ * supported by the CPU.
+ */
+int simd_select(const char * const name);
+
+/* Name of the currently selected level */
+const char * simd_selected(void);
+
+/* Name of the level-th level (in order of preference, lowest first) compiled
+ * in for this platform, or NULL if there is no such level. */
+const char * simd_level_name(const size_t level);
+
+/* Returns 1 if the named level can be used on this CPU and 0 otherwise */
+int simd_supported(const char * const name);
+
+/*
+ * Accumulates two FIR filters applied to the same (shifted) source:
+ *
+ *     acc1[t] += f1[j*fstride] * src_j[t]
+ *     acc2[t] += f2[j*fstride] * src_j[t]
+ *
+ * for t < n and j = 0, ..., ntaps - 1 in ascending order, where the source
+ * for tap j is
+ *
+ *     src_j = phase0 + (c - j) * w                      (decimate == 0)
+ *     src_j = phase[(c - j) % 2] + (c - j) / 2 * w      (decimate != 0)
+ *
+ * i.e. when decimating, phase0 and phase1 hold the even and odd samples of
+ * the signal.  Complex data is handled as interleaved real data with w = 2.
+ * The terms are added in the same order as in the scalar convolutions, so
+ * all levels give identical results.
+ */
+void float_dual_fir(const float * const phase0, const float * const phase1,
+                    const size_t c, const int decimate,
+                    const float * const f1, const float * const f2,
+                    const size_t fstride, const size_t ntaps, const size_t w,
+                    float * const acc1, float * const acc2, const size_t n);
+
+void double_dual_fir(const double * const phase0, const double * const phase1,
+                     const size_t c, const int decimate,
+                     const double * const f1, const double * const f2,
+                     const size_t fstride, const size_t ntaps, const size_t w,
+                     double * const acc1, double * const acc2, const size_t n);
+
+/*
+ * Kernels of the lifting steps (see lifting.h), which always run in double
+ * precision.  Complex data is handled as interleaved real data with w = 2.
+ *
+ * double_lifting_step:  x[t] += sum_m c[m] * src[t - m*w] for t < n, the
+ *                       terms being summed over m = 0, ..., length - 1 in
+ *                       ascending order before they are added
+ * double_deinterleave:  x0[k] = p[2*k], x1[k] = p[2*k + 1] for k < n
+ * double_interleave:    out[2*k] = s0 * x0[k], out[2*k + 1] = s1 * x1[k]
+ *                       for k < n
+ * double_scale:         out[t] = s * x[t] for t < n
+ */
+void double_lifting_step(double * const x, const double * const src,
+                         const double * const c, const size_t length,
+                         const size_t w, const size_t n);
+
+void double_deinterleave(const double * const p, double * const x0,
+                         double * const x1, const size_t n);
+
+void double_interleave(const double * const x0, const double * const x1,
+                       const double s0, const double s1, double * const out,
+                       const size_t n);
+
+void double_scale(const double * const x, const double s, double * const out,
+                  const size_t n);
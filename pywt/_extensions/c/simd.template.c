@@ -0,0 +1,199 @@
+/* Copyright (c) 2026 The PyWavelets Developers
+ *                    <https://github.com/PyWavelets/pywt>
+ * See COPYING for license details.
+ */
+
+#include "templating.h"
+
+#ifndef REAL_TYPE
+#error REAL_TYPE must be defined here.
+#else
+
+#ifndef SIMD_NAME
+#error SIMD_NAME must be defined here.
+#else
+
+#if defined _MSC_VER
+#define restrict __restrict
+#elif defined __GNUC__
+#define restrict __restrict__
+#endif
+
+/* SIMD_BYTES is the vector width (0 for plain scalar code) and SIMD_ATTR the
+ * function attributes enabling the matching instruction set. */
+
+static SIMD_ATTR void CAT(CAT(REAL_TYPE, _dual_fir_), SIMD_NAME)(
+    const REAL_TYPE * const restrict phase0, const REAL_TYPE * const restrict phase1,
+    const size_t c, const int decimate,
+    const REAL_TYPE * const restrict f1, const REAL_TYPE * const restrict f2,
+    const size_t fstride, const size_t ntaps, const size_t w,
+    REAL_TYPE * const restrict acc1, REAL_TYPE * const restrict acc2,
+    const size_t n)
+{
+    size_t j;
+#if SIMD_BYTES > 0
+    /* unaligned vector type that may alias REAL_TYPE */
+    typedef REAL_TYPE vec __attribute__((vector_size(SIMD_BYTES),
+                                         aligned(sizeof(REAL_TYPE)),
+                                         __may_alias__));
+    const size_t lanes = SIMD_BYTES / sizeof(REAL_TYPE);
+#endif
+
+    for (j = 0; j < ntaps; ++j){
+        const size_t s = c - j;
+        const REAL_TYPE * const restrict src = decimate
+            ? ((s % 2) ? phase1 : phase0) + (s / 2) * w
+            : phase0 + s * w;
+        const REAL_TYPE a = f1[j * fstride];
+        const REAL_TYPE b = f2[j * fstride];
+        size_t t = 0;
+#if SIMD_BYTES > 0
+        for (; t + 2 * lanes <= n; t += 2 * lanes){
+            const vec x0 = *(const vec *)(src + t);
+            const vec x1 = *(const vec *)(src + t + lanes);
+            *(vec *)(acc1 + t) += a * x0;
+            *(vec *)(acc1 + t + lanes) += a * x1;
+            *(vec *)(acc2 + t) += b * x0;
+            *(vec *)(acc2 + t + lanes) += b * x1;
+        }
+        for (; t + lanes <= n; t += lanes){
+            const vec x = *(const vec *)(src + t);
+            *(vec *)(acc1 + t) += a * x;
+            *(vec *)(acc2 + t) += b * x;
+        }
+#endif
+        for (; t < n; ++t){
+            acc1[t] += a * src[t];
+            acc2[t] += b * src[t];
+        }
+    }
+}
+
+#ifdef SIMD_LIFTING
+/* Kernels of the lifting steps, only compiled for REAL_TYPE double.  The
+ * shuffles pick the even and odd lanes of a pair of vectors, or interleave
+ * the lanes of two vectors. */
+#if SIMD_BYTES == 16
+#define SIMD_EVEN 0, 2
+#define SIMD_ODD 1, 3
+#define SIMD_LOW 0, 2
+#define SIMD_HIGH 1, 3
+#elif SIMD_BYTES == 32
+#define SIMD_EVEN 0, 2, 4, 6
+#define SIMD_ODD 1, 3, 5, 7
+#define SIMD_LOW 0, 4, 1, 5
+#define SIMD_HIGH 2, 6, 3, 7
+#elif SIMD_BYTES == 64
+#define SIMD_EVEN 0, 2, 4, 6, 8, 10, 12, 14
+#define SIMD_ODD 1, 3, 5, 7, 9, 11, 13, 15
+#define SIMD_LOW 0, 8, 1, 9, 2, 10, 3, 11
+#define SIMD_HIGH 4, 12, 5, 13, 6, 14, 7, 15
+#endif
+
+static SIMD_ATTR void CAT(CAT(REAL_TYPE, _lifting_step_), SIMD_NAME)(
+    REAL_TYPE * const restrict x, const REAL_TYPE * const restrict src,
+    const double * const restrict c, const size_t length, const size_t w,
+    const size_t n)
+{
+    size_t t = 0, m;
+#if SIMD_BYTES > 0
+    typedef REAL_TYPE vec __attribute__((vector_size(SIMD_BYTES),
+                                         aligned(sizeof(REAL_TYPE)),
+                                         __may_alias__));
+    const size_t lanes = SIMD_BYTES / sizeof(REAL_TYPE);
+
+    for (; t + lanes <= n; t += lanes){
+        vec sum = c[0] * *(const vec *)(src + t);
+        for (m = 1; m < length; ++m)
+            sum += c[m] * *(const vec *)(src + t - m * w);
+        *(vec *)(x + t) += sum;
+    }
+#endif
+    for (; t < n; ++t){
+        REAL_TYPE sum = c[0] * src[t];
+        for (m = 1; m < length; ++m)
+            sum += c[m] * src[t - m * w];
+        x[t] += sum;
+    }
+}
+
+
+static SIMD_ATTR void CAT(CAT(REAL_TYPE, _deinterleave_), SIMD_NAME)(
+    const REAL_TYPE * const restrict p, REAL_TYPE * const restrict x0,
+    REAL_TYPE * const restrict x1, const size_t n)
+{
+    size_t k = 0;
+#if SIMD_BYTES > 0 && defined(SIMD_SHUFFLE)
+    typedef REAL_TYPE vec __attribute__((vector_size(SIMD_BYTES),
+                                         aligned(sizeof(REAL_TYPE)),
+                                         __may_alias__));
+    const size_t lanes = SIMD_BYTES / sizeof(REAL_TYPE);
+
+    for (; k + lanes <= n; k += lanes){
+        const vec a = *(const vec *)(p + 2 * k);
+        const vec b = *(const vec *)(p + 2 * k + lanes);
+        *(vec *)(x0 + k) = __builtin_shufflevector(a, b, SIMD_EVEN);
+        *(vec *)(x1 + k) = __builtin_shufflevector(a, b, SIMD_ODD);
+    }
+#endif
+    for (; k < n; ++k){
+        x0[k] = p[2 * k];
+        x1[k] = p[2 * k + 1];
+    }
+}
+
+
+static SIMD_ATTR void CAT(CAT(REAL_TYPE, _interleave_), SIMD_NAME)(
+    const REAL_TYPE * const restrict x0, const REAL_TYPE * const restrict x1,
+    const REAL_TYPE s0, const REAL_TYPE s1, REAL_TYPE * const restrict out,
+    const size_t n)
+{
+    size_t k = 0;
+#if SIMD_BYTES > 0 && defined(SIMD_SHUFFLE)
+    typedef REAL_TYPE vec __attribute__((vector_size(SIMD_BYTES),
+                                         aligned(sizeof(REAL_TYPE)),
+                                         __may_alias__));
+    const size_t lanes = SIMD_BYTES / sizeof(REAL_TYPE);
+
+    for (; k + lanes <= n; k += lanes){
+        const vec a = s0 * *(const vec *)(x0 + k);
+        const vec b = s1 * *(const vec *)(x1 + k);
+        *(vec *)(out + 2 * k) = __builtin_shufflevector(a, b, SIMD_LOW);
+        *(vec *)(out + 2 * k + lanes) = __builtin_shufflevector(a, b,
+                                                                SIMD_HIGH);
+    }
+#endif
+    for (; k < n; ++k){
+        out[2 * k] = s0 * x0[k];
+        out[2 * k + 1] = s1 * x1[k];
+    }
+}
+
+
+static SIMD_ATTR void CAT(CAT(REAL_TYPE, _scale_), SIMD_NAME)(
+    const REAL_TYPE * const restrict x, const REAL_TYPE s,
+    REAL_TYPE * const restrict out, const size_t n)
+{
+    size_t t = 0;
+#if SIMD_BYTES > 0
+    typedef REAL_TYPE vec __attribute__((vector_size(SIMD_BYTES),
+                                         aligned(sizeof(REAL_TYPE)),
+                                         __may_alias__));
+    const size_t lanes = SIMD_BYTES / sizeof(REAL_TYPE);
+
+    for (; t + lanes <= n; t += lanes)
+        *(vec *)(out + t) = s * *(const vec *)(x + t);
+#endif
+    for (; t < n; ++t)
+        out[t] = s * x[t];
+}
+
+#undef SIMD_EVEN
+#undef SIMD_ODD
+#undef SIMD_LOW
+#undef SIMD_HIGH
+#endif /* SIMD_LIFTING */
+
+#undef restrict
+#endif /* SIMD_NAME */
+#endif /* REAL_TYPE */
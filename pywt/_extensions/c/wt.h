@@ -2,6 +2,8 @@
 
 #include "common.h"
 #include "convolution.h"
+#include "haar.h"
+#include "lifting.h"
 #include "wavelets.h"
 
 #ifdef TYPE
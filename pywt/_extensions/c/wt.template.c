@@ -22,6 +22,59 @@
 #define restrict __restrict__
 #endif
 
+/*
+ * Copies count rows of n items into the contiguous tile (row r at tile + r*n).
+ * The rows start row_stride bytes apart and their items are stride bytes
+ * apart.  The rows are traversed together so that neighbouring rows share
+ * the cache lines loaded from a strided axis.
+ */
+static void CAT(TYPE, _gather_tile)(const char * const restrict base,
+                                    const pywt_index_t row_stride,
+                                    const pywt_index_t stride,
+                                    const size_t n, const size_t count,
+                                    TYPE * const restrict tile){
+    size_t k, r;
+    for (k = 0; k < n; ++k)
+        for (r = 0; r < count; ++r)
+            tile[r * n + k] = *(const TYPE *)(base + (pywt_index_t) r * row_stride
+                                              + (pywt_index_t) k * stride);
+}
+
+
+/* Inverse of _gather_tile */
+static void CAT(TYPE, _scatter_tile)(const TYPE * const restrict tile,
+                                     const size_t n, const size_t count,
+                                     char * const restrict base,
+                                     const pywt_index_t row_stride,
+                                     const pywt_index_t stride){
+    size_t k, r;
+    for (k = 0; k < n; ++k)
+        for (r = 0; r < count; ++r)
+            *(TYPE *)(base + (pywt_index_t) r * row_stride
+                      + (pywt_index_t) k * stride) = tile[r * n + k];
+}
+
+
+/*
+ * Rows along strided axes are processed in tiles of neighbouring rows along
+ * the last of the other axes (inner).  Returns the number of rows of the
+ * tile starting at row i of the iteration.
+ */
+static size_t CAT(TYPE, _tile_count)(const size_t i, const size_t row_stop,
+                                     const size_t inner_len,
+                                     const size_t tile_rows){
+    size_t count;
+    if (tile_rows <= 1)
+        return 1;
+    count = inner_len - i % inner_len;
+    if (count > tile_rows)
+        count = tile_rows;
+    if (count > row_stop - i)
+        count = row_stop - i;
+    return count;
+}
+
+
 /* Decomposition of input with lowpass filter */
 
 int CAT(TYPE, _downcoef_axis)(const TYPE * const restrict input, const ArrayInfo input_info,
@@ -30,9 +83,30 @@ int CAT(TYPE, _downcoef_axis)(const TYPE * const restrict input, const ArrayInfo
                               const Coefficient coef, const MODE dwt_mode,
                               const size_t swt_level,
                               const DiscreteTransformType transform){
-    size_t i;
-    size_t num_loops = 1;
+    return CAT(TYPE, _downcoef_axis_rows)(input, input_info, output, output_info,
+                                          wavelet, axis, coef, dwt_mode,
+                                          swt_level, transform,
+                                          0, (size_t) -1);
+}
+
+
+/*
+ * As _downcoef_axis, but only transforms rows [row_start, row_stop) of the
+ * (C-ordered) iteration over all axes other than `axis`.  Disjoint row ranges
+ * may be processed concurrently, as every call uses its own temporary
+ * buffers.
+ */
+int CAT(TYPE, _downcoef_axis_rows)(const TYPE * const restrict input, const ArrayInfo input_info,
+                                   TYPE * const restrict output, const ArrayInfo output_info,
+                                   const DiscreteWavelet * const restrict wavelet, const size_t axis,
+                                   const Coefficient coef, const MODE dwt_mode,
+                                   const size_t swt_level,
+                                   const DiscreteTransformType transform,
+                                   const size_t row_start, size_t row_stop){
+    size_t i, count;
+    size_t num_loops = 1, inner = 0, tile_rows = 1;
     TYPE * temp_input = NULL, * temp_output = NULL;
+    const int haar = is_haar(wavelet);
 
     // These are boolean values, but MSVC does not have <stdbool.h>
     int make_temp_input, make_temp_output;
@@ -64,22 +138,27 @@ int CAT(TYPE, _downcoef_axis)(const TYPE * const restrict input, const ArrayInfo
 
     make_temp_input = input_info.strides[axis] != sizeof(TYPE);
     make_temp_output = output_info.strides[axis] != sizeof(TYPE);
+    if ((make_temp_input || make_temp_output) && input_info.ndim > 1){
+        inner = (axis == input_info.ndim - 1) ? axis - 1 : input_info.ndim - 1;
+        tile_rows = axis_tile_rows(input_info.shape[axis], sizeof(TYPE));
+    }
     if (make_temp_input)
-        if ((temp_input = malloc(input_info.shape[axis] * sizeof(TYPE))) == NULL)
+        if ((temp_input = malloc(tile_rows * input_info.shape[axis] * sizeof(TYPE))) == NULL)
             goto cleanup;
     if (make_temp_output)
-        if ((temp_output = malloc(output_info.shape[axis] * sizeof(TYPE))) == NULL)
+        if ((temp_output = malloc(tile_rows * output_info.shape[axis] * sizeof(TYPE))) == NULL)
             goto cleanup;
 
     for (i = 0; i < output_info.ndim; ++i){
         if (i != axis)
             num_loops *= output_info.shape[i];
     }
+    if (row_stop > num_loops)
+        row_stop = num_loops;
 
-    for (i = 0; i < num_loops; ++i){
+    for (i = row_start; i < row_stop; i += count){
         pywt_index_t j, axis_idx, input_offset = 0, output_offset = 0;
-        const TYPE * input_row;
-        TYPE * output_row;
+        size_t r;
 
         // Calculate offset into linear buffer
         {
@@ -95,65 +174,89 @@ int CAT(TYPE, _downcoef_axis)(const TYPE * const restrict input, const ArrayInfo
                 }
             }
         }
+        count = CAT(TYPE, _tile_count)(i, row_stop, input_info.shape[inner],
+                                       tile_rows);
 
         // Copy to temporary input if necessary
         if (make_temp_input)
-            for (j = 0; j < input_info.shape[axis]; ++j)
-                // Offsets are byte offsets, to need to cast to char and back
-                temp_input[j] = *(TYPE *)(((char *) input) + input_offset
-                                          + j * input_info.strides[axis]);
-
-        // Select temporary or direct output and input
-        input_row = make_temp_input ? temp_input
-            : (const TYPE *)((const char *) input + input_offset);
-        output_row = make_temp_output ? temp_output
-            : (TYPE *)((char *) output + output_offset);
-
+            CAT(TYPE, _gather_tile)((const char *) input + input_offset,
+                                    input_info.strides[inner],
+                                    input_info.strides[axis],
+                                    input_info.shape[axis], count, temp_input);
+
+        for (r = 0; r < count; ++r){
+            // Select temporary or direct output and input
+            // Offsets are byte offsets, to need to cast to char and back
+            const TYPE * input_row = make_temp_input
+                ? temp_input + r * input_info.shape[axis]
+                : (const TYPE *)((const char *) input + input_offset
+                                 + (pywt_index_t) r * input_info.strides[inner]);
+            TYPE * output_row = make_temp_output
+                ? temp_output + r * output_info.shape[axis]
+                : (TYPE *)((char *) output + output_offset
+                           + (pywt_index_t) r * output_info.strides[inner]);
 
-        switch (transform) {
-            case DWT_TRANSFORM:
-                // Apply along axis
-                switch (coef){
-                case COEF_APPROX:
-                    CAT(TYPE, _dec_a)(input_row, input_info.shape[axis],
-                                      wavelet,
-                                      output_row, output_info.shape[axis],
-                                      dwt_mode);
-                    break;
-                case COEF_DETAIL:
-                    CAT(TYPE, _dec_d)(input_row, input_info.shape[axis],
-                                      wavelet,
-                                      output_row, output_info.shape[axis],
-                                      dwt_mode);
+            switch (transform) {
+                case DWT_TRANSFORM:
+                    if (haar){
+                        CAT(TYPE, _dwt_haar)(
+                            input_row, input_info.shape[axis], wavelet,
+                            coef == COEF_APPROX ? output_row : NULL,
+                            coef == COEF_DETAIL ? output_row : NULL,
+                            output_info.shape[axis], dwt_mode);
+                        break;
+                    }
+                    // Apply along axis
+                    switch (coef){
+                    case COEF_APPROX:
+                        CAT(TYPE, _dec_a)(input_row, input_info.shape[axis],
+                                          wavelet,
+                                          output_row, output_info.shape[axis],
+                                          dwt_mode);
+                        break;
+                    case COEF_DETAIL:
+                        CAT(TYPE, _dec_d)(input_row, input_info.shape[axis],
+                                          wavelet,
+                                          output_row, output_info.shape[axis],
+                                          dwt_mode);
+                        break;
+                    }
                     break;
-                }
-                break;
 
-            case SWT_TRANSFORM:
-                // Apply along axis
-                switch (coef){
-                case COEF_APPROX:
-                    CAT(TYPE, _swt_a)(input_row, input_info.shape[axis],
-                                      wavelet,
-                                      output_row, output_info.shape[axis],
-                                      swt_level);
+                case SWT_TRANSFORM:
+                    if (haar){
+                        CAT(TYPE, _swt_haar)(
+                            input_row, input_info.shape[axis], wavelet,
+                            coef == COEF_APPROX ? output_row : NULL,
+                            coef == COEF_DETAIL ? output_row : NULL,
+                            (unsigned int) swt_level);
+                        break;
+                    }
+                    // Apply along axis
+                    switch (coef){
+                    case COEF_APPROX:
+                        CAT(TYPE, _swt_a)(input_row, input_info.shape[axis],
+                                          wavelet,
+                                          output_row, output_info.shape[axis],
+                                          swt_level);
+                        break;
+                    case COEF_DETAIL:
+                        CAT(TYPE, _swt_d)(input_row, input_info.shape[axis],
+                                          wavelet,
+                                          output_row, output_info.shape[axis],
+                                          swt_level);
+                        break;
+                    }
                     break;
-                case COEF_DETAIL:
-                    CAT(TYPE, _swt_d)(input_row, input_info.shape[axis],
-                                      wavelet,
-                                      output_row, output_info.shape[axis],
-                                      swt_level);
-                    break;
-                }
-                break;
+            }
         }
 
         // Copy from temporary output if necessary
         if (make_temp_output)
-            for (j = 0; j < output_info.shape[axis]; ++j)
-                // Offsets are byte offsets, to need to cast to char and back
-                *(TYPE *)((char *) output + output_offset
-                          + j * output_info.strides[axis]) = output_row[j];
+            CAT(TYPE, _scatter_tile)(temp_output, output_info.shape[axis], count,
+                                     (char *) output + output_offset,
+                                     output_info.strides[inner],
+                                     output_info.strides[axis]);
     }
 
     free(temp_input);
@@ -167,14 +270,205 @@ int CAT(TYPE, _downcoef_axis)(const TYPE * const restrict input, const ArrayInfo
 }
 
 
+/* Decomposition into both approximation and detail coefficients */
+
+int CAT(TYPE, _dwt_axis)(const TYPE * const restrict input, const ArrayInfo input_info,
+                         TYPE * const restrict output_a, const ArrayInfo a_info,
+                         TYPE * const restrict output_d, const ArrayInfo d_info,
+                         const DiscreteWavelet * const restrict wavelet, const size_t axis,
+                         const MODE mode){
+    return CAT(TYPE, _dwt_axis_rows)(input, input_info, output_a, a_info,
+                                     output_d, d_info, wavelet, axis, mode,
+                                     0, (size_t) -1, NULL);
+}
+
+
+/*
+ * As _downcoef_axis_rows, but computes the approximation and detail
+ * coefficients together so that every input row is only read (and extended)
+ * once.
+ */
+int CAT(TYPE, _dwt_axis_rows)(const TYPE * const restrict input, const ArrayInfo input_info,
+                              TYPE * const restrict output_a, const ArrayInfo a_info,
+                              TYPE * const restrict output_d, const ArrayInfo d_info,
+                              const DiscreteWavelet * const restrict wavelet, const size_t axis,
+                              const MODE mode,
+                              const size_t row_start, size_t row_stop,
+                              const LiftingScheme * const restrict lifting){
+    size_t i, count, buffer_size;
+    size_t num_loops = 1, inner = 0, tile_rows = 1;
+    TYPE * buffer = NULL, * temp_input = NULL, * temp_a = NULL, * temp_d = NULL;
+    // the Haar kernel is faster than its lifting steps, and exact
+    const int haar = is_haar(wavelet);
+
+    // These are boolean values, but MSVC does not have <stdbool.h>
+    int make_temp_input, make_temp_a, make_temp_d;
+
+    if (input_info.ndim != a_info.ndim || input_info.ndim != d_info.ndim)
+        return 1;
+    if (axis >= input_info.ndim)
+        return 2;
+
+    for (i = 0; i < input_info.ndim; ++i){
+        if (a_info.shape[i] != d_info.shape[i])
+            return 5;
+        if (i == axis){
+            if (dwt_buffer_length(input_info.shape[i], wavelet->dec_len,
+                                  mode) != a_info.shape[i])
+                return 3;
+        } else {
+            if (input_info.shape[i] != a_info.shape[i])
+                return 5;
+        }
+    }
+
+    make_temp_input = input_info.strides[axis] != sizeof(TYPE);
+    make_temp_a = a_info.strides[axis] != sizeof(TYPE);
+    make_temp_d = d_info.strides[axis] != sizeof(TYPE);
+    if ((make_temp_input || make_temp_a || make_temp_d) && input_info.ndim > 1){
+        inner = (axis == input_info.ndim - 1) ? axis - 1 : input_info.ndim - 1;
+        tile_rows = axis_tile_rows(input_info.shape[axis], sizeof(TYPE));
+    }
+    if (lifting != NULL && !haar){
+        buffer_size = lifting_dwt_buffer_length(lifting, input_info.shape[axis],
+                                                wavelet->dec_len, mode)
+            * sizeof(CAT(TYPE, _lifting_work));
+        if (buffer_size == 0)
+            return 4;
+    } else {
+        buffer_size = downsampling_convolution_qmf_buffer_length(
+            input_info.shape[axis], wavelet->dec_len) * sizeof(TYPE);
+    }
+    if ((buffer = malloc(buffer_size)) == NULL)
+        goto cleanup;
+    if (make_temp_input)
+        if ((temp_input = malloc(tile_rows * input_info.shape[axis] * sizeof(TYPE))) == NULL)
+            goto cleanup;
+    if (make_temp_a)
+        if ((temp_a = malloc(tile_rows * a_info.shape[axis] * sizeof(TYPE))) == NULL)
+            goto cleanup;
+    if (make_temp_d)
+        if ((temp_d = malloc(tile_rows * d_info.shape[axis] * sizeof(TYPE))) == NULL)
+            goto cleanup;
+
+    for (i = 0; i < input_info.ndim; ++i){
+        if (i != axis)
+            num_loops *= input_info.shape[i];
+    }
+    if (row_stop > num_loops)
+        row_stop = num_loops;
+
+    for (i = row_start; i < row_stop; i += count){
+        pywt_index_t j, axis_idx, input_offset = 0, a_offset = 0, d_offset = 0;
+        size_t r;
+
+        // Calculate offset into linear buffer
+        {
+            size_t reduced_idx = i;
+            for (j = 0; j < input_info.ndim; ++j){
+                size_t j_rev = input_info.ndim - 1 - j;
+                if (j_rev != axis){
+                    axis_idx = reduced_idx % input_info.shape[j_rev];
+                    reduced_idx /= input_info.shape[j_rev];
+
+                    input_offset += (axis_idx * input_info.strides[j_rev]);
+                    a_offset += (axis_idx * a_info.strides[j_rev]);
+                    d_offset += (axis_idx * d_info.strides[j_rev]);
+                }
+            }
+        }
+        count = CAT(TYPE, _tile_count)(i, row_stop, input_info.shape[inner],
+                                       tile_rows);
+
+        // Copy to temporary input if necessary
+        if (make_temp_input)
+            CAT(TYPE, _gather_tile)((const char *) input + input_offset,
+                                    input_info.strides[inner],
+                                    input_info.strides[axis],
+                                    input_info.shape[axis], count, temp_input);
+
+        for (r = 0; r < count; ++r){
+            // Select temporary or direct output and input
+            // Offsets are byte offsets, to need to cast to char and back
+            const TYPE * input_row = make_temp_input
+                ? temp_input + r * input_info.shape[axis]
+                : (const TYPE *)((const char *) input + input_offset
+                                 + (pywt_index_t) r * input_info.strides[inner]);
+            TYPE * a_row = make_temp_a
+                ? temp_a + r * a_info.shape[axis]
+                : (TYPE *)((char *) output_a + a_offset
+                           + (pywt_index_t) r * a_info.strides[inner]);
+            TYPE * d_row = make_temp_d
+                ? temp_d + r * d_info.shape[axis]
+                : (TYPE *)((char *) output_d + d_offset
+                           + (pywt_index_t) r * d_info.strides[inner]);
+
+            if (haar)
+                CAT(TYPE, _dwt_haar)(input_row, input_info.shape[axis], wavelet,
+                                     a_row, d_row, a_info.shape[axis], mode);
+            else if (lifting != NULL)
+                CAT(TYPE, _dwt_lifting)(
+                    input_row, input_info.shape[axis], lifting,
+                    wavelet->dec_len, a_row, d_row, a_info.shape[axis], mode,
+                    (CAT(TYPE, _lifting_work) *) buffer);
+            else
+                CAT(TYPE, _downsampling_convolution_qmf)(
+                    input_row, input_info.shape[axis],
+                    wavelet->CAT(dec_lo_, REAL_TYPE), wavelet->CAT(dec_hi_, REAL_TYPE),
+                    wavelet->dec_len, a_row, d_row, a_info.shape[axis], mode, buffer);
+        }
+
+        // Copy from temporary output if necessary
+        if (make_temp_a)
+            CAT(TYPE, _scatter_tile)(temp_a, a_info.shape[axis], count,
+                                     (char *) output_a + a_offset,
+                                     a_info.strides[inner], a_info.strides[axis]);
+        if (make_temp_d)
+            CAT(TYPE, _scatter_tile)(temp_d, d_info.shape[axis], count,
+                                     (char *) output_d + d_offset,
+                                     d_info.strides[inner], d_info.strides[axis]);
+    }
+
+    free(buffer);
+    free(temp_input);
+    free(temp_a);
+    free(temp_d);
+    return 0;
+
+ cleanup:
+    free(buffer);
+    free(temp_input);
+    free(temp_a);
+    free(temp_d);
+    return 6;
+}
+
+
 int CAT(TYPE, _idwt_axis)(const TYPE * const restrict coefs_a, const ArrayInfo * const a_info,
                           const TYPE * const restrict coefs_d, const ArrayInfo * const d_info,
                           TYPE * const restrict output, const ArrayInfo output_info,
                           const DiscreteWavelet * const restrict wavelet,
                           const size_t axis, const MODE mode){
-    size_t i;
-    size_t num_loops = 1;
+    return CAT(TYPE, _idwt_axis_rows)(coefs_a, a_info, coefs_d, d_info,
+                                      output, output_info, wavelet, axis, mode,
+                                      0, (size_t) -1, NULL);
+}
+
+
+/* As _idwt_axis, but only reconstructs rows [row_start, row_stop). */
+int CAT(TYPE, _idwt_axis_rows)(const TYPE * const restrict coefs_a, const ArrayInfo * const a_info,
+                               const TYPE * const restrict coefs_d, const ArrayInfo * const d_info,
+                               TYPE * const restrict output, const ArrayInfo output_info,
+                               const DiscreteWavelet * const restrict wavelet,
+                               const size_t axis, const MODE mode,
+                               const size_t row_start, size_t row_stop,
+                               const LiftingScheme * const restrict lifting){
+    size_t i, count, buffer_size = 0;
+    size_t num_loops = 1, inner = 0, tile_rows = 1;
+    TYPE * buffer = NULL;
     TYPE * temp_coefs_a = NULL, * temp_coefs_d = NULL, * temp_output = NULL;
+    // the Haar kernel is faster than its lifting steps, and exact
+    const int haar = is_haar(wavelet);
 
     // These are boolean values, but MSVC does not have <stdbool.h>
     int make_temp_coefs_a, make_temp_coefs_d, make_temp_output;
@@ -212,27 +506,45 @@ int CAT(TYPE, _idwt_axis)(const TYPE * const restrict coefs_a, const ArrayInfo *
         }
     }
 
+    if (lifting != NULL && !haar){
+        buffer_size = lifting_idwt_buffer_length(
+            lifting, have_a ? a_info->shape[axis] : d_info->shape[axis],
+            wavelet->rec_len, mode) * sizeof(CAT(TYPE, _lifting_work));
+        if (buffer_size == 0)
+            return 4;
+    }
+
     make_temp_coefs_a = have_a && a_info->strides[axis] != sizeof(TYPE);
     make_temp_coefs_d = have_d && d_info->strides[axis] != sizeof(TYPE);
     make_temp_output = output_info.strides[axis] != sizeof(TYPE);
+    if ((make_temp_coefs_a || make_temp_coefs_d || make_temp_output)
+        && output_info.ndim > 1){
+        inner = (axis == output_info.ndim - 1) ? axis - 1 : output_info.ndim - 1;
+        tile_rows = axis_tile_rows(output_info.shape[axis], sizeof(TYPE));
+    }
+    if (buffer_size > 0)
+        if ((buffer = malloc(buffer_size)) == NULL)
+            goto cleanup;
     if (make_temp_coefs_a)
-        if ((temp_coefs_a = malloc(a_info->shape[axis] * sizeof(TYPE))) == NULL)
+        if ((temp_coefs_a = malloc(tile_rows * a_info->shape[axis] * sizeof(TYPE))) == NULL)
             goto cleanup;
     if (make_temp_coefs_d)
-        if ((temp_coefs_d = malloc(d_info->shape[axis] * sizeof(TYPE))) == NULL)
+        if ((temp_coefs_d = malloc(tile_rows * d_info->shape[axis] * sizeof(TYPE))) == NULL)
             goto cleanup;
     if (make_temp_output)
-        if ((temp_output = malloc(output_info.shape[axis] * sizeof(TYPE))) == NULL)
+        if ((temp_output = malloc(tile_rows * output_info.shape[axis] * sizeof(TYPE))) == NULL)
             goto cleanup;
 
     for (i = 0; i < output_info.ndim; ++i){
         if (i != axis)
             num_loops *= output_info.shape[i];
     }
+    if (row_stop > num_loops)
+        row_stop = num_loops;
 
-    for (i = 0; i < num_loops; ++i){
+    for (i = row_start; i < row_stop; i += count){
         pywt_index_t j, axis_idx, a_offset = 0, d_offset = 0, output_offset = 0;
-        TYPE * output_row;
+        size_t r;
 
         // Calculate offset into linear buffer
         {
@@ -251,61 +563,90 @@ int CAT(TYPE, _idwt_axis)(const TYPE * const restrict coefs_a, const ArrayInfo *
                 }
             }
         }
+        count = CAT(TYPE, _tile_count)(i, row_stop, output_info.shape[inner],
+                                       tile_rows);
 
         // Copy to temporary input if necessary
         if (make_temp_coefs_a)
-            for (j = 0; j < a_info->shape[axis]; ++j)
-                // Offsets are byte offsets, to need to cast to char and back
-                temp_coefs_a[j] = *(TYPE *)((char *) coefs_a + a_offset
-                                            + j * a_info->strides[axis]);
+            CAT(TYPE, _gather_tile)((const char *) coefs_a + a_offset,
+                                    a_info->strides[inner], a_info->strides[axis],
+                                    a_info->shape[axis], count, temp_coefs_a);
         if (make_temp_coefs_d)
-            for (j = 0; j < d_info->shape[axis]; ++j)
-                // Offsets are byte offsets, to need to cast to char and back
-                temp_coefs_d[j] = *(TYPE *)((char *) coefs_d + d_offset
-                                            + j * d_info->strides[axis]);
+            CAT(TYPE, _gather_tile)((const char *) coefs_d + d_offset,
+                                    d_info->strides[inner], d_info->strides[axis],
+                                    d_info->shape[axis], count, temp_coefs_d);
 
-        // Select temporary or direct output
-        output_row = make_temp_output ? temp_output
-            : (TYPE *)((char *) output + output_offset);
+        for (r = 0; r < count; ++r){
+            // Select temporary or direct output
+            TYPE * output_row = make_temp_output
+                ? temp_output + r * output_info.shape[axis]
+                : (TYPE *)((char *) output + output_offset
+                           + (pywt_index_t) r * output_info.strides[inner]);
 
-        // upsampling_convolution adds to input, so zero
-        memset(output_row, 0, output_info.shape[axis] * sizeof(TYPE));
+            const TYPE * a_row = NULL, * d_row = NULL;
 
-        if (have_a){
-            // Pointer arithmetic on NULL is undefined
-            const TYPE * a_row = make_temp_coefs_a ? temp_coefs_a
-                : (const TYPE *)((const char *) coefs_a + a_offset);
-            CAT(TYPE, _upsampling_convolution_valid_sf)
-                (a_row, a_info->shape[axis],
-                 wavelet->CAT(rec_lo_, REAL_TYPE), wavelet->rec_len,
-                 output_row, output_info.shape[axis],
-                 mode);
-        }
-        if (have_d){
             // Pointer arithmetic on NULL is undefined
-            const TYPE * d_row = make_temp_coefs_d ? temp_coefs_d
-                : (const TYPE *)((const char *) coefs_d + d_offset);
-            CAT(TYPE, _upsampling_convolution_valid_sf)
-                (d_row, d_info->shape[axis],
-                 wavelet->CAT(rec_hi_, REAL_TYPE), wavelet->rec_len,
-                 output_row, output_info.shape[axis],
-                 mode);
+            if (have_a)
+                a_row = make_temp_coefs_a
+                    ? temp_coefs_a + r * a_info->shape[axis]
+                    : (const TYPE *)((const char *) coefs_a + a_offset
+                                     + (pywt_index_t) r * a_info->strides[inner]);
+            if (have_d)
+                d_row = make_temp_coefs_d
+                    ? temp_coefs_d + r * d_info->shape[axis]
+                    : (const TYPE *)((const char *) coefs_d + d_offset
+                                     + (pywt_index_t) r * d_info->strides[inner]);
+
+            if (haar){
+                CAT(TYPE, _idwt_haar)
+                    (a_row, d_row,
+                     have_a ? a_info->shape[axis] : d_info->shape[axis],
+                     wavelet, output_row, output_info.shape[axis]);
+                continue;
+            }
+            if (lifting != NULL){
+                CAT(TYPE, _idwt_lifting)
+                    (a_row, d_row,
+                     have_a ? a_info->shape[axis] : d_info->shape[axis],
+                     lifting, wavelet->rec_len,
+                     output_row, output_info.shape[axis], mode,
+                     (CAT(TYPE, _lifting_work) *) buffer);
+                continue;
+            }
+
+            // upsampling_convolution adds to input, so zero
+            memset(output_row, 0, output_info.shape[axis] * sizeof(TYPE));
+
+            if (have_a)
+                CAT(TYPE, _upsampling_convolution_valid_sf)
+                    (a_row, a_info->shape[axis],
+                     wavelet->CAT(rec_lo_, REAL_TYPE), wavelet->rec_len,
+                     output_row, output_info.shape[axis],
+                     mode);
+            if (have_d)
+                CAT(TYPE, _upsampling_convolution_valid_sf)
+                    (d_row, d_info->shape[axis],
+                     wavelet->CAT(rec_hi_, REAL_TYPE), wavelet->rec_len,
+                     output_row, output_info.shape[axis],
+                     mode);
         }
 
         // Copy from temporary output if necessary
         if (make_temp_output)
-            for (j = 0; j < output_info.shape[axis]; ++j)
-                // Offsets are byte offsets, to need to cast to char and back
-                *(TYPE *)((char *) output + output_offset
-                          + j * output_info.strides[axis]) = output_row[j];
+            CAT(TYPE, _scatter_tile)(temp_output, output_info.shape[axis], count,
+                                     (char *) output + output_offset,
+                                     output_info.strides[inner],
+                                     output_info.strides[axis]);
     }
 
+    free(buffer);
     free(temp_coefs_a);
     free(temp_coefs_d);
     free(temp_output);
     return 0;
 
  cleanup:
+    free(buffer);
     free(temp_coefs_a);
     free(temp_coefs_d);
     free(temp_output);
@@ -323,6 +664,9 @@ int CAT(TYPE, _dec_a)(const TYPE * const restrict input, const size_t input_len,
         return -1;
     }
 
+    if (is_haar(wavelet))
+        return CAT(TYPE, _dwt_haar)(input, input_len, wavelet, output, NULL,
+                                    output_len, mode);
     return CAT(TYPE, _downsampling_convolution)(input, input_len,
                                                 wavelet->CAT(dec_lo_, REAL_TYPE),
                                                 wavelet->dec_len, output,
@@ -341,6 +685,9 @@ int CAT(TYPE, _dec_d)(const TYPE * const restrict input, const size_t input_len,
     if(output_len != dwt_buffer_length(input_len, wavelet->dec_len, mode))
         return -1;
 
+    if (is_haar(wavelet))
+        return CAT(TYPE, _dwt_haar)(input, input_len, wavelet, NULL, output,
+                                    output_len, mode);
     return CAT(TYPE, _downsampling_convolution)(input, input_len,
                                                 wavelet->CAT(dec_hi_, REAL_TYPE),
                                                 wavelet->dec_len, output,
@@ -348,6 +695,36 @@ int CAT(TYPE, _dec_d)(const TYPE * const restrict input, const size_t input_len,
 }
 
 
+/* Decomposition of input with both filters in a single pass */
+
+int CAT(TYPE, _dec_ad)(const TYPE * const restrict input, const size_t input_len,
+                       const DiscreteWavelet * const restrict wavelet,
+                       TYPE * const restrict output_a, TYPE * const restrict output_d,
+                       const size_t output_len, const MODE mode){
+    TYPE * buffer;
+    int ret;
+
+    /* check output length */
+    if(output_len != dwt_buffer_length(input_len, wavelet->dec_len, mode))
+        return -1;
+
+    if (is_haar(wavelet))
+        return CAT(TYPE, _dwt_haar)(input, input_len, wavelet, output_a,
+                                    output_d, output_len, mode);
+    if ((buffer = wtmalloc(downsampling_convolution_qmf_buffer_length(
+             input_len, wavelet->dec_len) * sizeof(TYPE))) == NULL)
+        return -3;
+    ret = CAT(TYPE, _downsampling_convolution_qmf)(input, input_len,
+                                                   wavelet->CAT(dec_lo_, REAL_TYPE),
+                                                   wavelet->CAT(dec_hi_, REAL_TYPE),
+                                                   wavelet->dec_len,
+                                                   output_a, output_d, output_len,
+                                                   mode, buffer);
+    wtfree(buffer);
+    return ret;
+}
+
+
 /* Direct reconstruction with lowpass reconstruction filter */
 
 int CAT(TYPE, _rec_a)(const TYPE * const restrict coeffs_a, const size_t coeffs_len,
@@ -409,6 +786,13 @@ int CAT(TYPE, _idwt)(const TYPE * const restrict coeffs_a, const size_t coeffs_a
     if(output_len != idwt_buffer_length(input_len, wavelet->rec_len, mode))
         goto error;
 
+    if (is_haar(wavelet)){
+        if (CAT(TYPE, _idwt_haar)(coeffs_a, coeffs_d, input_len, wavelet,
+                                  output, output_len) < 0)
+            goto error;
+        return 0;
+    }
+
     /*
      * Set output to zero (this can be omitted if output array is already
      * cleared) memset(output, 0, output_len * sizeof(TYPE));
@@ -499,6 +883,12 @@ int CAT(TYPE, _swt_a)(const TYPE * const restrict input, pywt_index_t input_len,
                       const DiscreteWavelet * const restrict wavelet,
                       TYPE * const restrict output, pywt_index_t output_len,
                       unsigned int level){
+    if (is_haar(wavelet)){
+        if (input_len < 0 || output_len != input_len)
+            return -1;
+        return CAT(TYPE, _swt_haar)(input, (size_t) input_len, wavelet, output,
+                                    NULL, level);
+    }
     return CAT(TYPE, _swt_)(input, input_len, wavelet->CAT(dec_lo_, REAL_TYPE),
                             wavelet->dec_len, output, output_len, level);
 }
@@ -510,10 +900,535 @@ int CAT(TYPE, _swt_d)(const TYPE * const restrict input, pywt_index_t input_len,
                       const DiscreteWavelet * const restrict wavelet,
                       TYPE * const restrict output, pywt_index_t output_len,
                       unsigned int level){
+    if (is_haar(wavelet)){
+        if (input_len < 0 || output_len != input_len)
+            return -1;
+        return CAT(TYPE, _swt_haar)(input, (size_t) input_len, wavelet, NULL,
+                                    output, level);
+    }
     return CAT(TYPE, _swt_)(input, input_len, wavelet->CAT(dec_hi_, REAL_TYPE),
                             wavelet->dec_len, output, output_len, level);
 }
 
+int CAT(TYPE, _swt_window)(const TYPE * const restrict input,
+                           const size_t num_rows, const size_t N,
+                           const DiscreteWavelet * const restrict wavelet,
+                           const unsigned int level,
+                           const size_t start, const size_t count,
+                           TYPE * const restrict output_a,
+                           TYPE * const restrict output_d){
+    const REAL_TYPE * const restrict lo = wavelet->CAT(dec_lo_, REAL_TYPE);
+    const REAL_TYPE * const restrict hi = wavelet->CAT(dec_hi_, REAL_TYPE);
+    const size_t F = wavelet->dec_len;
+    const int haar = is_haar(wavelet);
+    size_t step, r, i, k;
+
+    if (level < 1 || level > 8 * sizeof(size_t) - 2 || N < 1 || start >= N)
+        return -1;
+    step = (size_t) 1 << (level - 1);
+    // the filter must not wrap around onto itself
+    if (F > 1 && step > (N - 1) / (F - 1))
+        return -1;
+
+    for (r = 0; r < num_rows; ++r){
+        const TYPE * const restrict row = input + r * N;
+        TYPE * const restrict a = output_a + r * count;
+        TYPE * const restrict d = output_d + r * count;
+        size_t n = start;
+        for (i = 0; i < count; ++i, n = (n + 1 < N) ? n + 1 : 0){
+            if (haar){
+                // as in _swt_haar
+                const size_t m = (n + step < N) ? n + step : n + step - N;
+                a[i] = lo[1] * (row[n] + row[m]);
+                d[i] = hi[1] * (row[n] - row[m]);
+            } else {
+                TYPE sum_a = 0, sum_d = 0;
+                size_t idx = (n + step * (F / 2)) % N;
+                for (k = 0; k < F; ++k){
+                    sum_a += row[idx] * lo[k];
+                    sum_d += row[idx] * hi[k];
+                    idx = (idx >= step) ? idx - step : idx + N - step;
+                }
+                a[i] = sum_a;
+                d[i] = sum_d;
+            }
+        }
+    }
+    return 0;
+}
+
+/*
+ * One level of the SWT of a row of N items, the approximation and detail
+ * coefficients at positions [start, stop):
+ *
+ *     output[n] = sum_k filter[k] * input[(n + step * (F/2 - k)) mod N]
+ *
+ * with step = 2**(level - 1).  The terms are summed in the order used by
+ * _swt_a and _swt_d, so that the results are identical.
+ */
+static void CAT(TYPE, _swt_row_range)(const TYPE * const restrict input,
+                                      const size_t N,
+                                      const DiscreteWavelet * const restrict wavelet,
+                                      const int haar, const size_t step,
+                                      TYPE * const restrict output_a,
+                                      TYPE * const restrict output_d,
+                                      const size_t start, const size_t stop){
+    const REAL_TYPE * const restrict lo = wavelet->CAT(dec_lo_, REAL_TYPE);
+    const REAL_TYPE * const restrict hi = wavelet->CAT(dec_hi_, REAL_TYPE);
+    const size_t F = wavelet->dec_len;
+    const pywt_index_t len = (pywt_index_t) N;
+    const pywt_index_t s = (pywt_index_t) step;
+    const pywt_index_t offset = s * (pywt_index_t) (F / 2);
+    const pywt_index_t reach = s * (pywt_index_t) (F - 1);
+    size_t n, k;
+
+    if (haar){
+        // as in _swt_haar
+        const REAL_TYPE p = lo[1], q = hi[1];
+        for (n = start; n < stop; ++n){
+            const size_t m = (n + step < N) ? n + step : n + step - N;
+            output_a[n] = p * (input[n] + input[m]);
+            output_d[n] = q * (input[n] - input[m]);
+        }
+        return;
+    }
+
+    for (n = start; n < stop; ++n){
+        TYPE sum_a = 0, sum_d = 0;
+        const pywt_index_t first = (pywt_index_t) n + offset;
+        pywt_index_t idx = first;
+        if (idx < len && idx - reach >= 0){
+            for (k = 0; k < F; ++k, idx -= s){
+                sum_a += input[idx] * lo[k];
+                sum_d += input[idx] * hi[k];
+            }
+        } else {
+            // the filter wraps around the ends of the row.  Like the
+            // periodization convolution, start with the taps past the right
+            // end, innermost first.
+            size_t wrapped = 0;
+            while (wrapped < F && first - (pywt_index_t) wrapped * s >= len)
+                ++wrapped;
+            for (k = wrapped; k-- > 0;){
+                const pywt_index_t m = (first - (pywt_index_t) k * s) % len;
+                sum_a += lo[k] * input[m];
+                sum_d += hi[k] * input[m];
+            }
+            for (k = wrapped; k < F; ++k){
+                pywt_index_t m = (first - (pywt_index_t) k * s) % len;
+                if (m < 0)
+                    m += len;
+                sum_a += lo[k] * input[m];
+                sum_d += hi[k] * input[m];
+            }
+        }
+        output_a[n] = sum_a;
+        output_d[n] = sum_d;
+    }
+}
+
+
+/* Number of samples of a row advanced per sweep over the levels */
+#define SWT_BLOCK 2048
+
+/*
+ * Levels first_level, ..., first_level + levels - 1 of the SWT of a row of N
+ * items, with the coefficients of level first_level + m written to a[m] and
+ * d[m].  The levels are computed together in a single sweep along the row:
+ * after each block of the input, every level is advanced as far as the
+ * coefficients of the level below allow, so the data each level reads has
+ * only just been written.  Only the coefficients whose filter wraps around
+ * the ends of the row, (F - 1) * 2**(level - 1) of each level, are left to a
+ * second pass.  work holds 2 * levels items.
+ */
+static void CAT(TYPE, _swt_levels_row)(const TYPE * const restrict input,
+                                       const size_t N,
+                                       const DiscreteWavelet * const restrict wavelet,
+                                       const int haar, const unsigned int first_level,
+                                       const size_t levels,
+                                       TYPE * const * const restrict a,
+                                       TYPE * const * const restrict d,
+                                       size_t * const restrict work){
+    const size_t F = wavelet->dec_len;
+    size_t * const begin = work, * const end = work + levels;
+    size_t m, pos, left = 0;
+
+    // the first coefficient of level m whose filter does not wrap around
+    // the start of the row, given that of the level below
+    for (m = 0; m < levels; ++m){
+        const size_t step = (size_t) 1 << (first_level + m - 1);
+        left += step * (F / 2 - 1);
+        if (left > N)
+            left = N;
+        begin[m] = end[m] = left;
+    }
+
+    for (pos = 0; pos < N;){
+        size_t available;
+        pos = (N - pos > SWT_BLOCK) ? pos + SWT_BLOCK : N;
+        available = pos;
+        for (m = 0; m < levels; ++m){
+            const size_t step = (size_t) 1 << (first_level + m - 1);
+            const size_t target = (available > step * (F / 2))
+                ? available - step * (F / 2) : 0;
+            if (target > end[m]){
+                CAT(TYPE, _swt_row_range)(m ? a[m - 1] : input, N,
+                                          wavelet, haar, step,
+                                          a[m], d[m], end[m], target);
+                end[m] = target;
+            }
+            available = end[m];
+        }
+    }
+
+    // the coefficients at both ends, once the level below is complete
+    for (m = 0; m < levels; ++m){
+        const size_t step = (size_t) 1 << (first_level + m - 1);
+        const TYPE * const level_input = m ? a[m - 1] : input;
+        CAT(TYPE, _swt_row_range)(level_input, N, wavelet, haar, step,
+                                  a[m], d[m], 0, begin[m]);
+        CAT(TYPE, _swt_row_range)(level_input, N, wavelet, haar, step,
+                                  a[m], d[m], end[m], N);
+    }
+}
+
+#undef SWT_BLOCK
+
+
+int CAT(TYPE, _swt_levels_axis)(const TYPE * const restrict input, const ArrayInfo input_info,
+                                TYPE * const restrict coefs_a, const ArrayInfo a_info,
+                                TYPE * const restrict coefs_d, const ArrayInfo d_info,
+                                const DiscreteWavelet * const restrict wavelet,
+                                const size_t axis, const unsigned int first_level,
+                                const size_t levels){
+    size_t i, m, count, N, a_levels, row_items;
+    size_t num_loops = 1, inner = 0, tile_rows = 1;
+    TYPE * temp_input = NULL, * temp_a = NULL, * temp_d = NULL;
+    TYPE ** a_rows = NULL, ** d_rows = NULL;
+    size_t * work = NULL;
+    const int haar = is_haar(wavelet);
+
+    // These are boolean values, but MSVC does not have <stdbool.h>
+    int make_temp_input, make_temp_a, make_temp_d;
+
+    if (levels < 1 || first_level < 1 ||
+        first_level + levels - 1 > 8 * sizeof(size_t) - 1)
+        return 1;
+    if (a_info.ndim != input_info.ndim + 1 || d_info.ndim != input_info.ndim + 1)
+        return 1;
+    if (axis >= input_info.ndim)
+        return 1;
+    for (i = 0; i < input_info.ndim; ++i){
+        if (a_info.shape[i + 1] != input_info.shape[i] ||
+            d_info.shape[i + 1] != input_info.shape[i])
+            return 1;
+    }
+    a_levels = a_info.shape[0];
+    if (d_info.shape[0] != levels || (a_levels != levels && a_levels != 1))
+        return 1;
+    // the rows are extended periodically, so any length will do as long as
+    // the shift of the Haar filters, 2**(level - 1), does not exceed it
+    N = input_info.shape[axis];
+    if (N == 0 || ((size_t) 1 << (first_level + levels - 2)) > N)
+        return 1;
+
+    // with a single approximation, those of the other levels are temporary
+    make_temp_input = input_info.strides[axis] != sizeof(TYPE);
+    make_temp_a = a_info.strides[axis + 1] != sizeof(TYPE) || a_levels != levels;
+    make_temp_d = d_info.strides[axis + 1] != sizeof(TYPE);
+    if ((make_temp_input || make_temp_a || make_temp_d) && input_info.ndim > 1){
+        inner = (axis == input_info.ndim - 1) ? axis - 1 : input_info.ndim - 1;
+        tile_rows = axis_tile_rows(N, sizeof(TYPE));
+        // the coefficients of all levels are kept for the whole tile
+        row_items = N * (1 + 2 * levels);
+        while (tile_rows > 1 && tile_rows * row_items * sizeof(TYPE) > 4 * 1024 * 1024)
+            tile_rows /= 2;
+    }
+    if (make_temp_input)
+        if ((temp_input = malloc(tile_rows * N * sizeof(TYPE))) == NULL)
+            goto cleanup;
+    if (make_temp_a)
+        if ((temp_a = malloc(levels * tile_rows * N * sizeof(TYPE))) == NULL)
+            goto cleanup;
+    if (make_temp_d)
+        if ((temp_d = malloc(levels * tile_rows * N * sizeof(TYPE))) == NULL)
+            goto cleanup;
+    if ((a_rows = malloc(levels * sizeof(TYPE *))) == NULL ||
+        (d_rows = malloc(levels * sizeof(TYPE *))) == NULL ||
+        (work = malloc(2 * levels * sizeof(size_t))) == NULL)
+        goto cleanup;
+
+    for (i = 0; i < input_info.ndim; ++i){
+        if (i != axis)
+            num_loops *= input_info.shape[i];
+    }
+
+    for (i = 0; i < num_loops; i += count){
+        pywt_index_t j, axis_idx, input_offset = 0, a_offset = 0, d_offset = 0;
+        size_t r;
+
+        // Calculate offset into linear buffer
+        {
+            size_t reduced_idx = i;
+            for (j = 0; j < input_info.ndim; ++j){
+                size_t j_rev = input_info.ndim - 1 - j;
+                if (j_rev != axis){
+                    axis_idx = reduced_idx % input_info.shape[j_rev];
+                    reduced_idx /= input_info.shape[j_rev];
+
+                    input_offset += (axis_idx * input_info.strides[j_rev]);
+                    a_offset += (axis_idx * a_info.strides[j_rev + 1]);
+                    d_offset += (axis_idx * d_info.strides[j_rev + 1]);
+                }
+            }
+        }
+        count = CAT(TYPE, _tile_count)(i, num_loops, input_info.shape[inner],
+                                       tile_rows);
+
+        // Copy to temporary input if necessary
+        if (make_temp_input)
+            CAT(TYPE, _gather_tile)((const char *) input + input_offset,
+                                    input_info.strides[inner],
+                                    input_info.strides[axis],
+                                    N, count, temp_input);
+
+        for (r = 0; r < count; ++r){
+            const TYPE * const input_row = make_temp_input
+                ? temp_input + r * N
+                : (const TYPE *)((const char *) input + input_offset
+                                 + (pywt_index_t) r * input_info.strides[inner]);
+            for (m = 0; m < levels; ++m){
+                a_rows[m] = make_temp_a
+                    ? temp_a + (m * tile_rows + r) * N
+                    : (TYPE *)((char *) coefs_a + a_offset
+                               + (pywt_index_t) m * a_info.strides[0]
+                               + (pywt_index_t) r * a_info.strides[inner + 1]);
+                d_rows[m] = make_temp_d
+                    ? temp_d + (m * tile_rows + r) * N
+                    : (TYPE *)((char *) coefs_d + d_offset
+                               + (pywt_index_t) m * d_info.strides[0]
+                               + (pywt_index_t) r * d_info.strides[inner + 1]);
+            }
+            CAT(TYPE, _swt_levels_row)(input_row, N, wavelet, haar, first_level,
+                                       levels, a_rows, d_rows, work);
+        }
+
+        // Copy from temporary output if necessary
+        for (m = 0; m < levels; ++m){
+            if (make_temp_a && m + a_levels >= levels)
+                CAT(TYPE, _scatter_tile)(temp_a + m * tile_rows * N, N, count,
+                                         (char *) coefs_a + a_offset
+                                         + (pywt_index_t) (m + a_levels - levels)
+                                           * a_info.strides[0],
+                                         a_info.strides[inner + 1],
+                                         a_info.strides[axis + 1]);
+            if (make_temp_d)
+                CAT(TYPE, _scatter_tile)(temp_d + m * tile_rows * N, N, count,
+                                         (char *) coefs_d + d_offset
+                                         + (pywt_index_t) m * d_info.strides[0],
+                                         d_info.strides[inner + 1],
+                                         d_info.strides[axis + 1]);
+        }
+    }
+
+    free(temp_input);
+    free(temp_a);
+    free(temp_d);
+    free(a_rows);
+    free(d_rows);
+    free(work);
+    return 0;
+
+ cleanup:
+    free(temp_input);
+    free(temp_a);
+    free(temp_d);
+    free(a_rows);
+    free(d_rows);
+    free(work);
+    return 2;
+}
+
+
+/*
+ * Inverse SWT of a single level along a row.  output[n] is the average of
+ * the reconstructions from the even and the odd coefficients of each phase,
+ *
+ *     (sum_k rec_lo[k] * a[n + step * (F/2 - 1 - k)]
+ *            + rec_hi[k] * d[n + step * (F/2 - 1 - k)]) / 2,
+ *
+ * with the indices taken modulo N and step = 2**(level - 1).  Either
+ * coefs_a or coefs_d may be NULL for coefficients that are all zero.
+ */
+static void CAT(TYPE, _iswt_row)(const TYPE * const restrict coefs_a,
+                                 const TYPE * const restrict coefs_d,
+                                 const size_t N,
+                                 const REAL_TYPE * const restrict rec_lo,
+                                 const REAL_TYPE * const restrict rec_hi,
+                                 const size_t F, const size_t step,
+                                 TYPE * const restrict output){
+    const pywt_index_t len = (pywt_index_t) N;
+    const pywt_index_t s = (pywt_index_t) step;
+    const pywt_index_t offset = s * (pywt_index_t) (F / 2 - 1);
+    const pywt_index_t reach = s * (pywt_index_t) (F - 1);
+    pywt_index_t n, idx;
+    size_t k;
+
+    for (n = 0; n < len; ++n){
+        // the even and odd taps are those of the two reconstructions, and
+        // are summed separately to keep the rounding errors of long filters
+        // small
+        TYPE sum_a[2] = {0, 0}, sum_d[2] = {0, 0};
+        const pywt_index_t first = n + offset;
+        if (first < len && first - reach >= 0){
+            if (coefs_a != NULL)
+                for (k = 0, idx = first; k < F; ++k, idx -= s)
+                    sum_a[k & 1] += rec_lo[k] * coefs_a[idx];
+            if (coefs_d != NULL)
+                for (k = 0, idx = first; k < F; ++k, idx -= s)
+                    sum_d[k & 1] += rec_hi[k] * coefs_d[idx];
+        } else {
+            // the filter wraps around the ends of the row
+            for (k = 0, idx = first; k < F; ++k, idx -= s){
+                pywt_index_t m = idx % len;
+                if (m < 0)
+                    m += len;
+                if (coefs_a != NULL)
+                    sum_a[k & 1] += rec_lo[k] * coefs_a[m];
+                if (coefs_d != NULL)
+                    sum_d[k & 1] += rec_hi[k] * coefs_d[m];
+            }
+        }
+        output[n] = ((sum_a[0] + sum_d[0]) + (sum_a[1] + sum_d[1])) / 2;
+    }
+}
+
+
+int CAT(TYPE, _iswt_axis)(const TYPE * const restrict coefs_a, const ArrayInfo a_info,
+                          const TYPE * const restrict coefs_d, const ArrayInfo d_info,
+                          TYPE * const restrict output, const ArrayInfo output_info,
+                          const DiscreteWavelet * const restrict wavelet,
+                          const size_t axis, const unsigned int level){
+    size_t i, count, step;
+    size_t num_loops = 1, inner = 0, tile_rows = 1;
+    TYPE * temp_coefs_a = NULL, * temp_coefs_d = NULL, * temp_output = NULL;
+
+    // These are boolean values, but MSVC does not have <stdbool.h>
+    int make_temp_coefs_a, make_temp_coefs_d, make_temp_output;
+
+    if (level < 1 || level > 8 * sizeof(size_t) - 1)
+        return 1;
+    if (coefs_a == NULL && coefs_d == NULL)
+        return 1;
+    if (a_info.ndim != output_info.ndim || d_info.ndim != output_info.ndim)
+        return 1;
+    if (axis >= output_info.ndim)
+        return 1;
+    for (i = 0; i < output_info.ndim; ++i){
+        if (a_info.shape[i] != output_info.shape[i] ||
+            d_info.shape[i] != output_info.shape[i])
+            return 1;
+    }
+    if (output_info.shape[axis] == 0)
+        return 1;
+    step = (size_t) 1 << (level - 1);
+
+    make_temp_coefs_a = coefs_a != NULL && a_info.strides[axis] != sizeof(TYPE);
+    make_temp_coefs_d = coefs_d != NULL && d_info.strides[axis] != sizeof(TYPE);
+    make_temp_output = output_info.strides[axis] != sizeof(TYPE);
+    if ((make_temp_coefs_a || make_temp_coefs_d || make_temp_output)
+        && output_info.ndim > 1){
+        inner = (axis == output_info.ndim - 1) ? axis - 1 : output_info.ndim - 1;
+        tile_rows = axis_tile_rows(output_info.shape[axis], sizeof(TYPE));
+    }
+    if (make_temp_coefs_a)
+        if ((temp_coefs_a = malloc(tile_rows * a_info.shape[axis] * sizeof(TYPE))) == NULL)
+            goto cleanup;
+    if (make_temp_coefs_d)
+        if ((temp_coefs_d = malloc(tile_rows * d_info.shape[axis] * sizeof(TYPE))) == NULL)
+            goto cleanup;
+    if (make_temp_output)
+        if ((temp_output = malloc(tile_rows * output_info.shape[axis] * sizeof(TYPE))) == NULL)
+            goto cleanup;
+
+    for (i = 0; i < output_info.ndim; ++i){
+        if (i != axis)
+            num_loops *= output_info.shape[i];
+    }
+
+    for (i = 0; i < num_loops; i += count){
+        pywt_index_t j, axis_idx, a_offset = 0, d_offset = 0, output_offset = 0;
+        size_t r;
+
+        // Calculate offset into linear buffer
+        {
+            size_t reduced_idx = i;
+            for (j = 0; j < output_info.ndim; ++j){
+                size_t j_rev = output_info.ndim - 1 - j;
+                if (j_rev != axis){
+                    axis_idx = reduced_idx % output_info.shape[j_rev];
+                    reduced_idx /= output_info.shape[j_rev];
+
+                    a_offset += (axis_idx * a_info.strides[j_rev]);
+                    d_offset += (axis_idx * d_info.strides[j_rev]);
+                    output_offset += (axis_idx * output_info.strides[j_rev]);
+                }
+            }
+        }
+        count = CAT(TYPE, _tile_count)(i, num_loops, output_info.shape[inner],
+                                       tile_rows);
+
+        // Copy to temporary input if necessary
+        if (make_temp_coefs_a)
+            CAT(TYPE, _gather_tile)((const char *) coefs_a + a_offset,
+                                    a_info.strides[inner], a_info.strides[axis],
+                                    a_info.shape[axis], count, temp_coefs_a);
+        if (make_temp_coefs_d)
+            CAT(TYPE, _gather_tile)((const char *) coefs_d + d_offset,
+                                    d_info.strides[inner], d_info.strides[axis],
+                                    d_info.shape[axis], count, temp_coefs_d);
+
+        for (r = 0; r < count; ++r){
+            const size_t n = output_info.shape[axis];
+            const TYPE * const a_row = coefs_a == NULL ? NULL
+                : make_temp_coefs_a ? temp_coefs_a + r * n
+                : (const TYPE *)((const char *) coefs_a + a_offset
+                                 + (pywt_index_t) r * a_info.strides[inner]);
+            const TYPE * const d_row = coefs_d == NULL ? NULL
+                : make_temp_coefs_d ? temp_coefs_d + r * n
+                : (const TYPE *)((const char *) coefs_d + d_offset
+                                 + (pywt_index_t) r * d_info.strides[inner]);
+            TYPE * const output_row = make_temp_output
+                ? temp_output + r * n
+                : (TYPE *)((char *) output + output_offset
+                           + (pywt_index_t) r * output_info.strides[inner]);
+
+            CAT(TYPE, _iswt_row)(a_row, d_row, n,
+                                 wavelet->CAT(rec_lo_, REAL_TYPE),
+                                 wavelet->CAT(rec_hi_, REAL_TYPE),
+                                 wavelet->rec_len, step, output_row);
+        }
+
+        // Copy from temporary output if necessary
+        if (make_temp_output)
+            CAT(TYPE, _scatter_tile)(temp_output, output_info.shape[axis], count,
+                                     (char *) output + output_offset,
+                                     output_info.strides[inner],
+                                     output_info.strides[axis]);
+    }
+
+    free(temp_coefs_a);
+    free(temp_coefs_d);
+    free(temp_output);
+    return 0;
+
+ cleanup:
+    free(temp_coefs_a);
+    free(temp_coefs_d);
+    free(temp_output);
+    return 2;
+}
+
 #endif /* REAL_TYPE */
 #endif /* TYPE */
 #undef restrict
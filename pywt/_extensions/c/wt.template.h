@@ -30,6 +30,33 @@ int CAT(TYPE, _downcoef_axis)(const TYPE * const restrict input, const ArrayInfo
                               const size_t swt_level,
                               const DiscreteTransformType transform);
 
+/* Only transform rows [row_start, row_stop) of the iteration over the axes
+ * other than `axis` (used to split the work across threads). */
+int CAT(TYPE, _downcoef_axis_rows)(const TYPE * const restrict input, const ArrayInfo input_info,
+                                   TYPE * const restrict output, const ArrayInfo output_info,
+                                   const DiscreteWavelet * const restrict wavelet, const size_t axis,
+                                   const Coefficient detail, const MODE dwt_mode,
+                                   const size_t swt_level,
+                                   const DiscreteTransformType transform,
+                                   const size_t row_start, size_t row_stop);
+
+/* Approximation and detail coefficients along axis in a single pass */
+int CAT(TYPE, _dwt_axis)(const TYPE * const restrict input, const ArrayInfo input_info,
+                         TYPE * const restrict output_a, const ArrayInfo a_info,
+                         TYPE * const restrict output_d, const ArrayInfo d_info,
+                         const DiscreteWavelet * const restrict wavelet, const size_t axis,
+                         const MODE mode);
+
+/* If lifting is not NULL, the rows are transformed with this factorization
+ * of the wavelet's decomposition filters instead of by convolution. */
+int CAT(TYPE, _dwt_axis_rows)(const TYPE * const restrict input, const ArrayInfo input_info,
+                              TYPE * const restrict output_a, const ArrayInfo a_info,
+                              TYPE * const restrict output_d, const ArrayInfo d_info,
+                              const DiscreteWavelet * const restrict wavelet, const size_t axis,
+                              const MODE mode,
+                              const size_t row_start, size_t row_stop,
+                              const LiftingScheme * const restrict lifting);
+
 // a_info and d_info are pointers, as they may be NULL
 int CAT(TYPE, _idwt_axis)(const TYPE * const restrict coefs_a, const ArrayInfo * a_info,
                           const TYPE * const restrict coefs_d, const ArrayInfo * d_info,
@@ -37,6 +64,16 @@ int CAT(TYPE, _idwt_axis)(const TYPE * const restrict coefs_a, const ArrayInfo *
                           const DiscreteWavelet * const restrict wavelet,
                           const size_t axis, const MODE mode);
 
+/* As for _dwt_axis_rows, lifting is a factorization of the reconstruction
+ * filters or NULL. */
+int CAT(TYPE, _idwt_axis_rows)(const TYPE * const restrict coefs_a, const ArrayInfo * a_info,
+                               const TYPE * const restrict coefs_d, const ArrayInfo * d_info,
+                               TYPE * const restrict output, const ArrayInfo output_info,
+                               const DiscreteWavelet * const restrict wavelet,
+                               const size_t axis, const MODE mode,
+                               const size_t row_start, size_t row_stop,
+                               const LiftingScheme * const restrict lifting);
+
 /* Single level decomposition */
 int CAT(TYPE, _dec_a)(const TYPE * const restrict input, const size_t input_len,
                       const DiscreteWavelet * const restrict wavelet,
@@ -48,6 +85,11 @@ int CAT(TYPE, _dec_d)(const TYPE * const restrict input, const size_t input_len,
                       TYPE * const restrict output, const size_t output_len,
                       const MODE mode);
 
+int CAT(TYPE, _dec_ad)(const TYPE * const restrict input, const size_t input_len,
+                       const DiscreteWavelet * const restrict wavelet,
+                       TYPE * const restrict output_a, TYPE * const restrict output_d,
+                       const size_t output_len, const MODE mode);
+
 /* Single level reconstruction */
 int CAT(TYPE, _rec_a)(const TYPE * const restrict coeffs_a, const size_t coeffs_len,
                       const DiscreteWavelet * const restrict wavelet,
@@ -74,10 +116,47 @@ int CAT(TYPE, _swt_d)(const TYPE * const restrict input, pywt_index_t input_len,
                       TYPE * const restrict output, pywt_index_t output_len,
                       unsigned int level);
 
+/* Coefficients start, ..., start + count - 1 of the SWT at the given level of
+ * each of the num_rows rows of N items of input, which are taken as circular:
+ *
+ *     output[r*count + i] = sum_k filter[k] * input[r*N + (n + step*(F/2 - k)) mod N]
+ *
+ * with n = (start + i) mod N and step = 2**(level - 1).  The terms are summed
+ * as by _swt_a and _swt_d away from the ends of their input, so that the
+ * coefficients are identical.  The filter must be shorter than the rows,
+ * (F - 1) * step < N. */
+int CAT(TYPE, _swt_window)(const TYPE * const restrict input,
+                           const size_t num_rows, const size_t N,
+                           const DiscreteWavelet * const restrict wavelet,
+                           const unsigned int level,
+                           const size_t start, const size_t count,
+                           TYPE * const restrict output_a,
+                           TYPE * const restrict output_d);
+
 int CAT(TYPE, _swt_axis)(const TYPE * const restrict input, const ArrayInfo input_info,
                          TYPE * const restrict output, const ArrayInfo output_info,
                          const DiscreteWavelet * const restrict wavelet, const size_t axis,
                          const Coefficient detail, unsigned int level);
 
+/* Levels first_level, ..., first_level + levels - 1 of the SWT along axis,
+ * computed together.  coefs_d has the shape (levels, ) + input shape, with
+ * the finest level first, and coefs_a either the same shape or (1, ) + input
+ * shape for the approximation of the last level only. */
+int CAT(TYPE, _swt_levels_axis)(const TYPE * const restrict input, const ArrayInfo input_info,
+                                TYPE * const restrict coefs_a, const ArrayInfo a_info,
+                                TYPE * const restrict coefs_d, const ArrayInfo d_info,
+                                const DiscreteWavelet * const restrict wavelet,
+                                const size_t axis, const unsigned int first_level,
+                                const size_t levels);
+
+/* Inverse SWT of a single level along axis.  coefs_a, coefs_d and output
+ * all have the same shape.  One of coefs_a and coefs_d may be NULL for
+ * coefficients that are all zero. */
+int CAT(TYPE, _iswt_axis)(const TYPE * const restrict coefs_a, const ArrayInfo a_info,
+                          const TYPE * const restrict coefs_d, const ArrayInfo d_info,
+                          TYPE * const restrict output, const ArrayInfo output_info,
+                          const DiscreteWavelet * const restrict wavelet,
+                          const size_t axis, const unsigned int level);
+
 #endif /* TYPE */
 #undef restrict
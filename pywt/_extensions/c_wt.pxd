@@ -9,6 +9,20 @@ from .wavelet cimport DiscreteWavelet, ContinuousWavelet
 
 include "config.pxi"
 
+cdef extern from "c/lifting.h":
+    ctypedef struct LiftingScheme:
+        size_t num_steps
+        int *target
+        pywt_index_t *offset
+        size_t *length
+        double *coeffs
+        double scale[2]
+        pywt_index_t shift[2]
+        int parity
+
+cdef extern from "c/haar.h":
+    cdef int is_haar(const DiscreteWavelet * const wavelet) nogil
+
 cdef extern from "c/wt.h":
     # Cython does not know the 'restrict' keyword
     cdef int double_downcoef_axis(const double * const input, const ArrayInfo input_info,
@@ -17,11 +31,37 @@ cdef extern from "c/wt.h":
                                   const Coefficient detail, const MODE dwt_mode,
                                   const size_t swt_level,
                                   const DiscreteTransformType transform) nogil
+    cdef int double_downcoef_axis_rows(const double * const input, const ArrayInfo input_info,
+                                  double * const output, const ArrayInfo output_info,
+                                  const DiscreteWavelet * const wavelet, const size_t axis,
+                                  const Coefficient detail, const MODE dwt_mode,
+                                  const size_t swt_level,
+                                  const DiscreteTransformType transform,
+                                  const size_t row_start, size_t row_stop) nogil
+    cdef int double_dwt_axis(const double * const input, const ArrayInfo input_info,
+                             double * const output_a, const ArrayInfo a_info,
+                             double * const output_d, const ArrayInfo d_info,
+                             const DiscreteWavelet * const wavelet, const size_t axis,
+                             const MODE mode) nogil
+    cdef int double_dwt_axis_rows(const double * const input, const ArrayInfo input_info,
+                                  double * const output_a, const ArrayInfo a_info,
+                                  double * const output_d, const ArrayInfo d_info,
+                                  const DiscreteWavelet * const wavelet, const size_t axis,
+                                  const MODE mode,
+                                  const size_t row_start, size_t row_stop,
+                                  const LiftingScheme * const lifting) nogil
     cdef int double_idwt_axis(const double * const coefs_a, const ArrayInfo * const a_info,
                               const double * const coefs_d, const ArrayInfo * const d_info,
                               double * const output, const ArrayInfo output_info,
                               const DiscreteWavelet * const wavelet, const size_t axis,
                               const MODE mode) nogil
+    cdef int double_idwt_axis_rows(const double * const coefs_a, const ArrayInfo * const a_info,
+                                  const double * const coefs_d, const ArrayInfo * const d_info,
+                                  double * const output, const ArrayInfo output_info,
+                                  const DiscreteWavelet * const wavelet, const size_t axis,
+                                  const MODE mode,
+                                  const size_t row_start, size_t row_stop,
+                                  const LiftingScheme * const lifting) nogil
     cdef int double_dec_a(const double * const input, const size_t input_len,
                           const DiscreteWavelet * const wavelet,
                           double * const output, const size_t output_len,
@@ -30,6 +70,10 @@ cdef extern from "c/wt.h":
                           const DiscreteWavelet * const wavelet,
                           double * const output, const size_t output_len,
                           const MODE mode) nogil
+    cdef int double_dec_ad(const double * const input, const size_t input_len,
+                           const DiscreteWavelet * const wavelet,
+                           double * const output_a, double * const output_d,
+                           const size_t output_len, const MODE mode) nogil
 
     cdef int double_rec_a(const double * const coeffs_a, const size_t coeffs_len,
                           const DiscreteWavelet * const wavelet,
@@ -47,6 +91,20 @@ cdef extern from "c/wt.h":
                           double * const output, pywt_index_t output_len, int level) nogil
     cdef int double_swt_d(const double * const input, pywt_index_t input_len, const DiscreteWavelet * const wavelet,
                           double * const output, pywt_index_t output_len, int level) nogil
+    cdef int double_swt_window(const double * const input, const size_t num_rows, const size_t N,
+                               const DiscreteWavelet * const wavelet, const unsigned int level,
+                               const size_t start, const size_t count,
+                               double * const output_a, double * const output_d) nogil
+    cdef int double_swt_levels_axis(const double * const input, const ArrayInfo input_info,
+                                    double * const coefs_a, const ArrayInfo a_info,
+                                    double * const coefs_d, const ArrayInfo d_info,
+                                    const DiscreteWavelet * const wavelet, const size_t axis,
+                                    const unsigned int first_level, const size_t levels) nogil
+    cdef int double_iswt_axis(const double * const coefs_a, const ArrayInfo a_info,
+                              const double * const coefs_d, const ArrayInfo d_info,
+                              double * const output, const ArrayInfo output_info,
+                              const DiscreteWavelet * const wavelet, const size_t axis,
+                              const unsigned int level) nogil
 
 
     cdef int float_downcoef_axis(const float * const input, const ArrayInfo input_info,
@@ -55,11 +113,37 @@ cdef extern from "c/wt.h":
                                  const Coefficient detail, const MODE dwt_mode,
                                  const size_t swt_level,
                                  const DiscreteTransformType transform) nogil
+    cdef int float_downcoef_axis_rows(const float * const input, const ArrayInfo input_info,
+                                  float * const output, const ArrayInfo output_info,
+                                  const DiscreteWavelet * const wavelet, const size_t axis,
+                                  const Coefficient detail, const MODE dwt_mode,
+                                  const size_t swt_level,
+                                  const DiscreteTransformType transform,
+                                  const size_t row_start, size_t row_stop) nogil
+    cdef int float_dwt_axis(const float * const input, const ArrayInfo input_info,
+                            float * const output_a, const ArrayInfo a_info,
+                            float * const output_d, const ArrayInfo d_info,
+                            const DiscreteWavelet * const wavelet, const size_t axis,
+                            const MODE mode) nogil
+    cdef int float_dwt_axis_rows(const float * const input, const ArrayInfo input_info,
+                                 float * const output_a, const ArrayInfo a_info,
+                                 float * const output_d, const ArrayInfo d_info,
+                                 const DiscreteWavelet * const wavelet, const size_t axis,
+                                 const MODE mode,
+                                 const size_t row_start, size_t row_stop,
+                                 const LiftingScheme * const lifting) nogil
     cdef int float_idwt_axis(const float * const coefs_a, const ArrayInfo * const a_info,
                              const float * const coefs_d, const ArrayInfo * const d_info,
                              float * const output, const ArrayInfo output_info,
                              const DiscreteWavelet * const wavelet, const size_t axis,
                              const MODE mode) nogil
+    cdef int float_idwt_axis_rows(const float * const coefs_a, const ArrayInfo * const a_info,
+                                  const float * const coefs_d, const ArrayInfo * const d_info,
+                                  float * const output, const ArrayInfo output_info,
+                                  const DiscreteWavelet * const wavelet, const size_t axis,
+                                  const MODE mode,
+                                  const size_t row_start, size_t row_stop,
+                                  const LiftingScheme * const lifting) nogil
     cdef int float_dec_a(const float * const input, const size_t input_len,
                          const DiscreteWavelet * const wavelet,
                          float * const output, const size_t output_len,
@@ -68,6 +152,10 @@ cdef extern from "c/wt.h":
                          const DiscreteWavelet * const wavelet,
                          float * const output, const size_t output_len,
                          const MODE mode) nogil
+    cdef int float_dec_ad(const float * const input, const size_t input_len,
+                          const DiscreteWavelet * const wavelet,
+                          float * const output_a, float * const output_d,
+                          const size_t output_len, const MODE mode) nogil
 
     cdef int float_rec_a(const float * const coeffs_a, const size_t coeffs_len,
                          const DiscreteWavelet * const wavelet,
@@ -85,6 +173,20 @@ cdef extern from "c/wt.h":
                          float * const output, pywt_index_t output_len, int level) nogil
     cdef int float_swt_d(const float * const input, pywt_index_t input_len, const DiscreteWavelet * const wavelet,
                          float * const output, pywt_index_t output_len, int level) nogil
+    cdef int float_swt_window(const float * const input, const size_t num_rows, const size_t N,
+                              const DiscreteWavelet * const wavelet, const unsigned int level,
+                              const size_t start, const size_t count,
+                              float * const output_a, float * const output_d) nogil
+    cdef int float_swt_levels_axis(const float * const input, const ArrayInfo input_info,
+                                   float * const coefs_a, const ArrayInfo a_info,
+                                   float * const coefs_d, const ArrayInfo d_info,
+                                   const DiscreteWavelet * const wavelet, const size_t axis,
+                                   const unsigned int first_level, const size_t levels) nogil
+    cdef int float_iswt_axis(const float * const coefs_a, const ArrayInfo a_info,
+                             const float * const coefs_d, const ArrayInfo d_info,
+                             float * const output, const ArrayInfo output_info,
+                             const DiscreteWavelet * const wavelet, const size_t axis,
+                             const unsigned int level) nogil
 
     IF HAVE_C99_CPLX:
         # complex variants only available if the compiler supports C99 complex
@@ -94,11 +196,37 @@ cdef extern from "c/wt.h":
                                       const Coefficient detail, const MODE dwt_mode,
                                       const size_t swt_level,
                                       const DiscreteTransformType transform) nogil
+        cdef int double_complex_downcoef_axis_rows(const double complex * const input, const ArrayInfo input_info,
+                                      double complex * const output, const ArrayInfo output_info,
+                                      const DiscreteWavelet * const wavelet, const size_t axis,
+                                      const Coefficient detail, const MODE dwt_mode,
+                                      const size_t swt_level,
+                                      const DiscreteTransformType transform,
+                                      const size_t row_start, size_t row_stop) nogil
+        cdef int double_complex_dwt_axis(const double complex * const input, const ArrayInfo input_info,
+                                         double complex * const output_a, const ArrayInfo a_info,
+                                         double complex * const output_d, const ArrayInfo d_info,
+                                         const DiscreteWavelet * const wavelet, const size_t axis,
+                                         const MODE mode) nogil
+        cdef int double_complex_dwt_axis_rows(const double complex * const input, const ArrayInfo input_info,
+                                              double complex * const output_a, const ArrayInfo a_info,
+                                              double complex * const output_d, const ArrayInfo d_info,
+                                              const DiscreteWavelet * const wavelet, const size_t axis,
+                                              const MODE mode,
+                                              const size_t row_start, size_t row_stop,
+                                              const LiftingScheme * const lifting) nogil
         cdef int double_complex_idwt_axis(const double complex * const coefs_a, const ArrayInfo * const a_info,
                                   const double complex * const coefs_d, const ArrayInfo * const d_info,
                                   double complex * const output, const ArrayInfo output_info,
                                   const DiscreteWavelet * const wavelet, const size_t axis,
                                   const MODE mode) nogil
+        cdef int double_complex_idwt_axis_rows(const double complex * const coefs_a, const ArrayInfo * const a_info,
+                                      const double complex * const coefs_d, const ArrayInfo * const d_info,
+                                      double complex * const output, const ArrayInfo output_info,
+                                      const DiscreteWavelet * const wavelet, const size_t axis,
+                                      const MODE mode,
+                                      const size_t row_start, size_t row_stop,
+                                      const LiftingScheme * const lifting) nogil
         cdef int double_complex_dec_a(const double complex * const input, const size_t input_len,
                               const DiscreteWavelet * const wavelet,
                               double complex * const output, const size_t output_len,
@@ -107,6 +235,10 @@ cdef extern from "c/wt.h":
                               const DiscreteWavelet * const wavelet,
                               double complex * const output, const size_t output_len,
                               const MODE mode) nogil
+        cdef int double_complex_dec_ad(const double complex * const input, const size_t input_len,
+                                       const DiscreteWavelet * const wavelet,
+                                       double complex * const output_a, double complex * const output_d,
+                                       const size_t output_len, const MODE mode) nogil
 
         cdef int double_complex_rec_a(const double complex * const coeffs_a, const size_t coeffs_len,
                               const DiscreteWavelet * const wavelet,
@@ -124,6 +256,20 @@ cdef extern from "c/wt.h":
                               double complex * const output, size_t output_len, int level) nogil
         cdef int double_complex_swt_d(const double complex * const input, size_t input_len, const DiscreteWavelet * const wavelet,
                               double complex * const output, size_t output_len, int level) nogil
+        cdef int double_complex_swt_window(const double complex * const input, const size_t num_rows, const size_t N,
+                                           const DiscreteWavelet * const wavelet, const unsigned int level,
+                                           const size_t start, const size_t count,
+                                           double complex * const output_a, double complex * const output_d) nogil
+        cdef int double_complex_swt_levels_axis(const double complex * const input, const ArrayInfo input_info,
+                                                double complex * const coefs_a, const ArrayInfo a_info,
+                                                double complex * const coefs_d, const ArrayInfo d_info,
+                                                const DiscreteWavelet * const wavelet, const size_t axis,
+                                                const unsigned int first_level, const size_t levels) nogil
+        cdef int double_complex_iswt_axis(const double complex * const coefs_a, const ArrayInfo a_info,
+                                          const double complex * const coefs_d, const ArrayInfo d_info,
+                                          double complex * const output, const ArrayInfo output_info,
+                                          const DiscreteWavelet * const wavelet, const size_t axis,
+                                          const unsigned int level) nogil
 
 
 
@@ -133,11 +279,37 @@ cdef extern from "c/wt.h":
                                      const Coefficient detail, const MODE dwt_mode,
                                      const size_t swt_level,
                                      const DiscreteTransformType transform) nogil
+        cdef int float_complex_downcoef_axis_rows(const float complex * const input, const ArrayInfo input_info,
+                                      float complex * const output, const ArrayInfo output_info,
+                                      const DiscreteWavelet * const wavelet, const size_t axis,
+                                      const Coefficient detail, const MODE dwt_mode,
+                                      const size_t swt_level,
+                                      const DiscreteTransformType transform,
+                                      const size_t row_start, size_t row_stop) nogil
+        cdef int float_complex_dwt_axis(const float complex * const input, const ArrayInfo input_info,
+                                        float complex * const output_a, const ArrayInfo a_info,
+                                        float complex * const output_d, const ArrayInfo d_info,
+                                        const DiscreteWavelet * const wavelet, const size_t axis,
+                                        const MODE mode) nogil
+        cdef int float_complex_dwt_axis_rows(const float complex * const input, const ArrayInfo input_info,
+                                             float complex * const output_a, const ArrayInfo a_info,
+                                             float complex * const output_d, const ArrayInfo d_info,
+                                             const DiscreteWavelet * const wavelet, const size_t axis,
+                                             const MODE mode,
+                                             const size_t row_start, size_t row_stop,
+                                             const LiftingScheme * const lifting) nogil
         cdef int float_complex_idwt_axis(const float complex * const coefs_a, const ArrayInfo * const a_info,
                                  const float complex * const coefs_d, const ArrayInfo * const d_info,
                                  float complex * const output, const ArrayInfo output_info,
                                  const DiscreteWavelet * const wavelet, const size_t axis,
                                  const MODE mode) nogil
+        cdef int float_complex_idwt_axis_rows(const float complex * const coefs_a, const ArrayInfo * const a_info,
+                                      const float complex * const coefs_d, const ArrayInfo * const d_info,
+                                      float complex * const output, const ArrayInfo output_info,
+                                      const DiscreteWavelet * const wavelet, const size_t axis,
+                                      const MODE mode,
+                                      const size_t row_start, size_t row_stop,
+                                      const LiftingScheme * const lifting) nogil
         cdef int float_complex_dec_a(const float complex * const input, const size_t input_len,
                              const DiscreteWavelet * const wavelet,
                              float complex * const output, const size_t output_len,
@@ -146,6 +318,10 @@ cdef extern from "c/wt.h":
                              const DiscreteWavelet * const wavelet,
                              float complex * const output, const size_t output_len,
                              const MODE mode) nogil
+        cdef int float_complex_dec_ad(const float complex * const input, const size_t input_len,
+                                      const DiscreteWavelet * const wavelet,
+                                      float complex * const output_a, float complex * const output_d,
+                                      const size_t output_len, const MODE mode) nogil
 
         cdef int float_complex_rec_a(const float complex * const coeffs_a, const size_t coeffs_len,
                              const DiscreteWavelet * const wavelet,
@@ -163,6 +339,20 @@ cdef extern from "c/wt.h":
                              float complex * const output, size_t output_len, int level) nogil
         cdef int float_complex_swt_d(const float complex * const input, size_t input_len, const DiscreteWavelet* const wavelet,
                              float complex * const output, size_t output_len, int level) nogil
+        cdef int float_complex_swt_window(const float complex * const input, const size_t num_rows, const size_t N,
+                                          const DiscreteWavelet * const wavelet, const unsigned int level,
+                                          const size_t start, const size_t count,
+                                          float complex * const output_a, float complex * const output_d) nogil
+        cdef int float_complex_swt_levels_axis(const float complex * const input, const ArrayInfo input_info,
+                                               float complex * const coefs_a, const ArrayInfo a_info,
+                                               float complex * const coefs_d, const ArrayInfo d_info,
+                                               const DiscreteWavelet * const wavelet, const size_t axis,
+                                               const unsigned int first_level, const size_t levels) nogil
+        cdef int float_complex_iswt_axis(const float complex * const coefs_a, const ArrayInfo a_info,
+                                         const float complex * const coefs_d, const ArrayInfo d_info,
+                                         float complex * const output, const ArrayInfo output_info,
+                                         const DiscreteWavelet * const wavelet, const size_t axis,
+                                         const unsigned int level) nogil
 
 cdef extern from "c/cwt.h":
     # Cython does not know the 'restrict' keyword
@@ -42,3 +42,11 @@ cdef extern from "c/common.h":
     # max dec levels
     cdef unsigned char dwt_max_level(size_t input_len, size_t filter_len)
     cdef unsigned char swt_max_level(size_t input_len)
+
+
+cdef extern from "c/simd.h":
+    # runtime selection of the vectorized convolution kernels
+    cdef int simd_select(const char * name)
+    cdef const char * simd_selected()
+    cdef const char * simd_level_name(size_t level)
+    cdef int simd_supported(const char * name)
@@ -0,0 +1,480 @@
+# Copyright (c) 2026 The PyWavelets Developers
+#                    <https://github.com/PyWavelets/pywt>
+# See COPYING for license details.
+"""
+Lifting factorizations of the polyphase matrices of two-channel filter banks.
+
+A Laurent polynomial ``sum(c[i] * z**(lo + i))`` is represented by the tuple
+``(lo, c)``, and ``None`` stands for the zero polynomial.  A polynomial ``P``
+acts on a sequence ``x`` as ``(P x)[k] = sum(c[i] * x[k - lo - i])``.
+
+The polyphase matrix ``M`` of a filter bank maps the two input phases
+``(x0, x1)`` to the two output phases.  It is factored as
+
+    M = diag(K0 * z**s0, K1 * z**s1) * S_n * ... * S_1
+
+where each lifting step ``S`` adds a filtered copy of one phase to the other
+one.  The steps are found with the Euclidean algorithm of Daubechies and
+Sweldens, "Factoring wavelet transforms into lifting steps" (1998).
+
+The integer to integer transforms of Calderbank, Daubechies, Sweldens and
+Yeo, "Wavelet transforms that map integers to integers" (1998), round the
+update of each lifting step, so that the inverse undoes them exactly.
+"""
+
+from functools import cache
+
+import numpy as np
+
+from ._extensions._dwt import LiftingScheme
+from ._extensions._pywt import Modes
+from ._utils import AxisError, _as_wavelet
+
+__all__ = ['lifting_scheme']
+
+# values of the ``method`` argument of the transforms
+_methods = ('convolution', 'lifting', 'integer')
+
+# wavelets with an integer to integer transform: the S-transform (the
+# integer Haar transform) and the reversible CDF 5/3 transform of JPEG 2000
+_integer_schemes = {'haar': 'haar', 'db1': 'haar', 'bior1.1': 'haar',
+                    'rbio1.1': 'haar', 'bior2.2': 'cdf53'}
+
+# bits of growth of the intermediate values of one level of each integer
+# scheme: up to twice the data for 'haar' and four times for 'cdf53'
+_integer_growth = {'haar': 1, 'cdf53': 2}
+
+# families whose filter banks are factored into lifting steps (on first use),
+# everything else is transformed by convolution
+_lifting_families = ('haar', 'db', 'sym', 'bior', 'rbio')
+
+# tolerances for dropping the cancelled coefficients of the remainders,
+# tightest first.  Some filters are only tabulated to about 1e-12, which
+# makes the tight ones fail.
+_tolerances = (1e-12, 1e-10)
+# a factorization is accepted if it reproduces the polyphase matrix to this
+# absolute error.  The steps are always perfectly reconstructing, so filters
+# that are tabulated less accurately are transformed by convolution.
+_max_residual = 1e-11
+# largest condition number accepted (see `_condition`), the rounding errors
+# of the steps relative to those of the convolution grow with it
+_max_condition = 1000.
+# number of partial factorizations kept at each division of the search
+_beam_width = 8
+
+
+def _poly(lo, coeffs, tol=0):
+    """Build a polynomial, dropping leading and trailing near-zeros."""
+    coeffs = np.asarray(coeffs, dtype=np.float64)
+    nonzero = np.flatnonzero(np.abs(coeffs) > tol)
+    if nonzero.size == 0:
+        return None
+    return (lo + int(nonzero[0]), coeffs[nonzero[0]:nonzero[-1] + 1])
+
+
+def _mul(p, q):
+    if p is None or q is None:
+        return None
+    return (p[0] + q[0], np.convolve(p[1], q[1]))
+
+
+def _sub(p, q, tol=0):
+    if q is None:
+        return p
+    if p is None:
+        return (q[0], -q[1])
+    lo = min(p[0], q[0])
+    hi = max(p[0] + len(p[1]), q[0] + len(q[1]))
+    coeffs = np.zeros(hi - lo)
+    coeffs[p[0] - lo:p[0] - lo + len(p[1])] += p[1]
+    coeffs[q[0] - lo:q[0] - lo + len(q[1])] -= q[1]
+    return _poly(lo, coeffs, tol)
+
+
+def _divmod(a, b, top, tol):
+    """Quotient and remainder of ``a / b``, with the remainder shorter than b.
+
+    The quotient cancels the ``top`` highest and the remaining lowest powers
+    of ``a``.
+    """
+    na, nb = len(a[1]), len(b[1])
+    nq = na - nb + 1
+    cancel = np.r_[0:nq - top, na - top:na]
+    # column i of conv holds b shifted by i, so a - conv @ quot keeps only
+    # the powers that are not cancelled
+    conv = np.zeros((na, nq))
+    for i in range(nq):
+        conv[i:i + nb, i] = b[1]
+    quot = np.linalg.solve(conv[cancel], a[1][cancel])
+    rem = (a[1] - conv @ quot)[nq - top:na - top]
+    return (a[0] - b[0], quot), _poly(a[0] + nq - top, rem, tol)
+
+
+def _divisions(a, b, tol):
+    """All divisions of ``a`` by ``b``, smallest quotient first.
+
+    The cancelled powers of ``a`` can be split in any way between its top and
+    its bottom.  Small quotients keep the lifting steps well conditioned.
+    """
+    nq = len(a[1]) - len(b[1]) + 1
+    return sorted((_divmod(a, b, top, tol) for top in range(nq + 1)),
+                  key=lambda qr: np.max(np.abs(qr[0][1])))
+
+
+def _diagonalize(a, b, c, d, steps, tol):
+    """Finish a factorization once an entry of the first row vanished."""
+    steps = list(steps)
+    if a is None:
+        if b is None:
+            return None
+        # move the remaining monomial to the diagonal: col0 += col1, then
+        # col1 -= col0
+        minus_one, one = (0, -np.ones(1)), (0, np.ones(1))
+        a, c = b, _sub(c, _mul(minus_one, d), tol)
+        steps.append((1, minus_one))
+        b, d = None, _sub(d, c, tol)
+        steps.append((0, one))
+
+    if len(a[1]) != 1 or d is None or len(d[1]) != 1:
+        return None
+    if c is not None:
+        # d is a monomial, so this division is exact
+        p, _ = _divmod(c, d, 0, tol)
+        steps.append((1, p))
+    return steps, (a, d)
+
+
+def _factor(matrix, tol):
+    """Lifting steps ``[(target, P), ...]`` and diagonal ``(K0 z**s0,
+    K1 z**s1)`` of a polyphase matrix, or None.
+
+    The Euclidean algorithm is run on the first row of the matrix with
+    column operations, which are undone by the lifting steps in reverse
+    order: "col0 -= P col1" is the step x1 += P x0 (target 1) and
+    "col1 -= P col0" is the step x0 += P x1 (target 0).  Each division has
+    several choices of quotient, and the conditioning of the steps depends
+    strongly on them.  The choices are searched breadth-first, keeping the
+    `_beam_width` partial factorizations with the smallest lower bound of
+    the condition number, and the best conditioned factorization that
+    reproduces the matrix is returned.
+    """
+    (a, b), (c, d) = matrix
+    ref = max(_norm(a) + _norm(b), _norm(c) + _norm(d))
+    # the diagonal of every factorization has K0 * K1 = det(matrix)
+    det = _sub(_mul(a, d), _mul(b, c), tol)
+    det = abs(det[1][0]) if det is not None and len(det[1]) == 1 else 0.
+    best, best_condition = None, _max_condition
+
+    # a state holds the remaining matrix, the steps so far and the row sums
+    # of the product of their absolute values
+    states = [(a, b, c, d, [], (1., 1.))]
+    while states:
+        children = []
+        for a, b, c, d, steps, rows in states:
+            swap = len(a[1]) < len(b[1])
+            for p, rem in (_divisions(b, a, tol) if swap
+                           else _divisions(a, b, tol)):
+                size = _norm(p)
+                if swap:
+                    child = (a, rem, c, _sub(d, _mul(p, c), tol),
+                             steps + [(0, p)],
+                             (rows[0] + size * rows[1], rows[1]))
+                else:
+                    child = (rem, b, _sub(c, _mul(p, d), tol), d,
+                             steps + [(1, p)],
+                             (rows[0], rows[1] + size * rows[0]))
+                if child[0] is not None and child[1] is not None:
+                    # the remaining steps and the diagonal can only add to
+                    # the row sums
+                    bound = np.sqrt(det * child[5][0] * child[5][1]) / ref
+                    if bound < best_condition:
+                        children.append((bound, len(children), child))
+                    continue
+                factors = _diagonalize(*child[:5], tol)
+                if factors is None:
+                    continue
+                condition = _condition(*factors) / ref
+                if (condition < best_condition and
+                        _check(matrix, *factors, _max_residual)):
+                    best, best_condition = factors, condition
+        children.sort(key=lambda child: child[:2])
+        states = [child for bound, _, child in children[:_beam_width]
+                  if bound < best_condition]
+    return best
+
+
+def _norm(p):
+    """Sum of the absolute values of the coefficients of ``p``."""
+    return 0. if p is None else float(np.sum(np.abs(p[1])))
+
+
+def _condition(steps, diagonal):
+    """Largest row sum of the product of the absolute values of the factors.
+
+    The rounding errors of each step are propagated through the following
+    steps, so relative to the largest row sum of the polyphase matrix this
+    bounds how much more the lifting steps round than the convolution.
+    """
+    product = [[(diagonal[0][0], np.abs(diagonal[0][1])), None],
+               [None, (diagonal[1][0], np.abs(diagonal[1][1]))]]
+    for target, p in reversed(steps):
+        p = (p[0], -np.abs(p[1]))
+        for row in product:
+            if target == 1:
+                row[0] = _sub(row[0], _mul(p, row[1]))
+            else:
+                row[1] = _sub(row[1], _mul(p, row[0]))
+    return max(_norm(row[0]) + _norm(row[1]) for row in product)
+
+
+def _check(matrix, steps, diagonal, tol):
+    """Whether the product of the lifting steps reproduces ``matrix``."""
+    product = [[diagonal[0], None], [None, diagonal[1]]]
+    for target, p in reversed(steps):
+        for row in product:
+            if target == 1:
+                row[0] = _sub(row[0], _mul((p[0], -p[1]), row[1]))
+            else:
+                row[1] = _sub(row[1], _mul((p[0], -p[1]), row[0]))
+    for row, expected_row in zip(product, matrix):
+        for entry, expected in zip(row, expected_row):
+            diff = _sub(entry, expected)
+            if diff is not None and np.max(np.abs(diff[1])) > tol:
+                return False
+    return True
+
+
+@cache
+def _scheme(m00, m01, m10, m11, shift, parity):
+    """Lifting scheme of the matrix ``[[m00, m01], [m10, m11]]``, where the
+    entries of column 1 are delayed by ``shift``.
+
+    ``parity`` is the input phase of an analysis scheme, or -1 for synthesis.
+    """
+    matrix = [[_poly(0, m00), _poly(shift, m01)],
+              [_poly(0, m10), _poly(shift, m11)]]
+    for tol in _tolerances:
+        factors = _factor(matrix, tol)
+        if factors is not None:
+            break
+    else:
+        return None
+    steps, diagonal = factors
+    # consecutive steps updating the same phase are applied as one
+    merged = []
+    for target, p in steps:
+        if merged and merged[-1][0] == target:
+            p = _sub(merged[-1][1], (p[0], -p[1]))
+            merged.pop()
+            if p is None:
+                continue
+        merged.append((target, p))
+    steps = merged
+    return LiftingScheme(
+        [target for target, _ in steps], [p[0] for _, p in steps],
+        [p[1] for _, p in steps],
+        (diagonal[0][1][0], diagonal[1][1][0]),
+        (diagonal[0][0], diagonal[1][0]), parity)
+
+
+def _analysis_parity(filter_len, mode):
+    """Phase of the extended input that the first output is centered on."""
+    if mode == Modes.periodization:
+        return (filter_len // 2) % 2
+    return 1
+
+
+def lifting_scheme(wavelet, mode, inverse=False):
+    """Lifting scheme for a forward or inverse single level DWT.
+
+    Parameters
+    ----------
+    wavelet : Wavelet
+        Wavelet to factor.
+    mode : int
+        Signal extension mode, as an integer from `Modes.from_object`.
+    inverse : bool, optional
+        If True, return the scheme of the inverse transform.
+
+    Returns
+    -------
+    scheme : LiftingScheme or None
+        None if ``wavelet`` is not in one of the supported families or its
+        filter bank has no well conditioned factorization.  This depends on
+        ``mode`` and ``inverse``.  The convolution based transform should be
+        used instead.
+    """
+    if wavelet.short_family_name not in _lifting_families:
+        return None
+    if inverse:
+        # synthesis: output phase p gets the p-th polyphase components
+        lo, hi = tuple(wavelet.rec_lo), tuple(wavelet.rec_hi)
+        return _scheme(lo[0::2], hi[0::2], lo[1::2], hi[1::2], 0, -1)
+    # analysis: the output at 2*t + parity of the full convolution takes the
+    # even filter taps from the input phase 2*k + parity and the odd taps
+    # from the other phase, delayed by one for parity 0
+    lo, hi = tuple(wavelet.dec_lo), tuple(wavelet.dec_hi)
+    parity = _analysis_parity(len(lo), mode)
+    return _scheme(lo[0::2], lo[1::2], hi[0::2], hi[1::2], 1 - parity, parity)
+
+
+def _lifting_for_method(method, wavelet, mode, inverse=False):
+    """Lifting scheme selected by the ``method`` argument of a transform.
+
+    Returns None if the transform should use convolution.
+    """
+    if method not in _methods:
+        raise ValueError(f"Unknown method {method!r}, must be one of "
+                         f"{_methods}.")
+    if method == 'lifting':
+        return lifting_scheme(wavelet, mode, inverse)
+    return None
+
+
+def _integer_dtype(dtype):
+    """Dtype of the coefficients of the integer transforms.
+
+    The coefficients grow by a few bits at each level, so integers of up to
+    16 bits are transformed as int32, and uint32 as int64.  int32 and int64
+    inputs keep their dtype and must leave room for the growth, which
+    `_integer_dwt_axis` checks.
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind not in 'iu' or (dtype.kind == 'u' and dtype.itemsize > 4):
+        raise TypeError("method='integer' requires integer input of at most "
+                        f"32 bits or int64, got {dtype}.")
+    if dtype.itemsize < 4 or dtype == np.int32:
+        return np.dtype(np.int32)
+    return np.dtype(np.int64)
+
+
+def _integer_scheme(wavelet, mode):
+    wavelet = _as_wavelet(wavelet)
+    if wavelet.name not in _integer_schemes:
+        raise ValueError(
+            "method='integer' supports the wavelets "
+            f"{sorted(_integer_schemes)}, got {wavelet.name!r}.")
+    if Modes.from_object(mode) != Modes.periodization:
+        raise ValueError("method='integer' requires mode='periodization'.")
+    return _integer_schemes[wavelet.name]
+
+
+def _integer_limit(scheme, dtype):
+    """Data of ``dtype`` in ``[-limit, limit)`` does not overflow one level
+    of the integer ``scheme`` computed in ``dtype``."""
+    bits = np.iinfo(dtype).bits - 1 - _integer_growth[scheme]
+    # 4 * 2**bits itself would overflow for 'cdf53'
+    return 2**bits - (_integer_growth[scheme] > 1)
+
+
+def _periodic_sum(x, shift, out):
+    """``out = x + x`` rolled by ``shift`` (+1 or -1) along the last axis."""
+    if shift > 0:
+        np.add(x[..., 1:], x[..., :-1], out=out[..., 1:])
+        np.add(x[..., 0], x[..., -1], out=out[..., 0])
+    else:
+        np.add(x[..., :-1], x[..., 1:], out=out[..., :-1])
+        np.add(x[..., -1], x[..., 0], out=out[..., -1])
+    return out
+
+
+def _integer_dwt_axis(data, wavelet, mode, axis):
+    """Single level integer DWT of ``data`` along ``axis``.
+
+    Returns integer approximation and detail coefficients with the dtype
+    given by `_integer_dtype`.  They are close to the coefficients of the
+    convolution scaled by ``1/sqrt(2)`` and ``sqrt(2)`` respectively.
+    """
+    scheme = _integer_scheme(wavelet, mode)
+    data = np.asarray(data)
+    dtype = _integer_dtype(data.dtype)
+    if axis < 0:
+        axis = axis + data.ndim
+    if not 0 <= axis < data.ndim:
+        raise AxisError("Axis greater than data dimensions")
+    n = data.shape[axis]
+    if n < 1:
+        raise ValueError("Value of data_len must be greater than zero.")
+    if data.dtype == dtype:
+        # not widened, check that the coefficients do not wrap around
+        limit = _integer_limit(scheme, dtype)
+        if data.size and (data.min() < -limit or data.max() >= limit):
+            raise ValueError(
+                f"{dtype} data must lie in [{-limit}, {limit}) for "
+                f"method='integer' with {_as_wavelet(wavelet).name!r}"
+                + (", convert it to int64." if dtype == np.int32 else "."))
+
+    # the signal is padded to even length by repeating its last sample, as
+    # for the convolution in periodization mode
+    shape = list(data.shape)
+    shape[axis] = n + n % 2
+    x = np.moveaxis(np.empty(shape, dtype), axis, -1)
+    x[..., :n] = np.moveaxis(data, axis, -1)
+    if n % 2:
+        x[..., n] = x[..., n - 1]
+    even, odd = x[..., 0::2], x[..., 1::2]
+
+    if scheme == 'haar':
+        # d = x0 - x1, a = x1 + floor(d / 2)
+        np.subtract(even, odd, out=even)
+        odd += even >> 1
+        a, d = odd, even
+    else:
+        # d = x1 - floor((x0 + x0[+1]) / 2),
+        # a = x0 + floor((d[-1] + d + 2) / 4)
+        tmp = np.empty_like(odd)
+        odd -= _periodic_sum(even, -1, tmp) >> 1
+        tmp = _periodic_sum(odd, 1, tmp)
+        tmp += 2
+        even += tmp >> 2
+        # sign of the detail of the convolution with bior2.2
+        np.negative(odd, out=odd)
+        a, d = even, odd
+    return (np.ascontiguousarray(np.moveaxis(a, -1, axis)),
+            np.ascontiguousarray(np.moveaxis(d, -1, axis)))
+
+
+def _integer_idwt_axis(cA, cD, wavelet, mode, axis):
+    """Inverse of `_integer_dwt_axis`, either coefficient can be None."""
+    scheme = _integer_scheme(wavelet, mode)
+    coeffs = [np.asarray(c) for c in (cA, cD) if c is not None]
+    if not coeffs:
+        return None
+    dtype = _integer_dtype(np.result_type(*coeffs))
+    if any(c.shape != coeffs[0].shape for c in coeffs):
+        raise ValueError("Coefficients arrays must have the same shape.")
+    ndim = coeffs[0].ndim
+    if axis < 0:
+        axis = axis + ndim
+    if not 0 <= axis < ndim:
+        raise AxisError("Axis greater than coefficient dimensions")
+    if coeffs[0].shape[axis] < 1:
+        raise ValueError("Value of data_len must be greater than zero.")
+
+    shape = list(coeffs[0].shape)
+    shape[axis] *= 2
+    rec = np.empty(shape, dtype)
+    x = np.moveaxis(rec, axis, -1)
+    even, odd = x[..., 0::2], x[..., 1::2]
+
+    def fill(out, c):
+        if c is None:
+            out[...] = 0
+        else:
+            out[...] = np.moveaxis(np.asarray(c), axis, -1)
+
+    if scheme == 'haar':
+        # x1 = a - floor(d / 2), x0 = d + x1
+        fill(odd, cA)
+        fill(even, cD)
+        odd -= even >> 1
+        even += odd
+    else:
+        fill(even, cA)
+        fill(odd, cD)
+        np.negative(odd, out=odd)
+        tmp = _periodic_sum(odd, 1, np.empty_like(odd))
+        tmp += 2
+        even -= tmp >> 2
+        odd += _periodic_sum(even, -1, tmp) >> 1
+    return rec
@@ -1,22 +1,109 @@
-from functools import partial, reduce
+from functools import reduce
 
 import numpy as np
 
-from ._multilevel import (
-    _prep_axes_wavedecn,
-    wavedec,
-    wavedec2,
-    wavedecn,
-    waverec,
-    waverec2,
-    waverecn,
+from ._c99_config import _have_c99_complex
+from ._extensions._pywt import _check_dtype
+from ._multidim import idwtn
+from ._multilevel import _prep_axes_wavedecn, wavedec, wavedec2, wavedecn
+from ._swt import (
+    _iswt_level,
+    _rescale_wavelet_filterbank,
+    swt,
+    swt2,
+    swt_max_level,
+    swtn,
 )
-from ._swt import iswt, iswt2, iswtn, swt, swt2, swt_max_level, swtn
 from ._utils import _modes_per_axis, _wavelets_per_axis
 
 __all__ = ["mra", "mra2", "mran", "imra", "imra2", "imran"]
 
 
+def _swt_projection(coeffs, level, wavelets, axes):
+    """The reconstruction from the dict ``coeffs`` of normalized swtn
+    coefficients of ``level`` alone, i.e. with the coefficients of all other
+    subbands and levels zero.
+
+    Only the given subbands are upsampled, through the ``level`` levels
+    below them, and the zero coefficients are never formed.
+    """
+    if not _have_c99_complex and any(np.iscomplexobj(c)
+                                     for c in coeffs.values()):
+        real = {k: np.real(c) for k, c in coeffs.items()}
+        imag = {k: np.imag(c) for k, c in coeffs.items()}
+        return (_swt_projection(real, level, wavelets, axes)
+                + 1j * _swt_projection(imag, level, wavelets, axes))
+    approx = 'a' * len(axes)
+    coeffs = {k: np.asarray(c, dtype=_check_dtype(c))
+              for k, c in coeffs.items()}
+    for j in range(level, 0, -1):
+        coeffs = {approx: _iswt_level(coeffs, wavelets, axes, j)}
+    return coeffs[approx]
+
+
+def _dwt_projection(coeffs, shapes, wavelets, modes, axes):
+    """The reconstruction from the dict ``coeffs`` of dwtn coefficients of a
+    single level alone, where ``shapes`` are the shapes of the detail
+    coefficients of that level and of all finer ones, coarsest first.
+
+    As in `waverecn`, the approximation is trimmed to the shape of the
+    details of each level before it is upsampled.
+    """
+    approx = 'a' * len(axes)
+    if not shapes:
+        return coeffs[approx]
+    rec = idwtn(coeffs, wavelets, modes, axes)
+    for shape in shapes[1:]:
+        rec = idwtn({approx: rec[tuple(slice(n) for n in shape)]}, wavelets,
+                    modes, axes)
+    return rec
+
+
+def _mra_bands(coeffs, transform, wavelets, modes, axes, shape):
+    """The projections of the subbands of ``coeffs``, the coefficients of
+    ``transform`` ('swt' or 'dwt') as ``[approx] + details``, with a dict of
+    the detail subbands for each level, coarsest first.
+
+    Returns the projection of the approximation followed by a dict of the
+    projections of the details of each level, trimmed to ``shape``.  Each
+    subband is only upsampled through the levels below it, and the zero
+    coefficients of all other subbands are never formed, instead of running
+    a full inverse transform per subband.
+    """
+    ndim = len(shape)
+    axes = [a + ndim if a < 0 else a for a in axes]
+    approx = 'a' * len(axes)
+    num_levels = len(coeffs) - 1
+
+    # entry j > 0 of coeffs holds the details of level num_levels + 1 - j,
+    # entry 0 the approximation of level num_levels
+    if transform == 'swt':
+        wavelets = [_rescale_wavelet_filterbank(w, np.sqrt(2))
+                    for w in wavelets]
+
+        def project(c, j):
+            return _swt_projection(c, num_levels + 1 - max(j, 1), wavelets,
+                                   axes)
+    else:
+        shapes = [np.shape(next(iter(d.values()))) for d in coeffs[1:]]
+
+        def project(c, j):
+            return _dwt_projection(c, shapes[max(j, 1) - 1:], wavelets,
+                                   modes, axes)
+
+    def trim(rec):
+        if rec.shape != shape:
+            # trim any excess coefficients
+            rec = rec[tuple(slice(n) for n in shape)]
+        return rec
+
+    bands = [trim(project({approx: coeffs[0]}, 0))]
+    for j, details in enumerate(coeffs[1:], 1):
+        bands.append({k: trim(project({k: c}, j))
+                      for k, c in details.items()})
+    return bands
+
+
 def mra(data, wavelet, level=None, axis=-1, transform='swt',
         mode='periodization'):
     """Forward 1D multiresolution analysis.
@@ -72,52 +159,24 @@ def mra(data, wavelet, level=None, axis=-1, transform='swt',
         https://doi.org/10.2307/2965551
 
     """
+    data = np.asarray(data)
     if transform == 'swt':
         if mode != 'periodization':
             raise ValueError(
                 "transform swt only supports mode='periodization'")
-        kwargs = {"wavelet": wavelet, "axis": axis, "norm": True}
-        forward = partial(swt, level=level, trim_approx=True, **kwargs)
-        inverse = partial(iswt, **kwargs)
-        is_swt = True
+        wav_coeffs = swt(data, wavelet, level=level, axis=axis,
+                         trim_approx=True, norm=True)
     elif transform == 'dwt':
-        kwargs = {"wavelet": wavelet, "mode": mode, "axis": axis}
-        forward = partial(wavedec, level=level, **kwargs)
-        inverse = partial(waverec, **kwargs)
-        is_swt = False
+        wav_coeffs = wavedec(data, wavelet, mode=mode, level=level,
+                             axis=axis)
     else:
         raise ValueError(f"unrecognized transform: {transform}")
 
-    wav_coeffs = forward(data)
-
-    mra_coeffs = []
-    nc = len(wav_coeffs)
-
-    if is_swt:
-        # replicate same zeros array to save memory
-        z = np.zeros_like(wav_coeffs[0])
-        tmp = [z, ] * nc
-    else:
-        # zero arrays have variable size in DWT case
-        tmp = [np.zeros_like(c) for c in wav_coeffs]
-
-    for j in range(nc):
-        # tmp has arrays of zeros except for the jth entry
-        tmp[j] = wav_coeffs[j]
-
-        # reconstruct
-        rec = inverse(tmp)
-        if rec.shape != data.shape:
-            # trim any excess coefficients
-            rec = rec[tuple([slice(sz) for sz in data.shape])]
-        mra_coeffs.append(rec)
-
-        # restore zeros
-        if is_swt:
-            tmp[j] = z
-        else:
-            tmp[j] = np.zeros_like(tmp[j])
-    return mra_coeffs
+    wav_coeffs = [wav_coeffs[0]] + [{'d': d} for d in wav_coeffs[1:]]
+    bands = _mra_bands(wav_coeffs, transform,
+                       _wavelets_per_axis(wavelet, [axis]),
+                       _modes_per_axis(mode, [axis]), [axis], data.shape)
+    return [bands[0]] + [d['d'] for d in bands[1:]]
 
 
 def imra(mra_coeffs):
@@ -208,52 +267,20 @@ def mra2(data, wavelet, level=None, axes=(-2, -1), transform='swt2',
                 "transform swt only supports mode='periodization'")
         if level is None:
             level = min(swt_max_level(s) for s in data.shape)
-        kwargs = {"wavelet": wavelet, "axes": axes, "norm": True}
-        forward = partial(swt2, level=level, trim_approx=True, **kwargs)
-        inverse = partial(iswt2, **kwargs)
+        wav_coeffs = swt2(data, wavelet, level=level, axes=axes,
+                          trim_approx=True, norm=True)
     elif transform == 'dwt2':
-        kwargs = {"wavelet": wavelet, "mode": mode, "axes": axes}
-        forward = partial(wavedec2, level=level, **kwargs)
-        inverse = partial(waverec2, **kwargs)
+        wav_coeffs = wavedec2(data, wavelet, mode=mode, level=level,
+                              axes=axes)
     else:
         raise ValueError(f"unrecognized transform: {transform}")
 
-    wav_coeffs = forward(data)
-
-    mra_coeffs = []
-    nc = len(wav_coeffs)
-    z = np.zeros_like(wav_coeffs[0])
-    tmp = [z]
-    for j in range(1, nc):
-        tmp.append([np.zeros_like(c) for c in wav_coeffs[j]])
-
-    # tmp has arrays of zeros except for the jth entry
-    tmp[0] = wav_coeffs[0]
-    # reconstruct
-    rec = inverse(tmp)
-    if rec.shape != data.shape:
-        # trim any excess coefficients
-        rec = rec[tuple([slice(sz) for sz in data.shape])]
-    mra_coeffs.append(rec)
-    # restore zeros
-    tmp[0] = z
-
-    for j in range(1, nc):
-        dcoeffs = []
-        for n in range(3):
-            # tmp has arrays of zeros except for the jth entry
-            z = tmp[j][n]
-            tmp[j][n] = wav_coeffs[j][n]
-            # reconstruct
-            rec = inverse(tmp)
-            if rec.shape != data.shape:
-                # trim any excess coefficients
-                rec = rec[tuple([slice(sz) for sz in data.shape])]
-            dcoeffs.append(rec)
-            # restore zeros
-            tmp[j][n] = z
-        mra_coeffs.append(tuple(dcoeffs))
-    return mra_coeffs
+    wav_coeffs = [wav_coeffs[0]] + [{'da': h, 'ad': v, 'dd': d}
+                                    for h, v, d in wav_coeffs[1:]]
+    bands = _mra_bands(wav_coeffs, transform[:3],
+                       _wavelets_per_axis(wavelet, axes),
+                       _modes_per_axis(mode, axes), axes, np.shape(data))
+    return [bands[0]] + [(d['da'], d['ad'], d['dd']) for d in bands[1:]]
 
 
 def imra2(mra_coeffs):
@@ -351,56 +378,18 @@ def mran(data, wavelet, level=None, axes=None, transform='swtn',
                 "transform swt only supports mode='periodization'")
         if level is None:
             level = min(swt_max_level(s) for s in data.shape)
-        kwargs = {"wavelet": wavelets, "axes": axes, "norm": True}
-        forward = partial(swtn, level=level, trim_approx=True, **kwargs)
-        inverse = partial(iswtn, **kwargs)
+        modes = None
+        wav_coeffs = swtn(data, wavelets, level=level, axes=axes,
+                          trim_approx=True, norm=True)
     elif transform == 'dwtn':
         modes = _modes_per_axis(mode, axes)
-        kwargs = {"wavelet": wavelets, "mode": modes, "axes": axes}
-        forward = partial(wavedecn, level=level, **kwargs)
-        inverse = partial(waverecn, **kwargs)
+        wav_coeffs = wavedecn(data, wavelets, mode=modes, level=level,
+                              axes=axes)
     else:
         raise ValueError(f"unrecognized transform: {transform}")
 
-    wav_coeffs = forward(data)
-
-    mra_coeffs = []
-    nc = len(wav_coeffs)
-    z = np.zeros_like(wav_coeffs[0])
-    tmp = [z]
-    for j in range(1, nc):
-        tmp.append({k: np.zeros_like(v) for k, v in wav_coeffs[j].items()})
-
-    # tmp has arrays of zeros except for the jth entry
-    tmp[0] = wav_coeffs[0]
-    # reconstruct
-    rec = inverse(tmp)
-    if rec.shape != data.shape:
-        # trim any excess coefficients
-        rec = rec[tuple([slice(sz) for sz in data.shape])]
-    mra_coeffs.append(rec)
-    # restore zeros
-    tmp[0] = z
-
-    for j in range(1, nc):
-        dcoeffs = {}
-        dkeys = list(wav_coeffs[j].keys())
-        for k in dkeys:
-            # tmp has arrays of zeros except for the jth entry
-            z = tmp[j][k]
-            tmp[j][k] = wav_coeffs[j][k]
-            # tmp[j]['a' * len(k)] = z
-            # reconstruct
-            rec = inverse(tmp)
-            if rec.shape != data.shape:
-                # trim any excess coefficients
-                rec = rec[tuple([slice(sz) for sz in data.shape])]
-            dcoeffs[k] = rec
-            # restore zeros
-            tmp[j][k] = z
-            # tmp[j].pop('a' * len(k))
-        mra_coeffs.append(dcoeffs)
-    return mra_coeffs
+    return _mra_bands(wav_coeffs, transform[:3], wavelets, modes, axes,
+                      data.shape)
 
 
 def imran(mra_coeffs):
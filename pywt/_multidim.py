@@ -13,13 +13,34 @@ from itertools import product
 import numpy as np
 
 from ._c99_config import _have_c99_complex
-from ._extensions._dwt import dwt_axis, idwt_axis
-from ._utils import AxisError, _modes_per_axis, _wavelets_per_axis
+from ._extensions._dwt import (
+    _check_out,
+    _dwt_block,
+    _half_blocks,
+    _idwt_block,
+    _take_line,
+    dwt_axis,
+    dwt_coeff_len,
+    idwt_axis,
+    idwt_coeff_len,
+)
+from ._lifting import (
+    _integer_dwt_axis,
+    _integer_idwt_axis,
+    _lifting_for_method,
+)
+from ._utils import (
+    AxisError,
+    _check_workers,
+    _modes_per_axis,
+    _wavelets_per_axis,
+)
 
 __all__ = ['dwt2', 'idwt2', 'dwtn', 'idwtn']
 
 
-def dwt2(data, wavelet, mode='symmetric', axes=(-2, -1)):
+def dwt2(data, wavelet, mode='symmetric', axes=(-2, -1), workers=None,
+         method='convolution', out=None):
     """
     2D Discrete Wavelet Transform.
 
@@ -37,6 +58,14 @@ def dwt2(data, wavelet, mode='symmetric', axes=(-2, -1)):
     axes : 2-tuple of ints, optional
         Axes over which to compute the DWT. Repeated elements mean the DWT will
         be performed multiple times along these axes.
+    workers : int, optional
+        Maximum number of threads to use for the transform along each axis,
+        see `dwt`.
+    method : {'convolution', 'lifting', 'integer'}, optional
+        Algorithm used for the transform along each axis, see `dwt`.
+    out : tuple, optional
+        Preallocated arrays ``(cA, (cH, cV, cD))`` that receive the
+        coefficients, see `dwtn`.
 
     Returns
     -------
@@ -68,11 +97,15 @@ def dwt2(data, wavelet, mode='symmetric', axes=(-2, -1)):
         raise ValueError("Input array has fewer dimensions than the specified "
                          "axes")
 
-    coefs = dwtn(data, wavelet, mode, axes)
+    if out is not None:
+        cA, (cH, cV, cD) = out
+        out = {'aa': cA, 'da': cH, 'ad': cV, 'dd': cD}
+    coefs = dwtn(data, wavelet, mode, axes, workers, method, out=out)
     return coefs['aa'], (coefs['da'], coefs['ad'], coefs['dd'])
 
 
-def idwt2(coeffs, wavelet, mode='symmetric', axes=(-2, -1)):
+def idwt2(coeffs, wavelet, mode='symmetric', axes=(-2, -1), workers=None,
+          method='convolution', out=None):
     """
     2-D Inverse Discrete Wavelet Transform.
 
@@ -94,6 +127,13 @@ def idwt2(coeffs, wavelet, mode='symmetric', axes=(-2, -1)):
     axes : 2-tuple of ints, optional
         Axes over which to compute the IDWT. Repeated elements mean the IDWT
         will be performed multiple times along these axes.
+    workers : int, optional
+        Maximum number of threads to use for the transform along each axis,
+        see `dwt`.
+    method : {'convolution', 'lifting', 'integer'}, optional
+        Algorithm used for the transform along each axis, see `dwt`.
+    out : ndarray, optional
+        Preallocated array that receives the reconstruction, see `idwtn`.
 
     Examples
     --------
@@ -113,10 +153,11 @@ def idwt2(coeffs, wavelet, mode='symmetric', axes=(-2, -1)):
         raise ValueError("Expected 2 axes")
 
     coeffs = {'aa': LL, 'da': HL, 'ad': LH, 'dd': HH}
-    return idwtn(coeffs, wavelet, mode, axes)
+    return idwtn(coeffs, wavelet, mode, axes, workers, method, out=out)
 
 
-def dwtn(data, wavelet, mode='symmetric', axes=None):
+def dwtn(data, wavelet, mode='symmetric', axes=None, workers=None,
+         method='convolution', out=None):
     """
     Single-level n-dimensional Discrete Wavelet Transform.
 
@@ -141,6 +182,18 @@ def dwtn(data, wavelet, mode='symmetric', axes=None):
         will be larger, with additional values derived according to the
         ``mode`` parameter. ``pywt.wavedecn`` should be used for multilevel
         decomposition.
+    workers : int, optional
+        Maximum number of threads to use for the transform along each axis,
+        see `dwt`.
+    method : {'convolution', 'lifting', 'integer'}, optional
+        Algorithm used for the transform along each axis, see `dwt`.
+    out : dict, optional
+        Preallocated arrays that receive the coefficients, with the keys of
+        the result.  They must have the shape and dtype of the coefficients,
+        be writeable, and not overlap ``data`` or each other; any strides are
+        accepted.  Large inputs are transformed one strip along the first of
+        ``axes`` at a time, so that the temporary arrays only span a strip.
+        Not supported with ``method='integer'``.
 
     Returns
     -------
@@ -163,8 +216,15 @@ def dwtn(data, wavelet, mode='symmetric', axes=None):
     """
     data = np.asarray(data)
     if not _have_c99_complex and np.iscomplexobj(data):
-        real = dwtn(data.real, wavelet, mode, axes)
-        imag = dwtn(data.imag, wavelet, mode, axes)
+        if out is not None:
+            # the real and imaginary parts are views of the complex arrays
+            dwtn(data.real, wavelet, mode, axes, workers, method,
+                 out={k: v.real for k, v in out.items()})
+            dwtn(data.imag, wavelet, mode, axes, workers, method,
+                 out={k: v.imag for k, v in out.items()})
+            return dict(out)
+        real = dwtn(data.real, wavelet, mode, axes, workers, method)
+        imag = dwtn(data.imag, wavelet, mode, axes, workers, method)
         return {k: real[k] + 1j * imag[k] for k in real}
 
     if data.dtype == np.dtype('object'):
@@ -175,21 +235,89 @@ def dwtn(data, wavelet, mode='symmetric', axes=None):
     if axes is None:
         axes = range(data.ndim)
     axes = [a + data.ndim if a < 0 else a for a in axes]
+    if any(axis < 0 or axis >= data.ndim for axis in axes):
+        raise AxisError("Axis greater than data dimensions")
 
     modes = _modes_per_axis(mode, axes)
     wavelets = _wavelets_per_axis(wavelet, axes)
-
+    workers = _check_workers(workers)
+    if workers > 1 and method == 'integer':
+        raise ValueError("workers > 1 is not supported with method='integer'.")
+    if out is not None:
+        keys = {''.join(k) for k in product('ad', repeat=len(axes))}
+        if not isinstance(out, dict) or set(out) != keys:
+            raise ValueError(
+                f"out must be a dict with the keys {sorted(keys)}.")
+        if method == 'integer':
+            raise ValueError("out is not supported with method='integer'.")
+
+    if method == 'convolution' and len(axes) > 1:
+        coeffs = _dwtn_strips(data, wavelets, modes, axes, workers, out)
+        if coeffs is not None:
+            return coeffs
+    return _dwtn_axes(data, wavelets, modes, axes, workers, method, out)
+
+
+def _dwtn_axes(data, wavelets, modes, axes, workers, method, out):
+    """Transform ``data`` along each of ``axes`` in turn."""
     coeffs = [('', data)]
-    for axis, wav, mode in zip(axes, wavelets, modes):
+    for i, (axis, wav, mode) in enumerate(zip(axes, wavelets, modes)):
+        lifting = _lifting_for_method(method, wav, mode)
+        last = out is not None and i == len(axes) - 1
         new_coeffs = []
         for subband, x in coeffs:
-            cA, cD = dwt_axis(x, wav, mode, axis)
+            if method == 'integer':
+                cA, cD = _integer_dwt_axis(x, wav, mode, axis)
+            else:
+                cA, cD = dwt_axis(
+                    x, wav, mode, axis, workers, lifting,
+                    (out[subband + 'a'], out[subband + 'd']) if last else None)
             new_coeffs.extend([(subband + 'a', cA),
                                (subband + 'd', cD)])
         coeffs = new_coeffs
     return dict(coeffs)
 
 
+def _dwtn_strips(data, wavelets, modes, axes, workers, out,
+                 strip_size=1 << 18, min_rows=32):
+    """Transform ``data`` one strip of coefficients along ``axes[0]`` at a
+    time, the remaining axes writing each strip straight into the subbands,
+    so that the temporaries only span a strip of about ``strip_size``
+    samples (but at least ``min_rows`` coefficients along ``axes[0]``, as
+    shorter lines are slow to transform).  Returns None if ``data`` does not
+    span a few strips.
+    """
+    axis, wav, mode = axes[0], wavelets[0], modes[0]
+    n = data.shape[axis]
+    if axis in axes[1:] or data.size < 2 * strip_size:
+        return None
+    shape = list(data.shape)
+    for ax, w, md in zip(axes, wavelets, modes):
+        shape[ax] = dwt_coeff_len(shape[ax], w.dec_len, md)
+    blocks = _half_blocks(shape[axis],
+                          max(min_rows, strip_size // (2 * data.size // n)))
+    if len(blocks) < 3:
+        return None
+    keys = [''.join(k) for k in product('ad', repeat=len(axes))]
+    lead = (slice(None), ) * axis
+    for o0, o1 in blocks:
+        start, stop, n_ext, block_mode, keep = _dwt_block(
+            n, wav, mode, o0, o1)
+        halves = dwt_axis(_take_line(data, start, stop, axis, n_ext),
+                          wav, block_mode, axis, workers)
+        for s, c in zip('ad', halves):
+            c = c[lead + (keep, )]
+            if o0 == 0 and s == 'a':
+                out = {k: np.empty(shape, c.dtype) if out is None else
+                       _check_out(out[k], shape, c.dtype, (data, ))
+                       for k in keys}
+            _dwtn_axes(c, wavelets[1:], modes[1:], axes[1:], workers,
+                       'convolution',
+                       {k[1:]: out[k][lead + (slice(o0, o1), )]
+                        for k in keys if k[0] == s})
+    return out
+
+
 def _fix_coeffs(coeffs):
     missing_keys = [k for k, v in coeffs.items() if v is None]
     if missing_keys:
@@ -216,7 +344,8 @@ def _fix_coeffs(coeffs):
     return {k: np.asarray(v) for k, v in coeffs.items()}
 
 
-def idwtn(coeffs, wavelet, mode='symmetric', axes=None):
+def idwtn(coeffs, wavelet, mode='symmetric', axes=None, workers=None,
+          method='convolution', out=None):
     """
     Single-level n-dimensional Inverse Discrete Wavelet Transform.
 
@@ -239,11 +368,23 @@ def idwtn(coeffs, wavelet, mode='symmetric', axes=None):
 
         For the most accurate reconstruction, the axes should be provided in
         the same order as they were provided to ``dwtn``.
+    workers : int, optional
+        Maximum number of threads to use for the transform along each axis,
+        see `dwt`.
+    method : {'convolution', 'lifting', 'integer'}, optional
+        Algorithm used for the transform along each axis, see `dwt`.
+    out : ndarray, optional
+        Preallocated array that receives the reconstruction.  It must have
+        the shape and dtype of the result, be writeable, and not overlap the
+        coefficients; any strides are accepted.  Large results are
+        reconstructed one strip along the first of ``axes`` at a time, so
+        that the temporary arrays only span a strip.  Not supported with
+        ``method='integer'``.
 
     Returns
     -------
     data: ndarray
-        Original signal reconstructed from input data.
+        Original signal reconstructed from input data (``out`` if given).
 
     """
 
@@ -260,8 +401,14 @@ def idwtn(coeffs, wavelet, mode='symmetric', axes=None):
             any(np.iscomplexobj(v) for v in coeffs.values())):
         real_coeffs = {k: v.real for k, v in coeffs.items()}
         imag_coeffs = {k: v.imag for k, v in coeffs.items()}
-        return (idwtn(real_coeffs, wavelet, mode, axes) +
-                1j * idwtn(imag_coeffs, wavelet, mode, axes))
+        if out is not None:
+            idwtn(real_coeffs, wavelet, mode, axes, workers, method,
+                  out=out.real)
+            idwtn(imag_coeffs, wavelet, mode, axes, workers, method,
+                  out=out.imag)
+            return out
+        return (idwtn(real_coeffs, wavelet, mode, axes, workers, method) +
+                1j * idwtn(imag_coeffs, wavelet, mode, axes, workers, method))
 
     # key length matches the number of axes transformed
     ndim_transform = max(len(key) for key in coeffs)
@@ -285,17 +432,37 @@ def idwtn(coeffs, wavelet, mode='symmetric', axes=None):
 
     modes = _modes_per_axis(mode, axes)
     wavelets = _wavelets_per_axis(wavelet, axes)
+    workers = _check_workers(workers)
+    if workers > 1 and method == 'integer':
+        raise ValueError("workers > 1 is not supported with method='integer'.")
+    if out is not None and method == 'integer':
+        raise ValueError("out is not supported with method='integer'.")
+    if any(axis < 0 or axis >= ndim for axis in axes):
+        raise AxisError("Axis greater than data dimensions")
+
+    if method == 'convolution' and len(axes) == ndim_transform > 1:
+        data = _idwtn_strips(coeffs, wavelets, modes, axes, workers, out)
+        if data is not None:
+            return data
+    return _idwtn_axes(coeffs, wavelets, modes, axes, workers, method, out)
+
+
+def _idwtn_axes(coeffs, wavelets, modes, axes, workers, method, out):
+    """Reconstruct from ``coeffs`` along each of ``axes`` in turn, the last
+    one first.
+    """
     for key_length, (axis, wav, mode) in reversed(
             list(enumerate(zip(axes, wavelets, modes)))):
-        if axis < 0 or axis >= ndim:
-            raise AxisError("Axis greater than data dimensions")
-
+        lifting = _lifting_for_method(method, wav, mode, inverse=True)
         new_coeffs = {}
         new_keys = [''.join(coef) for coef in product('ad', repeat=key_length)]
 
         for key in new_keys:
             L = coeffs.get(key + 'a', None)
             H = coeffs.get(key + 'd', None)
+            if method == 'integer':
+                new_coeffs[key] = _integer_idwt_axis(L, H, wav, mode, axis)
+                continue
             if L is not None and H is not None:
                 if L.dtype != H.dtype:
                     # upcast to a common dtype (float64 or complex128)
@@ -305,7 +472,51 @@ def idwtn(coeffs, wavelet, mode='symmetric', axes=None):
                         dtype = np.float64
                     L = np.asarray(L, dtype=dtype)
                     H = np.asarray(H, dtype=dtype)
-            new_coeffs[key] = idwt_axis(L, H, wav, mode, axis)
+            new_coeffs[key] = idwt_axis(
+                L, H, wav, mode, axis, workers, lifting,
+                out if key_length == 0 else None)
         coeffs = new_coeffs
 
     return coeffs['']
+
+
+def _idwtn_strips(coeffs, wavelets, modes, axes, workers, out,
+                  strip_size=1 << 18, min_rows=64):
+    """Reconstruct one strip of samples along ``axes[0]`` at a time from
+    the coefficients it depends on, so that the temporaries only span a
+    strip of about ``strip_size`` samples (but at least ``min_rows`` along
+    ``axes[0]``).  Returns None if the result does not span a few strips,
+    or if the strips cannot be separated.
+    """
+    axis, wav, mode = axes[0], wavelets[0], modes[0]
+    if (axis in axes[1:] or wav.rec_len % 2 or
+            len({v.dtype for v in coeffs.values()}) > 1):
+        return None
+    n = next(iter(coeffs.values())).shape[axis]
+    shape = list(next(iter(coeffs.values())).shape)
+    for ax, w, md in zip(axes, wavelets, modes):
+        shape[ax] = idwt_coeff_len(shape[ax], w.rec_len, md)
+    size = np.prod(shape)
+    if size < 2 * strip_size:
+        return None
+    blocks = _half_blocks(shape[axis],
+                          max(min_rows, strip_size // (size // shape[axis])))
+    if len(blocks) < 3:
+        return None
+
+    lead = (slice(None), ) * axis
+    for p0, p1 in blocks:
+        start, stop, block_mode, keep = _idwt_block(n, wav, mode, p0, p1)
+        halves = []
+        for s in 'ad':
+            strip = {k[1:]: _take_line(v, start, stop, axis)
+                     for k, v in coeffs.items() if k[0] == s}
+            halves.append(_idwtn_axes(strip, wavelets[1:], modes[1:],
+                                      axes[1:], workers, 'convolution', None)
+                          if strip else None)
+        y = idwt_axis(*halves, wav, block_mode, axis, workers)
+        if p0 == 0:
+            out = (np.empty(shape, y.dtype) if out is None else
+                   _check_out(out, shape, y.dtype, list(coeffs.values())))
+        out[lead + (slice(p0, p1), )] = y[lead + (keep, )]
+    return out
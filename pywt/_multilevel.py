@@ -16,16 +16,33 @@ from itertools import product
 
 import numpy as np
 
+from ._c99_config import _have_c99_complex
 from ._dwt import dwt, dwt_coeff_len, idwt
-from ._extensions._dwt import dwt_max_level
-from ._extensions._pywt import Modes, Wavelet
+from ._extensions._dwt import (
+    _half_slabs,
+    _scratch_views,
+    dwt_axis,
+    dwt_max_level,
+    idwt_axis,
+    idwt_coeff_len,
+    wavedec_batch_packed,
+)
+from ._extensions._pywt import Modes, Wavelet, _check_dtype
 from ._multidim import _fix_coeffs, dwt2, dwtn, idwt2, idwtn
-from ._utils import AxisError, _as_wavelet, _modes_per_axis, _wavelets_per_axis
-
-__all__ = ['wavedec', 'waverec', 'wavedec2', 'waverec2', 'wavedecn',
-           'waverecn', 'coeffs_to_array', 'array_to_coeffs', 'ravel_coeffs',
-           'unravel_coeffs', 'dwtn_max_level', 'wavedecn_size',
-           'wavedecn_shapes', 'fswavedecn', 'fswaverecn', 'FswavedecnResult']
+from ._utils import (
+    AxisError,
+    _as_wavelet,
+    _check_workers,
+    _modes_per_axis,
+    _wavelets_per_axis,
+)
+
+__all__ = ['wavedec', 'waverec', 'wavedec_batch', 'wavedec2', 'waverec2',
+           'wavedecn', 'waverecn', 'coeffs_to_array', 'array_to_coeffs',
+           'ravel_coeffs', 'unravel_coeffs', 'dwtn_max_level',
+           'wavedecn_size', 'wavedecn_shapes', 'fswavedecn', 'fswaverecn',
+           'FswavedecnResult', 'WavedecnCoeffs', 'wavedecn_inplace',
+           'waverecn_inplace']
 
 
 def _check_level(sizes, dec_lens, level):
@@ -46,7 +63,56 @@ def _check_level(sizes, dec_lens, level):
     return level
 
 
-def wavedec(data, wavelet, mode='symmetric', level=None, axis=-1):
+def _check_multilevel_out(out, level):
+    """Check that ``out`` has an entry for each coefficient of a ``level``
+    level decomposition; the entries are checked by the single level
+    transforms."""
+    if out is None:
+        return None
+    out = list(out)
+    if len(out) != level + 1:
+        raise ValueError(
+            f"out must hold {level + 1} entries for a {level} level "
+            "decomposition.")
+    if level == 0:
+        raise ValueError("out is not supported for a level 0 decomposition.")
+    return out
+
+
+def _level_buffers(arrays, details, wavelets, modes, axes, method,
+                   min_size=1 << 16):
+    """Views of two ping-pong buffers receiving the approximations of the
+    intermediate levels of a multilevel reconstruction, or None if the
+    levels need arrays of their own.
+
+    ``details`` holds a detail array of each level but the finest one.  The
+    buffers are only used if all coefficients share one dtype, so that every
+    level produces that dtype, and if the largest intermediate approximation
+    has at least about ``min_size`` elements: smaller arrays are cheaper to
+    allocate than to pass as ``out``.
+    """
+    if (not details or
+            method == 'integer' or
+            not all(isinstance(c, np.ndarray) for c in arrays) or
+            details[-1].size << len(axes) < min_size or
+            len({c.dtype for c in arrays}) != 1 or
+            arrays[0].dtype == np.float16):
+        return None
+    shapes = []
+    try:
+        for d in details:
+            shape = list(d.shape)
+            for axis, wav, mode in zip(axes, wavelets, modes):
+                shape[axis] = idwt_coeff_len(shape[axis], wav.rec_len, mode)
+            shapes.append(tuple(shape))
+    except IndexError:
+        # invalid axes are reported by the reconstruction
+        return None
+    return _scratch_views(shapes, _check_dtype(arrays[0]))
+
+
+def wavedec(data, wavelet, mode='symmetric', level=None, axis=-1,
+            workers=None, method='convolution', out=None):
     """
     Multilevel 1D Discrete Wavelet Transform of data.
 
@@ -64,6 +130,15 @@ def wavedec(data, wavelet, mode='symmetric', level=None, axis=-1):
     axis: int, optional
         Axis over which to compute the DWT. If not given, the
         last axis is used.
+    workers : int, optional
+        Maximum number of threads to use for each level of the transform, see
+        `dwt`.
+    method : {'convolution', 'lifting', 'integer'}, optional
+        Algorithm used for each level of the transform, see `dwt`.
+    out : list, optional
+        Preallocated arrays that receive the coefficients, structured as the
+        returned list, see `dwt`.  The approximation coefficients of the
+        intermediate levels are still allocated.
 
     Returns
     -------
@@ -95,12 +170,19 @@ def wavedec(data, wavelet, mode='symmetric', level=None, axis=-1):
     except IndexError:
         raise AxisError("Axis greater than data dimensions")
     level = _check_level(axes_shape, wavelet.dec_len, level)
+    out = _check_multilevel_out(out, level)
 
     coeffs_list = []
 
     a = data
     for i in range(level):
-        a, d = dwt(a, wavelet, mode, axis)
+        if out is None:
+            a, d = dwt(a, wavelet, mode, axis, workers, method)
+        else:
+            d = out[-i - 1]
+            a_out = out[0] if i == level - 1 else np.empty(d.shape, d.dtype)
+            a, d = dwt(a, wavelet, mode, axis, workers, method,
+                       out=(a_out, d))
         coeffs_list.append(d)
 
     coeffs_list.append(a)
@@ -109,7 +191,124 @@ def wavedec(data, wavelet, mode='symmetric', level=None, axis=-1):
     return coeffs_list
 
 
-def waverec(coeffs, wavelet, mode='symmetric', axis=-1):
+def wavedec_batch(data, wavelet, mode='symmetric', level=None, offsets=None,
+                  workers=None):
+    """
+    Multilevel 1D Discrete Wavelet Transform of a batch of signals.
+
+    The signals may have different lengths.  The whole batch is decomposed
+    in a single call, without the per-call overhead of ``wavedec``.
+
+    Parameters
+    ----------
+    data : array_like or sequence of array_like
+        Either the signals concatenated into a single 1D array, split by
+        ``offsets``, or a sequence of 1D signals.
+    wavelet : Wavelet object or name string
+        Wavelet to use
+    mode : str, optional
+        Signal extension mode, see :ref:`Modes <ref-modes>`.
+    level : int, optional
+        Decomposition level (must be >= 0), common to all signals.  If level
+        is None (default) then it will be calculated using the
+        ``dwt_max_level`` function for the shortest signal.
+    offsets : array_like of ints, optional
+        Required if ``data`` is a single array: signal ``i`` is
+        ``data[offsets[i]:offsets[i + 1]]``.
+    workers : int, optional
+        Maximum number of threads to use.  The signals are split into
+        ``workers`` groups that are processed concurrently.  If negative, the
+        value wraps around from ``os.cpu_count()``.  The default (None) uses a
+        single thread.
+
+    Returns
+    -------
+    coeffs : ndarray
+        The coefficients of all signals, packed into a single 1D array.
+    coeff_offsets : ndarray
+        Integer array of shape ``(n_signals, level + 2)``.  Coefficient
+        array ``j`` of the list ``[cA_n, cD_n, ..., cD1]`` that ``wavedec``
+        returns for signal ``i`` is
+        ``coeffs[coeff_offsets[i, j]:coeff_offsets[i, j + 1]]``.
+
+    Examples
+    --------
+    >>> import pywt
+    >>> coeffs, coeff_offsets = pywt.wavedec_batch(
+    ...     [[1, 2, 3, 4, 5, 6, 7, 8], [1, 2, 3, 4]], 'db1', level=1)
+    >>> coeff_offsets
+    array([[ 0,  4,  8],
+           [ 8, 10, 12]])
+    >>> coeffs[coeff_offsets[1, 0]:coeff_offsets[1, 1]]
+    array([2.12132034, 4.94974747])
+    """
+    if offsets is None:
+        signals = [np.asarray(x) for x in data]
+        if any(x.ndim != 1 for x in signals):
+            raise ValueError("The signals must be 1D.")
+        offsets = np.zeros(len(signals) + 1, dtype=np.int64)
+        np.cumsum([x.size for x in signals], out=offsets[1:])
+        data = np.concatenate(signals) if signals else np.zeros(0)
+    else:
+        data = np.asarray(data)
+        if data.ndim != 1:
+            raise ValueError("data must be 1D when offsets are given.")
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if (offsets.ndim != 1 or offsets.size < 1 or offsets[0] < 0 or
+                offsets[-1] > data.size):
+            raise ValueError("offsets must be a 1D array of indices into "
+                             "data.")
+    lengths = np.diff(offsets)
+    if np.any(lengths < 1):
+        raise ValueError("All signals must have non-zero length.")
+
+    if not _have_c99_complex and np.iscomplexobj(data):
+        kwargs = {'wavelet': wavelet, 'mode': mode, 'level': level,
+                  'offsets': offsets, 'workers': workers}
+        real, coeff_offsets = wavedec_batch(data.real, **kwargs)
+        imag, _ = wavedec_batch(data.imag, **kwargs)
+        return real + 1j * imag, coeff_offsets
+
+    wavelet = _as_wavelet(wavelet)
+    mode = Modes.from_object(mode)
+    workers = _check_workers(workers)
+    if lengths.size:
+        level = _check_level(int(lengths.min()), wavelet.dec_len, level)
+    elif level is None:
+        level = 0
+
+    # coefficient lengths of each level, as computed by dwt_coeff_len
+    level_lengths = [lengths]
+    for m in range(level):
+        n = level_lengths[-1]
+        if mode in (Modes.reflect, Modes.antireflect) and np.any(n == 1):
+            raise ValueError(
+                "Input data length must be greater than 1 for [anti]reflect "
+                "mode.")
+        if mode == Modes.periodization:
+            level_lengths.append((n + 1) // 2)
+        else:
+            level_lengths.append((n + wavelet.dec_len - 1) // 2)
+    sizes = np.stack([level_lengths[-1]] + level_lengths[:0:-1], axis=1)
+    coeff_offsets = np.zeros((lengths.size, level + 2), dtype=np.int64)
+    coeff_offsets[:, 1:] = np.cumsum(sizes.ravel()).reshape(sizes.shape)
+    coeff_offsets[1:, 0] = coeff_offsets[:-1, -1]
+
+    # float16 is computed in float32, as by the other transforms
+    dtype = _check_dtype(data)
+    contiguous = np.ascontiguousarray(data[offsets[0]:offsets[-1]],
+                                      dtype=dtype)
+    coeffs = np.empty(coeff_offsets[-1, -1] if lengths.size else 0, dtype)
+    if lengths.size:
+        wavedec_batch_packed(contiguous, offsets - offsets[0], coeffs,
+                             coeff_offsets, wavelet, mode, level, workers)
+    if data.dtype == np.float16:
+        coeffs = coeffs.astype(np.float16)
+    return coeffs, coeff_offsets
+
+
+def waverec(coeffs, wavelet, mode='symmetric', axis=-1, workers=None,
+            method='convolution', out=None):
     """
     Multilevel 1D Inverse Discrete Wavelet Transform.
 
@@ -124,6 +323,13 @@ def waverec(coeffs, wavelet, mode='symmetric', axis=-1):
     axis: int, optional
         Axis over which to compute the inverse DWT. If not given, the
         last axis is used.
+    workers : int, optional
+        Maximum number of threads to use for each level of the transform, see
+        `dwt`.
+    method : {'convolution', 'lifting', 'integer'}, optional
+        Algorithm used for each level of the transform, see `dwt`.
+    out : ndarray, optional
+        Preallocated array that receives the reconstruction, see `idwt`.
 
     Notes
     -----
@@ -152,11 +358,17 @@ def waverec(coeffs, wavelet, mode='symmetric', axis=-1):
             "Coefficient list too short (minimum 1 arrays required).")
     elif len(coeffs) == 1:
         # level 0 transform (just returns the approximation coefficients)
+        if out is not None:
+            raise ValueError(
+                "out is not supported for a level 0 reconstruction.")
         return coeffs[0]
 
     a, ds = coeffs[0], coeffs[1:]
+    bufs = _level_buffers(
+        [a] + list(ds), ds[:-1], [_as_wavelet(wavelet)],
+        [Modes.from_object(mode)], [axis], method)
 
-    for d in ds:
+    for idx, d in enumerate(ds):
         if d is not None and not isinstance(d, np.ndarray):
             raise ValueError(
                 f"Unexpected detail coefficient type: {type(d)}. Detail coefficients "
@@ -171,12 +383,17 @@ def waverec(coeffs, wavelet, mode='symmetric', axis=-1):
                     raise ValueError("coefficient shape mismatch")
             except IndexError:
                 raise AxisError("Axis greater than coefficient dimensions")
-        a = idwt(a, d, wavelet, mode, axis)
+        if idx == len(ds) - 1:
+            level_out = out
+        else:
+            level_out = None if bufs is None else bufs[idx]
+        a = idwt(a, d, wavelet, mode, axis, workers, method, out=level_out)
 
     return a
 
 
-def wavedec2(data, wavelet, mode='symmetric', level=None, axes=(-2, -1)):
+def wavedec2(data, wavelet, mode='symmetric', level=None, axes=(-2, -1),
+             workers=None, method='convolution', out=None):
     """
     Multilevel 2D Discrete Wavelet Transform.
 
@@ -195,6 +412,15 @@ def wavedec2(data, wavelet, mode='symmetric', level=None, axes=(-2, -1)):
         will be calculated using the ``dwt_max_level`` function.
     axes : 2-tuple of ints, optional
         Axes over which to compute the DWT. Repeated elements are not allowed.
+    workers : int, optional
+        Maximum number of threads to use for each level of the transform, see
+        `dwt`.
+    method : {'convolution', 'lifting', 'integer'}, optional
+        Algorithm used for each level of the transform, see `dwt`.
+    out : list, optional
+        Preallocated arrays that receive the coefficients, structured as the
+        returned list, see `dwtn`.  The approximation coefficients of the
+        intermediate levels are still allocated.
 
     Returns
     -------
@@ -239,12 +465,20 @@ def wavedec2(data, wavelet, mode='symmetric', level=None, axes=(-2, -1)):
     dec_lengths = [w.dec_len for w in wavelets]
 
     level = _check_level(axes_sizes, dec_lengths, level)
+    out = _check_multilevel_out(out, level)
 
     coeffs_list = []
 
     a = data
     for i in range(level):
-        a, ds = dwt2(a, wavelet, mode, axes)
+        if out is None:
+            a, ds = dwt2(a, wavelet, mode, axes, workers, method)
+        else:
+            ds = tuple(out[-i - 1])
+            a_out = (out[0] if i == level - 1 else
+                     np.empty(ds[0].shape, ds[0].dtype))
+            a, ds = dwt2(a, wavelet, mode, axes, workers, method,
+                         out=(a_out, ds))
         coeffs_list.append(ds)
 
     coeffs_list.append(a)
@@ -253,7 +487,8 @@ def wavedec2(data, wavelet, mode='symmetric', level=None, axes=(-2, -1)):
     return coeffs_list
 
 
-def waverec2(coeffs, wavelet, mode='symmetric', axes=(-2, -1)):
+def waverec2(coeffs, wavelet, mode='symmetric', axes=(-2, -1),
+             workers=None, method='convolution', out=None):
     """
     Multilevel 2D Inverse Discrete Wavelet Transform.
 
@@ -267,6 +502,13 @@ def waverec2(coeffs, wavelet, mode='symmetric', axes=(-2, -1)):
         also be a tuple containing a mode to apply along each axis in ``axes``.
     axes : 2-tuple of ints, optional
         Axes over which to compute the IDWT. Repeated elements are not allowed.
+    workers : int, optional
+        Maximum number of threads to use for each level of the transform, see
+        `dwt`.
+    method : {'convolution', 'lifting', 'integer'}, optional
+        Algorithm used for each level of the transform, see `dwt`.
+    out : ndarray, optional
+        Preallocated array that receives the reconstruction, see `idwtn`.
 
     Returns
     -------
@@ -308,12 +550,21 @@ def waverec2(coeffs, wavelet, mode='symmetric', axes=(-2, -1)):
             "Coefficient list too short (minimum 1 array required).")
     elif len(coeffs) == 1:
         # level 0 transform (just returns the approximation coefficients)
+        if out is not None:
+            raise ValueError(
+                "out is not supported for a level 0 reconstruction.")
         return coeffs[0]
 
     a, ds = coeffs[0], coeffs[1:]
     a = np.asarray(a)
+    bufs = None
+    if all(isinstance(d, (list, tuple)) and len(d) == 3 for d in ds):
+        bufs = _level_buffers(
+            [a] + [c for d in ds for c in d], [d[0] for d in ds[:-1]],
+            _wavelets_per_axis(wavelet, axes), _modes_per_axis(mode, axes),
+            axes, method)
 
-    for d in ds:
+    for idx, d in enumerate(ds):
         if not isinstance(d, (list, tuple)) or len(d) != 3:
             raise ValueError(
                 f"Unexpected detail coefficient type: {type(d)}. Detail coefficients "
@@ -332,7 +583,12 @@ def waverec2(coeffs, wavelet, mode='symmetric', axes=(-2, -1)):
                 raise ValueError("All detail shapes must be the same length.")
             idxs = tuple(slice(None, -1 if a_len == d_len + 1 else None)
                          for a_len, d_len in zip(a.shape, d_shape))
-        a = idwt2((a[idxs], d), wavelet, mode, axes)
+        if idx == len(ds) - 1:
+            level_out = out
+        else:
+            level_out = None if bufs is None else bufs[idx]
+        a = idwt2((a[idxs], d), wavelet, mode, axes, workers, method,
+                  out=level_out)
 
     return a
 
@@ -357,7 +613,8 @@ def _prep_axes_wavedecn(shape, axes):
     return axes, axes_shapes, ndim_transform
 
 
-def wavedecn(data, wavelet, mode='symmetric', level=None, axes=None):
+def wavedecn(data, wavelet, mode='symmetric', level=None, axes=None,
+             workers=None, method='convolution', out=None):
     """
     Multilevel nD Discrete Wavelet Transform.
 
@@ -378,6 +635,17 @@ def wavedecn(data, wavelet, mode='symmetric', level=None, axes=None):
         Axes over which to compute the DWT. Axes may not be repeated. The
         default is None, which means transform all axes
         (``axes = range(data.ndim)``).
+    workers : int, optional
+        Maximum number of threads to use for each level of the transform, see
+        `dwt`.
+    method : {'convolution', 'lifting', 'integer'}, optional
+        Algorithm used for each level of the transform, see `dwt`.
+    out : list or WavedecnCoeffs, optional
+        Preallocated arrays that receive the coefficients, structured as the
+        returned list, see `dwtn`.  The approximation coefficients of the
+        intermediate levels are still allocated.  A `WavedecnCoeffs` stores
+        the whole decomposition in a single array and is returned in place
+        of the list.
 
     Returns
     -------
@@ -427,15 +695,27 @@ def wavedecn(data, wavelet, mode='symmetric', level=None, axes=None):
     dec_lengths = [w.dec_len for w in wavelets]
 
     level = _check_level(axes_shapes, dec_lengths, level)
+    out_arg, out = out, _check_multilevel_out(out, level)
 
     coeffs_list = []
 
     a = data
     for i in range(level):
-        coeffs = dwtn(a, wavelet, mode, axes)
+        if out is None:
+            coeffs = dwtn(a, wavelet, mode, axes, workers, method)
+        else:
+            d = dict(out[-i - 1])
+            d_any = next(iter(d.values()), None)
+            d['a' * ndim_transform] = (
+                out[0] if i == level - 1 or d_any is None else
+                np.empty(d_any.shape, d_any.dtype))
+            coeffs = dwtn(a, wavelet, mode, axes, workers, method, out=d)
         a = coeffs.pop('a' * ndim_transform)
         coeffs_list.append(coeffs)
 
+    if isinstance(out_arg, WavedecnCoeffs):
+        return out_arg
+
     coeffs_list.append(a)
     coeffs_list.reverse()
 
@@ -458,11 +738,12 @@ def _match_coeff_dims(a_coeff, d_coeff_dict):
     return a_coeff[tuple(slice(s) for s in d_coeff.shape)]
 
 
-def waverecn(coeffs, wavelet, mode='symmetric', axes=None):
+def waverecn(coeffs, wavelet, mode='symmetric', axes=None, workers=None,
+             method='convolution', out=None):
     """
     Multilevel nD Inverse Discrete Wavelet Transform.
 
-    coeffs : array_like
+    coeffs : array_like or WavedecnCoeffs
         Coefficients list [cAn, {details_level_n}, ... {details_level_1}]
     wavelet : Wavelet object or name string, or tuple of wavelets
         Wavelet to use.  This can also be a tuple containing a wavelet to
@@ -472,6 +753,13 @@ def waverecn(coeffs, wavelet, mode='symmetric', axes=None):
         also be a tuple containing a mode to apply along each axis in ``axes``.
     axes : sequence of ints, optional
         Axes over which to compute the IDWT.  Axes may not be repeated.
+    workers : int, optional
+        Maximum number of threads to use for each level of the transform, see
+        `dwt`.
+    method : {'convolution', 'lifting', 'integer'}, optional
+        Algorithm used for each level of the transform, see `dwt`.
+    out : ndarray, optional
+        Preallocated array that receives the reconstruction, see `idwtn`.
 
     Returns
     -------
@@ -534,6 +822,9 @@ def waverecn(coeffs, wavelet, mode='symmetric', axes=None):
 
     if not ds:
         # level 0 transform (just returns the approximation coefficients)
+        if out is not None:
+            raise ValueError(
+                "out is not supported for a level 0 reconstruction.")
         return coeffs[0]
     if a is None and not any(ds):
         raise ValueError(
@@ -563,6 +854,13 @@ def waverecn(coeffs, wavelet, mode='symmetric', axes=None):
     if len(axes) != len(set(axes)):
         raise ValueError("The axes passed to waverecn must be unique.")
     ndim_transform = len(axes)
+    bufs = None
+    if all(ds):
+        bufs = _level_buffers(
+            [a] + [c for d in ds for c in d.values()],
+            [next(iter(d.values())) for d in ds[:-1]],
+            _wavelets_per_axis(wavelet, axes), _modes_per_axis(mode, axes),
+            axes, method)
 
     for idx, d in enumerate(ds):
         if a is None and not d:
@@ -573,11 +871,198 @@ def waverecn(coeffs, wavelet, mode='symmetric', axes=None):
         if idx > 0:
             a = _match_coeff_dims(a, d)
         d['a' * ndim_transform] = a
-        a = idwtn(d, wavelet, mode, axes)
+        if idx == len(ds) - 1:
+            level_out = out
+        else:
+            level_out = None if bufs is None else bufs[idx]
+        a = idwtn(d, wavelet, mode, axes, workers, method, out=level_out)
 
     return a
 
 
+def _prep_inplace(arr, wavelet, level, axes):
+    if not isinstance(arr, np.ndarray):
+        raise TypeError("arr must be a numpy.ndarray.")
+    if not np.issubdtype(arr.dtype, np.inexact):
+        raise TypeError(
+            f"arr must be floating point or complex, not {arr.dtype}.")
+    if not arr.flags.writeable:
+        raise ValueError("arr must be writeable.")
+    axes, axes_shapes, ndim_transform = _prep_axes_wavedecn(arr.shape, axes)
+    axes = [a + arr.ndim if a < 0 else a for a in axes]
+    wavelets = _wavelets_per_axis(wavelet, axes)
+    if level is None:
+        # the number of times 2 divides every size, at most the max level
+        level = min([_check_level(axes_shapes,
+                                  [w.dec_len for w in wavelets], None)] +
+                    [(n & -n).bit_length() - 1 for n in axes_shapes if n])
+    level = _check_level(axes_shapes, [w.dec_len for w in wavelets], level)
+    if any(n % 2**level for n in axes_shapes):
+        raise ValueError(
+            "The size of arr along each transformed axis must be a multiple "
+            f"of 2**level = {2**level}.")
+    return axes, wavelets, level
+
+
+def _mallat_slices(shape, axes, level):
+    """Coefficient slices of an in-place decomposition, in the format of
+    ``coeffs_to_array``."""
+    a_shape = list(shape)
+    for ax in axes:
+        a_shape[ax] >>= level
+    coeff_slices = [tuple(slice(n) for n in a_shape)]
+    for j in range(level, 0, -1):
+        coeff_slices.append({})
+        for key in product('ad', repeat=len(axes)):
+            if 'd' not in key:
+                continue
+            sl = [slice(None), ] * len(shape)
+            for let, ax in zip(key, axes):
+                n = shape[ax] >> j
+                sl[ax] = slice(n) if let == 'a' else slice(n, 2 * n)
+            coeff_slices[-1][''.join(key)] = tuple(sl)
+    return coeff_slices
+
+
+def _inplace_region(arr, axes, j):
+    """View of the approximation of level ``j`` of an in-place
+    decomposition of ``arr``."""
+    sl = [slice(None), ] * arr.ndim
+    for ax in axes:
+        sl[ax] = slice(arr.shape[ax] >> j)
+    return arr[tuple(sl)]
+
+
+def wavedecn_inplace(arr, wavelet, level=None, axes=None, workers=None):
+    """Multilevel nD Discrete Wavelet Transform overwriting the input.
+
+    ``arr`` is replaced by its coefficients, arranged as by
+    ``coeffs_to_array``: the approximation coefficients occupy the leading
+    corner and the detail subbands of each level the remaining blocks (the
+    "Mallat" layout).  The transform uses ``'periodization'`` mode, for
+    which the coefficients take exactly the space of the data.  Apart from
+    ``arr``, the memory used is bounded by a tile of 2**18 elements, or of a
+    single line along a transformed axis when that is longer.
+
+    Parameters
+    ----------
+    arr : ndarray
+        Writeable floating point or complex array to transform.  Its size
+        along each transformed axis must be a multiple of ``2**level``.
+    wavelet : Wavelet object or name string, or tuple of wavelets
+        Wavelet to use.  This can also be a tuple containing a wavelet to
+        apply along each axis in ``axes``.
+    level : int, optional
+        Decomposition level (must be >= 0). If level is None (default) then it
+        will be calculated using the ``dwt_max_level`` function, capped at the
+        number of times 2 divides the size along every transformed axis.
+    axes : sequence of ints, optional
+        Axes over which to compute the DWT. Axes may not be repeated. The
+        default is None, which means transform all axes
+        (``axes = range(arr.ndim)``).
+    workers : int, optional
+        Maximum number of threads to use for each level of the transform, see
+        `dwt`.
+
+    Returns
+    -------
+    arr : ndarray
+        The input array, now holding the coefficients.
+    coeff_slices : list
+        List of slices corresponding to each coefficient, as returned by
+        ``coeffs_to_array``.
+
+    See Also
+    --------
+    waverecn_inplace : the inverse of wavedecn_inplace
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pywt
+    >>> x = np.arange(256.).reshape(16, 16)
+    >>> arr, slices = pywt.wavedecn_inplace(x.copy(), 'db2', level=2)
+    >>> coeffs = pywt.wavedecn(x, 'db2', 'periodization', level=2)
+    >>> np.allclose(arr[slices[1]['dd']], coeffs[1]['dd'])
+    True
+    """
+    axes, wavelets, level = _prep_inplace(arr, wavelet, level, axes)
+    if not _have_c99_complex and np.iscomplexobj(arr):
+        wavedecn_inplace(arr.real, wavelets, level, axes, workers)
+        wavedecn_inplace(arr.imag, wavelets, level, axes, workers)
+        return arr, _mallat_slices(arr.shape, axes, level)
+
+    workers = _check_workers(workers)
+    for j in range(level):
+        region = _inplace_region(arr, axes, j)
+        for axis, wav in zip(axes, wavelets):
+            n = region.shape[axis] // 2
+            lo = (slice(None), ) * axis + (slice(n), )
+            hi = (slice(None), ) * axis + (slice(n, None), )
+            for s in _half_slabs(region.shape, axis):
+                # the tile is copied, the coefficients are written into arr
+                view = region[s]
+                dwt_axis(view.copy(), wav, Modes.periodization, axis, workers,
+                         None, (view[lo], view[hi]))
+    return arr, _mallat_slices(arr.shape, axes, level)
+
+
+def waverecn_inplace(arr, wavelet, level, axes=None, workers=None):
+    """Multilevel nD Inverse Discrete Wavelet Transform overwriting the input.
+
+    Inverse of ``wavedecn_inplace``: ``arr`` holds the coefficients in the
+    layout of ``coeffs_to_array`` and is replaced by the reconstructed data.
+    Apart from ``arr``, the memory used is bounded by a tile of 2**18
+    elements, or of a single line along a transformed axis when that is
+    longer.
+
+    Parameters
+    ----------
+    arr : ndarray
+        Writeable array of coefficients, as produced by ``wavedecn_inplace``.
+    wavelet : Wavelet object or name string, or tuple of wavelets
+        Wavelet to use.  This can also be a tuple containing a wavelet to
+        apply along each axis in ``axes``.
+    level : int
+        Decomposition level of the coefficients.
+    axes : sequence of ints, optional
+        Axes over which to compute the IDWT. Axes may not be repeated. The
+        default is None, which means transform all axes
+        (``axes = range(arr.ndim)``).
+    workers : int, optional
+        Maximum number of threads to use for each level of the transform, see
+        `dwt`.
+
+    Returns
+    -------
+    arr : ndarray
+        The input array, now holding the reconstructed data.
+
+    See Also
+    --------
+    wavedecn_inplace : the inverse of waverecn_inplace
+    """
+    axes, wavelets, level = _prep_inplace(arr, wavelet, level, axes)
+    if not _have_c99_complex and np.iscomplexobj(arr):
+        waverecn_inplace(arr.real, wavelets, level, axes, workers)
+        waverecn_inplace(arr.imag, wavelets, level, axes, workers)
+        return arr
+
+    workers = _check_workers(workers)
+    for j in range(level - 1, -1, -1):
+        region = _inplace_region(arr, axes, j)
+        for axis, wav in reversed(list(zip(axes, wavelets))):
+            n = region.shape[axis] // 2
+            lo = (slice(None), ) * axis + (slice(n), )
+            hi = (slice(None), ) * axis + (slice(n, None), )
+            for s in _half_slabs(region.shape, axis):
+                view = region[s]
+                tile = view.copy()
+                idwt_axis(tile[lo], tile[hi], wav, Modes.periodization, axis,
+                          workers, None, view)
+    return arr
+
+
 def _coeffs_wavedec_to_wavedecn(coeffs):
     """Convert wavedec coefficients to the wavedecn format."""
     if len(coeffs) == 0:
@@ -1071,6 +1556,9 @@ def ravel_coeffs(coeffs, axes=None):
     >>> arr, coeff_slices, coeff_shapes = pywt.ravel_coeffs(coeffs)
 
     """
+    if isinstance(coeffs, WavedecnCoeffs):
+        # already raveled, no copy is needed
+        return coeffs.array, coeffs.coeff_slices, coeffs.coeff_shapes
     coeffs, axes, ndim, ndim_transform = _prepare_coeffs_axes(coeffs, axes)
 
     # initialize with the approximation coefficients.
@@ -1191,6 +1679,162 @@ def unravel_coeffs(arr, coeff_slices, coeff_shapes, output_format='wavedecn'):
     return coeffs
 
 
+class WavedecnCoeffs(np.lib.mixins.NDArrayOperatorsMixin):
+    """Multilevel nD wavelet coefficients stored in a single array.
+
+    The coefficients of all levels and subbands are views into one 1D array
+    with the layout produced by ``ravel_coeffs``.  Passing the object as
+    ``out`` to ``wavedecn`` computes the decomposition directly into it, and
+    ``waverecn`` accepts it in place of a coefficient list.
+
+    NumPy ufuncs and arithmetic operators apply elementwise to all
+    coefficients at once and return a new ``WavedecnCoeffs``.
+
+    Parameters
+    ----------
+    shapes : list
+        Coefficient shapes as returned by ``wavedecn_shapes``.
+    dtype : data-type, optional
+        Data type of the coefficients.  Must match the dtype ``wavedecn``
+        produces for the data when used as its ``out`` argument.  Defaults
+        to the dtype of ``buffer`` if given, otherwise to float64.
+    buffer : ndarray, optional
+        1D array of ``wavedecn_size(shapes)`` elements holding the
+        coefficients.  It is used without copying, so its dtype must match
+        ``dtype`` if both are given.  If not given, an uninitialized array is
+        allocated.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pywt
+    >>> x = np.ones((16, 16, 16))
+    >>> shapes = pywt.wavedecn_shapes(x.shape, 'db1', level=2)
+    >>> coeffs = pywt.wavedecn(x, 'db1', level=2,
+    ...                        out=pywt.WavedecnCoeffs(shapes))
+    >>> coeffs[1]['ddd'].shape
+    (4, 4, 4)
+    >>> np.allclose(pywt.waverecn(coeffs / 2, 'db1'), x / 2)
+    True
+    """
+    def __init__(self, shapes, dtype=None, buffer=None):
+        if len(shapes) < 1:
+            raise ValueError("shapes must contain at least one entry.")
+        a_shape = tuple(shapes[0])
+        self._coeff_shapes = [a_shape]
+        self._coeff_slices = [slice(int(np.prod(a_shape)))]
+        offset = self._coeff_slices[0].stop
+        for d in shapes[1:]:
+            if not isinstance(d, dict):
+                raise ValueError(
+                    "Detail shapes must be dictionaries as returned by "
+                    "wavedecn_shapes.")
+            self._coeff_shapes.append({})
+            self._coeff_slices.append({})
+            # sort keys to match the layout of ravel_coeffs
+            for key in sorted(d):
+                shape = tuple(d[key])
+                size = int(np.prod(shape))
+                self._coeff_shapes[-1][key] = shape
+                self._coeff_slices[-1][key] = slice(offset, offset + size)
+                offset += size
+
+        if buffer is None:
+            buffer = np.empty(offset,
+                              dtype=np.float64 if dtype is None else dtype)
+        elif not isinstance(buffer, np.ndarray) or buffer.shape != (offset, ):
+            raise ValueError(
+                f"buffer must be a 1D array of {offset} elements.")
+        elif dtype is not None and np.dtype(dtype) != buffer.dtype:
+            raise ValueError(
+                f"dtype {np.dtype(dtype)} does not match the dtype of buffer, "
+                f"{buffer.dtype}.")
+        self._array = buffer
+
+    @property
+    def array(self):
+        """ndarray: All coefficients raveled into a single 1D array."""
+        return self._array
+
+    @property
+    def coeff_slices(self):
+        """list: Slices of ``array`` holding each coefficient, as returned
+        by ``ravel_coeffs``."""
+        return self._coeff_slices
+
+    @property
+    def coeff_shapes(self):
+        """list: Shapes of the coefficients, as returned by
+        ``wavedecn_shapes``."""
+        return self._coeff_shapes
+
+    @property
+    def dtype(self):
+        """numpy.dtype: Data type of the coefficients."""
+        return self._array.dtype
+
+    @property
+    def level(self):
+        """int: Number of decomposition levels."""
+        return len(self._coeff_shapes) - 1
+
+    def __len__(self):
+        return len(self._coeff_shapes)
+
+    def __iter__(self):
+        for n in range(len(self)):
+            yield self[n]
+
+    def __getitem__(self, n):
+        """Views of the coefficients of one entry of the coefficient list.
+
+        Parameters
+        ----------
+        n : int or slice
+            Index into ``[cAn, {details_level_n}, ... {details_level_1}]``.
+            The details are returned as a new dictionary of views on each
+            access.
+        """
+        if isinstance(n, slice):
+            return [self[i] for i in range(*n.indices(len(self)))]
+        n = range(len(self))[n]
+        if n == 0:
+            return self._array[self._coeff_slices[0]].reshape(
+                self._coeff_shapes[0])
+        return {k: self._array[sl].reshape(self._coeff_shapes[n][k])
+                for k, sl in self._coeff_slices[n].items()}
+
+    def _wrap(self, arr):
+        return WavedecnCoeffs(self._coeff_shapes, buffer=arr)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__':
+            return NotImplemented
+        for x in inputs + kwargs.get('out', ()):
+            if isinstance(x, WavedecnCoeffs):
+                if x.coeff_shapes != self._coeff_shapes:
+                    raise ValueError(
+                        "The coefficient shapes of the operands differ.")
+            elif np.ndim(x) != 0:
+                # arrays would broadcast against the raveled coefficients
+                return NotImplemented
+        args = [x._array if isinstance(x, WavedecnCoeffs) else x
+                for x in inputs]
+        out = kwargs.pop('out', None)
+        if out is not None:
+            kwargs['out'] = tuple(x._array for x in out)
+        result = ufunc(*args, **kwargs)
+        if out is not None:
+            return out[0] if len(out) == 1 else out
+        if isinstance(result, tuple):
+            return tuple(self._wrap(r) for r in result)
+        return self._wrap(result)
+
+    def copy(self):
+        """Return a copy of the coefficients."""
+        return self._wrap(self._array.copy())
+
+
 def _check_fswavedecn_axes(data, axes):
     """Axes checks common to fswavedecn, fswaverecn."""
     if len(axes) != len(set(axes)):
@@ -0,0 +1,684 @@
+"""Online wavelet transforms of signals that arrive in chunks."""
+import warnings
+
+import numpy as np
+
+from ._c99_config import _have_c99_complex
+from ._dwt import dwt, idwt
+from ._extensions._pywt import _check_dtype
+from ._extensions._swt import _swt_window
+from ._swt import _rescale_wavelet_filterbank
+from ._utils import AxisError, _as_wavelet, _mode_name
+
+__all__ = ['StreamingDWT', 'StreamingIDWT', 'StreamingSWT']
+
+
+def _output_dtype(dtype):
+    # the dtype of the coefficients of the discrete transforms
+    if dtype == np.float16:
+        return dtype
+    return np.dtype(_check_dtype(np.empty(0, dtype)))
+
+
+def _idwt_dtype(a_dtype, d_dtype):
+    # the dtype of the reconstruction of `idwt`
+    if a_dtype != d_dtype:
+        if a_dtype.kind == 'c' or d_dtype.kind == 'c':
+            return np.dtype(np.complex128)
+        return np.dtype(np.float64)
+    return _output_dtype(a_dtype)
+
+
+def _take(x, start, stop, axis):
+    """Samples ``start:stop`` of ``x`` along ``axis``."""
+    return x[(slice(None), ) * (axis % x.ndim) + (slice(start, stop), )]
+
+
+def _check_chunk(chunk, ndim):
+    """``chunk`` as an array, which must have ``ndim`` dimensions unless
+    ``ndim`` is None."""
+    chunk = np.asarray(chunk)
+    if chunk.ndim == 0:
+        raise ValueError("Expected at least 1D input data.")
+    if ndim is not None and chunk.ndim != ndim:
+        raise ValueError("All chunks must have the same number of "
+                         "dimensions.")
+    return chunk
+
+
+def _append(buffer, x, axis):
+    """The samples of ``buffer`` followed by those of ``x`` along ``axis``."""
+    if buffer is None or buffer.shape[axis] == 0:
+        return x
+    if x.shape[axis] == 0:
+        return buffer
+    return np.concatenate([buffer, x], axis=axis)
+
+
+class _DWTLevel:
+    """The state of a single level of `StreamingDWT`.
+
+    Coefficient ``k`` is computed from the samples ``2*k + 1 - j``,
+    ``j = 0, ..., filter_len - 1`` of the extended signal.  The first
+    ``filter_len // 2 - 1`` coefficients depend on the extension of the start
+    of the signal.  They are computed once ``2 * filter_len`` samples have
+    arrived, from the transform of these samples, which is extended in the
+    same way.  The other coefficients are computed as soon as their last
+    sample arrives.  The coefficients that depend on the extension of the end
+    of the signal are computed by `flush`.
+    """
+
+    def __init__(self, wavelet, mode, axis):
+        self.wavelet = wavelet
+        self.mode = mode
+        self.axis = axis
+        filter_len = wavelet.dec_len
+        # the number of samples at the start and end of the signal from which
+        # the coefficients that depend on the extension are computed
+        self.edge = 2 * filter_len
+        self.skip = filter_len // 2 - 1
+        self.reset()
+
+    def reset(self):
+        # the samples that are still needed, starting at sample self.start
+        self.buffer = None
+        self.start = 0
+        self.size = 0
+        # the next coefficient to compute
+        self.next = 0
+
+    def _empty(self, like):
+        shape = list(like.shape)
+        shape[self.axis] = 0
+        return np.empty(shape, _output_dtype(like.dtype))
+
+    def push(self, x):
+        """Append the samples ``x`` and return the coefficients that can be
+        computed."""
+        axis = self.axis
+        self.buffer = _append(self.buffer, x, axis)
+        self.size += x.shape[axis]
+        if self.size < self.edge:
+            return self._empty(x), self._empty(x)
+
+        coeffs = []
+        if self.next == 0 and self.skip:
+            head = _take(self.buffer, 0, self.edge, axis)
+            a, d = dwt(head, self.wavelet, self.mode, axis)
+            coeffs.append((_take(a, 0, self.skip, axis),
+                           _take(d, 0, self.skip, axis)))
+            self.next = self.skip
+        # the coefficients whose last sample has arrived
+        stop = self.size // 2
+        if stop > self.next:
+            filter_len = self.wavelet.dec_len
+            x = _take(self.buffer, 2 * self.next + 2 - filter_len - self.start,
+                      2 * stop - self.start, axis)
+            a, d = dwt(x, self.wavelet, 'zero', axis)
+            count = stop - self.next
+            coeffs.append((_take(a, self.skip, self.skip + count, axis),
+                           _take(d, self.skip, self.skip + count, axis)))
+            self.next = stop
+            # keep the samples of the next coefficient and the end of the
+            # signal, from which the final coefficients are computed
+            keep = min(2 * stop + 2 - filter_len, self.size - self.edge - 1)
+            if keep > self.start:
+                self.buffer = _take(self.buffer, keep - self.start, None, axis)
+                self.start = keep
+        if not coeffs:
+            return self._empty(x), self._empty(x)
+        if len(coeffs) == 1:
+            return coeffs[0]
+        return tuple(np.concatenate(c, axis=axis) for c in zip(*coeffs))
+
+    def flush(self):
+        """Return the remaining coefficients at the end of the signal."""
+        buffer, axis = self.buffer, self.axis
+        start, size, next_coeff = self.start, self.size, self.next
+        self.reset()
+        if buffer is None:
+            return None, None
+        if size < self.edge:
+            # the whole signal is still buffered
+            return dwt(buffer, self.wavelet, self.mode, axis)
+        # transform the end of the signal, starting at an even sample so that
+        # the coefficients line up
+        tail = self.edge + (size - self.edge) % 2
+        shift = (size - tail) // 2
+        a, d = dwt(_take(buffer, size - tail - start, None, axis),
+                   self.wavelet, self.mode, axis)
+        return (_take(a, next_coeff - shift, None, axis),
+                _take(d, next_coeff - shift, None, axis))
+
+
+class StreamingDWT:
+    """
+    Online multilevel 1D Discrete Wavelet Transform.
+
+    The signal is passed in chunks of arbitrary size to `push`, which returns
+    the coefficients that are determined by the samples received so far.
+    Once the signal ends, `flush` returns the remaining coefficients, which
+    depend on the extension of the end of the signal.  The concatenation of
+    the coefficients returned for each level equals the result of
+    `pywt.wavedec` on the whole signal.
+
+    Parameters
+    ----------
+    wavelet : Wavelet object or name string
+        Wavelet to use
+    mode : str, optional
+        Signal extension mode, see :ref:`Modes <ref-modes>`.  The periodic
+        modes, which extend the start of the signal by its end, are not
+        supported.
+    level : int, optional
+        Decomposition level (must be >= 1).
+    axis : int, optional
+        Axis of the chunks along which the signal runs.  The other axes hold
+        independent channels.
+
+    Notes
+    -----
+    Each level only buffers the samples needed for its next coefficients and
+    the last ``2 * filter_len + 1`` samples, so the memory used does not grow
+    with the length of the signal, and each chunk is transformed in time
+    proportional to its size.  The coefficients that depend on the extension
+    of the start of the signal are returned once ``2 * filter_len`` samples
+    have arrived at a level.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pywt
+    >>> x = np.random.randn(1000)
+    >>> stream = pywt.StreamingDWT('db2', level=2)
+    >>> chunks = [stream.push(c) for c in np.array_split(x, 10)]
+    >>> chunks.append(stream.flush())
+    >>> coeffs = [np.concatenate(c) for c in zip(*chunks)]
+    >>> expected = pywt.wavedec(x, 'db2', level=2)
+    >>> all(np.allclose(c, e) for c, e in zip(coeffs, expected))
+    True
+    """
+
+    def __init__(self, wavelet, mode='symmetric', level=1, axis=-1):
+        self.wavelet = _as_wavelet(wavelet)
+        self.mode = _mode_name(mode)
+        if self.mode in ('periodic', 'periodization'):
+            raise ValueError(
+                f"mode '{self.mode}' extends the start of the signal by its "
+                "end and is not supported for streaming.")
+        if level < 1:
+            raise ValueError("level must be greater than zero.")
+        self.level = level
+        self.axis = axis
+        self._levels = [_DWTLevel(self.wavelet, self.mode, axis)
+                        for _ in range(level)]
+        self._ndim = None
+
+    def push(self, chunk):
+        """
+        Transform the next samples of the signal.
+
+        Parameters
+        ----------
+        chunk : array_like
+            The next samples of the signal, along ``axis``.
+
+        Returns
+        -------
+        [cA_n, cD_n, cD_n-1, ..., cD2, cD1] : list
+            The coefficients of each level that are determined by the samples
+            received so far and were not returned before.
+        """
+        a = _check_chunk(chunk, self._ndim)
+        self._ndim = a.ndim
+        details = []
+        for level in self._levels:
+            a, d = level.push(a)
+            details.append(d)
+        return [a] + details[::-1]
+
+    def flush(self):
+        """
+        End the signal.
+
+        The object is reset, and can transform another signal.
+
+        Returns
+        -------
+        [cA_n, cD_n, cD_n-1, ..., cD2, cD1] : list
+            The coefficients of each level that were not returned before.
+        """
+        if self._levels[0].buffer is None:
+            raise ValueError("No samples have been pushed.")
+        a = None
+        details = []
+        for level in self._levels:
+            coeffs = [level.push(a)] if a is not None else []
+            last = level.flush()
+            if last[0] is not None:
+                coeffs.append(last)
+            a, d = (np.concatenate(c, axis=self.axis) for c in zip(*coeffs))
+            details.append(d)
+        self._ndim = None
+        return [a] + details[::-1]
+
+
+class _IDWTLevel:
+    """The state of a single level of `StreamingIDWT`.
+
+    The reconstructed samples ``2*k0, ..., 2*k1 - filter_len + 1`` only
+    depend on the coefficients ``k0, ..., k1 - 1``, so each sample is
+    computed as soon as the last coefficient it depends on arrives.  The
+    coefficients that overlap the following samples are kept, starting at
+    coefficient ``start``, which is the half of the next sample.
+    """
+
+    def __init__(self, wavelet, mode, axis):
+        self.wavelet = wavelet
+        self.mode = mode
+        self.axis = axis
+        self.reset()
+
+    def reset(self):
+        self.a = None
+        self.d = None
+        self.start = 0
+
+    def push(self, a, d):
+        """Append the coefficients ``a`` and ``d`` and return the samples that
+        can be reconstructed."""
+        axis = self.axis
+        self.a = _append(self.a, a, axis)
+        self.d = _append(self.d, d, axis)
+        count = min(self.a.shape[axis], self.d.shape[axis])
+        # the number of coefficients that overlap the next samples
+        overlap = self.wavelet.rec_len // 2 - 1
+        if count <= overlap:
+            shape = list(self.d.shape)
+            shape[axis] = 0
+            return np.empty(shape, _idwt_dtype(self.a.dtype, self.d.dtype))
+        x = idwt(_take(self.a, 0, count, axis), _take(self.d, 0, count, axis),
+                 self.wavelet, self.mode, axis)
+        keep = count - overlap
+        self.a = _take(self.a, keep, None, axis)
+        self.d = _take(self.d, keep, None, axis)
+        self.start += keep
+        return x
+
+    def flush(self):
+        """Check that the coefficients are complete and reset the state."""
+        a, d, axis = self.a, self.d, self.axis
+        start = self.start
+        self.reset()
+        if start == 0:
+            raise ValueError("Too few coefficients to reconstruct a signal.")
+        # as in waverec, the approximation can have one more coefficient,
+        # which is discarded
+        if a.shape[axis] - d.shape[axis] not in (0, 1):
+            raise ValueError("Coefficient shape mismatch: the number of "
+                             "approximation and detail coefficients of a "
+                             "level differ.")
+
+
+class StreamingIDWT:
+    """
+    Online multilevel 1D Inverse Discrete Wavelet Transform.
+
+    The coefficients are passed in chunks to `push`, in the format returned by
+    `StreamingDWT.push`, and `push` returns the samples of the signal that are
+    determined by the coefficients received so far.  The concatenation of
+    these samples equals the result of `pywt.waverec` on the whole
+    coefficients.
+
+    Parameters
+    ----------
+    wavelet : Wavelet object or name string
+        Wavelet to use
+    mode : str, optional
+        Signal extension mode, see :ref:`Modes <ref-modes>`.  The
+        reconstruction of the periodization mode, which wraps around the end
+        of the signal, is not supported.
+    axis : int, optional
+        Axis of the coefficient chunks along which the signal runs.  The other
+        axes hold independent channels.
+
+    Notes
+    -----
+    The reconstruction of each level is an overlap-add of the filters
+    weighted by the coefficients, so it needs no extension of the signal.
+    Each level only keeps the ``rec_len // 2 - 1`` coefficients that overlap
+    the samples that are not reconstructed yet, and a sample is returned as
+    soon as the last coefficient it depends on has arrived at every level.
+    All samples are thus returned by `push`, and `flush` only checks that the
+    coefficients were complete.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pywt
+    >>> x = np.random.randn(1000)
+    >>> analysis = pywt.StreamingDWT('db2', level=2)
+    >>> synthesis = pywt.StreamingIDWT('db2')
+    >>> chunks = [synthesis.push(analysis.push(c))
+    ...           for c in np.array_split(x, 10)]
+    >>> chunks.append(synthesis.push(analysis.flush()))
+    >>> synthesis.flush()
+    >>> np.allclose(np.concatenate(chunks), x)
+    True
+    """
+
+    def __init__(self, wavelet, mode='symmetric', axis=-1):
+        self.wavelet = _as_wavelet(wavelet)
+        self.mode = _mode_name(mode)
+        if self.mode == 'periodization':
+            raise ValueError(
+                "mode 'periodization' wraps around the end of the signal and "
+                "is not supported for streaming.")
+        self.axis = axis
+        self._levels = None
+
+    def push(self, coeffs):
+        """
+        Reconstruct the next samples of the signal.
+
+        Parameters
+        ----------
+        coeffs : [cA_n, cD_n, cD_n-1, ..., cD2, cD1] : list
+            The next coefficients of each level, along ``axis``.  The number
+            of levels must stay the same until `flush` is called.
+
+        Returns
+        -------
+        x : ndarray
+            The samples that are determined by the coefficients received so
+            far and were not returned before.
+        """
+        if not isinstance(coeffs, (list, tuple)):
+            raise ValueError("Expected sequence of coefficient arrays.")
+        if len(coeffs) < 2:
+            raise ValueError(
+                "Coefficient list too short (minimum 2 arrays required).")
+        if self._levels is None:
+            self._levels = [_IDWTLevel(self.wavelet, self.mode, self.axis)
+                            for _ in coeffs[1:]]
+        elif len(coeffs) != len(self._levels) + 1:
+            raise ValueError("The number of coefficient arrays must be the "
+                             "same for all chunks.")
+        a = np.asarray(coeffs[0])
+        for level, d in zip(self._levels, coeffs[1:]):
+            a = level.push(a, np.asarray(d))
+        return a
+
+    def flush(self):
+        """
+        End the signal.
+
+        The object is reset, and can reconstruct another signal.
+        """
+        if self._levels is None:
+            raise ValueError("No coefficients have been pushed.")
+        levels = self._levels
+        self._levels = None
+        for level in levels:
+            level.flush()
+
+
+class _SWTLevel:
+    """The state of a single level of `StreamingSWT`.
+
+    At level ``j``, coefficient ``k`` is computed from the samples
+    ``k + filter_len // 2 - i``, ``i = 0, ..., filter_len - 1`` of the
+    approximation of the previous level, where ``filter_len`` is the length of
+    the filter upsampled by ``2**(j - 1)``.  The samples are held in a
+    circular buffer with a row per channel, sample ``p`` at position
+    ``p % buffer.shape[1]``, which keeps the last ``filter_len - 1`` samples
+    for the next coefficients.  Only the new coefficients are computed.
+    """
+
+    def __init__(self, wavelet, level):
+        self.wavelet = wavelet
+        self.level = level
+        self.filter_len = wavelet.dec_len * 2**(level - 1)
+        self.reset()
+
+    def reset(self):
+        self.buffer = None
+        # the number of samples received and of coefficients returned
+        self.received = 0
+        self.returned = 0
+
+    def _grow(self, x, size):
+        """Replace the buffer by one of ``size`` samples, holding the samples
+        that the next coefficients depend on."""
+        buffer = np.zeros((x.shape[0], size), x.dtype)
+        if self.buffer is not None:
+            p = np.arange(self.returned, self.received)
+            buffer[:, p % size] = self.buffer[:, p % self.buffer.shape[1]]
+        self.buffer = buffer
+
+    def push(self, x):
+        """Append the samples ``x``, with a row per channel, and return the
+        coefficients whose samples have all arrived, the approximations
+        stacked on the details."""
+        n = x.shape[1]
+        if self.buffer is None or self.buffer.shape[1] < self.filter_len + n:
+            self._grow(x, self.filter_len + n)
+        size = self.buffer.shape[1]
+        p = self.received % size
+        head = min(n, size - p)
+        self.buffer[:, p:p + head] = x[:, :head]
+        self.buffer[:, :n - head] = x[:, head:]
+        self.received += n
+
+        count = max(self.received - self.filter_len + 1 - self.returned, 0)
+        start = (self.returned + self.filter_len // 2 - 1) % size
+        self.returned += count
+        if not _have_c99_complex and np.iscomplexobj(self.buffer):
+            real = _swt_window(np.ascontiguousarray(self.buffer.real),
+                               self.wavelet, self.level, start, count)
+            imag = _swt_window(np.ascontiguousarray(self.buffer.imag),
+                               self.wavelet, self.level, start, count)
+            return real + 1j * imag
+        return _swt_window(self.buffer, self.wavelet, self.level, start,
+                           count)
+
+
+class StreamingSWT:
+    """
+    Online multilevel 1D Stationary Wavelet Transform.
+
+    The signal is passed in chunks of arbitrary size to `push`, which returns
+    the coefficients of all levels for the samples whose coefficients are
+    determined by the samples received so far.  Once the signal ends, `flush`
+    returns the coefficients of the last samples.
+
+    The signal is extended by zeros at both ends, instead of periodically as
+    by `pywt.swt`, so the coefficients equal those of `pywt.swt` applied to
+    the signal padded by enough zeros.  Away from the ends of the signal they
+    equal those of `pywt.swt` on the signal itself.
+
+    Parameters
+    ----------
+    wavelet : Wavelet object or name string
+        Wavelet to use
+    level : int, optional
+        The number of decomposition steps to perform (must be >= 1).
+    axis : int, optional
+        Axis of the chunks along which the signal runs.  The other axes hold
+        independent channels.
+    trim_approx : bool, optional
+        If True, only the approximation coefficients of the final level are
+        returned, see `pywt.swt`.
+    norm : bool, optional
+        If True, the transform is normalized as by `pywt.swt`.
+
+    Notes
+    -----
+    The coefficients of a sample are returned once ``lag`` more samples have
+    arrived, where the ``lag`` attribute, ``dec_len // 2 * (2**level - 1)``,
+    is the number of samples after it that the upsampled filters of all
+    levels reach.  Each level keeps the ``dec_len * 2**(j - 1) - 1`` samples
+    of its input that the next coefficients depend on in a circular buffer,
+    and computes only the coefficients of the new samples, so that the cost
+    per sample is proportional to ``level * dec_len`` for chunks of any
+    size.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pywt
+    >>> x = np.random.randn(1024)
+    >>> stream = pywt.StreamingSWT('db2', level=3, trim_approx=True)
+    >>> stream.lag
+    14
+    >>> chunks = [stream.push(c) for c in np.array_split(x, 16)]
+    >>> chunks.append(stream.flush())
+    >>> coeffs = [np.concatenate(c) for c in zip(*chunks)]
+    >>> expected = pywt.swt(x, 'db2', level=3, trim_approx=True)
+    >>> all(np.allclose(c[100:-100], e[100:-100])
+    ...     for c, e in zip(coeffs, expected))
+    True
+    """
+
+    def __init__(self, wavelet, level=1, axis=-1, trim_approx=False,
+                 norm=False):
+        wavelet = _as_wavelet(wavelet)
+        if norm:
+            if not wavelet.orthogonal:
+                warnings.warn(
+                    "norm=True, but the wavelet is not orthogonal: \n"
+                    "\tThe conditions for energy preservation are not "
+                    "satisfied.")
+            wavelet = _rescale_wavelet_filterbank(wavelet, 1/np.sqrt(2))
+        if level < 1:
+            raise ValueError("level must be greater than zero.")
+        self.wavelet = wavelet
+        self.level = level
+        self.axis = axis
+        self.trim_approx = trim_approx
+        self._levels = [_SWTLevel(wavelet, j) for j in range(1, level + 1)]
+        self.lag = sum(lev.filter_len // 2 for lev in self._levels)
+        self._reset()
+
+    def _reset(self):
+        for lev in self._levels:
+            lev.reset()
+        # the index of the next coefficient of each level, which starts
+        # before the signal where the coefficients of the first samples
+        # depend on the zeros that extend it
+        self._index = []
+        first = 0
+        for lev in reversed(self._levels):
+            self._index.insert(0, first)
+            first -= lev.filter_len // 2 - 1
+        self._lead = -first
+        # the coefficients that are not returned yet, from sample self._next
+        self._pending = [None] * self.level
+        self._next = 0
+        self._size = 0
+        self._dtype = None
+
+    def _rows(self, x):
+        """The samples ``x`` with a row per channel."""
+        x = x.transpose(self._order)
+        if x.shape[:-1] != self._shape:
+            raise ValueError("All chunks must have the same shape apart "
+                             "from axis.")
+        return x.reshape(self._channels, x.shape[-1])
+
+    def _transform(self, a):
+        # the coefficients are kept with a row per channel, the
+        # approximations stacked on the details
+        for j, lev in enumerate(self._levels):
+            coeffs = lev.push(a)
+            a = coeffs[0]
+            skip = min(max(-self._index[j], 0), a.shape[1])
+            self._index[j] += a.shape[1]
+            self._pending[j] = _append(self._pending[j], coeffs[:, :, skip:],
+                                       2)
+
+    def _emit(self):
+        """The pending coefficients up to the last sample whose coefficients
+        are known at all levels."""
+        count = min(p.shape[2] for p in self._pending)
+        count = min(count, self._size - self._next)
+        self._next += count
+        shape = (2, ) + self._shape + (count, )
+        coeffs = []
+        for j, c in enumerate(self._pending):
+            self._pending[j] = c[:, :, count:]
+            a, d = (c[:, :, :count].reshape(shape).transpose(self._inverse)
+                    .astype(self._dtype, copy=False))
+            coeffs.append(d if self.trim_approx else (a, d))
+        coeffs.reverse()
+        if self.trim_approx:
+            coeffs.insert(0, a)
+        return coeffs
+
+    def push(self, chunk):
+        """
+        Transform the next samples of the signal.
+
+        Parameters
+        ----------
+        chunk : array_like
+            The next samples of the signal, along ``axis``.
+
+        Returns
+        -------
+        coeffs : list
+            The coefficients of the samples that follow those returned before
+            and are determined by the samples received so far, structured as
+            the result of `pywt.swt`.
+        """
+        ndim = None if self._dtype is None else self._ndim
+        chunk = _check_chunk(chunk, ndim)
+        if self._dtype is None:
+            if not -chunk.ndim <= self.axis < chunk.ndim:
+                raise AxisError("Axis greater than data dimensions")
+            self._ndim = chunk.ndim
+            self._dtype = _output_dtype(chunk.dtype)
+            # the axes of the chunks, with axis moved to the end, and the
+            # inverse permutation for the stacked coefficients
+            axes = list(range(chunk.ndim))
+            axes.append(axes.pop(self.axis))
+            self._order = tuple(axes)
+            self._inverse = (0, ) + tuple(axes.index(i) + 1
+                                          for i in range(chunk.ndim))
+            self._shape = tuple(chunk.shape[i] for i in self._order[:-1])
+            self._channels = int(np.prod(self._shape))
+            # the zeros that extend the start of the signal
+            self._transform(np.zeros((self._channels, self._lead),
+                                     self._work_dtype))
+        self._size += chunk.shape[self.axis]
+        self._transform(self._rows(chunk.astype(self._work_dtype,
+                                                copy=False)))
+        return self._emit()
+
+    @property
+    def _work_dtype(self):
+        # float16 is transformed in float32, as by swt
+        if self._dtype == np.float16:
+            return np.dtype(np.float32)
+        return self._dtype
+
+    def flush(self):
+        """
+        End the signal.
+
+        The object is reset, and can transform another signal.
+
+        Returns
+        -------
+        coeffs : list
+            The coefficients of the last samples, structured as the result of
+            `pywt.swt`.
+        """
+        if self._dtype is None:
+            raise ValueError("No samples have been pushed.")
+        # the zeros that extend the end of the signal
+        self._transform(np.zeros((self._channels, self.lag),
+                                 self._work_dtype))
+        coeffs = self._emit()
+        self._reset()
+        return coeffs
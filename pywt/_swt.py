@@ -1,18 +1,17 @@
 import warnings
-from itertools import product
 
 import numpy as np
 
 from ._c99_config import _have_c99_complex
-from ._extensions._dwt import idwt_single
-from ._extensions._pywt import Modes, Wavelet, _check_dtype
+from ._extensions._pywt import Wavelet, _check_dtype
+from ._extensions._swt import _check_levels, _default_level, swt_max_level
+from ._extensions._swt import iswt_axis as _iswt_axis
 from ._extensions._swt import swt as _swt
 from ._extensions._swt import swt_axis as _swt_axis
-from ._extensions._swt import swt_max_level
-from ._multidim import idwt2, idwtn
 from ._utils import AxisError, _as_wavelet, _wavelets_per_axis
 
-__all__ = ["swt", "swt_max_level", 'iswt', 'swt2', 'iswt2', 'swtn', 'iswtn']
+__all__ = ["swt", "swt_max_level", 'iswt', 'swt2', 'iswt2', 'swtn', 'iswtn',
+           'iter_swt', 'iter_swt2', 'iter_swtn']
 
 
 def _rescale_wavelet_filterbank(wavelet, sf):
@@ -25,8 +24,14 @@ def _rescale_wavelet_filterbank(wavelet, sf):
     return wav
 
 
+def _all_float16(arrays):
+    """Whether all ``arrays`` are float16.  The inverse transforms chain the
+    levels of such coefficients in float32 and return float16."""
+    return all(np.asarray(c).dtype == np.float16 for c in arrays)
+
+
 def swt(data, wavelet, level=None, start_level=0, axis=-1,
-        trim_approx=False, norm=False):
+        trim_approx=False, norm=False, out=None):
     """
     Multilevel 1D stationary wavelet transform.
 
@@ -55,6 +60,12 @@ def swt(data, wavelet, level=None, start_level=0, axis=-1,
         will be equal to the energy of ``data``. In other words,
         ``np.linalg.norm(data.ravel())`` will equal the norm of the
         concatenated transform coefficients when ``trim_approx`` is True.
+    out : list, optional
+        Preallocated arrays that receive the coefficients, structured as the
+        returned list.  They must have the shape and dtype of the
+        coefficients, be writeable, and not overlap ``data`` or each other;
+        any strides are accepted.  Approximations of intermediate levels that
+        are not part of the result are still allocated.
 
     Returns
     -------
@@ -80,10 +91,13 @@ def swt(data, wavelet, level=None, start_level=0, axis=-1,
 
     Notes
     -----
-    The implementation here follows the "algorithm a-trous" and requires that
-    the signal length along the transformed axis be a multiple of ``2**level``.
-    If this is not the case, the user should pad up to an appropriate size
-    using a function such as ``numpy.pad``.
+    The implementation here follows the "algorithm a-trous". The signal is
+    extended periodically, so it can have any length of at least
+    ``2**(start_level + level)`` along the transformed axis, and the
+    coefficients have the same length. The default ``level`` is
+    `swt_max_level`, the highest level for which the length is a multiple
+    of ``2**level``, or ``floor(log2(len(data)))`` for lengths that are not
+    a multiple of 2.
 
     A primary benefit of this transform in comparison to its decimated
     counterpart (``pywt.wavedecn``), is that it is shift-invariant. This comes
@@ -105,8 +119,8 @@ def swt(data, wavelet, level=None, start_level=0, axis=-1,
     When used with ``norm=True``, this transform is closely related to the
     maximal-overlap DWT (MODWT) as popularized for time-series analysis,
     although the underlying implementation is slightly different from the one
-    published in [1]_. Specifically, the implementation used here requires a
-    signal that is a multiple of ``2**level`` in length.
+    published in [1]_. Specifically, the coefficients here are circularly
+    shifted relative to those of [1]_.
 
     References
     ----------
@@ -118,6 +132,17 @@ def swt(data, wavelet, level=None, start_level=0, axis=-1,
         data = np.asarray(data)
         kwargs = {"wavelet": wavelet, "level": level, "start_level": start_level,
                       "trim_approx": trim_approx, "axis": axis, "norm": norm}
+        if out is not None:
+            # the real and imaginary parts are views of the complex arrays
+            if trim_approx:
+                swt(data.real, out=[c.real for c in out], **kwargs)
+                swt(data.imag, out=[c.imag for c in out], **kwargs)
+            else:
+                swt(data.real, out=[(a.real, d.real) for a, d in out],
+                    **kwargs)
+                swt(data.imag, out=[(a.imag, d.imag) for a, d in out],
+                    **kwargs)
+            return list(out)
         coeffs_real = swt(data.real, **kwargs)
         coeffs_imag = swt(data.imag, **kwargs)
         if not trim_approx:
@@ -129,9 +154,11 @@ def swt(data, wavelet, level=None, start_level=0, axis=-1,
                            for (cr, ci) in zip(coeffs_real, coeffs_imag)]
         return coeffs_cplx
 
-    # accept array_like input; make a copy to ensure a contiguous array
-    dt = _check_dtype(data)
-    data = np.array(data, dtype=dt)
+    # accept array_like input; make a copy to ensure a contiguous array.
+    # float16 is kept, _swt_axis transforms it in float32
+    data = np.asarray(data)
+    if data.dtype != np.float16:
+        data = np.array(data, dtype=_check_dtype(data))
 
     wavelet = _as_wavelet(wavelet)
     if norm:
@@ -147,15 +174,34 @@ def swt(data, wavelet, level=None, start_level=0, axis=-1,
         raise AxisError("Axis greater than data dimensions")
 
     if level is None:
-        level = swt_max_level(data.shape[axis])
+        level = _default_level(data.shape[axis])
 
-    if data.ndim == 1:
+    if data.ndim == 1 and data.dtype != np.float16 and out is None:
         ret = _swt(data, wavelet, level, start_level, trim_approx)
     else:
-        ret = _swt_axis(data, wavelet, level, start_level, axis, trim_approx)
+        ret = _swt_axis(data, wavelet, level, start_level, axis, trim_approx,
+                        out)
     return ret
 
 
+def _iswt_level(coeffs, wavelets, axes, level):
+    """The approximation of level ``level - 1`` reconstructed from the dict of
+    the coefficients of ``level``, with keys as returned by `swtn`.
+
+    As in `idwtn`, the axes are reconstructed in reverse order. Missing
+    subbands are taken as zero without being formed.
+    """
+    for key_length, (axis, wav) in reversed(
+            list(enumerate(zip(axes, wavelets)))):
+        new_coeffs = {}
+        for key in sorted({k[:key_length] for k in coeffs}):
+            new_coeffs[key] = _iswt_axis(coeffs.get(key + 'a'),
+                                         coeffs.get(key + 'd'), wav, level,
+                                         axis)
+        coeffs = new_coeffs
+    return coeffs['']
+
+
 def iswt(coeffs, wavelet, norm=False, axis=-1):
     """
     Multilevel 1D inverse discrete stationary wavelet transform.
@@ -213,6 +259,8 @@ def iswt(coeffs, wavelet, norm=False, axis=-1):
 
     if trim_approx:
         coeffs = coeffs[1:]
+    half = _all_float16(
+        [cA] + [c if trim_approx else c[1] for c in coeffs])
 
     if cA.ndim != 1:
         raise ValueError("iswt only supports 1D data")
@@ -225,10 +273,7 @@ def iswt(coeffs, wavelet, norm=False, axis=-1):
     wavelet = _as_wavelet(wavelet)
     if norm:
         wavelet = _rescale_wavelet_filterbank(wavelet, np.sqrt(2))
-    mode = Modes.from_object('periodization')
     for j in range(num_levels, 0, -1):
-        step_size = int(pow(2, j-1))
-        last_index = step_size
         if trim_approx:
             cD = coeffs[-j]
         else:
@@ -242,33 +287,10 @@ def iswt(coeffs, wavelet, norm=False, axis=-1):
                 dtype = np.float64
             output = np.asarray(output, dtype=dtype)
             cD = np.asarray(cD, dtype=dtype)
-        for first in range(last_index):  # 0 to last_index - 1
-
-            # Getting the indices that we will transform
-            indices = np.arange(first, len(cD), step_size)
-
-            # select the even indices
-            even_indices = indices[0::2]
-            # select the odd indices
-            odd_indices = indices[1::2]
-
-            # perform the inverse dwt on the selected indices,
-            # making sure to use periodic boundary conditions
-            # Note:  indexing with an array of ints returns a contiguous
-            #        copy as required by idwt_single.
-            x1 = idwt_single(output[even_indices],
-                             cD[even_indices],
-                             wavelet, mode)
-            x2 = idwt_single(output[odd_indices],
-                             cD[odd_indices],
-                             wavelet, mode)
-
-            # perform a circular shift right
-            x2 = np.roll(x2, 1)
-
-            # average and insert into the correct indices
-            output[indices] = (x1 + x2)/2.
+        output = _iswt_axis(output, cD, wavelet, j)
 
+    if half:
+        output = output.astype(np.float16)
     return output
 
 
@@ -331,10 +353,14 @@ def swt2(data, wavelet, level, start_level=0, axes=(-2, -1),
 
     Notes
     -----
-    The implementation here follows the "algorithm a-trous" and requires that
-    the signal length along the transformed axes be a multiple of ``2**level``.
-    If this is not the case, the user should pad up to an appropriate size
-    using a function such as ``numpy.pad``.
+    The implementation here follows the "algorithm a-trous". The signal is
+    extended periodically, so it can have any length of at least
+    ``2**(start_level + level)`` along the transformed axes, and the
+    coefficients have the same length. `swt_max_level` gives the highest
+    level for which the length is a multiple of ``2**level``.
+
+    float16 data gives float16 coefficients, computed in float32 a slab of
+    the data at a time.
 
     A primary benefit of this transform in comparison to its decimated
     counterpart (``pywt.wavedecn``), is that it is shift-invariant. This comes
@@ -457,6 +483,8 @@ def iswt2(coeffs, wavelet, norm=False, axes=(-2, -1)):
 
     if trim_approx:
         coeffs = coeffs[1:]
+    half = _all_float16(
+        [cA] + [c for d in coeffs for c in (d if trim_approx else d[1])])
 
     # copy to avoid modification of input data
     dt = _check_dtype(cA)
@@ -474,8 +502,6 @@ def iswt2(coeffs, wavelet, norm=False, axes=(-2, -1)):
                     for wav in wavelets]
 
     for j in range(num_levels):
-        step_size = int(pow(2, num_levels-j-1))
-        last_index = step_size
         if trim_approx:
             (cH, cV, cD) = coeffs[j]
         else:
@@ -486,53 +512,19 @@ def iswt2(coeffs, wavelet, norm=False, axes=(-2, -1)):
                 "Mismatch in shape of intermediate coefficient arrays")
 
         # make sure output shares the common dtype
-        # (conversion of dtype for individual coeffs is handled within idwt2 )
         common_dtype = np.result_type(*(
             [dt, ] + [_check_dtype(c) for c in [cH, cV, cD]]))
         if output.dtype != common_dtype:
             output = output.astype(common_dtype)
 
-        for first_h in range(last_index):  # 0 to last_index - 1
-            for first_w in range(last_index):  # 0 to last_index - 1
-                # Getting the indices that we will transform
-                indices_h = slice(first_h, cH.shape[0], step_size)
-                indices_w = slice(first_w, cH.shape[1], step_size)
-
-                even_idx_h = slice(first_h, cH.shape[0], 2*step_size)
-                even_idx_w = slice(first_w, cH.shape[1], 2*step_size)
-                odd_idx_h = slice(first_h + step_size, cH.shape[0], 2*step_size)
-                odd_idx_w = slice(first_w + step_size, cH.shape[1], 2*step_size)
-
-                # perform the inverse dwt on the selected indices,
-                # making sure to use periodic boundary conditions
-                x1 = idwt2((output[even_idx_h, even_idx_w],
-                           (cH[even_idx_h, even_idx_w],
-                            cV[even_idx_h, even_idx_w],
-                            cD[even_idx_h, even_idx_w])),
-                           wavelets, 'periodization')
-                x2 = idwt2((output[even_idx_h, odd_idx_w],
-                           (cH[even_idx_h, odd_idx_w],
-                            cV[even_idx_h, odd_idx_w],
-                            cD[even_idx_h, odd_idx_w])),
-                           wavelets, 'periodization')
-                x3 = idwt2((output[odd_idx_h, even_idx_w],
-                           (cH[odd_idx_h, even_idx_w],
-                            cV[odd_idx_h, even_idx_w],
-                            cD[odd_idx_h, even_idx_w])),
-                           wavelets, 'periodization')
-                x4 = idwt2((output[odd_idx_h, odd_idx_w],
-                           (cH[odd_idx_h, odd_idx_w],
-                            cV[odd_idx_h, odd_idx_w],
-                            cD[odd_idx_h, odd_idx_w])),
-                           wavelets, 'periodization')
-
-                # perform a circular shifts
-                x2 = np.roll(x2, 1, axis=1)
-                x3 = np.roll(x3, 1, axis=0)
-                x4 = np.roll(x4, 1, axis=0)
-                x4 = np.roll(x4, 1, axis=1)
-                output[indices_h, indices_w] = (x1 + x2 + x3 + x4) / 4
+        coeffs_level = {'da': cH, 'ad': cV, 'dd': cD}
+        coeffs_level = {k: np.asarray(v, dtype=common_dtype)
+                        for k, v in coeffs_level.items()}
+        coeffs_level['aa'] = output
+        output = _iswt_level(coeffs_level, wavelets, (0, 1), num_levels - j)
 
+    if half:
+        output = output.astype(np.float16)
     return output
 
 
@@ -589,10 +581,14 @@ def swtn(data, wavelet, level, start_level=0, axes=None, trim_approx=False,
 
     Notes
     -----
-    The implementation here follows the "algorithm a-trous" and requires that
-    the signal length along the transformed axes be a multiple of ``2**level``.
-    If this is not the case, the user should pad up to an appropriate size
-    using a function such as ``numpy.pad``.
+    The implementation here follows the "algorithm a-trous". The signal is
+    extended periodically, so it can have any length of at least
+    ``2**(start_level + level)`` along the transformed axes, and the
+    coefficients have the same length. `swt_max_level` gives the highest
+    level for which the length is a multiple of ``2**level``.
+
+    float16 data gives float16 coefficients, computed in float32 a slab of
+    the data at a time.
 
     A primary benefit of this transform in comparison to its decimated
     counterpart (``pywt.wavedecn``), is that it is shift-invariant. This comes
@@ -629,6 +625,22 @@ def swtn(data, wavelet, level, start_level=0, axes=None, trim_approx=False,
                 {k: rdict[k] + 1j * idict[k] for k in rdict})
         return cplx
 
+    data, wavelets, axes = _swtn_setup(data, wavelet, axes, norm)
+    approx_key = 'a' * len(axes)
+    ret = []
+    for coeffs in _iter_swtn(data, wavelets, axes, level, start_level):
+        ret.append(coeffs)
+        if trim_approx:
+            data = coeffs.pop(approx_key)
+    if trim_approx:
+        ret.append(data)
+    ret.reverse()
+    return ret
+
+
+def _swtn_setup(data, wavelet, axes, norm):
+    """Check the arguments of `swtn` and return the data, the wavelet of each
+    axis and the axes."""
     if data.dtype == np.dtype('object'):
         raise TypeError("Input must be a numeric array-like")
     if data.ndim < 1:
@@ -641,7 +653,6 @@ def swtn(data, wavelet, level, start_level=0, axes=None, trim_approx=False,
         raise AxisError("Axis greater than data dimensions")
     if len(axes) != len(set(axes)):
         raise ValueError("The axes passed to swtn must be unique.")
-    num_axes = len(axes)
 
     wavelets = _wavelets_per_axis(wavelet, axes)
     if norm:
@@ -651,7 +662,12 @@ def swtn(data, wavelet, level, start_level=0, axes=None, trim_approx=False,
                 "\tThe conditions for energy preservation are not satisfied.")
         wavelets = [_rescale_wavelet_filterbank(wav, 1/np.sqrt(2))
                     for wav in wavelets]
-    ret = []
+    return data, wavelets, axes
+
+
+def _iter_swtn(data, wavelets, axes, level, start_level):
+    """Yield the dict of the coefficients of each level of `swtn`."""
+    approx_key = 'a' * len(axes)
     for i in range(start_level, start_level + level):
         coeffs = [('', data)]
         for axis, wavelet in zip(axes, wavelets):
@@ -662,18 +678,159 @@ def swtn(data, wavelet, level, start_level=0, axes=None, trim_approx=False,
                 new_coeffs.extend([(subband + 'a', cA),
                                    (subband + 'd', cD)])
             coeffs = new_coeffs
+        # the suspended generator must only keep the approximation alive, so
+        # drop the other references to the subbands and pop the result
+        del x, cA, cD, new_coeffs
+        coeffs = [dict(coeffs)]
+        # data for the next level is the approximation coeffs from this level
+        data = coeffs[0][approx_key]
+        yield coeffs.pop()
 
-        coeffs = dict(coeffs)
-        ret.append(coeffs)
 
-        # data for the next level is the approximation coeffs from this level
-        data = coeffs['a' * num_axes]
-        if trim_approx:
-            coeffs.pop('a' * num_axes)
-    if trim_approx:
-        ret.append(data)
-    ret.reverse()
-    return ret
+def iter_swtn(data, wavelet, level, start_level=0, axes=None, norm=False):
+    """
+    Iterate over the levels of the multilevel nD stationary wavelet
+    transform.
+
+    The coefficients of each level are computed when the next item is
+    requested, and only the approximation coefficients of the last level are
+    kept to compute the next one.  Unlike `swtn`, which returns the
+    coefficients of all levels at once, this allows processing (e.g.
+    thresholding or saving) the coefficients of a level before the next one
+    is computed, in memory proportional to the size of ``data`` rather than to
+    ``level`` times that size.
+
+    Parameters
+    ----------
+    data : array_like
+        Input data
+    wavelet : Wavelet object or name string, or tuple of wavelets
+        Wavelet to use.  This can also be a tuple of wavelets to apply per
+        axis in ``axes``.
+    level : int
+        The number of decomposition steps to perform.
+    start_level : int, optional
+        The level at which the decomposition will start (default: 0)
+    axes : sequence of ints, optional
+        Axes over which to compute the SWT. A value of ``None`` (the
+        default) selects all axes. Axes may not be repeated.
+    norm : bool, optional
+        If True, transform is normalized as by `swtn`.
+
+    Yields
+    ------
+    coeffs : dict
+        The coefficients of levels ``start_level + 1`` through
+        ``start_level + level``, from the finest to the coarsest level, each
+        as a dict with the keys of a level of the result of `swtn`, including
+        the approximation coefficients.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pywt
+    >>> data = np.ones((16, 16))
+    >>> for level, coeffs in enumerate(pywt.iter_swtn(data, 'db1', 3), 1):
+    ...     print(level, sorted(coeffs))
+    1 ['aa', 'ad', 'da', 'dd']
+    2 ['aa', 'ad', 'da', 'dd']
+    3 ['aa', 'ad', 'da', 'dd']
+    """
+    data = np.asarray(data)
+    if not _have_c99_complex and np.iscomplexobj(data):
+        return _iter_complex(
+            iter_swtn(data.real, wavelet, level, start_level, axes, norm),
+            iter_swtn(data.imag, wavelet, level, start_level, axes, norm))
+    data, wavelets, axes = _swtn_setup(data, wavelet, axes, norm)
+    # check the levels now rather than when the first level is requested
+    for axis in axes:
+        _check_levels(data.shape[axis], level, start_level)
+    return _iter_swtn(data, wavelets, axes, level, start_level)
+
+
+def _iter_complex(real, imag):
+    """Combine the coefficients yielded by the transforms of the real and
+    imaginary parts."""
+    for rdict, idict in zip(real, imag):
+        yield {k: rdict.pop(k) + 1j * idict.pop(k) for k in list(rdict)}
+
+
+def iter_swt(data, wavelet, level=None, start_level=0, axis=-1, norm=False):
+    """
+    Iterate over the levels of the multilevel 1D stationary wavelet
+    transform.
+
+    This is the 1D counterpart of `iter_swtn`.
+
+    Parameters
+    ----------
+    data : array_like
+        Input signal
+    wavelet : Wavelet object or name string
+        Wavelet to use
+    level : int, optional
+        The number of decomposition steps to perform.
+    start_level : int, optional
+        The level at which the decomposition will begin (default: 0)
+    axis: int, optional
+        Axis over which to compute the SWT. If not given, the last axis is
+        used.
+    norm : bool, optional
+        If True, transform is normalized as by `swt`.
+
+    Yields
+    ------
+    (cA, cD) : tuple
+        The approximation and detail coefficients of levels
+        ``start_level + 1`` through ``start_level + level``, from the finest
+        to the coarsest level.
+    """
+    data = np.asarray(data)
+    if level is None:
+        if not -data.ndim <= axis < data.ndim:
+            raise AxisError("Axis greater than data dimensions")
+        level = _default_level(data.shape[axis])
+    levels = iter_swtn(data, wavelet, level, start_level, (axis, ), norm)
+    return ((c.pop('a'), c.pop('d')) for c in levels)
+
+
+def iter_swt2(data, wavelet, level, start_level=0, axes=(-2, -1),
+              norm=False):
+    """
+    Iterate over the levels of the multilevel 2D stationary wavelet
+    transform.
+
+    This is the 2D counterpart of `iter_swtn`.
+
+    Parameters
+    ----------
+    data : array_like
+        2D array with input data
+    wavelet : Wavelet object or name string, or 2-tuple of wavelets
+        Wavelet to use.  This can also be a tuple of wavelets to apply per
+        axis in ``axes``.
+    level : int
+        The number of decomposition steps to perform.
+    start_level : int, optional
+        The level at which the decomposition will start (default: 0)
+    axes : 2-tuple of ints, optional
+        Axes over which to compute the SWT. Repeated elements are not allowed.
+    norm : bool, optional
+        If True, transform is normalized as by `swt2`.
+
+    Yields
+    ------
+    (cA, (cH, cV, cD)) : tuple
+        The approximation, horizontal, vertical and diagonal detail
+        coefficients of levels ``start_level + 1`` through
+        ``start_level + level``, from the finest to the coarsest level.
+    """
+    axes = tuple(axes)
+    if len(axes) != 2:
+        raise ValueError("Expected 2 axes")
+    levels = iter_swtn(data, wavelet, level, start_level, axes, norm)
+    return ((c.pop('aa'), (c.pop('da'), c.pop('ad'), c.pop('dd')))
+            for c in levels)
 
 
 def iswtn(coeffs, wavelet, axes=None, norm=False):
@@ -735,6 +892,9 @@ def iswtn(coeffs, wavelet, axes=None, norm=False):
 
     if trim_approx:
         coeffs = coeffs[1:]
+    half = _all_float16(
+        [cA] + [v for c in coeffs for k, v in c.items()
+                if k != 'a' * ndim_transform])
 
     # copy to avoid modification of input data
     dt = _check_dtype(cA)
@@ -757,19 +917,9 @@ def iswtn(coeffs, wavelet, axes=None, norm=False):
         wavelets = [_rescale_wavelet_filterbank(wav, np.sqrt(2))
                     for wav in wavelets]
 
-    # initialize various slice objects used in the loops below
-    # these will remain slice(None) only on axes that aren't transformed
-    indices = [slice(None), ]*ndim
-    even_indices = [slice(None), ]*ndim
-    odd_indices = [slice(None), ]*ndim
-    odd_even_slices = [slice(None), ]*ndim
-
     for j in range(num_levels):
-        step_size = int(pow(2, num_levels-j-1))
-        last_index = step_size
-        if not trim_approx:
-            a = coeffs[j].pop('a'*ndim_transform)  # will restore later
-        details = coeffs[j]
+        details = {k: v for k, v in coeffs[j].items()
+                   if k != 'a'*ndim_transform}
         # make sure dtype matches the coarsest level approximation coefficients
         common_dtype = np.result_type(*(
             [dt, ] + [v.dtype for v in details.values()]))
@@ -782,43 +932,10 @@ def iswtn(coeffs, wavelet, axes=None, norm=False):
             raise RuntimeError(
                 "Mismatch in shape of intermediate coefficient arrays")
 
-        # shape of a single coefficient array, excluding non-transformed axes
-        coeff_trans_shape = tuple([shapes[0][ax] for ax in axes])
-
-        # nested loop over all combinations of axis offsets at this level
-        for firsts in product(*([range(last_index), ]*ndim_transform)):
-            for first, sh, ax in zip(firsts, coeff_trans_shape, axes):
-                indices[ax] = slice(first, sh, step_size)
-                even_indices[ax] = slice(first, sh, 2*step_size)
-                odd_indices[ax] = slice(first+step_size, sh, 2*step_size)
-
-            # nested loop over all combinations of odd/even inidices
-            approx = output.copy()
-            output[tuple(indices)] = 0
-            ntransforms = 0
-            for odds in product(*([(0, 1), ]*ndim_transform)):
-                for o, ax in zip(odds, axes):
-                    if o:
-                        odd_even_slices[ax] = odd_indices[ax]
-                    else:
-                        odd_even_slices[ax] = even_indices[ax]
-                # extract the odd/even indices for all detail coefficients
-                details_slice = {}
-                for key, value in details.items():
-                    details_slice[key] = value[tuple(odd_even_slices)]
-                details_slice['a'*ndim_transform] = approx[
-                    tuple(odd_even_slices)]
-
-                # perform the inverse dwt on the selected indices,
-                # making sure to use periodic boundary conditions
-                x = idwtn(details_slice, wavelets, 'periodization', axes=axes)
-                for o, ax in zip(odds, axes):
-                    # circular shift along any odd indexed axis
-                    if o:
-                        x = np.roll(x, 1, axis=ax)
-                output[tuple(indices)] += x
-                ntransforms += 1
-            output[tuple(indices)] /= ntransforms  # normalize
-        if not trim_approx:
-            coeffs[j]['a'*ndim_transform] = a  # restore approx coeffs to dict
+        details = {k: np.asarray(v, dtype=common_dtype)
+                   for k, v in details.items()}
+        details['a'*ndim_transform] = output
+        output = _iswt_level(details, wavelets, axes, num_levels - j)
+    if half:
+        output = output.astype(np.float16)
     return output
@@ -2,6 +2,8 @@
 #                    <https://github.com/PyWavelets/pywt>
 # See COPYING for license details.
 import inspect
+import operator
+import os
 from collections.abc import Iterable
 
 import numpy as np
@@ -102,3 +104,32 @@ def _modes_per_axis(modes, axes):
     else:
         raise ValueError("modes must be a str, Mode enum or iterable")
     return modes
+
+
+def _mode_name(mode):
+    """The name of the signal extension ``mode``, given as a name or as a
+    Modes value."""
+    mode = Modes.from_object(mode)
+    return next(name for name in Modes.modes
+                if Modes.from_object(name) == mode)
+
+
+def _check_workers(workers):
+    """Convert the ``workers`` argument to a positive number of threads.
+
+    ``None`` means a single thread. Negative values wrap around, counting
+    back from the number of CPUs (``-1`` uses all of them).
+    """
+    if workers is None:
+        return 1
+    workers = operator.index(workers)
+    if workers == 0:
+        raise ValueError("workers must not be zero")
+    if workers < 0:
+        num_cpus = os.cpu_count() or 1
+        if workers < -num_cpus:
+            raise ValueError(
+                f"workers value out of range; got {workers}, must not be less "
+                f"than {-num_cpus}")
+        workers += num_cpus + 1
+    return workers
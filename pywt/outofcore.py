@@ -0,0 +1,403 @@
+"""
+Out-of-core multilevel discrete wavelet transforms.
+
+The functions of this module transform arrays that do not fit in memory, such
+as `numpy.memmap` arrays or any other array-like object supporting NumPy-style
+slicing.  The data is read in blocks along the transformed axis, extended by
+the halo of samples that the filters reach into the neighbouring blocks, and
+the coefficients are written block by block to memory-mapped ``.npy`` files
+(or to arrays provided by the caller).  The blocks are sized so that the
+memory used is bounded by ``memory_limit`` rather than by the size of the
+data.  The results are identical to those of `pywt.wavedec` and
+`pywt.wavedecn` for all signal extension modes.
+"""
+import math
+import os
+import tempfile
+from functools import partial
+
+import numpy as np
+
+from ._dwt import dwt, dwt_coeff_len
+from ._extensions._pywt import _check_dtype
+from ._multilevel import (
+    _check_multilevel_out,
+    _prep_axes_wavedecn,
+    wavedecn_shapes,
+)
+from ._utils import _mode_name, _modes_per_axis, _wavelets_per_axis
+
+__all__ = ['wavedec', 'wavedecn']
+
+# approximate number of copies of a block of samples held in memory while it
+# is transformed: the block, its extension, the coefficients and temporaries
+_BLOCK_COPIES = 6
+
+
+def _work_dtype(dtype):
+    """The dtype in which the transforms of ``dtype`` data are computed."""
+    if dtype == np.float16:
+        return np.dtype(np.float32)
+    return np.dtype(_check_dtype(np.empty(0, dtype)))
+
+
+def _output_dtype(dtype):
+    if dtype == np.float16:
+        return dtype
+    return _work_dtype(dtype)
+
+
+def _index(ndim, axis, s, row_axis=None, rows=slice(None)):
+    """Index selecting slice ``s`` along ``axis`` and ``rows`` along
+    ``row_axis``."""
+    idx = [slice(None)] * ndim
+    idx[axis] = s
+    if row_axis is not None:
+        idx[row_axis] = rows
+    return tuple(idx)
+
+
+def _blocking(shape, axis, num_coeffs, filter_len, itemsize, memory_limit):
+    """The number of coefficients per block along ``axis``, and the axis and
+    number of rows that are transformed at once along the other axes."""
+    others = [ax for ax in range(len(shape)) if ax != axis]
+    num_rows = math.prod(shape[ax] for ax in others)
+    sample_bytes = _BLOCK_COPIES * itemsize
+    # coefficients per block when all rows are transformed at once
+    block = (memory_limit // (sample_bytes * num_rows) - filter_len) // 2
+    min_block = min(num_coeffs, 16 * filter_len)
+    if block >= min_block or not others:
+        return max(min(block, num_coeffs), 1), None, 1
+    # transform fewer rows at a time instead of using tiny blocks
+    row_axis = max(others, key=lambda ax: shape[ax])
+    row_bytes = sample_bytes * (num_rows // shape[row_axis])
+    rows = memory_limit // (row_bytes * (2 * min_block + filter_len))
+    return min_block, row_axis, max(rows, 1)
+
+
+def _dwt_axis(src, out_a, out_d, wavelet, mode, axis, memory_limit):
+    """Single level DWT of ``src`` along ``axis`` into ``out_a`` and
+    ``out_d``, one block at a time."""
+    shape = src.shape
+    ndim = len(shape)
+    n = shape[axis]
+    num_coeffs = out_a.shape[axis]
+    if 0 in shape:
+        return
+    filter_len = wavelet.dec_len
+    block, row_axis, num_rows = _blocking(
+        shape, axis, num_coeffs, filter_len,
+        _work_dtype(src.dtype).itemsize, memory_limit)
+    # the number of samples at each end that the extension depends on
+    edge = filter_len + 1
+    blocked = block < num_coeffs and n > 2 * edge
+    if not blocked:
+        block = num_coeffs
+    # coefficient k is computed from the samples 2*k + offset - j,
+    # j = 0, ..., filter_len - 1, of the extended signal
+    offset = filter_len // 2 if mode == 'periodization' else 1
+    # the coefficients that only depend on samples of the signal itself
+    first = max(-(-(filter_len - 1 - offset) // 2), 0)
+    stop = (n - 1 - offset) // 2 + 1
+    # the first coefficient of a block is preceded by filter_len // 2 - 1
+    # coefficients that depend on samples outside of the block
+    skip = filter_len // 2 - 1
+
+    for r0 in range(0, shape[row_axis] if row_axis is not None else 1,
+                    num_rows):
+        index = partial(_index, ndim, axis, row_axis=row_axis,
+                        rows=slice(r0, r0 + num_rows))
+
+        if not blocked:
+            out_a[index(slice(None))], out_d[index(slice(None))] = dwt(
+                src[index(slice(None))], wavelet, mode, axis)
+            continue
+
+        # The coefficients near the boundaries depend on the extension of
+        # the signal, which only depends on the samples at both ends.  They
+        # are taken from the transform of these samples, which has the same
+        # parity as the signal.
+        tail = edge + (n - 2 * edge) % 2
+        ends = np.concatenate([np.asarray(src[index(slice(0, edge))]),
+                               np.asarray(src[index(slice(n - tail, n))])],
+                              axis=axis)
+        a, d = dwt(ends, wavelet, mode, axis)
+        shift = (n - edge - tail) // 2
+        for s, s_ends in [
+                (slice(0, first), slice(0, first)),
+                (slice(stop, num_coeffs), slice(stop - shift, None))]:
+            out_a[index(s)] = a[_index(ndim, axis, s_ends)]
+            out_d[index(s)] = d[_index(ndim, axis, s_ends)]
+
+        for k0 in range(first, stop, block):
+            k1 = min(k0 + block, stop)
+            x = np.asarray(src[index(slice(2 * k0 + offset + 1 - filter_len,
+                                           2 * k1 + offset - 1))])
+            a, d = dwt(x, wavelet, 'zero', axis)
+            valid = _index(ndim, axis, slice(skip, skip + k1 - k0))
+            out_a[index(slice(k0, k1))] = a[valid]
+            out_d[index(slice(k0, k1))] = d[valid]
+
+
+def _copy(src, dst, memory_limit):
+    """Copy ``src`` to ``dst`` one slab at a time."""
+    if src.ndim == 0 or 0 in src.shape:
+        dst[...] = np.asarray(src)
+        return
+    slab_bytes = src.dtype.itemsize * math.prod(src.shape[1:])
+    step = max(memory_limit // max(slab_bytes, 1), 1)
+    for i in range(0, src.shape[0], step):
+        dst[i:i + step] = src[i:i + step]
+
+
+class _Storage:
+    """Creates the coefficient arrays, either as memory-mapped ``.npy``
+    files in ``directory`` or from the arrays of ``out``, and the
+    intermediate approximations in a temporary directory.  Without
+    ``directory``, one is created on first use, and removed again if it
+    only held temporaries."""
+
+    def __init__(self, directory, dtype):
+        self.directory = directory
+        self.dtype = dtype
+        self._created = False
+        self._tmp = None
+
+    def _directory(self):
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix='pywt-')
+            self._created = True
+        return self.directory
+
+    def output(self, name, shape):
+        return np.lib.format.open_memmap(
+            os.path.join(self._directory(), name + '.npy'), mode='w+',
+            dtype=self.dtype, shape=shape)
+
+    def temporary(self, name, shape):
+        if self._tmp is None:
+            self._tmp = tempfile.TemporaryDirectory(dir=self._directory())
+        return np.lib.format.open_memmap(
+            os.path.join(self._tmp.name, name + '.npy'), mode='w+',
+            dtype=self.dtype, shape=shape)
+
+    def remove(self, arr):
+        """Remove the temporary file of ``arr``."""
+        filename = getattr(arr, 'filename', None)
+        del arr
+        if (self._tmp is not None and filename is not None and
+                os.path.dirname(filename) == self._tmp.name):
+            try:
+                os.remove(filename)
+            except OSError:
+                # still mapped on some platforms, removed by cleanup
+                pass
+
+    def cleanup(self):
+        if self._tmp is not None:
+            self._tmp.cleanup()
+        if self._created and not os.listdir(self.directory):
+            os.rmdir(self.directory)
+
+
+def _check_out_shapes(out, shapes):
+    for c, shape in zip(out, shapes):
+        if isinstance(shape, dict):
+            if not isinstance(c, dict) or c.keys() != shape.keys():
+                raise ValueError(
+                    "out must have the structure of the decomposition.")
+            _check_out_shapes([c[k] for k in shape],
+                              [shape[k] for k in shape])
+        elif tuple(c.shape) != tuple(shape):
+            raise ValueError(
+                f"out arrays must have shape {tuple(shape)}, got "
+                f"{tuple(c.shape)}.")
+
+
+def wavedec(data, wavelet, mode='symmetric', level=None, axis=-1, *,
+            out=None, directory=None, memory_limit=2**28):
+    """
+    Out-of-core multilevel 1D Discrete Wavelet Transform of data.
+
+    Parameters
+    ----------
+    data : array_like
+        Input data.  This can be a `numpy.memmap` or any other object with
+        ``shape`` and ``dtype`` attributes that can be sliced like an array.
+    wavelet : Wavelet object or name string
+        Wavelet to use
+    mode : str, optional
+        Signal extension mode, see :ref:`Modes <ref-modes>`.
+    level : int, optional
+        Decomposition level (must be >= 0). If level is None (default) then it
+        will be calculated using the ``dwt_max_level`` function.
+    axis: int, optional
+        Axis over which to compute the DWT. If not given, the last axis is
+        used.
+    out : list, optional
+        Arrays that receive the coefficients, structured as the result.  They
+        can be any objects that support assignment to slices.
+    directory : str, optional
+        Directory in which the coefficients are stored as ``.npy`` files,
+        named ``cA<level>.npy`` and ``cD<level>.npy``, if ``out`` is not
+        given.  The approximations of the intermediate levels are stored in
+        a temporary directory within it while the transform runs.  By
+        default, a new directory is created with `tempfile.mkdtemp`.
+    memory_limit : int, optional
+        Approximate number of bytes of the blocks held in memory.
+
+    Returns
+    -------
+    [cA_n, cD_n, cD_n-1, ..., cD2, cD1] : list
+        Ordered list of coefficients arrays, as for `pywt.wavedec`.  Unless
+        ``out`` is given, they are `numpy.memmap` arrays.
+    """
+    if not hasattr(data, 'shape'):
+        data = np.asarray(data)
+    if len(data.shape) < 1:
+        raise ValueError("Expected at least 1D input data.")
+    axis = axis + len(data.shape) if axis < 0 else axis
+    shapes = wavedecn_shapes(data.shape, wavelet, mode, level, (axis, ))
+    shapes = [shapes[0]] + [d['d'] for d in shapes[1:]]
+    level = len(shapes) - 1
+    out = _multilevel_outputs(out, shapes, level)
+    storage = _Storage(directory, _output_dtype(np.dtype(data.dtype)))
+    if out is None:
+        out = [storage.output(f'cA{level}', shapes[0])]
+        out += [storage.output(f'cD{level - i}', shape)
+                for i, shape in enumerate(shapes[1:])]
+    if level == 0:
+        _copy(data, out[0], memory_limit)
+        return out
+
+    wavelet = _wavelets_per_axis(wavelet, (axis, ))[0]
+    mode = _mode_name(_modes_per_axis(mode, (axis, ))[0])
+    try:
+        a = data
+        for i in range(level):
+            a_out = (out[0] if i == level - 1 else
+                     storage.temporary(f'cA{i + 1}', shapes[-i - 1]))
+            _dwt_axis(a, a_out, out[-i - 1], wavelet, mode, axis,
+                      memory_limit)
+            if a is not data:
+                storage.remove(a)
+            a = a_out
+        del a
+    finally:
+        storage.cleanup()
+    return out
+
+
+def _multilevel_outputs(out, shapes, level):
+    if out is None:
+        return None
+    if level == 0:
+        if len(out) != 1:
+            raise ValueError("out must hold 1 entry for a 0 level "
+                             "decomposition.")
+        out = list(out)
+    else:
+        out = _check_multilevel_out(out, level)
+    _check_out_shapes(out, shapes)
+    return out
+
+
+def wavedecn(data, wavelet, mode='symmetric', level=None, axes=None, *,
+             out=None, directory=None, memory_limit=2**28):
+    """
+    Out-of-core multilevel nD Discrete Wavelet Transform.
+
+    Parameters
+    ----------
+    data : array_like
+        Input data.  This can be a `numpy.memmap` or any other object with
+        ``shape`` and ``dtype`` attributes that can be sliced like an array.
+    wavelet : Wavelet object or name string, or tuple of wavelets
+        Wavelet to use.  This can also be a tuple containing a wavelet to
+        apply along each axis in ``axes``.
+    mode : str or tuple of str, optional
+        Signal extension mode, see :ref:`Modes <ref-modes>`. This can
+        also be a tuple containing a mode to apply along each axis in ``axes``.
+    level : int, optional
+        Decomposition level (must be >= 0). If level is None (default) then it
+        will be calculated using the ``dwt_max_level`` function.
+    axes : sequence of ints, optional
+        Axes over which to compute the DWT. Axes may not be repeated. The
+        default is None, which means transform all axes
+        (``axes = range(data.ndim)``).
+    out : list, optional
+        Arrays that receive the coefficients, structured as the result.  They
+        can be any objects that support assignment to slices.
+    directory : str, optional
+        Directory in which the coefficients are stored as ``.npy`` files,
+        named after the subband key and the level (e.g. ``aad1.npy``), if
+        ``out`` is not given.  The intermediate results of each level are
+        stored in a temporary directory within it while the transform runs.
+        By default, a new directory is created with `tempfile.mkdtemp`.
+    memory_limit : int, optional
+        Approximate number of bytes of the blocks held in memory.
+
+    Returns
+    -------
+    [cAn, {details_level_n}, ... {details_level_1}] : list
+        Coefficients list, as for `pywt.wavedecn`.  Unless ``out`` is given,
+        the arrays are `numpy.memmap` arrays.
+
+    Notes
+    -----
+    Each level is computed as a sequence of 1D transforms along the axes in
+    ``axes``.  The subbands between these transforms are stored in
+    temporary files, which needs up to twice the disk space of the level.
+    """
+    if not hasattr(data, 'shape'):
+        data = np.asarray(data)
+    axes, _, ndim_transform = _prep_axes_wavedecn(data.shape, axes)
+    axes = [ax + len(data.shape) if ax < 0 else ax for ax in axes]
+    wavelets = _wavelets_per_axis(wavelet, axes)
+    modes = [_mode_name(m) for m in _modes_per_axis(mode, axes)]
+    shapes = wavedecn_shapes(data.shape, wavelets, modes, level, axes)
+    level = len(shapes) - 1
+    out = _multilevel_outputs(out, shapes, level)
+    approx_key = 'a' * ndim_transform
+    storage = _Storage(directory, _output_dtype(np.dtype(data.dtype)))
+    if out is None:
+        out = [storage.output(approx_key + str(level), shapes[0])]
+        out += [{k: storage.output(k + str(level - i), shape)
+                 for k, shape in d.items()}
+                for i, d in enumerate(shapes[1:])]
+    if level == 0:
+        _copy(data, out[0], memory_limit)
+        return out
+
+    try:
+        a = data
+        for i in range(level):
+            details = out[-i - 1]
+            subbands = {'': a}
+            for j, (axis, wavelet, mode) in enumerate(zip(axes, wavelets,
+                                                          modes)):
+                last = j == ndim_transform - 1
+                split = {}
+                for key, x in subbands.items():
+                    shape = list(x.shape)
+                    shape[axis] = dwt_coeff_len(shape[axis],
+                                                wavelet.dec_len, mode)
+                    for c in 'ad':
+                        name = key + c
+                        if last and name in details:
+                            split[name] = details[name]
+                        elif last and i == level - 1:
+                            split[name] = out[0]
+                        else:
+                            split[name] = storage.temporary(
+                                f'{name}{i + 1}', tuple(shape))
+                    _dwt_axis(x, split[key + 'a'], split[key + 'd'], wavelet,
+                              mode, axis, memory_limit)
+                    if x is not data:
+                        storage.remove(x)
+                subbands = split
+            a = subbands[approx_key]
+        del a, subbands, split, x
+    finally:
+        storage.cleanup()
+    return out
@@ -0,0 +1,427 @@
+"""
+Parallel versions of transforms that act on a subset of the axes of their
+input.
+
+The input is split into chunks along one of the axes that is not transformed
+and the chunks are transformed concurrently.  The results are identical to
+those of the serial functions.
+
+Two backends are available.  ``backend='threads'`` transforms the chunks in a
+`concurrent.futures.ThreadPoolExecutor`, relying on the wavelet filtering
+running without holding the GIL.  ``backend='processes'`` transforms them in a
+`concurrent.futures.ProcessPoolExecutor`, which also parallelizes the steps
+that hold the GIL, such as the Python-level loops of the multiresolution
+analysis and of the wavelet packets.  The input and the coefficients are then
+placed in `multiprocessing.shared_memory` segments, so that no array is
+pickled, and the coefficients are returned as views into a shared segment.
+
+All functions take the following keyword-only arguments:
+
+workers : int, optional
+    Maximum number of threads or processes to use.  If negative, the value
+    wraps around from ``os.cpu_count()``, so ``-1`` uses all CPUs.  The
+    default (None) uses a single worker.
+chunk_size : int, optional
+    The number of entries along the chunked axis that are transformed per
+    task.  The default splits the data into ``workers`` chunks.
+backend : {'threads', 'processes'}, optional
+    Whether the chunks are transformed by a thread pool or by a process pool
+    working on shared memory.
+"""
+import math
+from concurrent import futures
+from functools import partial
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from ._cwt import cwt as _cwt
+from ._functions import scale2frequency
+from ._mra import mran as _mran
+from ._multilevel import wavedecn as _wavedecn
+from ._swt import swtn as _swtn
+from ._utils import _check_workers
+from ._wavelet_packets import WaveletPacket, WaveletPacketND
+
+__all__ = ['wavedecn', 'swtn', 'mran', 'packet_level', 'cwt']
+
+
+def _map(func, tree, *trees):
+    """Apply ``func`` to the arrays of the nested lists, tuples and dicts
+    ``tree`` and ``trees``, which have the same structure."""
+    if isinstance(tree, dict):
+        return {k: _map(func, v, *(t[k] for t in trees))
+                for k, v in tree.items()}
+    if isinstance(tree, (list, tuple)):
+        return type(tree)(_map(func, *leaves) for leaves in zip(tree, *trees))
+    return func(tree, *trees)
+
+
+def _chunk_axis(shape, axes):
+    """The longest axis of ``shape`` that is not in ``axes``, or None."""
+    axes = {ax % len(shape) for ax in axes}
+    free = [ax for ax in range(len(shape)) if ax not in axes]
+    if not free:
+        return None
+    return max(free, key=lambda ax: shape[ax])
+
+
+def _chunk_slices(n, workers, chunk_size):
+    """Slices that split ``range(n)`` into chunks of ``chunk_size``, by
+    default one chunk per worker."""
+    if chunk_size is None:
+        chunk_size = math.ceil(n / workers)
+    elif chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    return [slice(start, min(start + chunk_size, n))
+            for start in range(0, n, chunk_size)]
+
+
+def _index(axis, s):
+    """Index selecting slice ``s`` along ``axis``."""
+    return (slice(None), ) * axis + (s, )
+
+
+def _copy_result(transform, data, out, kwargs):
+    """Transform ``data`` and copy the result into ``out``."""
+    _map(np.copyto, out, transform(data, **kwargs))
+
+
+def _wavedecn_into(data, out, kwargs):
+    if len(out) == 1:
+        # out is not supported for level 0 decompositions
+        _copy_result(_wavedecn, data, out, kwargs)
+    else:
+        _wavedecn(data, out=out, **kwargs)
+
+
+def _transform_chunk(writer, kwargs, data, out, idx, out_idx):
+    writer(data[idx], _map(lambda c: c[out_idx], out), kwargs)
+
+
+class _Leaf:
+    """Shape and dtype of an array, and its offset in a shared memory
+    segment."""
+    __slots__ = ('shape', 'dtype', 'offset')
+
+    def __init__(self, shape, dtype, offset=0):
+        self.shape = shape
+        self.dtype = dtype
+        self.offset = offset
+
+    def attach(self, buf):
+        return np.ndarray(self.shape, self.dtype, buffer=buf,
+                          offset=self.offset)
+
+
+class _Segment(np.ndarray):
+    """The bytes of a shared memory segment.
+
+    NumPy does not keep the buffers of arrays exported, so the segment has to
+    be kept open for as long as arrays use it.  The arrays attached to a
+    `_Segment` reference it as their base, and it references the
+    `SharedMemory` that closes the segment once it is collected.
+    """
+
+
+def _shared_layout(leaves):
+    """The arrays ``leaves`` laid out in a single segment, and the size of
+    the segment."""
+    nbytes = 0
+
+    def place(leaf):
+        nonlocal nbytes
+        # keep every array aligned to a cache line
+        offset = -(-nbytes // 64) * 64
+        nbytes = offset + math.prod(leaf.shape) * leaf.dtype.itemsize
+        return _Leaf(leaf.shape, leaf.dtype, offset)
+
+    return _map(place, leaves), max(nbytes, 1)
+
+
+def _process_chunk(writer, kwargs, data_spec, out_spec, idx, out_idx):
+    """Transform a chunk of the data in a shared segment into the output
+    segment.  Runs in the worker processes."""
+    data_shm = shared_memory.SharedMemory(name=data_spec[0])
+    out_shm = shared_memory.SharedMemory(name=out_spec[0])
+    error = None
+    try:
+        _transform_chunk(writer, kwargs, data_spec[1].attach(data_shm.buf),
+                         _map(lambda c: c.attach(out_shm.buf), out_spec[1]),
+                         idx, out_idx)
+    except Exception as e:
+        # do not keep views of the segments alive in the traceback once the
+        # segments are closed
+        error = e.with_traceback(None)
+    data_shm.close()
+    out_shm.close()
+    if error is not None:
+        raise error
+
+
+def _run_processes(writer, kwargs, data, leaves, tasks, workers):
+    data_shm = shared_memory.SharedMemory(create=True,
+                                          size=max(data.nbytes, 1))
+    out_shm = None
+    coeffs = None
+    try:
+        data_leaf = _Leaf(data.shape, data.dtype)
+        data_leaf.attach(data_shm.buf)[...] = data
+        out_leaves, nbytes = _shared_layout(leaves)
+        out_shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        with futures.ProcessPoolExecutor(max_workers=workers) as ex:
+            running = [ex.submit(_process_chunk, writer, kwargs,
+                                 (data_shm.name, data_leaf),
+                                 (out_shm.name, out_leaves), idx, out_idx)
+                       for idx, out_idx in tasks]
+            for f in running:
+                f.result()
+        segment = _Segment(nbytes, np.uint8, buffer=out_shm.buf)
+        segment.shm = out_shm
+        coeffs = _map(lambda c: c.attach(segment), out_leaves)
+    finally:
+        data_shm.close()
+        data_shm.unlink()
+        if out_shm is not None:
+            if coeffs is None:
+                out_shm.close()
+            # the mapping stays valid after the segment is unlinked
+            out_shm.unlink()
+    return coeffs
+
+
+def _chunked(transform, data, kwargs, axes, out_axis_offset, workers,
+             chunk_size, backend, writer=None):
+    """Compute ``transform(data, **kwargs)`` in chunks along the longest axis
+    that is not in ``axes``.
+
+    The chunked axis of the arrays of the result is offset by
+    ``out_axis_offset`` from its position in ``data``.  ``writer(chunk, out,
+    kwargs)`` stores the transform of a chunk in ``out``, by default by
+    copying the result of ``transform``.
+    """
+    if backend not in ('threads', 'processes'):
+        raise ValueError("backend must be 'threads' or 'processes'.")
+    workers = _check_workers(workers)
+    if writer is None:
+        writer = partial(_copy_result, transform)
+    data = np.asarray(data)
+    if data.ndim == 0 or any(not -data.ndim <= ax < data.ndim for ax in axes):
+        # let the transform raise the appropriate error
+        return transform(data, **kwargs)
+    chunk_axis = _chunk_axis(data.shape, axes)
+    if chunk_axis is None or data.shape[chunk_axis] == 0:
+        return transform(data, **kwargs)
+    n = data.shape[chunk_axis]
+    out_axis = chunk_axis + out_axis_offset
+
+    # the chunked axis is not transformed, so the structure of the result
+    # follows from the transform of a single entry along it
+    probe = transform(data[_index(chunk_axis, slice(0, 1))], **kwargs)
+
+    def full_shape(c):
+        shape = list(c.shape)
+        shape[out_axis] = n
+        return _Leaf(tuple(shape), c.dtype)
+
+    leaves = _map(full_shape, probe)
+    tasks = [(_index(chunk_axis, s), _index(out_axis, s))
+             for s in _chunk_slices(n, workers, chunk_size)]
+    if backend == 'processes':
+        return _run_processes(writer, kwargs, data, leaves, tasks, workers)
+
+    out = _map(lambda c: np.empty(c.shape, c.dtype), leaves)
+    run = partial(_transform_chunk, writer, kwargs, data, out)
+    if workers == 1 or len(tasks) == 1:
+        for task in tasks:
+            run(*task)
+    else:
+        with futures.ThreadPoolExecutor(max_workers=workers) as ex:
+            for f in [ex.submit(run, *task) for task in tasks]:
+                f.result()
+    return out
+
+
+def wavedecn(data, wavelet, mode='symmetric', level=None, axes=None,
+             method='convolution', *, workers=None, chunk_size=None,
+             backend='threads'):
+    """
+    Multilevel nD Discrete Wavelet Transform, computed in parallel chunks.
+
+    See `pywt.wavedecn` for the description of the arguments and of the
+    result, which is identical.
+
+    Parameters
+    ----------
+    workers, chunk_size, backend : optional
+        Parallel execution, see `pywt.parallel`.
+
+    Notes
+    -----
+    The data is split along the longest axis that is not in ``axes``.  The
+    coefficients are allocated once and each chunk is transformed directly
+    into its part of them.  If all axes are transformed, a single
+    `pywt.wavedecn` call is made.  ``method='integer'`` is not supported.
+    """
+    data = np.asarray(data)
+    if axes is None:
+        axes = range(data.ndim)
+    elif np.isscalar(axes):
+        axes = (axes, )
+    axes = tuple(axes)
+    kwargs = {'wavelet': wavelet, 'mode': mode, 'level': level,
+              'axes': axes, 'method': method}
+    return _chunked(_wavedecn, data, kwargs, axes, 0, workers, chunk_size,
+                    backend, writer=_wavedecn_into)
+
+
+def swtn(data, wavelet, level, start_level=0, axes=None, trim_approx=False,
+         norm=False, *, workers=None, chunk_size=None, backend='threads'):
+    """
+    n-dimensional stationary wavelet transform, computed in parallel chunks.
+
+    See `pywt.swtn` for the description of the arguments and of the result,
+    which is identical.
+
+    Parameters
+    ----------
+    workers, chunk_size, backend : optional
+        Parallel execution, see `pywt.parallel`.
+
+    Notes
+    -----
+    The data is split along the longest axis that is not in ``axes``.  The
+    coefficients of each chunk are copied into arrays allocated once for the
+    whole result.  If all axes are transformed, a single `pywt.swtn` call is
+    made.
+    """
+    data = np.asarray(data)
+    axes = tuple(range(data.ndim) if axes is None else axes)
+    kwargs = {'wavelet': wavelet, 'level': level,
+              'start_level': start_level, 'axes': axes,
+              'trim_approx': trim_approx, 'norm': norm}
+    return _chunked(_swtn, data, kwargs, axes, 0, workers, chunk_size,
+                    backend)
+
+
+def mran(data, wavelet, level=None, axes=None, transform='swtn',
+         mode='periodization', *, workers=None, chunk_size=None,
+         backend='threads'):
+    """
+    Forward nD multiresolution analysis, computed in parallel chunks.
+
+    See `pywt.mran` for the description of the arguments and of the result,
+    which is identical.
+
+    Parameters
+    ----------
+    workers, chunk_size, backend : optional
+        Parallel execution, see `pywt.parallel`.
+
+    Notes
+    -----
+    The data is split along the longest axis that is not in ``axes``.  The
+    coefficients of each chunk are copied into arrays allocated once for the
+    whole result.  If all axes are transformed, a single `pywt.mran` call is
+    made.
+    """
+    data = np.asarray(data)
+    axes = tuple(range(data.ndim) if axes is None else axes)
+    kwargs = {'wavelet': wavelet, 'level': level, 'axes': axes,
+              'transform': transform, 'mode': mode}
+    return _chunked(_mran, data, kwargs, axes, 0, workers, chunk_size,
+                    backend)
+
+
+def _packet_level(data, wavelet, level, mode, axes):
+    if isinstance(axes, tuple):
+        wp = WaveletPacketND(data, wavelet, mode, level, axes)
+    else:
+        wp = WaveletPacket(data, wavelet, mode, level, axes)
+    return {node.path: node.data for node in wp.get_level(level)}
+
+
+def packet_level(data, wavelet, level, mode='symmetric', axes=-1, *,
+                 workers=None, chunk_size=None, backend='threads'):
+    """
+    Wavelet packet coefficients at one decomposition level, computed in
+    parallel chunks.
+
+    Parameters
+    ----------
+    data : array_like
+        Input data.
+    wavelet : Wavelet object or name string
+        Wavelet to use.
+    level : int
+        The decomposition level of the coefficients.
+    mode : str, optional
+        Signal extension mode, see :ref:`Modes <ref-modes>`.
+    axes : int or sequence of ints, optional
+        The axis of a `pywt.WaveletPacket` decomposition, or the axes of a
+        `pywt.WaveletPacketND` decomposition.  ``None`` transforms all axes.
+    workers, chunk_size, backend : optional
+        Parallel execution, see `pywt.parallel`.
+
+    Returns
+    -------
+    coeffs : dict
+        The data of the nodes at ``level`` of the packet decomposition, keyed
+        by their path, in the natural order of ``get_level``.
+
+    Notes
+    -----
+    The data is split along the longest axis that is not transformed.  The
+    coefficients of each chunk are copied into arrays allocated once for the
+    whole result.
+    """
+    data = np.asarray(data)
+    if axes is None:
+        axes = tuple(range(data.ndim))
+    elif not np.isscalar(axes):
+        axes = tuple(axes)
+    kwargs = {'wavelet': wavelet, 'level': level, 'mode': mode,
+              'axes': axes}
+    return _chunked(_packet_level, data, kwargs,
+                    np.atleast_1d(axes).tolist(), 0, workers, chunk_size,
+                    backend)
+
+
+def _cwt_coefs(data, **kwargs):
+    return _cwt(data, **kwargs)[0]
+
+
+def cwt(data, scales, wavelet, sampling_period=1., method='conv', axis=-1,
+        *, precision=12, workers=None, chunk_size=None, backend='threads'):
+    """
+    Continuous wavelet transform, computed in parallel chunks.
+
+    See `pywt.cwt` for the description of the arguments and of the result,
+    which is identical.
+
+    Parameters
+    ----------
+    workers, chunk_size, backend : optional
+        Parallel execution, see `pywt.parallel`.
+
+    Notes
+    -----
+    The data is split along the longest axis other than ``axis``.  The
+    coefficients of each chunk are copied into an array allocated once for
+    the whole result.  One-dimensional data is transformed by a single
+    `pywt.cwt` call.
+    """
+    kwargs = {'scales': scales, 'wavelet': wavelet,
+              'sampling_period': sampling_period, 'method': method,
+              'axis': axis, 'precision': precision}
+    if not np.isscalar(axis):
+        # let cwt raise the appropriate error
+        return _cwt(data, **kwargs)
+    # the coefficients have an additional leading axis for the scales
+    coefs = _chunked(_cwt_coefs, data, kwargs, [axis], 1, workers,
+                     chunk_size, backend)
+    frequencies = scale2frequency(wavelet, np.atleast_1d(scales), precision)
+    if np.isscalar(frequencies):
+        frequencies = np.array([frequencies])
+    frequencies /= sampling_period
+    return coefs, frequencies
@@ -9,7 +9,8 @@ from functools import partial
 
 import numpy as np
 import pytest
-from numpy.testing import assert_allclose, assert_array_equal
+from numpy.testing import assert_allclose, assert_array_equal, assert_raises
+from pywt._extensions._dwt import _reset_executor
 
 import pywt
 from pywt._pytest import futures, max_workers, uses_futures
@@ -104,3 +105,67 @@ def test_concurrent_cwt():
     expected_result = transform(sst)
     for a1, a2 in zip(expected_result, results[-1]):
         assert_allclose(a1, a2, atol=atol, rtol=rtol)
+
+
+@uses_futures
+@pytest.mark.parametrize('workers', [2, 3, -1])
+def test_workers_dwt_idwt(workers):
+    rstate = np.random.RandomState(1234)
+    x = rstate.randn(7, 9, 16)
+    for axis in range(x.ndim):
+        expected = pywt.dwt(x, 'db2', axis=axis)
+        result = pywt.dwt(x, 'db2', axis=axis, workers=workers)
+        _assert_all_coeffs_equal([expected, ], [result, ])
+        assert_array_equal(
+            pywt.idwt(*result, 'db2', axis=axis, workers=workers),
+            pywt.idwt(*expected, 'db2', axis=axis))
+    # a single detail band and non-contiguous input
+    assert_array_equal(pywt.idwt(None, x[:, ::2], 'sym3', workers=workers),
+                       pywt.idwt(None, x[:, ::2], 'sym3'))
+
+
+@uses_futures
+@pytest.mark.parametrize('dtype', [np.float32, np.float64, np.complex128])
+def test_workers_wavedecn_waverecn(dtype):
+    rstate = np.random.RandomState(1234)
+    x = rstate.randn(24, 16, 33).astype(dtype)
+    expected = pywt.wavedecn(x, 'db2', level=2)
+    result = pywt.wavedecn(x, 'db2', level=2, workers=max_workers)
+    assert_array_equal(result[0], expected[0])
+    _assert_all_coeffs_equal(result[1:], expected[1:])
+    assert_array_equal(pywt.waverecn(result, 'db2', workers=max_workers),
+                       pywt.waverecn(expected, 'db2'))
+
+    expected = pywt.wavedec2(x, 'db1', level=2, axes=(0, 2))
+    result = pywt.wavedec2(x, 'db1', level=2, axes=(0, 2), workers=2)
+    _assert_all_coeffs_equal(result[1:], expected[1:])
+    assert_array_equal(pywt.waverec2(result, 'db1', axes=(0, 2), workers=2),
+                       pywt.waverec2(expected, 'db1', axes=(0, 2)))
+
+
+@uses_futures
+def test_workers_shared_pool():
+    # calls with different workers share one thread pool, which is grown
+    # while other calls are still submitting to it
+    rstate = np.random.RandomState(0)
+    x = rstate.randn(256, 64)
+    cA, cD = pywt.dwt(x, 'db2', axis=0)
+
+    def transform(workers):
+        return pywt.dwt(x, 'db2', axis=0, workers=workers)
+
+    for _ in range(20):
+        _reset_executor()
+        with futures.ThreadPoolExecutor(max_workers=8) as ex:
+            results = list(ex.map(transform, [2, 3, 4, 5, 6, 7, 8, 2] * 4))
+        for a, d in results:
+            assert_array_equal(a, cA)
+            assert_array_equal(d, cD)
+
+
+def test_workers_invalid():
+    x = np.ones((4, 8))
+    assert_raises(ValueError, pywt.dwt, x, 'haar', workers=0)
+    assert_raises(ValueError, pywt.dwtn, x, 'haar', workers=-10000)
+    assert_raises(TypeError, pywt.idwtn, pywt.dwtn(x, 'haar'), 'haar',
+                  workers=1.5)
@@ -5,12 +5,12 @@ from numpy.testing import assert_, assert_allclose, assert_array_equal, assert_r
 
 import pywt
 
-# Check that float32, float64, complex64, complex128 are preserved.
+# Check that float16, float32, float64, complex64, complex128 are preserved.
 # Other real types get converted to float64.
 # complex256 gets converted to complex128
 dtypes_in = [np.int8, np.float16, np.float32, np.float64, np.complex64,
              np.complex128]
-dtypes_out = [np.float64, np.float32, np.float32, np.float64, np.complex64,
+dtypes_out = [np.float64, np.float16, np.float32, np.float64, np.complex64,
               np.complex128]
 
 # test complex256 as well if it is available
@@ -68,6 +68,127 @@ def test_dwt_idwt_dtypes():
         assert_(x_roundtrip.dtype == dt_out, "idwt: " + errmsg)
 
 
+def test_dwt_idwt_float16():
+    # float16 is computed in float32 over several slabs of a large array
+    rstate = np.random.RandomState(0)
+    x = rstate.randn(600, 1000).astype(np.float16)
+    for axis in (0, 1):
+        cA, cD = pywt.dwt(x, 'db4', axis=axis)
+        cA32, cD32 = pywt.dwt(x.astype(np.float32), 'db4', axis=axis)
+        assert_(cA.dtype == cD.dtype == np.float16)
+        assert_array_equal(cA, cA32.astype(np.float16))
+        assert_array_equal(cD, cD32.astype(np.float16))
+
+        r = pywt.idwt(cA, cD, 'db4', axis=axis)
+        r32 = pywt.idwt(cA.astype(np.float32), cD.astype(np.float32), 'db4',
+                        axis=axis)
+        assert_(r.dtype == np.float16)
+        assert_array_equal(r, r32.astype(np.float16))
+        assert_allclose(r, x, rtol=1e-2, atol=1e-2)
+
+
+def test_dwt_idwt_float16_long():
+    # float16 lines too long for a single tile are converted in blocks
+    rstate = np.random.RandomState(0)
+    for n in [300000, 300001]:
+        x = rstate.randn(n).astype(np.float16)
+        for mode in pywt.Modes.modes:
+            for wavelet in ['db1', 'db4', 'bior3.5']:
+                cA, cD = pywt.dwt(x, wavelet, mode)
+                cA32, cD32 = pywt.dwt(x.astype(np.float32), wavelet, mode)
+                assert_array_equal(cA, cA32.astype(np.float16))
+                assert_array_equal(cD, cD32.astype(np.float16))
+
+                r = pywt.idwt(cA, cD, wavelet, mode)
+                r32 = pywt.idwt(cA.astype(np.float32),
+                                cD.astype(np.float32), wavelet, mode)
+                assert_(r.dtype == np.float16)
+                # rounded from float32 sums taken in another order
+                assert_allclose(r, r32, rtol=1e-3, atol=1e-3)
+
+
+def test_dwt_idwt_haar():
+    # Haar is transformed by a dedicated path, check it against the
+    # pairwise sums and differences and the lifting implementation
+    rstate = np.random.RandomState(1234)
+    c = np.sqrt(0.5)
+    for size in range(1, 10):
+        x = rstate.randn(size, 3)
+        for mode in pywt.Modes.modes:
+            if size == 1 and mode in ['reflect', 'antireflect']:
+                continue
+            if size % 2 == 0:
+                ext = x
+            elif mode == 'periodization':
+                ext = np.concatenate((x, x[-1:]))
+            else:
+                ext = pywt.pad(x, ((0, 1), (0, 0)), mode)
+            cA, cD = pywt.dwt(x, 'haar', mode, axis=0)
+            assert_allclose(cA, c * (ext[0::2] + ext[1::2]), atol=1e-14)
+            assert_allclose(cD, c * (ext[0::2] - ext[1::2]), atol=1e-14)
+            # lifting uses the same kernel for Haar filters
+            cA_l, cD_l = pywt.dwt(x, 'haar', mode, axis=0, method='lifting')
+            assert_array_equal(cA, cA_l)
+            assert_array_equal(cD, cD_l)
+            assert_array_equal(pywt.dwt(x[:, 1], 'haar', mode), (cA[:, 1],
+                                                                 cD[:, 1]))
+
+            for coeffs in [(cA, cD), (cA, None), (None, cD)]:
+                rec = pywt.idwt(*coeffs, 'haar', mode, axis=0)
+                assert_allclose(
+                    rec, pywt.idwt(*coeffs, 'haar', mode, axis=0,
+                                   method='lifting'), atol=1e-14)
+            assert_allclose(rec[:size] + pywt.idwt(cA, None, 'haar', mode,
+                                                   axis=0)[:size],
+                            x, atol=1e-14)
+            assert_allclose(pywt.idwt(cA[:, 2], cD[:, 2], 'haar', mode),
+                            rec[:, 2] + pywt.idwt(cA[:, 2], None, 'haar', mode))
+
+    # the path also applies to rescaled or sign flipped Haar filter banks
+    x = rstate.randn(7).astype(np.float32)
+    w = pywt.Wavelet('flipped_haar',
+                     filter_bank=[[c, c], [c, -c], [c, c], [-c, c]])
+    cA, cD = pywt.dwt(x, w, 'smooth')
+    cA_ref, cD_ref = pywt.dwt(x, 'haar', 'smooth')
+    assert_allclose(cA, cA_ref, rtol=1e-6)
+    assert_allclose(cD, -cD_ref, rtol=1e-6)
+    assert_allclose(pywt.idwt(cA, cD, w, 'smooth')[:7], x, rtol=1e-5,
+                    atol=1e-6)
+
+
+def test_dwt_idwt_out():
+    rstate = np.random.RandomState(1234)
+    for dtype in [np.float32, np.float64, np.complex128]:
+        x = rstate.randn(3, 18).astype(dtype)
+        cA_ref, cD_ref = pywt.dwt(x, 'db2')
+        # any strides are accepted, e.g. interleaved outputs
+        buf = np.full((2, ) + cA_ref.shape, np.nan, dtype).transpose(1, 2, 0)
+        cA, cD = pywt.dwt(x, 'db2', out=(buf[..., 0], buf[..., 1]))
+        assert_(np.shares_memory(cA, buf) and np.shares_memory(cD, buf))
+        assert_allclose(cA, cA_ref, rtol=1e-6)
+        assert_allclose(cD, cD_ref, rtol=1e-6)
+
+        rec = np.empty_like(x)
+        assert_(pywt.idwt(cA, cD, 'db2', out=rec) is rec)
+        assert_allclose(rec, x, rtol=1e-5, atol=1e-5)
+
+    x = np.arange(8.)
+    cA, cD = np.empty(4), np.empty(4)
+    # wrong shape, wrong dtype, read-only and overlapping outputs
+    assert_raises(ValueError, pywt.dwt, x, 'haar', out=(cA, np.empty(5)))
+    assert_raises(ValueError, pywt.dwt, x, 'haar',
+                  out=(cA, np.empty(4, np.float32)))
+    read_only = np.empty(4)
+    read_only.flags.writeable = False
+    assert_raises(ValueError, pywt.dwt, x, 'haar', out=(cA, read_only))
+    assert_raises(ValueError, pywt.dwt, x, 'haar', out=(cA, cA))
+    assert_raises(ValueError, pywt.idwt, cA, cD, 'haar', out=x[:4])
+    assert_raises(ValueError, pywt.idwt, x[:4], cD, 'haar', out=x)
+    assert_raises(TypeError, pywt.dwt, x, 'haar', out=(cA, [0] * 4))
+    assert_raises(ValueError, pywt.dwt, x, 'haar', method='integer',
+                  out=(cA, cD))
+
+
 def test_dwt_idwt_basic_complex():
     x = np.asarray([3, 7, 1, 1, -2, 5, 4, 6])
     x = x + 0.5j*x
@@ -165,6 +286,62 @@ def test_dwt_single_axis():
     assert_allclose(cD[1], cD1)
 
 
+def test_dwt_matches_downcoef():
+    # dwt computes cA and cD in a single pass; the result must be identical
+    # to computing them separately, including near the boundaries and when
+    # the filter is longer than the signal
+    rstate = np.random.RandomState(1234)
+    for size in [2, 3, 5, 8, 17]:
+        for dtype in [np.float32, np.float64, np.complex128]:
+            x = rstate.randn(size).astype(dtype)
+            xs = np.stack([x, -x], axis=0)
+            for wavelet in ['haar', 'db2', 'sym5', 'rbio3.3', 'coif3']:
+                for mode in pywt.Modes.modes:
+                    cA, cD = pywt.dwt(x, wavelet, mode)
+                    assert_array_equal(cA, pywt.downcoef('a', x, wavelet,
+                                                         mode))
+                    assert_array_equal(cD, pywt.downcoef('d', x, wavelet,
+                                                         mode))
+                    # strided rows along axis 0
+                    cA2, cD2 = pywt.dwt(xs.T, wavelet, mode, axis=0)
+                    assert_array_equal(cA2[:, 0], cA)
+                    assert_array_equal(cD2[:, 0], cD)
+
+
+def test_simd_levels_match_scalar():
+    from pywt._extensions import _dwt
+    levels = _dwt._simd_levels()
+    assert_(levels[0] == 'scalar')
+    assert_raises(ValueError, _dwt._set_simd_level, 'no-such-level')
+
+    rstate = np.random.RandomState(1234)
+    x = rstate.randn(37, 300)
+    original = _dwt._get_simd_level()
+    try:
+        _dwt._set_simd_level('scalar')
+        expected = {}
+        for dtype in [np.float32, np.float64, np.complex64, np.complex128]:
+            for mode in ['symmetric', 'periodization']:
+                for method in ['convolution', 'lifting']:
+                    coeffs = pywt.dwtn(x.astype(dtype), 'db5', mode,
+                                       method=method)
+                    expected[dtype, mode, method] = (
+                        coeffs, pywt.idwtn(coeffs, 'db5', mode,
+                                           method=method))
+        for level in levels[1:]:
+            _dwt._set_simd_level(level)
+            for (dtype, mode, method), (coeffs, rec) in expected.items():
+                rtol = 1e-5 if dtype in (np.float32, np.complex64) else 1e-12
+                result = pywt.dwtn(x.astype(dtype), 'db5', mode,
+                                   method=method)
+                for key in coeffs:
+                    assert_allclose(result[key], coeffs[key], rtol=rtol)
+                assert_allclose(pywt.idwtn(result, 'db5', mode,
+                                           method=method), rec, rtol=rtol)
+    finally:
+        _dwt._set_simd_level(original)
+
+
 def test_idwt_single_axis():
     x = [[3, 7, 1, 1],
          [-2, 5, 4, 6]]
@@ -179,6 +356,7 @@ def test_idwt_single_axis():
     assert_allclose(x[0], x0)
     assert_allclose(x[1], x1)
 
+
 def test_dwt_invalid_input():
     x = np.arange(1)
     assert_raises(ValueError, pywt.dwt, x, 'db2', 'reflect')
@@ -195,10 +373,200 @@ def test_dwt_axis_arg():
     assert_allclose(cA_, cA)
     assert_allclose(cD_, cD)
 
+
+def test_dwt_idwt_strided_axes():
+    # rows along strided axes are gathered in tiles of neighbouring rows;
+    # compare against transforming each row separately
+    rstate = np.random.RandomState(1234)
+    x = rstate.randn(11, 70, 5)
+    views = [x, x[::-1, :, ::2], np.asfortranarray(x), x.transpose(1, 0, 2)]
+    for data in views:
+        for axis in range(data.ndim):
+            cA, cD = pywt.dwt(data, 'db3', axis=axis, workers=3)
+            rows = np.moveaxis(data, axis, -1).reshape(-1, data.shape[axis])
+            expected = [pywt.dwt(row, 'db3') for row in rows]
+            assert_array_equal(
+                np.moveaxis(cA, axis, -1).reshape(len(rows), -1),
+                [e[0] for e in expected])
+            assert_array_equal(
+                np.moveaxis(cD, axis, -1).reshape(len(rows), -1),
+                [e[1] for e in expected])
+            # strided coefficients
+            rec = pywt.idwt(cA[::-1].copy()[::-1], cD.copy(order='F'), 'db3',
+                            axis=axis)
+            assert_allclose(rec[tuple(slice(n) for n in data.shape)], data)
+
+
+def test_dwt_idwt_lifting():
+    # the lifting steps give the coefficients of the convolution
+    rstate = np.random.RandomState(1234)
+    wavelets = ['haar', 'db2', 'db5', 'db10', 'sym4', 'sym9', 'bior2.2',
+                'bior3.5', 'bior6.8', 'rbio1.3', 'rbio4.4']
+    for wavelet in wavelets:
+        for mode in pywt.Modes.modes:
+            for n in [1, 2, 5, 8, 17, 32]:
+                if n == 1 and mode in ('reflect', 'antireflect'):
+                    continue
+                x = rstate.randn(n)
+                cA, cD = pywt.dwt(x, wavelet, mode)
+                cA_l, cD_l = pywt.dwt(x, wavelet, mode, method='lifting')
+                assert_allclose(cA_l, cA, rtol=1e-10, atol=1e-10)
+                assert_allclose(cD_l, cD, rtol=1e-10, atol=1e-10)
+                assert_allclose(
+                    pywt.idwt(cA, cD, wavelet, mode, method='lifting'),
+                    pywt.idwt(cA, cD, wavelet, mode), rtol=1e-10, atol=1e-10)
+
+
+def test_dwt_idwt_lifting_all_wavelets():
+    # the lifting steps are computed in double precision and only well
+    # conditioned factorizations are used, so the results are as accurate as
+    # those of the convolution, relative to the largest coefficient
+    rstate = np.random.RandomState(1234)
+    for dtype, tol in [(np.float32, 1e-6), (np.float64, 2e-11)]:
+        for wavelet in pywt.wavelist(kind='discrete'):
+            for mode in ['periodization', 'symmetric', 'zero']:
+                for n in [33, 256]:
+                    x = rstate.randn(n).astype(dtype)
+                    cA, cD = pywt.dwt(x, wavelet, mode)
+                    scale = max(np.abs(cA).max(), np.abs(cD).max())
+                    cA_l, cD_l = pywt.dwt(x, wavelet, mode, method='lifting')
+                    assert_allclose(cA_l, cA, rtol=0, atol=tol * scale)
+                    assert_allclose(cD_l, cD, rtol=0, atol=tol * scale)
+                    rec = pywt.idwt(cA, cD, wavelet, mode)
+                    rec_l = pywt.idwt(cA, cD, wavelet, mode, method='lifting')
+                    assert_allclose(rec_l, rec, rtol=0,
+                                    atol=tol * np.abs(rec).max())
+
+
+def test_dwt_idwt_lifting_dtypes_axes():
+    rstate = np.random.RandomState(1234)
+    x = rstate.randn(6, 9, 4)
+    for dt_in, dt_out in zip(dtypes_in, dtypes_out):
+        data = x.astype(dt_in)
+        for axis in range(x.ndim):
+            cA, cD = pywt.dwt(data, 'sym4', axis=axis, method='lifting')
+            assert_(cA.dtype == cD.dtype == dt_out)
+            expected = pywt.dwt(data, 'sym4', axis=axis)
+            tol = {16: 1e-2, 32: 1e-5}.get(np.finfo(dt_out).bits, 1e-10)
+            assert_allclose(cA, expected[0], rtol=tol, atol=tol)
+            assert_allclose(cD, expected[1], rtol=tol, atol=tol)
+
+            # missing coefficients are taken to be zero
+            for coeffs in [(cA, None), (None, cD)]:
+                assert_allclose(
+                    pywt.idwt(*coeffs, 'sym4', axis=axis, method='lifting'),
+                    pywt.idwt(*coeffs, 'sym4', axis=axis),
+                    rtol=tol, atol=tol)
+
+
+def test_dwt_idwt_lifting_fallback():
+    # wavelets without lifting factorization are transformed by convolution
+    x = np.arange(20.)
+    for wavelet in ['coif2', 'dmey', 'db38']:
+        assert_array_equal(pywt.dwt(x, wavelet, method='lifting'),
+                           pywt.dwt(x, wavelet))
+    assert_raises(ValueError, pywt.dwt, x, 'db2', method='fft')
+    assert_raises(ValueError, pywt.idwt, x, x, 'db2', method='fft')
+    assert_raises(ValueError, pywt.idwt, x, x[:-1], 'db2', method='lifting')
+
+
+def test_dwt_idwt_integer():
+    rstate = np.random.RandomState(1234)
+    for dtype in [np.int8, np.uint8, np.int16, np.uint16, np.int32,
+                  np.uint32]:
+        info = np.iinfo(dtype)
+        high = min(info.max, 2**20)
+        for wavelet in ['haar', 'bior2.2']:
+            for n in [1, 2, 7, 16]:
+                x = rstate.randint(max(info.min, -high), high, size=(n, 3),
+                                   dtype=np.int64).astype(dtype)
+                for axis in [0, 1]:
+                    cA, cD = pywt.dwt(x, wavelet, 'periodization', axis=axis,
+                                      method='integer')
+                    assert_(cA.dtype == cD.dtype)
+                    assert_(cA.dtype == (np.int64 if dtype == np.uint32
+                                         else np.int32))
+                    # reconstruction is exact
+                    rec = pywt.idwt(cA, cD, wavelet, 'periodization',
+                                    axis=axis, method='integer')
+                    assert_array_equal(rec.take(range(x.shape[axis]), axis),
+                                       x)
+                    # close to the scaled coefficients of the convolution
+                    cA_f, cD_f = pywt.dwt(x.astype(np.float64), wavelet,
+                                          'periodization', axis=axis)
+                    assert_allclose(cA, cA_f / np.sqrt(2), atol=1.5)
+                    assert_allclose(cD, cD_f * np.sqrt(2), atol=1.5)
+
+    cA, cD = pywt.dwt([1, 2, 3, 4, 5, 6], 'haar', 'periodization',
+                      method='integer')
+    assert_array_equal(cA, [1, 3, 5])
+    assert_array_equal(cD, [-1, -1, -1])
+    assert_array_equal(pywt.idwt(cA, None, 'haar', 'periodization',
+                                 method='integer'), [1, 1, 3, 3, 5, 5])
+
+
+def test_dwt_idwt_integer_invalid():
+    x = np.arange(8)
+    assert_raises(TypeError, pywt.dwt, x.astype(np.float32), 'haar',
+                  'periodization', method='integer')
+    assert_raises(TypeError, pywt.dwt, x.astype(np.uint64), 'haar',
+                  'periodization', method='integer')
+    assert_raises(ValueError, pywt.dwt, x, 'db2', 'periodization',
+                  method='integer')
+    assert_raises(ValueError, pywt.dwt, x, 'haar', 'symmetric',
+                  method='integer')
+    assert_raises(ValueError, pywt.idwt, x, x[:-1], 'haar', 'periodization',
+                  method='integer')
+
+    # int32 data without room for the growth of the coefficients
+    for wavelet, limit in [('haar', 2**30), ('bior2.2', 2**29 - 1)]:
+        x = np.array([limit - 1, -limit, 0, limit - 1], dtype=np.int32)
+        cA, cD = pywt.dwt(x, wavelet, 'periodization', method='integer')
+        cA64, cD64 = pywt.dwt(x.astype(np.int64), wavelet, 'periodization',
+                              method='integer')
+        assert_array_equal(cA, cA64)
+        assert_array_equal(cD, cD64)
+        for bad in [limit, -limit - 1]:
+            x[1] = bad
+            assert_raises(ValueError, pywt.dwt, x, wavelet, 'periodization',
+                          method='integer')
+
+    # and int64 data, whose coefficients cannot be checked against a wider
+    # dtype
+    for wavelet, limit in [('haar', 2**62), ('bior2.2', 2**61 - 1)]:
+        x = np.array([limit - 1, -limit, 0, limit - 1], dtype=np.int64)
+        cA, cD = pywt.dwt(x, wavelet, 'periodization', method='integer')
+        assert_array_equal(pywt.idwt(cA, cD, wavelet, 'periodization',
+                                     method='integer'), x)
+        if wavelet == 'haar':
+            assert_(cD[0] == 2**63 - 1)
+            assert_(cA[0] == -limit + (2**63 - 1) // 2)
+        for bad in [limit, -limit - 1]:
+            x[1] = bad
+            assert_raises(ValueError, pywt.dwt, x, wavelet, 'periodization',
+                          method='integer')
+
+    # the integer transforms use a single thread
+    x = np.arange(16).reshape(4, 4)
+    assert_raises(ValueError, pywt.dwt, x, 'haar', 'periodization',
+                  workers=2, method='integer')
+    assert_raises(ValueError, pywt.idwt, x, x, 'haar', 'periodization',
+                  workers=2, method='integer')
+    assert_raises(ValueError, pywt.dwtn, x, 'haar', 'periodization',
+                  workers=2, method='integer')
+    assert_raises(ValueError, pywt.wavedec2, x, 'haar', 'periodization',
+                  workers=2, method='integer')
+    coeffs = pywt.dwt(x, 'haar', 'periodization', workers=1,
+                      method='integer')
+    assert_raises(ValueError, pywt.idwt2, (coeffs[0], (coeffs[1], ) * 3),
+                  'haar', 'periodization', workers=2, method='integer')
+
+
 def test_dwt_axis_invalid_input():
     x = np.ones((3,1))
     assert_raises(ValueError, pywt.dwt, x, 'db2', 'reflect')
 
+
 def test_idwt_axis_arg():
     x = [[3, 7, 1, 1],
          [-2, 5, 4, 6]]
@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+from functools import partial
+
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
@@ -95,6 +97,36 @@ def test_mra_axis(transform, ndim, axis, dtype):
     assert_allclose(x, y, rtol=rtol, atol=rtol)
 
 
+@pytest.mark.parametrize('wavelet', ['db1', 'sym4'])
+@pytest.mark.parametrize('transform', ['dwt', 'swt'])
+@pytest.mark.parametrize('dtype', [np.float32, np.complex128])
+def test_mra_bands_match_full_inverse(wavelet, transform, dtype):
+    # each band equals the inverse of the coefficients with all other
+    # subbands set to zero
+    x = data.ecg()[:96].astype(dtype)
+    if x.dtype.kind == 'c':
+        x.imag = x[::-1].real
+    level = 3
+    if transform == 'swt':
+        coeffs = pywt.swt(x, wavelet, level, trim_approx=True, norm=True)
+    else:
+        coeffs = pywt.wavedec(x, wavelet, 'periodization', level=level)
+
+    bands = pywt.mra(x, wavelet, level=level, transform=transform,
+                     mode='periodization')
+    assert len(bands) == len(coeffs)
+    rtol = tol_single if x.real.dtype == np.float32 else tol_double
+    for n, band in enumerate(bands):
+        c = [coeffs[i] if i == n else np.zeros_like(coeffs[i])
+             for i in range(len(coeffs))]
+        if transform == 'swt':
+            expected = pywt.iswt(c, wavelet, norm=True)
+        else:
+            expected = pywt.waverec(c, wavelet, 'periodization')
+        assert band.dtype == x.dtype
+        assert_allclose(band, expected[:x.size], rtol=rtol, atol=rtol)
+
+
 ####
 # 2d mra tests
 ####
@@ -255,3 +287,30 @@ def test_mran_axes(axes, transform):
     y = pywt.imran(coeffs)
     rtol = tol_single if x3d.real.dtype.kind == 'f' else tol_double
     assert_allclose(x3d, y, rtol=rtol, atol=rtol)
+
+
+@pytest.mark.parametrize('transform', ['dwtn', 'swtn'])
+def test_mran_bands_match_full_inverse(transform):
+    # each band equals the inverse of the coefficients with all other
+    # subbands set to zero
+    x = data.camera()[:32, :24].astype(np.float64)
+    level = 2
+    if transform == 'swtn':
+        coeffs = pywt.swtn(x, 'db2', level, trim_approx=True, norm=True)
+        inverse = partial(pywt.iswtn, wavelet='db2', norm=True)
+    else:
+        coeffs = pywt.wavedecn(x, 'db2', 'periodization', level=level)
+        inverse = partial(pywt.waverecn, wavelet='db2', mode='periodization')
+
+    bands = pywt.mran(x, 'db2', level=level, transform=transform)
+    zeros = [np.zeros_like(coeffs[0])] + [
+        {k: np.zeros_like(v) for k, v in d.items()} for d in coeffs[1:]]
+    expected = inverse([coeffs[0]] + zeros[1:])
+    assert_allclose(bands[0], expected, rtol=tol_double, atol=tol_double)
+    for n in range(1, len(coeffs)):
+        assert bands[n].keys() == coeffs[n].keys()
+        for key in coeffs[n]:
+            c = list(zeros)
+            c[n] = dict(zeros[n], **{key: coeffs[n][key]})
+            assert_allclose(bands[n][key], inverse(c),
+                            rtol=tol_double, atol=tol_double)
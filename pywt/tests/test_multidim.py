@@ -7,13 +7,14 @@ import numpy as np
 from numpy.testing import assert_, assert_allclose, assert_equal, assert_raises
 
 import pywt
+from pywt._utils import AxisError
 
-# Check that float32, float64, complex64, complex128 are preserved.
+# Check that float16, float32, float64, complex64, complex128 are preserved.
 # Other real types get converted to float64.
 # complex256 gets converted to complex128
 dtypes_in = [np.int8, np.float16, np.float32, np.float64, np.complex64,
              np.complex128]
-dtypes_out = [np.float64, np.float32, np.float32, np.float64, np.complex64,
+dtypes_out = [np.float64, np.float16, np.float32, np.float64, np.complex64,
               np.complex128]
 
 # test complex256 as well if it is available
@@ -349,6 +350,14 @@ def test_negative_axes():
     assert_equal(rec1, rec2)
 
 
+def test_dwtn_idwtn_invalid_axes():
+    data = np.ones((4, 4))
+    coefs = pywt.dwtn(data, 'haar')
+    for axes in [(0, 2), (-3, 1)]:
+        assert_raises(AxisError, pywt.dwtn, data, 'haar', axes=axes)
+        assert_raises(AxisError, pywt.idwtn, coefs, 'haar', axes=axes)
+
+
 def test_dwtn_idwtn_dtypes():
     wavelet = pywt.Wavelet('haar')
     for dt_in, dt_out in zip(dtypes_in, dtypes_out):
@@ -442,3 +451,88 @@ def test_error_on_continuous_wavelet():
 
             c = dec_fun(data, 'db1')
             assert_raises(ValueError, rec_fun, c, wavelet=cwave)
+
+
+def test_dwtn_idwtn_out():
+    rstate = np.random.RandomState(1234)
+    data = rstate.randn(8, 9, 10)
+    coefs_ref = pywt.dwtn(data, 'db2', axes=(0, 2))
+    out = {k: np.empty(v.shape[::-1]).T for k, v in coefs_ref.items()}
+    coefs = pywt.dwtn(data, 'db2', axes=(0, 2), out=out)
+    for k, v in coefs_ref.items():
+        assert_(coefs[k] is out[k])
+        assert_allclose(coefs[k], v)
+    rec = np.empty_like(data)
+    assert_(pywt.idwtn(coefs, 'db2', axes=(0, 2), out=rec) is rec)
+    assert_allclose(rec, data)
+
+    cA, (cH, cV, cD) = pywt.dwt2(data[:, 0], 'db2')
+    out = (np.empty_like(cA), (np.empty_like(cH), np.empty_like(cV),
+                               np.empty_like(cD)))
+    coefs2 = pywt.dwt2(data[:, 0], 'db2', out=out)
+    assert_(coefs2[0] is out[0])
+    assert_allclose(coefs2[1][1], cV)
+    rec = np.empty_like(data[:, 0])
+    assert_(pywt.idwt2(coefs2, 'db2', out=rec) is rec)
+    assert_allclose(rec, data[:, 0])
+
+    # the keys must match the coefficients
+    out = {k: np.empty_like(v) for k, v in coefs_ref.items() if k != 'dd'}
+    assert_raises(ValueError, pywt.dwtn, data, 'db2', axes=(0, 2), out=out)
+
+
+def test_dwtn_idwtn_matches_axis_by_axis():
+    # check against separate dwt calls on every intermediate subband
+    rstate = np.random.RandomState(1234)
+    for shape, axes in [((9, 10, 11), (0, 1, 2)), ((9, 10, 11), (2, 0)),
+                        ((6, 7, 8, 9), (3, 1, 0, 2))]:
+        x = rstate.randn(*shape)
+        wavelets = ['db2', 'sym3', 'haar', 'coif1'][:len(axes)]
+        modes = ['symmetric', 'periodization', 'zero', 'reflect'][:len(axes)]
+        for method in ['convolution', 'lifting']:
+            coefs = pywt.dwtn(x, wavelets, modes, axes=axes, method=method)
+            expected = {'': x}
+            for axis, wav, mode in zip(axes, wavelets, modes):
+                expected = {k + s: c for k, v in expected.items()
+                            for s, c in zip('ad', pywt.dwt(
+                                v, wav, mode, axis=axis, method=method))}
+            assert_equal(sorted(coefs), sorted(expected))
+            for k, v in expected.items():
+                assert_allclose(coefs[k], v, rtol=1e-10, atol=1e-10)
+
+            rec = pywt.idwtn(coefs, wavelets, modes, axes=axes,
+                             method=method)
+            assert_allclose(rec[tuple(slice(n) for n in shape)], x,
+                            rtol=1e-10, atol=1e-10)
+
+
+def test_dwtn_idwtn_large_strips():
+    # large inputs are transformed one strip along the first axis at a time
+    rstate = np.random.RandomState(1234)
+    for shape, axes in [((600, 900), (0, 1)), ((200, 60, 50), (0, 1, 2)),
+                        ((900, 600), (1, 0))]:
+        x = rstate.randn(*shape)
+        for i, mode in enumerate(pywt.Modes.modes):
+            wavelet = ['haar', 'db3', 'sym4', 'bior2.4'][i % 4]
+            expected = {'': x}
+            for axis in axes:
+                expected = {k + s: c for k, v in expected.items()
+                            for s, c in zip('ad', pywt.dwt(
+                                v, wavelet, mode, axis=axis))}
+            out = {k: np.empty_like(v) for k, v in expected.items()}
+            for coefs in [pywt.dwtn(x, wavelet, mode, axes),
+                          pywt.dwtn(x, wavelet, mode, axes, out=out)]:
+                assert_equal(sorted(coefs), sorted(expected))
+                for k, v in expected.items():
+                    assert_allclose(coefs[k], v, rtol=1e-12, atol=1e-12)
+
+            rec = expected
+            for axis in axes[::-1]:
+                rec = {k: pywt.idwt(rec[k + 'a'], rec[k + 'd'], wavelet,
+                                    mode, axis=axis)
+                       for k in {k[:-1] for k in rec}}
+            assert_allclose(pywt.idwtn(expected, wavelet, mode, axes),
+                            rec[''], rtol=1e-12, atol=1e-12)
+            out = np.empty_like(rec[''])
+            pywt.idwtn(expected, wavelet, mode, axes, out=out)
+            assert_allclose(out, rec[''], rtol=1e-12, atol=1e-12)
@@ -15,21 +15,23 @@ from numpy.testing import (
     assert_raises,
     assert_raises_regex,
 )
+from pywt._extensions._dwt import _half_slabs
 
 import pywt
 
-# Check that float32, float64, complex64, complex128 are preserved.
+# Check that float16, float32, float64, complex64, complex128 are preserved.
 # Other real types get converted to float64.
 # complex256 gets converted to complex128
 dtypes_in = [np.int8, np.float16, np.float32, np.float64, np.complex64,
              np.complex128]
-dtypes_out = [np.float64, np.float32, np.float32, np.float64, np.complex64,
+dtypes_out = [np.float64, np.float16, np.float32, np.float64, np.complex64,
               np.complex128]
 
 # tolerances used in accuracy comparisons
+tol_half = 1e-2
 tol_single = 1e-6
 tol_double = 1e-13
-dtypes_and_tolerances = [(np.float16, tol_single), (np.float32, tol_single),
+dtypes_and_tolerances = [(np.float16, tol_half), (np.float32, tol_single),
                          (np.float64, tol_double), (np.int8, tol_double),
                          (np.complex64, tol_single),
                          (np.complex128, tol_double)]
@@ -269,6 +271,44 @@ def test_waverecn():
         assert_allclose(pywt.waverecn(coeffs, 'db1'), x, rtol=tol_double)
 
 
+def test_wavedecn_waverecn_lifting():
+    rstate = np.random.RandomState(1234)
+    x = rstate.randn(40, 47)
+    for wavelet, mode in [('db2', 'symmetric'), ('bior2.4', 'periodization'),
+                          (('sym4', 'coif1'), ('reflect', 'zero'))]:
+        coeffs = pywt.wavedecn(x, wavelet, mode, level=2)
+        coeffs_l = pywt.wavedecn(x, wavelet, mode, level=2, method='lifting')
+        assert_allclose(pywt.coeffs_to_array(coeffs_l)[0],
+                        pywt.coeffs_to_array(coeffs)[0], atol=1e-10)
+        assert_allclose(pywt.waverecn(coeffs, wavelet, mode,
+                                      method='lifting'),
+                        pywt.waverecn(coeffs, wavelet, mode), atol=1e-10)
+
+    coeffs = pywt.wavedec(x, 'db3', level=3, method='lifting')
+    assert_allclose(pywt.waverec(coeffs, 'db3', method='lifting')[:, :47], x,
+                    atol=1e-10)
+    coeffs = pywt.wavedec2(x, 'sym2', level=2, method='lifting')
+    assert_allclose(pywt.waverec2(coeffs, 'sym2', method='lifting')[:, :47],
+                    x, atol=1e-10)
+
+
+def test_wavedecn_waverecn_integer():
+    rstate = np.random.RandomState(1234)
+    x = rstate.randint(0, 2**16, size=(32, 24, 3)).astype(np.uint16)
+    for wavelet in ['haar', 'bior2.2']:
+        coeffs = pywt.wavedecn(x, wavelet, 'periodization', level=2,
+                               axes=(0, 1), method='integer')
+        assert_(coeffs[0].dtype == coeffs[1]['dd'].dtype == np.int32)
+        rec = pywt.waverecn(coeffs, wavelet, 'periodization', axes=(0, 1),
+                            method='integer')
+        assert_array_equal(rec, x)
+
+    coeffs = pywt.wavedec(x[:, 0, 0], 'bior2.2', 'periodization', level=2,
+                          method='integer')
+    assert_array_equal(pywt.waverec(coeffs, 'bior2.2', 'periodization',
+                                    method='integer'), x[:, 0, 0])
+
+
 def test_waverecn_empty_coeff():
     coeffs = [np.ones((2, 2, 2)), {}, {}]
     assert_equal(pywt.waverecn(coeffs, 'db1').shape, (8, 8, 8))
@@ -871,7 +911,9 @@ def test_fswavedecn_fswaverecn_roundtrip():
                 data = data.astype(dt_in)
                 T = pywt.fswavedecn(data, 'haar', levels=levels)
                 rec = pywt.fswaverecn(T)
-                if data.real.dtype in [np.float32, np.float16]:
+                if data.real.dtype == np.float16:
+                    assert_allclose(rec, data, rtol=1e-2, atol=1e-2)
+                elif data.real.dtype == np.float32:
                     assert_allclose(rec, data, rtol=1e-6, atol=1e-6)
                 else:
                     assert_allclose(rec, data, rtol=1e-14, atol=1e-14)
@@ -1046,3 +1088,199 @@ def test_waverec_mixed_precision():
         r = ifunc(coeffs, 'db1')
         assert_allclose(r, x, rtol=1e-7, atol=1e-7)
         assert_equal(r.dtype, np.complex128)
+
+
+def test_multilevel_out():
+    rstate = np.random.RandomState(1234)
+    x = rstate.randn(16, 18)
+    coeffs = pywt.wavedec(x, 'db2', level=2)
+    out = [np.empty_like(c) for c in coeffs]
+    res = pywt.wavedec(x, 'db2', level=2, out=out)
+    for c, c_out, c_ref in zip(res, out, coeffs):
+        assert_(c is c_out)
+        assert_allclose(c, c_ref)
+    rec = np.empty_like(x)
+    assert_(pywt.waverec(res, 'db2', out=rec) is rec)
+    assert_allclose(rec, x)
+
+    coeffs = pywt.wavedec2(x, 'db2', level=2)
+    out = [np.empty_like(coeffs[0])] + [tuple(np.empty_like(c) for c in d)
+                                        for d in coeffs[1:]]
+    res = pywt.wavedec2(x, 'db2', level=2, out=out)
+    assert_(res[0] is out[0])
+    for d, d_ref in zip(res[1:], coeffs[1:]):
+        assert_allclose(d, d_ref)
+    rec = np.empty_like(x)
+    assert_(pywt.waverec2(res, 'db2', out=rec) is rec)
+    assert_allclose(rec, x)
+
+    coeffs = pywt.wavedecn(x, 'db2', level=2)
+    out = [np.empty_like(coeffs[0])] + [
+        {k: np.empty_like(v) for k, v in d.items()} for d in coeffs[1:]]
+    res = pywt.wavedecn(x, 'db2', level=2, out=out)
+    assert_(res[0] is out[0])
+    for d, d_ref in zip(res[1:], coeffs[1:]):
+        for k, v in d_ref.items():
+            assert_allclose(d[k], v)
+    rec = np.empty_like(x)
+    assert_(pywt.waverecn(res, 'db2', out=rec) is rec)
+    assert_allclose(rec, x)
+
+    # one entry per coefficient is required
+    assert_raises(ValueError, pywt.wavedec, x, 'db2', level=2, out=out[:2])
+
+
+def test_wavedecn_coeffs():
+    rstate = np.random.RandomState(1234)
+    x = rstate.randn(16, 20, 18)
+    shapes = pywt.wavedecn_shapes(x.shape, 'db2', level=2)
+    coeffs = pywt.WavedecnCoeffs(shapes)
+    assert_(pywt.wavedecn(x, 'db2', level=2, out=coeffs) is coeffs)
+    assert_equal(len(coeffs), 3)
+    assert_equal(coeffs.level, 2)
+
+    # same values and layout as ravel_coeffs, without a copy
+    coeffs_ref = pywt.wavedecn(x, 'db2', level=2)
+    arr, slices, shapes = pywt.ravel_coeffs(coeffs_ref)
+    assert_allclose(coeffs.array, arr)
+    assert_equal(coeffs.coeff_slices, slices)
+    assert_equal(coeffs.coeff_shapes, shapes)
+    assert_(pywt.ravel_coeffs(coeffs)[0] is coeffs.array)
+    for d, d_ref in zip(coeffs[1:], coeffs_ref[1:]):
+        for k, v in d_ref.items():
+            assert_(np.shares_memory(d[k], coeffs.array))
+            assert_allclose(d[k], v)
+
+    # ufuncs and arithmetic apply to all coefficients
+    scaled = np.abs(coeffs) * 2
+    assert_(isinstance(scaled, pywt.WavedecnCoeffs))
+    assert_allclose(scaled.array, 2 * np.abs(arr))
+    np.multiply(coeffs, 0.5, out=(coeffs, ))
+    assert_allclose(pywt.waverecn(coeffs, 'db2'), x / 2)
+    assert_raises(TypeError, np.add, coeffs, np.ones(3))
+    assert_raises(ValueError, np.add, coeffs,
+                  pywt.WavedecnCoeffs(shapes[:2]))
+
+    # a given buffer is used as is, its dtype must match dtype
+    buf = np.zeros(coeffs.array.size, np.float32)
+    assert_(pywt.WavedecnCoeffs(shapes, buffer=buf).array is buf)
+    assert_equal(pywt.WavedecnCoeffs(shapes, np.float32, buf).dtype,
+                 np.float32)
+    assert_raises(ValueError, pywt.WavedecnCoeffs, shapes, np.float64, buf)
+    assert_raises(ValueError, pywt.WavedecnCoeffs, shapes, buffer=buf[:-1])
+
+
+def test_wavedecn_inplace():
+    rstate = np.random.RandomState(1234)
+    for shape, axes in [((64, ), None), ((32, 48), None),
+                        ((16, 8, 24), (0, 2)), ((8, 16, 32), (-1, 0))]:
+        for dtype in [np.float32, np.float64, np.complex128]:
+            x = rstate.randn(*shape).astype(dtype)
+            arr = x.copy()
+            res, slices = pywt.wavedecn_inplace(arr, 'db1', level=3,
+                                                axes=axes)
+            assert_(res is arr)
+
+            # same layout as coeffs_to_array
+            coeffs = pywt.wavedecn(x, 'db1', 'periodization', level=3,
+                                   axes=axes)
+            expected, expected_slices = pywt.coeffs_to_array(coeffs,
+                                                             axes=axes)
+            assert_equal(slices, expected_slices)
+            assert_allclose(arr, expected, rtol=1e-5, atol=1e-5)
+
+            assert_(pywt.waverecn_inplace(arr, 'db1', 3, axes=axes) is arr)
+            assert_allclose(arr, x, rtol=1e-5, atol=1e-5)
+
+    # the default level is the number of times 2 divides all sizes, at most
+    # the max level
+    for shape, level in [((24, 24), 3), ((24, 40), 3), ((64, 64), 6),
+                         ((12, 64), 2), ((5, 8), 0)]:
+        x = rstate.randn(*shape)
+        arr = x.copy()
+        _, slices = pywt.wavedecn_inplace(arr, 'db1')
+        assert_equal(len(slices), level + 1)
+        pywt.waverecn_inplace(arr, 'db1', level)
+        assert_allclose(arr, x, atol=1e-12)
+    arr = np.zeros((64, 64))
+    assert_equal(len(pywt.wavedecn_inplace(arr, 'db4')[1]),
+                 pywt.dwt_max_level(64, 'db4') + 1)
+
+    # sizes must be multiples of 2**level and the data floating point
+    assert_raises(ValueError, pywt.wavedecn_inplace, np.zeros((12, 16)),
+                  'db1', 3)
+    assert_raises(TypeError, pywt.wavedecn_inplace, np.zeros(8, int), 'db1',
+                  1)
+
+
+def test_inplace_tiles():
+    # the tiles cover the array once, span the transformed axis and are cut
+    # along all other axes as needed
+    for shape, axis in [((16, 8, 32), 1), ((16, 8, 32), 0), ((5, 200), 1),
+                        ((300, ), 0), ((3, 0, 4), 2)]:
+        count = np.zeros(shape, int)
+        for s in _half_slabs(shape, axis, 64):
+            tile = count[s]
+            assert_equal(tile.shape[axis], shape[axis])
+            assert_(tile.size <= max(64, shape[axis]))
+            tile += 1
+        assert_equal(count, 1)
+
+
+def test_waverec_level_buffers():
+    # the intermediate levels of large reconstructions go to shared buffers,
+    # the result must still be an independent array of the right dtype
+    rstate = np.random.RandomState(1234)
+    x = rstate.randn(75, 76, 77)
+    x1 = rstate.randn(1 << 17)
+    for dtype in [np.float32, np.float64, np.complex128]:
+        xd = x.astype(dtype)
+        for dec, rec, data in [(pywt.wavedec, pywt.waverec, xd[0, 0]),
+                               (pywt.wavedec, pywt.waverec, x1.astype(dtype)),
+                               (pywt.wavedec2, pywt.waverec2, xd[0]),
+                               (pywt.wavedec2, pywt.waverec2,
+                                xd.reshape(75 * 4, -1)),
+                               (pywt.wavedecn, pywt.waverecn, xd[:19, :20]),
+                               (pywt.wavedecn, pywt.waverecn, xd)]:
+            coeffs = dec(data, 'db2', level=2)
+            r1 = rec(coeffs, 'db2')
+            r1_copy = r1.copy()
+            r2 = rec(coeffs, 'db2')
+            assert_equal(r1.dtype, dtype)
+            assert_(not np.shares_memory(r1, r2))
+            assert_array_equal(r1, r1_copy)
+            assert_allclose(r1[tuple(slice(n) for n in data.shape)], data,
+                            rtol=1e-5, atol=1e-5)
+
+
+def test_wavedec_batch():
+    rstate = np.random.RandomState(1234)
+    signals = [rstate.randn(n) for n in [12, 16, 33, 13, 64]]
+    offsets = np.cumsum([0] + [s.size for s in signals])
+    for mode in ['symmetric', 'periodization', 'reflect']:
+        for dtype in [np.float32, np.float64, np.complex128]:
+            batch = [s.astype(dtype) for s in signals]
+            coeffs, coeff_offsets = pywt.wavedec_batch(batch, 'db2', mode,
+                                                       level=2)
+            assert_equal(coeff_offsets.shape, (len(batch), 4))
+            for x, starts in zip(batch, coeff_offsets):
+                expected = pywt.wavedec(x, 'db2', mode, level=2)
+                for j, c in enumerate(expected):
+                    c_batch = coeffs[starts[j]:starts[j + 1]]
+                    assert_equal(c_batch.dtype, c.dtype)
+                    assert_allclose(c_batch, c, rtol=1e-5, atol=1e-5)
+
+            # packed input, split among threads
+            packed = pywt.wavedec_batch(np.concatenate(batch), 'db2', mode,
+                                        level=2, offsets=offsets, workers=2)
+            assert_array_equal(packed[0], coeffs)
+            assert_array_equal(packed[1], coeff_offsets)
+
+    # the default level is the maximum level of the shortest signal
+    coeffs, coeff_offsets = pywt.wavedec_batch(signals, 'db1')
+    assert_equal(coeff_offsets.shape, (len(signals), 5))
+
+    assert_raises(ValueError, pywt.wavedec_batch, [np.ones(4), np.ones(0)],
+                  'db1')
+    assert_raises(ValueError, pywt.wavedec_batch, np.ones(8), 'db1',
+                  offsets=[0, 4, 9])
@@ -0,0 +1,101 @@
+import os
+import tempfile
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+import pywt
+from pywt import outofcore
+
+
+def _assert_coeffs_equal(coeffs1, coeffs2):
+    assert len(coeffs1) == len(coeffs2)
+    for c1, c2 in zip(coeffs1, coeffs2):
+        if isinstance(c1, dict):
+            assert c1.keys() == c2.keys()
+            for k in c1:
+                assert c1[k].dtype == c2[k].dtype
+                assert_array_equal(c1[k], c2[k])
+        else:
+            assert c1.dtype == c2.dtype
+            assert_array_equal(c1, c2)
+
+
+@pytest.mark.parametrize('mode', pywt.Modes.modes)
+def test_outofcore_wavedec(mode, tmp_path):
+    rstate = np.random.RandomState(0)
+    for wavelet in ['haar', 'db2', 'sym5', 'coif2']:
+        for shape, axis in [((1001, ), -1), ((1000, ), 0), ((3, 777, 5), 1)]:
+            x = rstate.standard_normal(shape)
+            expected = pywt.wavedec(x, wavelet, mode, level=3, axis=axis)
+            # small limits transform the data in many blocks
+            for memory_limit in [2**9, 2**12, 2**30]:
+                result = outofcore.wavedec(x, wavelet, mode, level=3,
+                                           axis=axis, directory=tmp_path,
+                                           memory_limit=memory_limit)
+                _assert_coeffs_equal(result, expected)
+    # the intermediate approximations are removed
+    assert sorted(os.listdir(tmp_path)) == ['cA3.npy', 'cD1.npy', 'cD2.npy',
+                                            'cD3.npy']
+
+
+@pytest.mark.parametrize('dtype', [np.float16, np.float32, np.int32,
+                                   np.complex128])
+def test_outofcore_wavedec_dtypes(dtype, tmp_path):
+    x = np.lib.format.open_memmap(os.path.join(tmp_path, 'x.npy'), 'w+',
+                                  dtype, (4, 3000))
+    x[...] = np.random.RandomState(0).uniform(-100, 100, x.shape)
+    expected = pywt.wavedec(np.asarray(x), 'db3', 'smooth', level=3)
+    result = outofcore.wavedec(x, 'db3', 'smooth', level=3,
+                               directory=tmp_path, memory_limit=2**12)
+    _assert_coeffs_equal(result, expected)
+    assert all(isinstance(c, np.memmap) for c in result)
+
+
+@pytest.mark.parametrize('mode', ['symmetric', 'periodization', 'smooth'])
+def test_outofcore_wavedecn(mode, tmp_path):
+    x = np.random.RandomState(0).standard_normal((40, 36, 30))
+    for axes in [(0, 2), None]:
+        expected = pywt.wavedecn(x, 'db2', mode, level=2, axes=axes)
+        result = outofcore.wavedecn(x, 'db2', mode, level=2, axes=axes,
+                                    directory=tmp_path, memory_limit=2**12)
+        _assert_coeffs_equal(result, expected)
+
+    # per-axis wavelets and modes
+    expected = pywt.wavedecn(x, ('db1', 'sym3'), (mode, 'zero'), level=1,
+                             axes=(-1, 1))
+    result = outofcore.wavedecn(x, ('db1', 'sym3'), (mode, 'zero'), level=1,
+                                axes=(-1, 1), directory=tmp_path,
+                                memory_limit=2**12)
+    _assert_coeffs_equal(result, expected)
+
+
+def test_outofcore_out(tmp_path):
+    # no directory is left behind when out holds all coefficients
+    tmp_entries = set(os.listdir(tempfile.gettempdir()))
+    x = np.random.RandomState(0).standard_normal((60, 50))
+    expected = pywt.wavedec(x, 'db2', level=2, axis=0)
+    out = [np.empty_like(c) for c in expected]
+    result = outofcore.wavedec(x, 'db2', level=2, axis=0, out=out,
+                               memory_limit=2**10)
+    assert all(r is o for r, o in zip(result, out))
+    _assert_coeffs_equal(result, expected)
+
+    expected = pywt.wavedecn(x, 'haar', level=2)
+    out = [np.empty_like(expected[0])]
+    out += [{k: np.empty_like(v) for k, v in d.items()}
+            for d in expected[1:]]
+    result = outofcore.wavedecn(x, 'haar', level=2, out=out,
+                                memory_limit=2**10)
+    _assert_coeffs_equal(result, expected)
+    assert set(os.listdir(tempfile.gettempdir())) == tmp_entries
+
+    with pytest.raises(ValueError):
+        outofcore.wavedec(x, 'db2', level=2, axis=0, out=out[:2])
+    with pytest.raises(ValueError):
+        outofcore.wavedec(x, 'db2', level=1, axis=0,
+                          out=[np.empty((31, 50)), np.empty((30, 50))])
+
+    result = outofcore.wavedecn(x, 'haar', level=0, directory=tmp_path)
+    assert_array_equal(result[0], x)
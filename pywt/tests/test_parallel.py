@@ -0,0 +1,139 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+import pywt
+from pywt import parallel
+from pywt._pytest import uses_futures
+
+
+def _assert_coeffs_equal(coeffs1, coeffs2):
+    assert len(coeffs1) == len(coeffs2)
+    for c1, c2 in zip(coeffs1, coeffs2):
+        if isinstance(c1, dict):
+            assert c1.keys() == c2.keys()
+            for k in c1:
+                assert c1[k].dtype == c2[k].dtype
+                assert_array_equal(c1[k], c2[k])
+        else:
+            assert c1.dtype == c2.dtype
+            assert_array_equal(c1, c2)
+
+
+@uses_futures
+@pytest.mark.parametrize('dtype', [np.float32, np.float64, np.complex128,
+                                   np.int32])
+@pytest.mark.parametrize('chunk_size', [None, 1, 3])
+def test_parallel_wavedecn(dtype, chunk_size):
+    rstate = np.random.RandomState(0)
+    x = rstate.standard_normal((12, 20, 18)).astype(dtype)
+    for axes in [(1, 2), (0, ), (-1, 0), None]:
+        expected = pywt.wavedecn(x, 'db2', 'symmetric', level=2, axes=axes)
+        result = parallel.wavedecn(x, 'db2', 'symmetric', level=2, axes=axes,
+                                   workers=3, chunk_size=chunk_size)
+        _assert_coeffs_equal(result, expected)
+
+
+@uses_futures
+@pytest.mark.parametrize('trim_approx', [False, True])
+@pytest.mark.parametrize('chunk_size', [None, 2])
+def test_parallel_swtn(trim_approx, chunk_size):
+    rstate = np.random.RandomState(0)
+    x = rstate.standard_normal((16, 12, 8))
+    for axes in [(0, 2), (0, ), None]:
+        expected = pywt.swtn(x, 'db2', level=2, axes=axes,
+                             trim_approx=trim_approx)
+        result = parallel.swtn(x, 'db2', level=2, axes=axes,
+                               trim_approx=trim_approx, workers=2,
+                               chunk_size=chunk_size)
+        _assert_coeffs_equal(result, expected)
+
+
+@uses_futures
+@pytest.mark.parametrize('transform', ['swtn', 'dwtn'])
+def test_parallel_mran(transform):
+    rstate = np.random.RandomState(0)
+    x = rstate.standard_normal((12, 16, 12))
+    for axes in [(1, 2), (2, 0)]:
+        expected = pywt.mran(x, 'db2', level=2, axes=axes,
+                             transform=transform)
+        result = parallel.mran(x, 'db2', level=2, axes=axes,
+                               transform=transform, workers=2)
+        _assert_coeffs_equal(result, expected)
+
+
+@uses_futures
+def test_parallel_packet_level():
+    rstate = np.random.RandomState(0)
+    x = rstate.standard_normal((5, 16, 12))
+    wp = pywt.WaveletPacket(x, 'db2', 'symmetric', maxlevel=2, axis=1)
+    expected = {n.path: n.data for n in wp.get_level(2)}
+    result = parallel.packet_level(x, 'db2', 2, axes=1, workers=2)
+    _assert_coeffs_equal([result], [expected])
+    assert list(result) == list(expected)
+
+    wp = pywt.WaveletPacketND(x, 'db2', 'symmetric', maxlevel=2,
+                              axes=(0, 1))
+    expected = {n.path: n.data for n in wp.get_level(2)}
+    result = parallel.packet_level(x, 'db2', 2, axes=(0, 1), workers=2,
+                                   chunk_size=5)
+    _assert_coeffs_equal([result], [expected])
+
+
+@uses_futures
+def test_parallel_processes():
+    rstate = np.random.RandomState(0)
+    x = rstate.standard_normal((6, 16, 16)).astype(np.float32)
+    expected = pywt.wavedecn(x, 'db2', level=2, axes=(1, 2))
+    result = parallel.wavedecn(x, 'db2', level=2, axes=(1, 2), workers=2,
+                               backend='processes')
+    _assert_coeffs_equal(result, expected)
+
+    expected = pywt.mran(x, 'haar', level=2, axes=(2, 1))
+    result = parallel.mran(x, 'haar', level=2, axes=(2, 1), workers=2,
+                           chunk_size=5, backend='processes')
+    _assert_coeffs_equal(result, expected)
+
+    wp = pywt.WaveletPacket(x, 'db1', maxlevel=3, axis=1)
+    expected = {n.path: n.data for n in wp.get_level(3)}
+    result = parallel.packet_level(x, 'db1', 3, axes=1, workers=2,
+                                   backend='processes')
+    _assert_coeffs_equal([result], [expected])
+    # the coefficients are views of a single shared segment
+    base = result['aaa'].base
+    assert all(c.base is base for c in result.values())
+
+
+@uses_futures
+@pytest.mark.parametrize('method', ['conv', 'fft'])
+def test_parallel_cwt(method):
+    rstate = np.random.RandomState(0)
+    x = rstate.standard_normal((6, 64))
+    scales = np.arange(1, 8)
+    for axis, wavelet in [(-1, 'morl'), (0, 'cmor1.5-1.0')]:
+        coefs, freqs = pywt.cwt(x, scales, wavelet, method=method, axis=axis)
+        result = parallel.cwt(x, scales, wavelet, method=method, axis=axis,
+                              workers=-1, chunk_size=4)
+        assert result[0].dtype == coefs.dtype
+        assert_allclose(result[0], coefs, rtol=1e-12, atol=1e-12)
+        assert_array_equal(result[1], freqs)
+
+
+def test_parallel_errors():
+    x = np.ones((4, 8))
+    with pytest.raises(ValueError):
+        parallel.wavedecn(x, 'haar', axes=(1, ), workers=2, chunk_size=0)
+    with pytest.raises(ValueError):
+        parallel.wavedecn(x, 'haar', axes=(1, ), workers=0)
+    with pytest.raises(ValueError):
+        parallel.wavedecn(x, 'haar', axes=(1, ), method='integer')
+    with pytest.raises(pywt._utils.AxisError):
+        parallel.swtn(x, 'haar', level=1, axes=(2, ))
+    with pytest.raises(pywt._utils.AxisError):
+        parallel.cwt(x, [1, 2], 'morl', axis=2)
+    with pytest.raises(ValueError):
+        parallel.swtn(x, 'haar', level=1, axes=(1, ), backend='mpi')
+    with pytest.raises(ValueError):
+        # errors in the worker processes are raised in the caller
+        parallel.swtn(x, 'haar', level=4, axes=(1, ), workers=2,
+                      backend='processes')
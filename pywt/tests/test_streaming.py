@@ -0,0 +1,333 @@
+import warnings
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+import pywt
+
+streaming_modes = [m for m in pywt.Modes.modes
+                   if m not in ('periodic', 'periodization')]
+
+
+def _stream(stream, chunks):
+    results = [stream.push(c) for c in chunks]
+    results.append(stream.flush())
+    axis = stream.axis
+    return [np.concatenate(c, axis=axis) for c in zip(*results)]
+
+
+def _assert_coeffs_equal(coeffs1, coeffs2):
+    assert len(coeffs1) == len(coeffs2)
+    for c1, c2 in zip(coeffs1, coeffs2):
+        assert c1.dtype == c2.dtype
+        assert_array_equal(c1, c2)
+
+
+@pytest.mark.parametrize('mode', streaming_modes)
+def test_streaming_dwt(mode):
+    rstate = np.random.RandomState(0)
+    x = rstate.standard_normal(517)
+    for wavelet in ['haar', 'db2', 'sym5', 'coif2', 'bior3.5']:
+        expected = pywt.wavedec(x, wavelet, mode, level=3)
+        stream = pywt.StreamingDWT(wavelet, mode, level=3)
+        for chunk_size in [1, 2, 7, 64, 517]:
+            chunks = np.array_split(x, range(chunk_size, x.size, chunk_size))
+            _assert_coeffs_equal(_stream(stream, chunks), expected)
+
+
+def test_streaming_dwt_uneven_chunks():
+    rstate = np.random.RandomState(1)
+    x = rstate.standard_normal(1000)
+    expected = pywt.wavedec(x, 'db4', level=4)
+    stream = pywt.StreamingDWT('db4', level=4)
+    # chunks of random length, including empty ones
+    splits = np.sort(rstate.randint(0, x.size, 60))
+    _assert_coeffs_equal(_stream(stream, np.split(x, splits)), expected)
+
+
+def test_streaming_dwt_short_signals():
+    rstate = np.random.RandomState(2)
+    for n in range(1, 40):
+        x = rstate.standard_normal(n)
+        stream = pywt.StreamingDWT('db3', level=2)
+        with warnings.catch_warnings():
+            # level too high for the short signals
+            warnings.simplefilter('ignore', UserWarning)
+            expected = pywt.wavedec(x, 'db3', level=2)
+        _assert_coeffs_equal(_stream(stream, np.array_split(x, 3)), expected)
+
+
+def test_streaming_dwt_latency():
+    # coefficients are returned as soon as their samples have arrived
+    x = np.random.RandomState(3).standard_normal(1000)
+    stream = pywt.StreamingDWT('db2', level=1)
+    expected = pywt.wavedec(x, 'db2', level=1)
+    cA, cD = stream.push(x[:100])
+    assert cA.size == 50
+    assert_array_equal(cA, expected[0][:50])
+    assert_array_equal(cD, expected[1][:50])
+
+
+def test_streaming_dwt_axis():
+    rstate = np.random.RandomState(4)
+    x = rstate.standard_normal((3, 300, 2))
+    expected = pywt.wavedec(x, 'sym4', level=2, axis=1)
+    stream = pywt.StreamingDWT('sym4', level=2, axis=1)
+    chunks = np.array_split(x, 9, axis=1)
+    _assert_coeffs_equal(_stream(stream, chunks), expected)
+
+
+@pytest.mark.parametrize('dtype', [np.float16, np.float32, np.int32,
+                                   np.complex64])
+def test_streaming_dwt_dtypes(dtype):
+    x = (10 * np.random.RandomState(5).standard_normal(200)).astype(dtype)
+    expected = pywt.wavedec(x, 'db2', level=2)
+    stream = pywt.StreamingDWT('db2', level=2)
+    result = _stream(stream, np.array_split(x, 13))
+    for r, e in zip(result, expected):
+        assert r.dtype == e.dtype
+        assert_array_equal(r, e)
+
+
+def test_streaming_dwt_reuse():
+    rstate = np.random.RandomState(6)
+    stream = pywt.StreamingDWT('db2', level=2)
+    for n in [100, 57]:
+        x = rstate.standard_normal(n)
+        expected = pywt.wavedec(x, 'db2', level=2)
+        _assert_coeffs_equal(_stream(stream, np.array_split(x, 4)), expected)
+
+
+def test_streaming_dwt_errors():
+    for mode in ['periodic', 'periodization', pywt.Modes.periodization]:
+        with pytest.raises(ValueError):
+            pywt.StreamingDWT('db2', mode)
+    with pytest.raises(ValueError):
+        pywt.StreamingDWT('db2', level=0)
+    stream = pywt.StreamingDWT('db2')
+    with pytest.raises(ValueError):
+        stream.flush()
+    with pytest.raises(ValueError):
+        stream.push(1.0)
+    stream.push(np.ones(4))
+    with pytest.raises(ValueError):
+        stream.push(np.ones((2, 4)))
+
+
+def _reconstruct(stream, chunks):
+    result = np.concatenate([stream.push(c) for c in chunks], axis=stream.axis)
+    stream.flush()
+    return result
+
+
+def _coeff_chunks(coeffs, splits, axis=-1):
+    # split the coefficients of each level at the same fractions of its length
+    parts = [np.array_split(c, [int(f * c.shape[axis]) for f in splits],
+                            axis=axis)
+             for c in coeffs]
+    return [list(p) for p in zip(*parts)]
+
+
+@pytest.mark.parametrize('wavelet', ['haar', 'db2', 'sym5', 'coif2',
+                                     'bior3.5'])
+def test_streaming_idwt(wavelet):
+    rstate = np.random.RandomState(0)
+    for n in [517, 1000, 97]:
+        x = rstate.standard_normal(n)
+        coeffs = pywt.wavedec(x, wavelet, level=3)
+        expected = pywt.waverec(coeffs, wavelet)
+        stream = pywt.StreamingIDWT(wavelet)
+        for splits in [[], [0.5], np.linspace(0, 1, 30),
+                       np.sort(rstate.rand(7))]:
+            result = _reconstruct(stream, _coeff_chunks(coeffs, splits))
+            assert result.dtype == expected.dtype
+            assert_array_equal(result, expected)
+
+
+def test_streaming_idwt_round_trip():
+    rstate = np.random.RandomState(1)
+    x = rstate.standard_normal(1000)
+    analysis = pywt.StreamingDWT('db4', 'smooth', level=4)
+    synthesis = pywt.StreamingIDWT('db4', 'smooth')
+    chunks = [synthesis.push(analysis.push(c)) for c in np.array_split(x, 50)]
+    chunks.append(synthesis.push(analysis.flush()))
+    synthesis.flush()
+    expected = pywt.waverec(pywt.wavedec(x, 'db4', 'smooth', level=4), 'db4',
+                            'smooth')
+    assert_array_equal(np.concatenate(chunks), expected)
+
+
+def test_streaming_idwt_latency():
+    # a sample is returned once all the coefficients it depends on arrived
+    rstate = np.random.RandomState(2)
+    coeffs = pywt.wavedec(rstate.standard_normal(1000), 'db2', level=1)
+    expected = pywt.waverec(coeffs, 'db2')
+    stream = pywt.StreamingIDWT('db2')
+    x = stream.push([coeffs[0][:50], coeffs[1][:50]])
+    assert x.size == 2 * 50 - 2
+    assert_array_equal(x, expected[:x.size])
+
+
+def test_streaming_idwt_axis():
+    rstate = np.random.RandomState(3)
+    coeffs = pywt.wavedec(rstate.standard_normal((2, 301, 3)), 'sym4',
+                          level=2, axis=1)
+    expected = pywt.waverec(coeffs, 'sym4', axis=1)
+    stream = pywt.StreamingIDWT('sym4', axis=1)
+    result = _reconstruct(stream,
+                          _coeff_chunks(coeffs, [0.1, 0.4, 0.45, 0.9], axis=1))
+    assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize('dtype', [np.float16, np.float32, np.complex64])
+def test_streaming_idwt_dtypes(dtype):
+    x = np.random.RandomState(4).standard_normal(200).astype(dtype)
+    coeffs = pywt.wavedec(x, 'db2', level=2)
+    expected = pywt.waverec(coeffs, 'db2')
+    stream = pywt.StreamingIDWT('db2')
+    result = _reconstruct(stream, _coeff_chunks(coeffs, [0.01, 0.3, 0.6]))
+    assert result.dtype == expected.dtype
+    assert_array_equal(result, expected)
+
+
+def test_streaming_idwt_errors():
+    with pytest.raises(ValueError):
+        pywt.StreamingIDWT('db2', 'periodization')
+    stream = pywt.StreamingIDWT('db2')
+    with pytest.raises(ValueError):
+        stream.flush()
+    with pytest.raises(ValueError):
+        stream.push(np.ones(4))
+    with pytest.raises(ValueError):
+        stream.push([np.ones(4)])
+    stream.push([np.ones(4), np.ones(4)])
+    with pytest.raises(ValueError):
+        stream.push([np.ones(4), np.ones(4), np.ones(8)])
+    # the approximation has too many coefficients
+    stream.push([np.ones(2), np.ones(0)])
+    with pytest.raises(ValueError):
+        stream.flush()
+    # too few coefficients
+    stream.push([np.ones(1), np.ones(1)])
+    with pytest.raises(ValueError):
+        stream.flush()
+
+
+def _swt_zero_padded(x, wavelet, level, axis=-1, **kwargs):
+    # swt of x extended by enough zeros that the coefficients do not wrap
+    filter_len = pywt.Wavelet(wavelet).dec_len
+    lead = sum(filter_len * 2**(j - 1) // 2 - 1 for j in range(1, level + 1))
+    lag = filter_len // 2 * (2**level - 1)
+    n = x.shape[axis]
+    size = -(-(n + lead + lag) // 2**level) * 2**level
+    pad = [(0, 0)] * x.ndim
+    pad[axis] = (lead, size - n - lead)
+    coeffs = pywt.swt(np.pad(x, pad), wavelet, level, axis=axis, **kwargs)
+    s = [slice(None)] * x.ndim
+    s[axis] = slice(lead, lead + n)
+    s = tuple(s)
+    if kwargs.get('trim_approx'):
+        return [c[s] for c in coeffs]
+    return [(a[s], d[s]) for a, d in coeffs]
+
+
+def _stream_swt(stream, chunks):
+    results = [stream.push(c) for c in chunks]
+    results.append(stream.flush())
+    axis = stream.axis
+    if stream.trim_approx:
+        return [np.concatenate(c, axis=axis) for c in zip(*results)]
+    return [tuple(np.concatenate(c, axis=axis) for c in zip(*pairs))
+            for pairs in zip(*results)]
+
+
+@pytest.mark.parametrize('wavelet', ['haar', 'db2', 'sym5', 'coif2',
+                                     'bior3.5'])
+def test_streaming_swt(wavelet):
+    rstate = np.random.RandomState(0)
+    for level in [1, 2, 4]:
+        for n in [1, 37, 500]:
+            x = rstate.standard_normal(n)
+            expected = _swt_zero_padded(x, wavelet, level)
+            stream = pywt.StreamingSWT(wavelet, level)
+            for chunk_size in [1, 7, 100]:
+                chunks = np.array_split(x, range(chunk_size, n, chunk_size))
+                result = _stream_swt(stream, chunks)
+                assert len(result) == level
+                for (a, d), (ea, ed) in zip(result, expected):
+                    assert_array_equal(a, ea)
+                    assert_array_equal(d, ed)
+
+
+def test_streaming_swt_uneven_chunks():
+    rstate = np.random.RandomState(5)
+    x = rstate.standard_normal((2, 600))
+    expected = _swt_zero_padded(x, 'db8', 5, axis=1)
+    stream = pywt.StreamingSWT('db8', 5, axis=1)
+    # chunks of random length, including empty ones, and a long last one
+    # that the buffers of the levels have to grow for
+    splits = np.sort(rstate.randint(0, 400, 40))
+    result = _stream_swt(stream, np.split(x, splits, axis=1))
+    for (a, d), (ea, ed) in zip(result, expected):
+        assert_array_equal(a, ea)
+        assert_array_equal(d, ed)
+
+
+def test_streaming_swt_interior():
+    # away from the ends, the coefficients equal those of swt
+    x = np.random.RandomState(1).standard_normal(1024)
+    stream = pywt.StreamingSWT('db3', 3, trim_approx=True, norm=True)
+    result = _stream_swt(stream, np.array_split(x, 10))
+    expected = pywt.swt(x, 'db3', 3, trim_approx=True, norm=True)
+    for r, e in zip(result, expected):
+        assert_allclose(r[100:-100], e[100:-100], rtol=1e-12, atol=1e-12)
+
+
+def test_streaming_swt_lag():
+    x = np.random.RandomState(2).standard_normal(500)
+    stream = pywt.StreamingSWT('db2', 3, trim_approx=True)
+    assert stream.lag == 2 * (2**3 - 1)
+    expected = _swt_zero_padded(x, 'db2', 3, trim_approx=True)
+    coeffs = stream.push(x[:100])
+    for c, e in zip(coeffs, expected):
+        assert c.size == 100 - stream.lag
+        assert_array_equal(c, e[:c.size])
+    # all levels are returned for the same samples
+    coeffs = stream.push(x[100:101])
+    assert all(c.size == 1 for c in coeffs)
+
+
+def test_streaming_swt_axis():
+    rstate = np.random.RandomState(3)
+    x = rstate.standard_normal((2, 301, 3))
+    expected = _swt_zero_padded(x, 'sym4', 2, axis=1, trim_approx=True)
+    stream = pywt.StreamingSWT('sym4', 2, axis=1, trim_approx=True)
+    result = _stream_swt(stream, np.array_split(x, 9, axis=1))
+    for r, e in zip(result, expected):
+        assert_array_equal(r, e)
+
+
+@pytest.mark.parametrize('dtype', [np.float16, np.float32, np.int32,
+                                   np.complex64])
+def test_streaming_swt_dtypes(dtype):
+    x = (10 * np.random.RandomState(4).standard_normal(200)).astype(dtype)
+    expected = _swt_zero_padded(x, 'db2', 2, trim_approx=True)
+    stream = pywt.StreamingSWT('db2', 2, trim_approx=True)
+    result = _stream_swt(stream, np.array_split(x, 13))
+    for r, e in zip(result, expected):
+        assert r.dtype == e.dtype
+        assert_array_equal(r, e)
+
+
+def test_streaming_swt_errors():
+    with pytest.raises(ValueError):
+        pywt.StreamingSWT('db2', 0)
+    with pytest.warns(UserWarning):
+        pywt.StreamingSWT('bior2.2', norm=True)
+    stream = pywt.StreamingSWT('db2')
+    with pytest.raises(ValueError):
+        stream.flush()
+    stream.push(np.ones(4))
+    with pytest.raises(ValueError):
+        stream.push(np.ones((2, 4)))
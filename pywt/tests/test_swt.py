@@ -2,6 +2,7 @@
 
 
 import warnings
+import weakref
 from copy import deepcopy
 from itertools import combinations, permutations
 
@@ -15,13 +16,13 @@ from numpy.testing import (
 )
 
 import pywt
-from pywt._extensions._swt import swt_axis
+from pywt._extensions._swt import iswt_axis, swt_axis
 
 # Check that float32 and complex64 are preserved.  Other real types get
 # converted to float64.
 dtypes_in = [np.int8, np.float16, np.float32, np.float64, np.complex64,
              np.complex128]
-dtypes_out = [np.float64, np.float32, np.float32, np.float64, np.complex64,
+dtypes_out = [np.float64, np.float16, np.float32, np.float64, np.complex64,
               np.complex128]
 
 # tolerances used in accuracy comparisons
@@ -138,6 +139,35 @@ def test_swt_axis():
         pywt.swt(x, db1, level=2, axis=5)
 
 
+@pytest.mark.parametrize('wavelet', ['haar', 'db3', 'sym8', 'bior3.5'])
+def test_swt_levels_match_single_levels(wavelet):
+    # all levels are computed together in one sweep, unless arrays are
+    # given for the output, which are then filled one level at a time
+    rstate = np.random.RandomState(1234)
+    wavelet = pywt.Wavelet(wavelet)
+    for shape, axis in [((2**13, ), 0), ((64, 5), 0), ((3, 64), 1)]:
+        x = rstate.randn(*shape)
+        level = pywt.swt_max_level(shape[axis]) - 1
+        for start_level in [0, 1]:
+            coeffs = swt_axis(x, wavelet, level, start_level, axis)
+            out = [(np.empty_like(x), np.empty_like(x))
+                   for _ in range(level)]
+            swt_axis(x, wavelet, level, start_level, axis, out=out)
+            for (cA, cD), (cA_ref, cD_ref) in zip(coeffs, out):
+                assert_array_equal(cA, cA_ref)
+                assert_array_equal(cD, cD_ref)
+
+            coeffs = swt_axis(x, wavelet, level, start_level, axis,
+                              trim_approx=True)
+            assert_array_equal(coeffs[0], out[0][0])
+            for cD, (_, cD_ref) in zip(coeffs[1:], out):
+                assert_array_equal(cD, cD_ref)
+
+    # the coefficients share a single output block
+    coeffs = pywt.swt(x, wavelet, level=3)
+    assert_(all(c.base is coeffs[0][0].base for pair in coeffs for c in pair))
+
+
 def test_swt_iswt_integration():
     # This function performs a round-trip swt/iswt transform test on
     # all available types of wavelets in PyWavelets - except the
@@ -171,6 +201,136 @@ def test_swt_iswt_integration():
                 assert_allclose(Y, X, rtol=1e-5, atol=1e-7)
 
 
+def test_swt_iswt_haar():
+    # Haar uses a dedicated path: a[i] = c * (x[i] + x[i + s]) and
+    # d[i] = c * (x[i] - x[i + s]) with the step s = 2**(level - 1)
+    rstate = np.random.RandomState(1234)
+    c = np.sqrt(0.5)
+    x = rstate.randn(32, 3)
+    coeffs = pywt.swt(x, 'haar', level=3, axis=0)
+    approx = x
+    for level, (cA, cD) in enumerate(reversed(coeffs), start=1):
+        shifted = np.roll(approx, -2**(level - 1), axis=0)
+        assert_allclose(cA, c * (approx + shifted), atol=1e-14)
+        assert_allclose(cD, c * (approx - shifted), atol=1e-14)
+        approx = cA
+    assert_allclose(pywt.swt(x[:, 0], 'haar', level=3)[0][1],
+                    coeffs[0][1][:, 0], atol=1e-14)
+
+    # iswt averages the two reconstructions of each sample, which differ for
+    # coefficients that are not a transform of any signal
+    coeffs = [(rstate.randn(16), rstate.randn(16)) for _ in range(3)]
+    expected = coeffs[0][0]
+    for level, (_, cD) in zip(range(3, 0, -1), coeffs):
+        s = 2**(level - 1)
+        expected = c / 2 * (expected + np.roll(expected, s)
+                            + cD - np.roll(cD, s))
+    for wavelet in ['haar', 'db1']:
+        assert_allclose(pywt.iswt(coeffs, wavelet), expected, atol=1e-14)
+    assert_allclose(pywt.iswtn([{'a': a, 'd': d} for a, d in coeffs],
+                               'haar', axes=(0, )),
+                    expected, atol=1e-14)
+
+
+def _swt_reference(x, wavelet, level):
+    # one level of the SWT as a circular convolution with the filters
+    # dilated by 2**(level - 1)
+    wavelet = pywt.Wavelet(wavelet)
+    n = len(x)
+    step = 2**(level - 1)
+    taps = step * (wavelet.dec_len // 2 - np.arange(wavelet.dec_len))
+    idx = (np.arange(n)[:, np.newaxis] + taps) % n
+    return x[idx] @ wavelet.dec_lo, x[idx] @ wavelet.dec_hi
+
+
+def _iswt_reference(coeffs, wavelet):
+    # each level averages the periodized idwt of the even and of the odd
+    # coefficients of each of its 2**(level - 1) phases
+    output = coeffs[0][0]
+    for level, (_, cD) in zip(range(len(coeffs), 0, -1), coeffs):
+        step = 2**(level - 1)
+        result = np.empty_like(output)
+        for first in range(step):
+            a, d = output[first::step], cD[first::step]
+            x1 = pywt.idwt(a[0::2], d[0::2], wavelet, 'periodization')
+            x2 = pywt.idwt(a[1::2], d[1::2], wavelet, 'periodization')
+            result[first::step] = (x1 + np.roll(x2, 1)) / 2
+        output = result
+    return output
+
+
+@pytest.mark.parametrize('wavelet', ['db2', 'sym5', 'coif3', 'bior3.5'])
+def test_iswt_phases(wavelet):
+    rstate = np.random.RandomState(0)
+    for n, level in [(64, 3), (16, 4), (96, 5)]:
+        coeffs = [(rstate.randn(n), rstate.randn(n)) for _ in range(level)]
+        expected = _iswt_reference(coeffs, wavelet)
+        assert_allclose(pywt.iswt(coeffs, wavelet), expected, atol=1e-12)
+        coeffs = [(a + 1j * d, d - 1j * a) for a, d in coeffs]
+        expected = _iswt_reference(coeffs, wavelet)
+        assert_allclose(pywt.iswt(coeffs, wavelet), expected, atol=1e-12)
+
+    # non-contiguous coefficients along any axis
+    x = rstate.randn(8, 32, 16)
+    for axis in range(3):
+        x_axis = np.moveaxis(x, axis, 0)[:, :3, :4]
+        coeffs = pywt.swt(x_axis, wavelet, 2, axis=0)
+        assert_allclose(pywt.iswt(coeffs, wavelet, axis=0), x_axis,
+                        atol=1e-12)
+        expected = _iswt_reference(
+            [(a[:, 1, 2], d[:, 1, 2]) for a, d in coeffs], wavelet)
+        assert_allclose(pywt.iswt(coeffs, wavelet, axis=0)[:, 1, 2],
+                        expected, atol=1e-12)
+
+
+def test_iswt_axis_missing_coefficients():
+    # a missing approximation or detail is treated as zero
+    rstate = np.random.RandomState(0)
+    wavelet = pywt.Wavelet('sym4')
+    for x in [rstate.randn(40), rstate.randn(6, 40, 5) + 1j]:
+        zeros = np.zeros_like(x)
+        for level in [1, 2, 3]:
+            axis = 1 if x.ndim > 1 else 0
+            assert_allclose(iswt_axis(x, None, wavelet, level, axis),
+                            iswt_axis(x, zeros, wavelet, level, axis),
+                            atol=1e-14)
+            assert_allclose(iswt_axis(None, x, wavelet, level, axis),
+                            iswt_axis(zeros, x, wavelet, level, axis),
+                            atol=1e-14)
+    with pytest.raises(ValueError):
+        iswt_axis(None, None, wavelet, 1)
+
+
+@pytest.mark.parametrize('wavelet', ['haar', 'db2', 'sym5', 'bior2.4'])
+def test_swt_arbitrary_length(wavelet):
+    # the signal is extended periodically, so any length of at least
+    # 2**level can be transformed and the coefficients keep that length
+    rstate = np.random.RandomState(1234)
+    for n in [5, 12, 13, 100]:
+        x = rstate.randn(n)
+        for level in range(1, int(np.log2(n)) + 1):
+            coeffs = pywt.swt(x, wavelet, level)
+            assert_(all(c.shape == x.shape for pair in coeffs for c in pair))
+            assert_allclose(pywt.iswt(coeffs, wavelet), x, atol=1e-12)
+
+            # the levels are those of a circular convolution with the
+            # dilated filters
+            cA = x
+            for j, (cA_j, cD_j) in enumerate(coeffs[::-1]):
+                cA_ref, cD_ref = _swt_reference(cA, wavelet, j + 1)
+                assert_allclose(cA_j, cA_ref, atol=1e-12)
+                assert_allclose(cD_j, cD_ref, atol=1e-12)
+                cA = cA_ref
+        with pytest.raises(ValueError):
+            pywt.swt(x, wavelet, int(np.log2(n)) + 1)
+
+    x = rstate.randn(7, 12, 5)
+    coeffs = pywt.swt2(x[..., 0], wavelet, 2)
+    assert_allclose(pywt.iswt2(coeffs, wavelet), x[..., 0], atol=1e-12)
+    coeffs = pywt.swtn(x, wavelet, 2, trim_approx=True)
+    assert_allclose(pywt.iswtn(coeffs, wavelet), x, atol=1e-12)
+
+
 def test_swt_dtypes():
     wavelet = pywt.Wavelet('haar')
     for dt_in, dt_out in zip(dtypes_in, dtypes_out):
@@ -196,15 +356,38 @@ def test_swt_roundtrip_dtypes():
     for dt_in, dt_out in zip(dtypes_in, dtypes_out):
         # swt, iswt
         x = rstate.standard_normal((8, )).astype(dt_in)
+        # float16 coefficients are rounded to float16 precision
+        tol = 1e-2 if dt_in == np.float16 else 1e-6
         c = pywt.swt(x, wavelet, level=2)
         xr = pywt.iswt(c, wavelet)
-        assert_allclose(x, xr, rtol=1e-6, atol=1e-7)
+        assert_equal(xr.dtype, dt_out)
+        assert_allclose(x, xr, rtol=tol, atol=tol / 10)
 
         # swt2, iswt2
         x = rstate.standard_normal((8, 8)).astype(dt_in)
         c = pywt.swt2(x, wavelet, level=2)
         xr = pywt.iswt2(c, wavelet)
-        assert_allclose(x, xr, rtol=1e-6, atol=1e-7)
+        assert_equal(xr.dtype, dt_out)
+        assert_allclose(x, xr, rtol=tol, atol=tol / 10)
+
+        # swtn, iswtn
+        c = pywt.swtn(x, wavelet, level=2, trim_approx=True)
+        xr = pywt.iswtn(c, wavelet)
+        assert_equal(xr.dtype, dt_out)
+        assert_allclose(x, xr, rtol=tol, atol=tol / 10)
+
+
+def test_swt_float16_long():
+    # float16 lines too long for a single tile are converted in blocks
+    rstate = np.random.RandomState(0)
+    x = rstate.randn(300000).astype(np.float16)
+    for wavelet in ['db1', 'db3']:
+        coeffs = pywt.swt(x, wavelet, level=2, trim_approx=True)
+        coeffs32 = pywt.swt(x.astype(np.float32), wavelet, level=2,
+                            trim_approx=True)
+        for c, c32 in zip(coeffs, coeffs32):
+            assert_equal(c.dtype, np.float16)
+            assert_array_equal(c, c32.astype(np.float16))
 
 
 def test_swt_default_level_by_axis():
@@ -216,6 +399,25 @@ def test_swt_default_level_by_axis():
         assert_equal(len(sdec), pywt.swt_max_level(x.shape[axis]))
 
 
+def test_swt_default_level_odd_length():
+    # lengths that are not a multiple of 2 use the highest level possible
+    x = np.arange(37.)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', UserWarning)
+        coeffs = pywt.swt(x, 'db1')
+        assert_equal(len(coeffs), 5)
+        assert_equal(len(list(pywt.iter_swt(x, 'db1'))), 5)
+    assert_allclose(pywt.iswt(coeffs, 'db1'), x, atol=1e-12)
+
+    # a single sample cannot be transformed at any level
+    with pytest.raises(ValueError, match='too short'):
+        pywt.swt(np.ones(1), 'db1')
+    with pytest.raises(ValueError, match='too short'):
+        pywt.swt(np.ones(1), 'db1', level=1)
+    with pytest.raises(ValueError, match='too short'):
+        pywt.swtn(np.ones((1, 4)), 'db1', level=1)
+
+
 def test_swt2_ndim_error():
     x = np.ones(8)
     with pytest.raises(ValueError):
@@ -564,6 +766,67 @@ def test_iswtn_mixed_dtypes():
         assert_allclose(y, x, rtol=1e-3, atol=1e-3)
 
 
+def test_iter_swt():
+    rstate = np.random.RandomState(0)
+    x = rstate.randn(64, 32)
+    for wavelet in ['db2', ('haar', 'sym3')]:
+        for start_level in [0, 1]:
+            expected = pywt.swtn(x, wavelet, 3, start_level, norm=True)
+            result = list(pywt.iter_swtn(x, wavelet, 3, start_level,
+                                         norm=True))
+            assert len(result) == 3
+            for r, e in zip(result, expected[::-1]):
+                assert r.keys() == e.keys()
+                for k in e:
+                    assert_array_equal(r[k], e[k])
+
+            expected = pywt.swt2(x, wavelet, 3, start_level, axes=(1, 0))
+            result = list(pywt.iter_swt2(x, wavelet, 3, start_level,
+                                         axes=(1, 0)))
+            for (a, details), (ea, edetails) in zip(result, expected[::-1]):
+                assert_array_equal(a, ea)
+                for d, ed in zip(details, edetails):
+                    assert_array_equal(d, ed)
+
+    expected = pywt.swt(x, 'db3', axis=0)
+    result = list(pywt.iter_swt(x, 'db3', axis=0))
+    assert len(result) == len(expected) == 6
+    for (a, d), (ea, ed) in zip(result, expected[::-1]):
+        assert_array_equal(a, ea)
+        assert_array_equal(d, ed)
+
+    # complex data
+    z = x[:, 0] + 1j * x[:, 1]
+    for (a, d), (ea, ed) in zip(pywt.iter_swt(z, 'db2', 2),
+                                pywt.swt(z, 'db2', 2)[::-1]):
+        assert_allclose(a, ea, atol=1e-14)
+        assert_allclose(d, ed, atol=1e-14)
+
+
+def test_iter_swt_releases_levels():
+    # the generator does not keep the coefficients that were yielded alive
+    x = np.random.RandomState(1).randn(32, 32)
+    levels = pywt.iter_swtn(x, 'db2', 3)
+    refs = [weakref.ref(c) for c in next(levels).values()]
+    next(levels)
+    assert all(ref() is None for ref in refs)
+
+
+def test_iter_swt_errors():
+    # the arguments are checked before the first level is computed
+    with pytest.raises(ValueError):
+        pywt.iter_swtn(np.ones((8, 8)), 'db1', 2, axes=(0, 0))
+    with pytest.raises(ValueError):
+        pywt.iter_swt2(np.ones((8, 8)), 'db1', 2, axes=(0, ))
+
+    # as are the levels
+    for level, start_level in [(0, 0), (4, 0), (2, 2)]:
+        with pytest.raises(ValueError):
+            pywt.iter_swtn(np.ones((8, 8)), 'db1', level, start_level)
+        with pytest.raises(ValueError):
+            pywt.iter_swt(np.ones(8), 'db1', level, start_level)
+
+
 def test_swt_zero_size_axes():
     # raise on empty input array
     with pytest.raises(ValueError):
@@ -655,3 +918,29 @@ def test_swt_ravel_and_unravel():
         c = pywt.unravel_coeffs(arr, slices, shapes, output_format=ravel_type)
         r = _iswt(c, 'sym2')
         assert_allclose(x, r)
+
+
+def test_swt_out():
+    rstate = np.random.RandomState(1234)
+    for x in [rstate.randn(32), rstate.randn(4, 32)]:
+        coeffs = pywt.swt(x, 'db2', level=3)
+        out = [(np.empty_like(cA), np.empty_like(cD)) for cA, cD in coeffs]
+        res = pywt.swt(x, 'db2', level=3, out=out)
+        for (cA, cD), (cA_out, cD_out), (cA_ref, cD_ref) in zip(res, out,
+                                                                 coeffs):
+            assert_(cA is cA_out and cD is cD_out)
+            assert_allclose(cA, cA_ref)
+            assert_allclose(cD, cD_ref)
+
+        coeffs = pywt.swt(x, 'db2', level=3, trim_approx=True)
+        out = [np.empty_like(c) for c in coeffs]
+        res = pywt.swt(x, 'db2', level=3, trim_approx=True, out=out)
+        for c, c_out, c_ref in zip(res, out, coeffs):
+            assert_(c is c_out)
+            assert_allclose(c, c_ref)
+
+    # one pair per level is required, the outputs must not overlap
+    with pytest.raises(ValueError):
+        pywt.swt(x, 'db2', level=3, trim_approx=True, out=out[:3])
+    with pytest.raises(ValueError):
+        pywt.swt(x, 'db2', level=1, out=[(out[0], out[0])])
@@ -174,14 +174,21 @@ def test_wavelet_packet_dtypes():
         assert_equal(r.dtype, x.dtype)
         assert_allclose(r, x, atol=1e-5, rtol=1e-5)
 
+    if hasattr(np, "half"):
+        # float16 is preserved as well, at float16 precision
+        x = np.arange(N, dtype=np.half)
+        wp = pywt.WaveletPacket(x, wavelet='db1', mode='symmetric')
+        wp.get_level(wp.maxlevel)
+        r = wp.reconstruct(False)
+        assert_equal(r.dtype, np.half)
+        assert_allclose(r, x, atol=1e-2, rtol=1e-2)
+
     # first element of the tuple is the input dtype
     # second element of the tuple is the transform dtype
     dtype_pairs = [(np.uint8, np.float64),
                    (np.intp, np.float64), ]
     if hasattr(np, "complex256"):
         dtype_pairs += [(np.complex256, np.complex128), ]
-    if hasattr(np, "half"):
-        dtype_pairs += [(np.half, np.float32), ]
     for (dtype, transform_dtype) in dtype_pairs:
         x = np.arange(N, dtype=dtype)
         wp = pywt.WaveletPacket(x, wavelet='db1', mode='symmetric')